@@ -1,9 +1,12 @@
 """API client for Nodes API communication."""
 
+from griptape_nodes.api_client.blob_spool import BlobSpool, BlobSpoolError
 from griptape_nodes.api_client.client import Client
 from griptape_nodes.api_client.request_client import RequestClient
 
 __all__ = [
+    "BlobSpool",
+    "BlobSpoolError",
     "Client",
     "RequestClient",
 ]
@@ -0,0 +1,203 @@
+"""Local content-addressed spool for large WebSocket payload values.
+
+Messages between a workflow subprocess and its parent process are relayed through the Nodes
+API, so large values such as base64 image previews travel across the network twice as
+escaped JSON text. When both ends of a connection run on the same machine, the sender can
+instead write each large string to this spool once, keyed by its SHA-256 digest, and send a
+small reference in its place. The receiver replaces each reference with the spooled value.
+
+The spool lives in the user's private cache directory, so other local users can neither read
+the spooled values nor redirect or empty the spool.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import stat
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from xdg_base_dirs import xdg_cache_home
+
+from griptape_nodes.utils.file_utils import ensure_private_directory
+
+logger = logging.getLogger("griptape_nodes_client")
+
+# Key marking a dict as a reference to a spooled value
+BLOB_REFERENCE_KEY = "__gtn_blob__"
+
+# Strings at least this many characters long are moved into the spool
+DEFAULT_MIN_BLOB_SIZE = 16_384
+
+# Spooled values older than this are removed when a spool is opened
+DEFAULT_MAX_BLOB_AGE_S = 3600.0
+
+_DIGEST_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+def get_blob_spool_dir() -> Path:
+    """Get the current user's default spool directory."""
+    return xdg_cache_home() / "griptape_nodes" / "ws_blobs"
+
+
+class BlobSpoolError(Exception):
+    """Exception raised when a spooled value cannot be read."""
+
+
+class BlobSpool:
+    """Content-addressed store of large string values shared by processes on one machine."""
+
+    def __init__(self, directory: Path | None = None, *, min_blob_size: int = DEFAULT_MIN_BLOB_SIZE) -> None:
+        """Initialize the spool.
+
+        Args:
+            directory: Directory holding the spooled values (default: get_blob_spool_dir()). It is
+                created private to the current user, and refused if anyone else owns it.
+            min_blob_size: Strings at least this many characters long are spooled.
+        """
+        self.directory = directory if directory is not None else get_blob_spool_dir()
+        self.min_blob_size = min_blob_size
+        self._directory_checked = False
+
+    def _ensure_directory(self) -> None:
+        """Create the spool directory, or check an existing one, once per spool.
+
+        Raises:
+            PermissionError: If the path is a symlink, not a directory, or owned by another user.
+        """
+        if not self._directory_checked:
+            ensure_private_directory(self.directory)
+            self._directory_checked = True
+
+    def put(self, data: bytes) -> str:
+        """Store data in the spool.
+
+        Args:
+            data: Bytes to store.
+
+        Returns:
+            The SHA-256 hex digest that references the data.
+
+        Raises:
+            PermissionError: If the spool directory is not private to the current user.
+        """
+        self._ensure_directory()
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.directory / digest
+        if path.exists():
+            # Refresh the timestamp so pruning doesn't remove a value that is being reused
+            path.touch()
+            return digest
+        # Write to a temporary file first so readers never see a partial value
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=f".{digest}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Read data from the spool.
+
+        Args:
+            digest: Digest returned by put().
+
+        Returns:
+            The stored bytes.
+
+        Raises:
+            BlobSpoolError: If the digest is malformed, the value is missing, or it fails verification.
+        """
+        if not _DIGEST_PATTERN.fullmatch(digest):
+            msg = f"Invalid spooled value reference '{digest}'"
+            raise BlobSpoolError(msg)
+        try:
+            data = (self.directory / digest).read_bytes()
+        except OSError as e:
+            msg = f"Spooled value '{digest}' is not available: {e}"
+            raise BlobSpoolError(msg) from e
+        if hashlib.sha256(data).hexdigest() != digest:
+            msg = f"Spooled value '{digest}' is corrupt"
+            raise BlobSpoolError(msg)
+        return data
+
+    def prune(self, max_age_s: float = DEFAULT_MAX_BLOB_AGE_S) -> None:
+        """Remove spooled values that have not been written or reused for max_age_s seconds.
+
+        Only regular files named by a digest are removed. A spool directory that is not private
+        to the current user is left untouched.
+        """
+        if not self.directory.exists():
+            return
+        try:
+            self._ensure_directory()
+        except PermissionError as e:
+            logger.warning("Not pruning the WebSocket blob spool: %s", e)
+            return
+        cutoff = time.time() - max_age_s
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not _DIGEST_PATTERN.fullmatch(entry.name):
+                    continue
+                try:
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    if stat.S_ISREG(entry_stat.st_mode) and entry_stat.st_mtime < cutoff:
+                        Path(entry.path).unlink()
+                except OSError:
+                    # Another process may have pruned or replaced it concurrently
+                    continue
+
+    def externalize(self, value: Any) -> tuple[Any, int]:
+        """Replace large strings in a JSON-compatible value with spool references.
+
+        Args:
+            value: Value made of dicts, lists, and scalars.
+
+        Returns:
+            Tuple of the value with large strings replaced, and the number of strings replaced.
+            Containers without large strings are returned as-is.
+        """
+        if isinstance(value, str):
+            if len(value) < self.min_blob_size:
+                return value, 0
+            digest = self.put(value.encode())
+            return {BLOB_REFERENCE_KEY: digest, "size": len(value)}, 1
+        if isinstance(value, dict):
+            replaced = 0
+            result = {}
+            for key, item in value.items():
+                result[key], item_replaced = self.externalize(item)
+                replaced += item_replaced
+            return (result, replaced) if replaced else (value, 0)
+        if isinstance(value, list):
+            replaced = 0
+            items = []
+            for item in value:
+                new_item, item_replaced = self.externalize(item)
+                items.append(new_item)
+                replaced += item_replaced
+            return (items, replaced) if replaced else (value, 0)
+        return value, 0
+
+    def rehydrate(self, value: Any) -> Any:
+        """Replace spool references in a value produced by externalize() with the spooled strings.
+
+        Raises:
+            BlobSpoolError: If a referenced value cannot be read.
+        """
+        if isinstance(value, dict):
+            digest = value.get(BLOB_REFERENCE_KEY)
+            if isinstance(digest, str):
+                return self.get(digest).decode()
+            return {key: self.rehydrate(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.rehydrate(item) for item in value]
+        return value
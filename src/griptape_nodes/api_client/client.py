@@ -15,12 +15,16 @@ from urllib.parse import urljoin
 from websockets.asyncio.client import connect
 from websockets.exceptions import ConnectionClosed, InvalidStatus, InvalidURI
 
+from griptape_nodes.api_client.blob_spool import BLOB_REFERENCE_KEY, BlobSpoolError
+from griptape_nodes.retained_mode.events.event_codec import get_event_codec
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Awaitable, Callable
     from types import TracebackType
 
+    from griptape_nodes.api_client.blob_spool import BlobSpool
+
 logger = logging.getLogger("griptape_nodes_client")
 
 # Payload size (in bytes) above which a warning is logged before sending.
@@ -52,14 +56,18 @@ class Client:
         self,
         api_key: str | None = None,
         url: str | None = None,
+        blob_spool: BlobSpool | None = None,
     ):
         """Initialize Nodes API client.
 
         Args:
             api_key: API key for authentication (defaults to GT_CLOUD_API_KEY from SecretsManager)
             url: WebSocket URL to connect to (defaults to Nodes API endpoint)
+            blob_spool: Spool for large payload values. Only set this when every sender and
+                receiver on the topics used runs on this machine and uses the same spool.
         """
         self.url = url if url is not None else get_default_websocket_url()
+        self.blob_spool = blob_spool
 
         # Get API key from SecretsManager if not provided
         if api_key is None:
@@ -175,6 +183,21 @@ class Client:
         message = {"type": event_type, "payload": payload, "topic": topic}
         await self._send_message(message)
 
+    async def publish_serialized(self, event_type: str, payload_json: str, topic: str) -> None:
+        """Publish an event whose payload is already serialized, without decoding and re-encoding it.
+
+        Args:
+            event_type: Type of event to publish
+            payload_json: Event payload data as a JSON object string
+            topic: Topic to publish to
+        """
+        codec = get_event_codec()
+        serialized = f'{{"type": {codec.dumps(event_type)}, "payload": {payload_json}, "topic": {codec.dumps(topic)}}}'
+        await self._send_serialized(
+            serialized,
+            lambda: {"type": event_type, "payload": codec.loads(payload_json), "topic": topic},
+        )
+
     async def connect(self) -> None:
         """Connect to the WebSocket server and start receiving messages.
 
@@ -297,7 +320,9 @@ class Client:
         try:
             async for message in websocket:
                 try:
-                    data = json.loads(message)
+                    data = get_event_codec().loads(message)
+                    if self.blob_spool is not None and BLOB_REFERENCE_KEY in message:
+                        data = await asyncio.to_thread(self.blob_spool.rehydrate, data)
                     claimed = False
                     for f in self._message_filters:
                         if await f(data):
@@ -307,6 +332,8 @@ class Client:
                         await self._message_queue.put(data)
                 except json.JSONDecodeError:
                     logger.error("Failed to parse message: %s", message)
+                except BlobSpoolError as e:
+                    logger.error("Dropping message with an unreadable spooled value: %s", e)
                 except Exception as e:
                     logger.error("Error receiving message: %s", e)
         except asyncio.CancelledError:
@@ -319,6 +346,18 @@ class Client:
         Args:
             message: Message dictionary to send
 
+        Raises:
+            ConnectionError: If not connected
+        """
+        await self._send_serialized(get_event_codec().dumps(message), lambda: message)
+
+    async def _send_serialized(self, serialized: str, load_message: Callable[[], dict[str, Any]]) -> None:
+        """Send a serialized message through the WebSocket connection.
+
+        Args:
+            serialized: The message as JSON text
+            load_message: Returns the message as a dictionary. Only called for large messages.
+
         Raises:
             ConnectionError: If not connected
         """
@@ -326,7 +365,13 @@ class Client:
             msg = "Not connected to WebSocket"
             raise ConnectionError(msg)
 
-        serialized = json.dumps(message)
+        if len(serialized) <= LARGE_PAYLOAD_WARNING_THRESHOLD:
+            await self._send_text(serialized)
+            return
+
+        message = load_message()
+        if self.blob_spool is not None:
+            serialized = await asyncio.to_thread(self._spool_large_values, message, serialized)
         # TODO: Block large payloads https://github.com/griptape-ai/griptape-nodes/issues/4124
         if len(serialized) > LARGE_PAYLOAD_WARNING_THRESHOLD:
             logger.warning(
@@ -336,11 +381,44 @@ class Client:
                 message.get("payload", {}).get("result_type"),
                 len(serialized),
             )
+        await self._send_text(serialized)
+
+    async def _send_text(self, serialized: str) -> None:
         try:
             await self._websocket.send(serialized)
         except Exception as e:
             logger.error("Failed to send message: %s", e)
 
+    def _spool_large_values(self, message: dict[str, Any], serialized: str) -> str:
+        """Move large string values of a message into the blob spool and reserialize it.
+
+        Args:
+            message: Message dictionary to send
+            serialized: The message serialized without spooling
+
+        Returns:
+            The serialized message with large values replaced by spool references, or the
+            original serialization if nothing could be spooled.
+        """
+        if self.blob_spool is None:
+            return serialized
+        try:
+            spooled_message, spooled_count = self.blob_spool.externalize(message)
+        except OSError as e:
+            logger.warning("Failed to spool large WebSocket payload values, sending inline: %s", e)
+            return serialized
+        if not spooled_count:
+            return serialized
+        spooled = get_event_codec().dumps(spooled_message)
+        logger.debug(
+            "Spooled %d large value(s) of WebSocket message type=%s: %d -> %d bytes",
+            spooled_count,
+            message.get("type"),
+            len(serialized),
+            len(spooled),
+        )
+        return spooled
+
     async def _send_subscribe_command(self, topic: str) -> None:
         """Send subscribe command to server.
 
@@ -67,6 +67,7 @@ from griptape_nodes.retained_mode.events.node_events import (
 from griptape_nodes.retained_mode.events.parameter_events import (
     AddParameterToNodeRequest,
     AlterParameterDetailsRequest,
+    BatchSetParameterValuesRequest,
     GetConnectionsForParameterRequest,
     GetParameterDetailsRequest,
     GetParameterValueRequest,
@@ -117,6 +118,7 @@ FORWARDED_REQUEST_TYPES: frozenset[type[RequestPayload]] = frozenset(
         AddParameterToNodeRequest,
         RemoveParameterFromNodeRequest,
         SetParameterValueRequest,
+        BatchSetParameterValuesRequest,
         GetParameterDetailsRequest,
         AlterParameterDetailsRequest,
         GetParameterValueRequest,
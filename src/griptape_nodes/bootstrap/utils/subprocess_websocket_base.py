@@ -12,7 +12,7 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from griptape_nodes.api_client import Client
+from griptape_nodes.api_client import BlobSpool, Client
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
@@ -64,9 +64,14 @@ class SubprocessWebSocketBaseMixin:
 
         Creates and connects the WebSocket client.
         Subclasses should call this, then perform additional setup (subscribe, etc.).
+
+        The subprocess and its parent always run on the same machine, so the client moves
+        large payload values into a shared local spool instead of relaying them inline.
         """
         logger.info("Starting WebSocket client for session %s", self._session_id)
-        self._ws_client = Client()
+        blob_spool = BlobSpool()
+        await asyncio.to_thread(blob_spool.prune)
+        self._ws_client = Client(blob_spool=blob_spool)
         await self._ws_client.connect()
         logger.info("WebSocket client connected for session %s", self._session_id)
 
@@ -7,7 +7,6 @@ from subprocess executions back to the parent process using native asyncio.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 
 from griptape_nodes.bootstrap.utils.subprocess_websocket_base import SubprocessWebSocketBaseMixin, WebSocketMessage
@@ -65,8 +64,8 @@ class SubprocessWebSocketSenderMixin(SubprocessWebSocketBaseMixin):
                     continue
 
                 topic = message.topic or f"sessions/{self._session_id}/response"
-                payload_dict = json.loads(message.payload)
-                await self._ws_client.publish(message.event_type, payload_dict, topic)
+                # Payloads are already serialized events; splice them in rather than decoding and re-encoding
+                await self._ws_client.publish_serialized(message.event_type, message.payload, topic)
                 logger.debug("DELIVERED: %s event", message.event_type)
             except Exception as e:
                 logger.error("Error sending WebSocket message: %s", e)
@@ -0,0 +1,341 @@
+"""Pool of warm worker processes for subprocess workflow execution.
+
+Starting a workflow subprocess cold-starts a Python interpreter, the engine, and every
+library, which takes seconds. The pool instead keeps a few long-lived worker processes
+(see workflow_executors/utils/subprocess_worker_script.py) that pay that cost once and then
+run one workflow job at a time. Jobs travel to a worker as JSON lines on its stdin; the
+worker streams execution events over the job's websocket session just like a one-off
+subprocess, and reports the job's outcome as a prefixed JSON line on its stdout.
+
+Workers are reset between jobs and replaced with a fresh process after a number of jobs,
+when their memory grows past a ceiling, when a reset fails, or when a job is cancelled
+mid-run (the worker's state is unknown at that point).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from griptape_nodes.bootstrap.utils.python_subprocess_executor import _create_subprocess_env
+
+if TYPE_CHECKING:
+    from griptape_nodes.drivers.storage import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+# Marks stdout lines that carry protocol messages rather than worker log output
+WORKER_MESSAGE_PREFIX = "@@gtn-worker@@ "
+
+_WORKER_SCRIPT_PATH = Path(__file__).parent.parent / "workflow_executors" / "utils" / "subprocess_worker_script.py"
+
+
+class SubprocessWorkerPoolError(Exception):
+    """Exception raised when a pooled worker cannot run a workflow job."""
+
+
+@dataclass(kw_only=True, eq=False)
+class _Worker:
+    """A worker process and the bookkeeping for the job it is running."""
+
+    process: asyncio.subprocess.Process
+    ready: asyncio.Future[None]
+    pending_result: asyncio.Future[dict[str, Any]] | None = None
+    jobs_run: int = 0
+    output_tasks: list[asyncio.Task[None]] = field(default_factory=list)
+
+    def is_alive(self) -> bool:
+        return self.process.returncode is None
+
+
+class SubprocessWorkerPool:
+    """Runs workflow jobs on a fixed number of warm worker processes.
+
+    The worker processes' pipes belong to the event loop the pool was started on, so a pool
+    must only be used from that loop; keep one pool per loop.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        *,
+        max_jobs_per_worker: int = 50,
+        max_rss_mb: float | None = None,
+        env: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize the pool. Workers are started by start() or by the first job.
+
+        Args:
+            size: Number of worker processes (at least 1).
+            max_jobs_per_worker: Jobs a worker runs before it is replaced.
+            max_rss_mb: Worker memory in MB above which it is replaced after its current job.
+            env: Extra environment variables for the worker processes.
+        """
+        self.size = max(1, size)
+        self.max_jobs_per_worker = max(1, max_jobs_per_worker)
+        self.max_rss_mb = max_rss_mb
+        self._env = env or {}
+        # One entry per pool slot that is free. None marks a free slot whose worker failed to
+        # start; the next job to take it starts a worker itself. Created by start() on the
+        # running loop, which the pool is bound to from then on.
+        self._idle: asyncio.Queue[_Worker | None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._workers: set[_Worker] = set()
+        self._background_tasks: set[asyncio.Task[None]] = set()
+        self._started = False
+        self._closed = False
+        self._tmpdir: tempfile.TemporaryDirectory | None = None
+
+    async def start(self) -> None:
+        """Start the worker processes and wait for them to finish initializing.
+
+        Raises:
+            SubprocessWorkerPoolError: If the pool was started on a different event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._started:
+            if loop is not self._loop:
+                msg = "Subprocess worker pool was started on a different event loop"
+                raise SubprocessWorkerPoolError(msg)
+            return
+        self._started = True
+        self._loop = loop
+        self._idle = idle = asyncio.Queue()
+        self._tmpdir = tempfile.TemporaryDirectory()
+        workers = await asyncio.gather(*(self._spawn_worker() for _ in range(self.size)), return_exceptions=True)
+        for worker in workers:
+            if isinstance(worker, BaseException):
+                logger.error("Failed to start pooled workflow worker: %s", worker)
+                idle.put_nowait(None)
+            else:
+                idle.put_nowait(worker)
+
+    async def run_job(  # noqa: PLR0913
+        self,
+        *,
+        workflow_path: str,
+        flow_input: Any,
+        session_id: str,
+        storage_backend: StorageBackend,
+        pickle_control_flow_result: bool,
+        output_path: str | None = None,
+    ) -> None:
+        """Run a workflow on the next free worker and wait for it to finish.
+
+        If output_path is given, the worker writes the flow result there instead of sending it
+        over the websocket.
+
+        Raises:
+            SubprocessWorkerPoolError: If the pool is closed, the worker dies, or the workflow fails.
+        """
+        if self._closed:
+            msg = "Subprocess worker pool is closed"
+            raise SubprocessWorkerPoolError(msg)
+        await self.start()
+
+        worker = await self._acquire_worker()
+        stdin = cast("asyncio.StreamWriter", worker.process.stdin)
+
+        job_id = uuid.uuid4().hex
+        job = {
+            "job_id": job_id,
+            "workflow_path": workflow_path,
+            "flow_input": flow_input,
+            "session_id": session_id,
+            "storage_backend": storage_backend.value,
+            "pickle_control_flow_result": pickle_control_flow_result,
+            "output_path": output_path,
+        }
+        worker.pending_result = asyncio.get_running_loop().create_future()
+        try:
+            stdin.write((json.dumps(job) + "\n").encode())
+            await stdin.drain()
+            result = await worker.pending_result
+        except BaseException:
+            # The worker may be mid-job or dead; don't hand it to anyone else
+            self._replace_worker_in_background(worker)
+            raise
+        finally:
+            worker.pending_result = None
+
+        if result.get("job_id") != job_id:
+            # The worker is out of step with us; its next reply would go to the wrong job
+            self._replace_worker_in_background(worker)
+            msg = f"Pooled worker answered job '{result.get('job_id')}' while running job '{job_id}'"
+            raise SubprocessWorkerPoolError(msg)
+
+        worker.jobs_run += 1
+        self._release_worker(worker, result)
+        if result.get("error"):
+            msg = f"Workflow failed in pooled worker: {result['error']}"
+            raise SubprocessWorkerPoolError(msg)
+
+    async def close(self) -> None:
+        """Stop every worker process. Jobs still running fail with SubprocessWorkerPoolError."""
+        self._closed = True
+        for task in list(self._background_tasks):
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        await asyncio.gather(*(self._stop_worker(worker) for worker in list(self._workers)))
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+    def _get_idle_queue(self) -> asyncio.Queue[_Worker | None]:
+        if self._idle is None:
+            msg = "Subprocess worker pool has not been started"
+            raise SubprocessWorkerPoolError(msg)
+        return self._idle
+
+    async def _acquire_worker(self) -> _Worker:
+        """Take a free slot, starting a worker for it if its previous worker is gone."""
+        worker = await self._get_idle_queue().get()
+        if worker is not None and worker.is_alive():
+            return worker
+        if worker is not None:
+            # Died while idle
+            await self._stop_worker(worker)
+        try:
+            return await self._spawn_worker()
+        except Exception as e:
+            self._get_idle_queue().put_nowait(None)
+            msg = f"Failed to start a pooled worker: {e}"
+            raise SubprocessWorkerPoolError(msg) from e
+        except BaseException:
+            self._get_idle_queue().put_nowait(None)
+            raise
+
+    def _release_worker(self, worker: _Worker, result: dict[str, Any]) -> None:
+        rss_mb = result.get("rss_mb")
+        reason = None
+        if not worker.is_alive():
+            reason = "it exited"
+        elif not result.get("healthy", True):
+            reason = "it could not reset its state"
+        elif worker.jobs_run >= self.max_jobs_per_worker:
+            reason = f"it ran {worker.jobs_run} jobs"
+        elif self.max_rss_mb is not None and rss_mb is not None and rss_mb > self.max_rss_mb:
+            reason = f"its memory reached {rss_mb:.0f} MB"
+
+        if reason is None:
+            self._get_idle_queue().put_nowait(worker)
+            return
+        logger.info("Recycling pooled workflow worker (PID %s) because %s", worker.process.pid, reason)
+        self._replace_worker_in_background(worker)
+
+    def _replace_worker_in_background(self, worker: _Worker) -> None:
+        if self._closed:
+            return
+        task = asyncio.create_task(self._replace_worker(worker))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _replace_worker(self, worker: _Worker) -> None:
+        await self._stop_worker(worker)
+        try:
+            replacement = await self._spawn_worker()
+        except Exception:
+            logger.exception("Failed to start a replacement pooled workflow worker")
+            self._get_idle_queue().put_nowait(None)
+            return
+        if self._closed:
+            await self._stop_worker(replacement)
+            return
+        self._get_idle_queue().put_nowait(replacement)
+
+    async def _spawn_worker(self) -> _Worker:
+        subprocess_env = _create_subprocess_env({"GTN_CONFIG_ENABLE_WORKSPACE_FILE_WATCHING": "false", **self._env})
+        # Disable Python output buffering so we get real-time output
+        subprocess_env["PYTHONUNBUFFERED"] = "1"
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            str(_WORKER_SCRIPT_PATH),
+            cwd=self._tmpdir.name if self._tmpdir is not None else None,
+            env=subprocess_env,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        logger.info("Started pooled workflow worker with PID: %s", process.pid)
+
+        worker = _Worker(process=process, ready=asyncio.get_running_loop().create_future())
+        self._workers.add(worker)
+        worker.output_tasks = [
+            asyncio.create_task(self._read_stdout(worker)),
+            asyncio.create_task(self._read_stderr(worker)),
+        ]
+        try:
+            await worker.ready
+        except BaseException:
+            await self._stop_worker(worker)
+            raise
+        return worker
+
+    async def _read_stdout(self, worker: _Worker) -> None:
+        stream = worker.process.stdout
+        if stream is None:
+            return
+        while line := await stream.readline():
+            decoded_line = line.decode(errors="replace").rstrip()
+            if decoded_line.startswith(WORKER_MESSAGE_PREFIX):
+                self._handle_message(worker, json.loads(decoded_line.removeprefix(WORKER_MESSAGE_PREFIX)))
+            else:
+                _print_worker_output(decoded_line, sys.stdout)
+
+        # stdout closed: the worker exited
+        await worker.process.wait()
+        error = SubprocessWorkerPoolError(f"Pooled worker exited with return code {worker.process.returncode}")
+        if not worker.ready.done():
+            worker.ready.set_exception(error)
+        if worker.pending_result is not None and not worker.pending_result.done():
+            worker.pending_result.set_exception(error)
+
+    @staticmethod
+    async def _read_stderr(worker: _Worker) -> None:
+        stream = worker.process.stderr
+        if stream is None:
+            return
+        while line := await stream.readline():
+            _print_worker_output(line.decode(errors="replace").rstrip(), sys.stderr)
+
+    @staticmethod
+    def _handle_message(worker: _Worker, message: dict[str, Any]) -> None:
+        message_type = message.get("type")
+        if message_type == "ready":
+            if not worker.ready.done():
+                worker.ready.set_result(None)
+        elif message_type == "job_result":
+            if worker.pending_result is not None and not worker.pending_result.done():
+                worker.pending_result.set_result(message)
+        else:
+            logger.warning("Ignoring unknown message from pooled worker: %s", message_type)
+
+    async def _stop_worker(self, worker: _Worker) -> None:
+        self._workers.discard(worker)
+        if worker.is_alive():
+            if worker.process.stdin is not None:
+                # Closing stdin asks the worker to exit between jobs
+                worker.process.stdin.close()
+            worker.process.terminate()
+            try:
+                async with asyncio.timeout(5.0):
+                    await worker.process.wait()
+            except TimeoutError:
+                logger.warning(
+                    "Pooled worker (PID %s) did not terminate gracefully, force killing...", worker.process.pid
+                )
+                worker.process.kill()
+                await worker.process.wait()
+        await asyncio.gather(*worker.output_tasks, return_exceptions=True)
+
+
+def _print_worker_output(line: str, output_stream: Any) -> None:
+    # Dimmed, matching PythonSubprocessExecutor, to distinguish worker output from main process logs
+    print(f"\033[2m{line}\033[0m", file=output_stream, flush=True)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Self
 
 from griptape_nodes.bootstrap.utils.subprocess_websocket_sender import SubprocessWebSocketSenderMixin
@@ -22,6 +24,7 @@ from griptape_nodes.retained_mode.events.base_events import (
 )
 from griptape_nodes.retained_mode.events.execution_events import (
     ControlFlowCancelledEvent,
+    ControlFlowResolvedEvent,
     GriptapeEvent,
     StartFlowRequest,
     StartFlowResultFailure,
@@ -31,7 +34,6 @@ from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 if TYPE_CHECKING:
     from argparse import ArgumentParser, Namespace
     from collections.abc import Callable
-    from pathlib import Path
     from types import TracebackType
 
 logger = logging.getLogger(__name__)
@@ -47,6 +49,8 @@ class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSen
         *,
         project_file_path: Path | None = None,
         pickle_control_flow_result: bool = False,
+        broadcast_app_initialization: bool = True,
+        output_path: Path | None = None,
     ):
         super().__init__(
             storage_backend=storage_backend,
@@ -56,11 +60,16 @@ class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSen
         )
         self._init_websocket_sender(session_id)
         self._on_start_flow_result = on_start_flow_result
+        # Pooled workers initialize the engine once at startup and skip it for each workflow they run
+        self._broadcast_app_initialization = broadcast_app_initialization
+        # When set, the flow result is written here instead of being sent over the websocket
+        self._output_path = output_path
 
     async def __aenter__(self) -> Self:
         """Async context manager entry: initialize queue and broadcast app initialization."""
         GriptapeNodes.EventManager().initialize_queue()
-        await GriptapeNodes.EventManager().abroadcast_app_event(AppInitializationComplete())
+        if self._broadcast_app_initialization:
+            await GriptapeNodes.EventManager().abroadcast_app_event(AppInitializationComplete())
 
         logger.info("Setting up session %s", self._session_id)
         GriptapeNodes.SessionManager().save_session(self._session_id)
@@ -82,10 +91,26 @@ class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSen
 
         # TODO: Broadcast shutdown https://github.com/griptape-ai/griptape-nodes/issues/2149
 
-    async def _process_execution_event_async(self, event: ExecutionGriptapeNodeEvent) -> None:
+    async def _process_execution_event_async(self, event_json: str) -> None:
         """Process execution events asynchronously for real-time websocket emission."""
         logger.debug("REAL-TIME: Processing execution event for session %s", self._session_id)
-        self.send_event("execution_event", event.wrapped_event.json())
+        self.send_event("execution_event", event_json)
+
+    def _execution_event_json(self, event: ExecutionGriptapeNodeEvent) -> str:
+        """Serialize an execution event for the websocket.
+
+        With an output path, a ControlFlowResolvedEvent (whose output values can be large pickled
+        blobs) is written there in full, and the websocket copy carries only the End node name.
+        """
+        wrapped_event = event.wrapped_event
+        if self._output_path is None or not isinstance(wrapped_event.payload, ControlFlowResolvedEvent):
+            return wrapped_event.json()
+
+        self._output_path.write_text(wrapped_event.json(), encoding="utf-8")
+        stripped_payload = dataclasses.replace(
+            wrapped_event.payload, parameter_output_values={}, unique_parameter_uuid_to_values=None
+        )
+        return wrapped_event.model_copy(update={"payload": stripped_payload}).json()
 
     async def arun(
         self,
@@ -221,8 +246,9 @@ class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSen
                     task.add_done_callback(_handle_task_done)
                 elif isinstance(event, ExecutionGriptapeNodeEvent):
                     # Emit execution event via WebSocket
-                    self.send_event("execution_event", event.wrapped_event.json())
-                    task = asyncio.create_task(self._process_execution_event_async(event))
+                    event_json = self._execution_event_json(event)
+                    self.send_event("execution_event", event_json)
+                    task = asyncio.create_task(self._process_execution_event_async(event_json))
                     background_tasks.add(task)
                     task.add_done_callback(_handle_task_done)
                     is_flow_finished, error = await self._handle_execution_event(event, flow_name)
@@ -267,9 +293,15 @@ class LocalSessionWorkflowExecutor(LocalWorkflowExecutor, SubprocessWebSocketSen
             default=None,
             help="ID of the session to use",
         )
+        parser.add_argument(
+            "--output-file",
+            default=None,
+            help="Write the flow result to this file instead of sending it over the websocket",
+        )
 
     @classmethod
     def _cli_constructor_kwargs(cls, args: Namespace) -> dict[str, Any]:
         kwargs = super()._cli_constructor_kwargs(args)
         kwargs["session_id"] = args.session_id
+        kwargs["output_path"] = Path(args.output_file) if args.output_file is not None else None
         return kwargs
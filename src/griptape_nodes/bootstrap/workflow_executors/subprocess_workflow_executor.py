@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import shutil
 import tempfile
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Self
+from typing import IO, TYPE_CHECKING, Any, Self
 
 import anyio
+import portalocker
+from xdg_base_dirs import xdg_cache_home
 
 from griptape_nodes.bootstrap.utils.python_subprocess_executor import PythonSubprocessExecutor
 from griptape_nodes.bootstrap.utils.subprocess_websocket_listener import SubprocessWebSocketListenerMixin
@@ -22,15 +28,31 @@ from griptape_nodes.retained_mode.events.execution_events import (
     ControlFlowResolvedEvent,
     StartFlowRequest,
 )
+from griptape_nodes.utils.file_utils import ensure_private_directory
+from griptape_nodes.utils.workflow_value_store import WORKFLOW_VALUE_DIRS_ENV_VAR, get_workflow_values_dir
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable
     from types import TracebackType
 
+    from griptape_nodes.bootstrap.utils.subprocess_worker_pool import SubprocessWorkerPool
     from griptape_nodes.retained_mode.events.base_events import ResultPayload
 
 logger = logging.getLogger(__name__)
 
+_SUBPROCESS_SCRIPT_PATH = Path(__file__).parent / "utils" / "subprocess_script.py"
+_STAGED_WORKFLOW_FILE_NAME = "workflow.py"
+_STAGED_SCRIPT_FILE_NAME = "subprocess_script.py"
+# Runs hold a shared lock on this file in their staged directory; pruning skips directories it cannot lock
+_STAGED_IN_USE_FILE_NAME = ".in_use"
+# Least recently used staged directories beyond this many are removed when a new one is staged
+_MAX_STAGED_WORKFLOWS = 32
+# Times a run tries to claim a staged directory that other runs keep pruning or restaging
+_MAX_STAGING_ATTEMPTS = 3
+
+# (resolved path, mtime_ns, size) -> content hash, so an unchanged workflow file is not re-read every run
+_staged_workflow_hashes: dict[tuple[str, int, int], str] = {}
+
 
 class SubprocessWorkflowExecutorError(Exception):
     """Exception raised during subprocess workflow execution."""
@@ -43,6 +65,7 @@ class SubprocessWorkflowExecutor(WorkflowExecutor, PythonSubprocessExecutor, Sub
         on_start_flow_result: Callable[[ResultPayload], None] | None = None,
         on_event: Callable[[dict], None] | None = None,
         session_id: str | None = None,
+        worker_pool: SubprocessWorkerPool | None = None,
     ) -> None:
         WorkflowExecutor.__init__(self)
         PythonSubprocessExecutor.__init__(self)
@@ -50,6 +73,8 @@ class SubprocessWorkflowExecutor(WorkflowExecutor, PythonSubprocessExecutor, Sub
         self._workflow_path = workflow_path
         self._on_start_flow_result = on_start_flow_result
         self._stored_exception: SubprocessWorkflowExecutorError | None = None
+        # When set, runs go to a warm pooled worker instead of a freshly spawned interpreter
+        self._worker_pool = worker_pool
 
     async def __aenter__(self) -> Self:
         """Async context manager entry: start WebSocket listener."""
@@ -73,61 +98,123 @@ class SubprocessWorkflowExecutor(WorkflowExecutor, PythonSubprocessExecutor, Sub
         pickle_control_flow_result: bool = False,
         **kwargs: Any,  # noqa: ARG002
     ) -> None:
-        """Execute a workflow in a subprocess and wait for completion."""
-        script_path = Path(__file__).parent / "utils" / "subprocess_script.py"
+        """Execute a workflow in a subprocess and wait for completion.
 
+        The flow input and the flow result travel through files in a per-run scratch directory
+        rather than on the command line and over the websocket, so large values are not bound
+        by argv length or websocket message limits.
+        """
         with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_workflow_path = Path(tmpdir) / "workflow.py"
-            tmp_script_path = Path(tmpdir) / "subprocess_script.py"
-
-            try:
-                async with (
-                    await anyio.open_file(self._workflow_path, "rb") as src,
-                    await anyio.open_file(tmp_workflow_path, "wb") as dst,
-                ):
-                    await dst.write(await src.read())
-
-                async with (
-                    await anyio.open_file(script_path, "rb") as src,
-                    await anyio.open_file(tmp_script_path, "wb") as dst,
-                ):
-                    await dst.write(await src.read())
-            except Exception as e:
-                msg = f"Failed to copy workflow or script to temp directory: {e}"
-                logger.exception(msg)
-                raise SubprocessWorkflowExecutorError(msg) from e
-
-            args = [
-                "--json-input",
-                json.dumps(flow_input),
-                "--session-id",
-                self._session_id,
-                "--storage-backend",
-                storage_backend.value,
-                "--workflow-path",
-                str(tmp_workflow_path),
-            ]
-
-            if pickle_control_flow_result:
-                args.append("--pickle-control-flow-result")
-
-            try:
-                await self.execute_python_script(
-                    script_path=tmp_script_path,
-                    args=args,
-                    cwd=Path(tmpdir),
-                    env={
-                        "GTN_CONFIG_ENABLE_WORKSPACE_FILE_WATCHING": "false",
-                    },
+            input_path = Path(tmpdir) / "flow_input.json"
+            output_path = Path(tmpdir) / "flow_output.json"
+
+            if self._worker_pool is not None:
+                await self._arun_in_worker_pool(
+                    self._worker_pool,
+                    flow_input,
+                    storage_backend,
+                    pickle_control_flow_result=pickle_control_flow_result,
+                    output_path=output_path,
                 )
-            except Exception as e:
-                msg = f"Failed to execute subprocess script: {e}"
-                logger.exception(msg)
-                raise SubprocessWorkflowExecutorError(msg) from e
-            finally:
-                # Check if an exception was stored coming from the WebSocket
-                if self._stored_exception:
-                    raise self._stored_exception
+                await self._load_output_file(output_path)
+                return
+
+            # The staged directory's in-use lock is held until the subprocess exits
+            async with AsyncExitStack() as stack:
+                try:
+                    staged_dir = await stack.enter_async_context(_staged_workflow(Path(self._workflow_path)))
+                    await anyio.Path(input_path).write_text(json.dumps(flow_input), encoding="utf-8")
+                except Exception as e:
+                    msg = f"Failed to copy workflow or script to temp directory: {e}"
+                    logger.exception(msg)
+                    raise SubprocessWorkflowExecutorError(msg) from e
+
+                args = [
+                    "--json-input-file",
+                    str(input_path),
+                    "--output-file",
+                    str(output_path),
+                    "--session-id",
+                    self._session_id,
+                    "--storage-backend",
+                    storage_backend.value,
+                    "--workflow-path",
+                    str(staged_dir / _STAGED_WORKFLOW_FILE_NAME),
+                ]
+
+                if pickle_control_flow_result:
+                    args.append("--pickle-control-flow-result")
+
+                try:
+                    await self.execute_python_script(
+                        script_path=staged_dir / _STAGED_SCRIPT_FILE_NAME,
+                        args=args,
+                        cwd=Path(tmpdir),
+                        env={
+                            "GTN_CONFIG_ENABLE_WORKSPACE_FILE_WATCHING": "false",
+                            # The staged copy lives elsewhere; its stored values are next to the original
+                            WORKFLOW_VALUE_DIRS_ENV_VAR: _workflow_value_dirs(Path(self._workflow_path)),
+                        },
+                    )
+                except Exception as e:
+                    msg = f"Failed to execute subprocess script: {e}"
+                    logger.exception(msg)
+                    raise SubprocessWorkflowExecutorError(msg) from e
+                finally:
+                    # Check if an exception was stored coming from the WebSocket
+                    if self._stored_exception:
+                        raise self._stored_exception
+
+            await self._load_output_file(output_path)
+
+    async def _arun_in_worker_pool(
+        self,
+        worker_pool: SubprocessWorkerPool,
+        flow_input: Any,
+        storage_backend: StorageBackend,
+        *,
+        pickle_control_flow_result: bool,
+        output_path: Path,
+    ) -> None:
+        """Execute the workflow on a warm pooled worker and wait for completion.
+
+        The worker streams events over this executor's websocket session, so output and
+        failures are reported the same way as for a freshly spawned subprocess.
+        """
+        try:
+            await worker_pool.run_job(
+                workflow_path=self._workflow_path,
+                flow_input=flow_input,
+                session_id=self._session_id,
+                storage_backend=storage_backend,
+                pickle_control_flow_result=pickle_control_flow_result,
+                output_path=str(output_path),
+            )
+        except Exception as e:
+            msg = f"Failed to execute workflow in pooled worker: {e}"
+            logger.exception(msg)
+            raise SubprocessWorkflowExecutorError(msg) from e
+        finally:
+            # Check if an exception was stored coming from the WebSocket
+            if self._stored_exception:
+                raise self._stored_exception
+
+    async def _load_output_file(self, output_path: Path) -> None:
+        """Load the flow result the subprocess wrote to output_path, if it wrote one."""
+        output_file = anyio.Path(output_path)
+        if not await output_file.exists():
+            return
+        ex_event = ExecutionEvent.from_dict(data=json.loads(await output_file.read_text(encoding="utf-8")))
+        if isinstance(ex_event.payload, ControlFlowResolvedEvent):
+            self._set_output_from_resolved_event(ex_event.payload)
+
+    def _set_output_from_resolved_event(self, payload: ControlFlowResolvedEvent) -> None:
+        # Store both parameter output values and unique UUID values for deserialization
+        result = {
+            "parameter_output_values": payload.parameter_output_values,
+            "unique_parameter_uuid_to_values": payload.unique_parameter_uuid_to_values,
+        }
+        self.output = {payload.end_node_name: result}
 
     async def _handle_subprocess_event(self, event: dict) -> None:
         """Handle executor-specific events from the subprocess.
@@ -153,12 +240,9 @@ class SubprocessWorkflowExecutor(WorkflowExecutor, PythonSubprocessExecutor, Sub
 
         if isinstance(ex_event.payload, ControlFlowResolvedEvent):
             logger.info("Workflow execution completed successfully")
-            # Store both parameter output values and unique UUID values for deserialization
-            result = {
-                "parameter_output_values": ex_event.payload.parameter_output_values,
-                "unique_parameter_uuid_to_values": ex_event.payload.unique_parameter_uuid_to_values,
-            }
-            self.output = {ex_event.payload.end_node_name: result}
+            # When the subprocess writes its result to the output file, this copy has no values;
+            # _load_output_file replaces it once the subprocess exits.
+            self._set_output_from_resolved_event(ex_event.payload)
 
         if isinstance(ex_event.payload, ControlFlowCancelledEvent):
             logger.error("Workflow execution cancelled")
@@ -185,3 +269,188 @@ class SubprocessWorkflowExecutor(WorkflowExecutor, PythonSubprocessExecutor, Sub
                 self._on_start_flow_result(result_event.result)
         else:
             logger.warning("Ignoring result event for request type: %s", type(result_event.request).__name__)
+
+
+def _workflow_value_dirs(workflow_path: Path) -> str:
+    value_dirs = [str(get_workflow_values_dir(workflow_path.absolute()))]
+    inherited = os.getenv(WORKFLOW_VALUE_DIRS_ENV_VAR)
+    if inherited:
+        value_dirs.append(inherited)
+    return os.pathsep.join(value_dirs)
+
+
+@asynccontextmanager
+async def _staged_workflow(workflow_path: Path) -> AsyncIterator[Path]:
+    """Stage the workflow, keeping the staged directory from being pruned until the context exits."""
+    staged_dir, in_use_lock = await _stage_workflow(workflow_path)
+    try:
+        yield staged_dir
+    finally:
+        await anyio.to_thread.run_sync(_release_staged_workflow, in_use_lock)
+
+
+async def _stage_workflow(workflow_path: Path) -> tuple[Path, IO[bytes]]:
+    """Get a directory holding a copy of the workflow and the subprocess script.
+
+    Staged directories are keyed by a hash of both files' contents, so repeated runs of an
+    unchanged workflow (such as loop iterations) share one copy instead of copying per run.
+    They live in a per-user cache directory that only its owner can write to, and a reused
+    directory is hashed again and restaged if its files no longer match its name.
+
+    Returns:
+        The staged directory, and its in-use lock, which the caller releases with
+        _release_staged_workflow() once the run is over.
+    """
+    workflow_file = anyio.Path(workflow_path)
+    workflow_stat = await workflow_file.stat()
+    stat_key = (str(await workflow_file.resolve()), workflow_stat.st_mtime_ns, workflow_stat.st_size)
+    content_hash = _staged_workflow_hashes.get(stat_key)
+    if content_hash is None:
+        workflow_bytes = await workflow_file.read_bytes()
+        script_bytes = await anyio.Path(_SUBPROCESS_SCRIPT_PATH).read_bytes()
+        content_hash = _hash_staged_files(workflow_bytes, script_bytes)
+        _staged_workflow_hashes[stat_key] = content_hash
+    return await anyio.to_thread.run_sync(_claim_staged_workflow, workflow_path, content_hash)
+
+
+def _get_staged_workflows_root() -> Path:
+    return xdg_cache_home() / "griptape_nodes" / "staged_workflows"
+
+
+def _hash_staged_files(workflow_bytes: bytes, script_bytes: bytes) -> str:
+    return hashlib.sha256(workflow_bytes + b"\0" + script_bytes).hexdigest()
+
+
+def _ensure_private_directory(directory: Path) -> None:
+    """Create the directory readable and writable only by the current user, refusing one owned by anyone else."""
+    try:
+        ensure_private_directory(directory)
+    except PermissionError as e:
+        msg = f"Staged workflow directory is not usable: {e}"
+        raise SubprocessWorkflowExecutorError(msg) from e
+
+
+def _claim_staged_workflow(workflow_path: Path, content_hash: str) -> tuple[Path, IO[bytes]]:
+    """Lock the staged directory for a content hash as in use, staging it first if it is missing or altered."""
+    root = _get_staged_workflows_root()
+    _ensure_private_directory(root)
+    staged_dir = root / content_hash
+    for _ in range(_MAX_STAGING_ATTEMPTS):
+        in_use_lock = _lock_staged_dir(staged_dir)
+        if in_use_lock is not None:
+            if _staged_files_match(staged_dir, content_hash):
+                # Pruning removes the least recently used directories first
+                os.utime(staged_dir)
+                return staged_dir, in_use_lock
+            logger.warning("Staged workflow '%s' does not match its content hash; staging it again", staged_dir)
+            _release_staged_workflow(in_use_lock)
+            shutil.rmtree(staged_dir, ignore_errors=True)
+
+        workflow_bytes = workflow_path.read_bytes()
+        script_bytes = _SUBPROCESS_SCRIPT_PATH.read_bytes()
+        content_hash = _hash_staged_files(workflow_bytes, script_bytes)
+        staged_dir = root / content_hash
+        in_use_lock = _write_staged_workflow(staged_dir, workflow_bytes, script_bytes)
+        if in_use_lock is not None:
+            _prune_staged_workflows(keep=staged_dir)
+            return staged_dir, in_use_lock
+        # Another run staged the same content first; use theirs
+
+    msg = f"Could not stage workflow '{workflow_path}' in '{root}'"
+    raise SubprocessWorkflowExecutorError(msg)
+
+
+def _lock_staged_dir(staged_dir: Path) -> IO[bytes] | None:
+    """Take a shared in-use lock on a staged directory, or return None if it does not exist (any more)."""
+    lock_path = staged_dir / _STAGED_IN_USE_FILE_NAME
+    try:
+        in_use_lock = lock_path.open("ab")
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    portalocker.lock(in_use_lock, portalocker.LockFlags.SHARED)
+    # Pruning may have removed the directory while we waited for the lock
+    try:
+        is_current = os.path.samestat(os.fstat(in_use_lock.fileno()), lock_path.stat())
+    except OSError:
+        is_current = False
+    if not is_current:
+        _release_staged_workflow(in_use_lock)
+        return None
+    return in_use_lock
+
+
+def _release_staged_workflow(in_use_lock: IO[bytes]) -> None:
+    portalocker.unlock(in_use_lock)
+    in_use_lock.close()
+
+
+def _staged_files_match(staged_dir: Path, content_hash: str) -> bool:
+    try:
+        workflow_bytes = (staged_dir / _STAGED_WORKFLOW_FILE_NAME).read_bytes()
+        script_bytes = (staged_dir / _STAGED_SCRIPT_FILE_NAME).read_bytes()
+    except OSError:
+        return False
+    return _hash_staged_files(workflow_bytes, script_bytes) == content_hash
+
+
+def _write_staged_workflow(staged_dir: Path, workflow_bytes: bytes, script_bytes: bytes) -> IO[bytes] | None:
+    """Stage the files and return the new directory's in-use lock, or None if another run staged it first."""
+    # Write into a private directory and rename it into place, so concurrent runs never see a partial copy.
+    # Its in-use lock is taken before the rename so it cannot be pruned before we use it.
+    partial_dir = Path(tempfile.mkdtemp(dir=staged_dir.parent, prefix=".partial-"))
+    in_use_lock = None
+    try:
+        (partial_dir / _STAGED_WORKFLOW_FILE_NAME).write_bytes(workflow_bytes)
+        (partial_dir / _STAGED_SCRIPT_FILE_NAME).write_bytes(script_bytes)
+        in_use_lock = (partial_dir / _STAGED_IN_USE_FILE_NAME).open("ab")
+        portalocker.lock(in_use_lock, portalocker.LockFlags.SHARED)
+        partial_dir.rename(staged_dir)
+    except OSError:
+        if in_use_lock is not None:
+            _release_staged_workflow(in_use_lock)
+        shutil.rmtree(partial_dir, ignore_errors=True)
+        if not staged_dir.is_dir():
+            raise
+        return None
+    return in_use_lock
+
+
+def _prune_staged_workflows(keep: Path) -> None:
+    """Remove the least recently used staged directories beyond _MAX_STAGED_WORKFLOWS, skipping those in use."""
+    staged_dirs = []
+    for path in keep.parent.iterdir():
+        if path == keep or path.name.startswith("."):
+            continue
+        try:
+            staged_dirs.append((path.stat().st_mtime, path))
+        except OSError:
+            # Removed by another process while we were looking
+            continue
+    excess = len(staged_dirs) + 1 - _MAX_STAGED_WORKFLOWS
+    if excess <= 0:
+        return
+    staged_dirs.sort()
+    for _, stale_dir in staged_dirs:
+        if excess <= 0:
+            return
+        if _remove_unused_staged_dir(stale_dir):
+            excess -= 1
+
+
+def _remove_unused_staged_dir(staged_dir: Path) -> bool:
+    """Remove a staged directory unless a run holds its in-use lock. Returns whether it was removed."""
+    try:
+        in_use_lock = (staged_dir / _STAGED_IN_USE_FILE_NAME).open("ab")
+    except (FileNotFoundError, NotADirectoryError):
+        # Removed by another process while we were looking
+        return False
+    try:
+        portalocker.lock(in_use_lock, portalocker.LockFlags.EXCLUSIVE | portalocker.LockFlags.NON_BLOCKING)
+    except portalocker.LockException:
+        in_use_lock.close()
+        return False
+    try:
+        shutil.rmtree(staged_dir, ignore_errors=True)
+    finally:
+        _release_staged_workflow(in_use_lock)
+    return True
@@ -5,6 +5,7 @@ This script is intended to be run as a subprocess by the SubprocessWorkflowExecu
 
 import json
 from argparse import ArgumentParser
+from pathlib import Path
 
 from workflow import execute_workflow  # type: ignore[attr-defined]
 
@@ -23,13 +24,21 @@ def _main() -> None:
         default=json.dumps({}),
         help="JSON string representing the flow input",
     )
+    parser.add_argument(
+        "--json-input-file",
+        default=None,
+        help="Path to a JSON file with the flow input; takes precedence over --json-input",
+    )
     parser.add_argument(
         "--workflow-path",
         default=None,
         help="Path to the Griptape Nodes workflow file",
     )
     args = parser.parse_args()
-    flow_input = json.loads(args.json_input)
+    if args.json_input_file is not None:
+        flow_input = json.loads(Path(args.json_input_file).read_text(encoding="utf-8"))
+    else:
+        flow_input = json.loads(args.json_input)
 
     local_session_workflow_executor = LocalSessionWorkflowExecutor.from_cli_args(args)
 
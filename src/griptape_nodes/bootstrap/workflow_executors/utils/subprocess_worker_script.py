@@ -0,0 +1,113 @@
+"""Long-lived worker process that executes Griptape Nodes workflows on request.
+
+This script is started by the SubprocessWorkerPool. It initializes the engine and loads
+libraries once, then reads one JSON job per line from stdin, runs the job's workflow with a
+LocalSessionWorkflowExecutor (which streams events over the job's websocket session, exactly
+as a one-off subprocess run does), clears all object state, and reports the outcome on stdout.
+"""
+
+import asyncio
+import gc
+import importlib.util
+import json
+import logging
+import sys
+import traceback
+import uuid
+from pathlib import Path
+from typing import Any
+
+from griptape_nodes.bootstrap.utils.subprocess_worker_pool import WORKER_MESSAGE_PREFIX
+from griptape_nodes.bootstrap.workflow_executors.local_session_workflow_executor import LocalSessionWorkflowExecutor
+from griptape_nodes.common.iteration_scheduler import current_rss_mb
+from griptape_nodes.drivers.storage import StorageBackend
+from griptape_nodes.retained_mode.events.app_events import AppInitializationComplete
+from griptape_nodes.retained_mode.events.object_events import ClearAllObjectStateRequest
+from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+from griptape_nodes.utils import install_file_url_support
+
+# Install file:// URL support for httpx/requests in subprocess
+install_file_url_support()
+
+logger = logging.getLogger(__name__)
+
+
+def _send_message(message: dict[str, Any]) -> None:
+    sys.stdout.write(f"{WORKER_MESSAGE_PREFIX}{json.dumps(message)}\n")
+    sys.stdout.flush()
+
+
+async def _run_job(job: dict[str, Any]) -> None:
+    # Import the workflow under a unique module name so each job gets a fresh module
+    module_name = f"gtn_pooled_workflow_{uuid.uuid4().hex}"
+    spec = importlib.util.spec_from_file_location(module_name, job["workflow_path"])
+    if spec is None or spec.loader is None:
+        msg = f"Cannot import workflow from '{job['workflow_path']}'"
+        raise ImportError(msg)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+        workflow_executor = LocalSessionWorkflowExecutor(
+            session_id=job["session_id"],
+            storage_backend=StorageBackend(job["storage_backend"]),
+            broadcast_app_initialization=False,
+            output_path=Path(job["output_path"]) if job.get("output_path") else None,
+        )
+        await module.aexecute_workflow(
+            input=job["flow_input"],
+            workflow_executor=workflow_executor,
+            pickle_control_flow_result=job["pickle_control_flow_result"],
+        )
+    finally:
+        del sys.modules[module_name]
+
+
+async def _reset_engine() -> None:
+    """Delete everything the previous job created so the next job starts from a clean engine."""
+    clear_result = await GriptapeNodes.ahandle_request(ClearAllObjectStateRequest(i_know_what_im_doing=True))
+    if clear_result.failed():
+        msg = f"Failed to reset worker between jobs: {clear_result.result_details}"
+        raise RuntimeError(msg)
+    gc.collect()
+
+
+async def _main() -> None:
+    GriptapeNodes.EventManager().initialize_queue()
+    await GriptapeNodes.EventManager().abroadcast_app_event(AppInitializationComplete())
+    _send_message({"type": "ready"})
+
+    while True:
+        line = await asyncio.to_thread(sys.stdin.readline)
+        if not line:
+            # The pool closed our stdin; shut down
+            return
+
+        job = json.loads(line)
+        error = None
+        try:
+            await _run_job(job)
+        except Exception as e:
+            logger.exception("Pooled workflow job %s failed", job["job_id"])
+            error = "".join(traceback.format_exception_only(e)).strip()
+
+        healthy = True
+        try:
+            await _reset_engine()
+        except Exception:
+            logger.exception("Pooled worker could not be reset; asking to be replaced")
+            healthy = False
+
+        _send_message(
+            {
+                "type": "job_result",
+                "job_id": job["job_id"],
+                "error": error,
+                "healthy": healthy,
+                "rss_mb": current_rss_mb(),
+            }
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
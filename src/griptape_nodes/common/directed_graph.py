@@ -1,71 +1,118 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 logger = logging.getLogger("griptape_nodes")
 
 
 class DirectedGraph:
-    """Directed graph implementation using Python's graphlib for DAG operations."""
+    """Directed graph used for DAG operations.
+
+    Both predecessor and successor sets are kept for every node, so degree lookups and
+    node removal cost O(degree) rather than O(N). The set of leaf nodes (nodes with an
+    in-degree of 0, i.e. nodes whose dependencies have all been satisfied) is maintained
+    incrementally as edges are added and nodes are removed, so schedulers can find the
+    nodes that are ready to run without scanning the whole graph.
+    """
 
     def __init__(self) -> None:
         self._nodes: set[str] = set()
         self._predecessors: dict[str, set[str]] = {}
+        self._successors: dict[str, set[str]] = {}
+        self._leaves: set[str] = set()
 
     def __len__(self) -> int:
         """Return the number of nodes in the graph."""
         return len(self._nodes)
 
+    def __contains__(self, node: object) -> bool:
+        """Return True if the node is in the graph, without copying the node set."""
+        return node in self._nodes
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the nodes in the graph without copying the node set."""
+        return iter(self._nodes)
+
     def add_node(self, node_for_adding: str) -> None:
         """Add a node to the graph."""
+        if node_for_adding in self._nodes:
+            return
         self._nodes.add(node_for_adding)
-        if node_for_adding not in self._predecessors:
-            self._predecessors[node_for_adding] = set()
+        self._predecessors[node_for_adding] = set()
+        self._successors[node_for_adding] = set()
+        self._leaves.add(node_for_adding)
 
     def add_edge(self, from_node: str, to_node: str) -> None:
         """Add a directed edge from from_node to to_node."""
         self.add_node(from_node)
         self.add_node(to_node)
         self._predecessors[to_node].add(from_node)
+        self._successors[from_node].add(to_node)
+        self._leaves.discard(to_node)
 
     def nodes(self) -> set[str]:
         """Return all nodes in the graph."""
         return self._nodes.copy()
 
+    def leaf_nodes(self) -> set[str]:
+        """Return all nodes with an in-degree of 0 (nodes with no remaining dependencies)."""
+        return self._leaves.copy()
+
+    def predecessors(self, node: str) -> set[str]:
+        """Return the nodes with an edge into the given node."""
+        if node not in self._nodes:
+            msg = f"Node {node} not found in graph"
+            raise KeyError(msg)
+        return self._predecessors[node].copy()
+
+    def successors(self, node: str) -> set[str]:
+        """Return the nodes the given node has an edge into."""
+        if node not in self._nodes:
+            msg = f"Node {node} not found in graph"
+            raise KeyError(msg)
+        return self._successors[node].copy()
+
     def in_degree(self, node: str) -> int:
         """Return the in-degree of a node (number of incoming edges)."""
         if node not in self._nodes:
             msg = f"Node {node} not found in graph"
             raise KeyError(msg)
-        return len(self._predecessors.get(node, set()))
+        return len(self._predecessors[node])
 
     def out_degree(self, node: str) -> int:
         """Return the out-degree of a node (number of outgoing edges)."""
         if node not in self._nodes:
             msg = f"Node {node} not found in graph"
             raise KeyError(msg)
-        count = 0
-        for predecessors in self._predecessors.values():
-            if node in predecessors:
-                count += 1
-        return count
+        return len(self._successors[node])
 
     def remove_node(self, node: str) -> None:
-        """Remove a node and all its edges from the graph."""
+        """Remove a node and all its edges from the graph.
+
+        Any successor left without predecessors becomes a leaf.
+        """
         if node not in self._nodes:
             return
 
         self._nodes.remove(node)
+        self._leaves.discard(node)
 
-        # Remove this node from all predecessor lists
-        for predecessors in self._predecessors.values():
-            predecessors.discard(node)
+        for predecessor in self._predecessors.pop(node):
+            self._successors[predecessor].discard(node)
 
-        # Remove this node's predecessor entry
-        if node in self._predecessors:
-            del self._predecessors[node]
+        for successor in self._successors.pop(node):
+            successor_predecessors = self._predecessors[successor]
+            successor_predecessors.discard(node)
+            if not successor_predecessors:
+                self._leaves.add(successor)
 
     def clear(self) -> None:
         """Clear all nodes and edges from the graph."""
         self._nodes.clear()
         self._predecessors.clear()
+        self._successors.clear()
+        self._leaves.clear()
@@ -0,0 +1,204 @@
+"""Bounded, adaptive scheduling for parallel loop iterations."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+logger = logging.getLogger("griptape_nodes")
+
+# Resource readings are reused for this long, so a burst of completions does not re-sample each time.
+_SAMPLE_INTERVAL_S = 0.5
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def current_rss_mb() -> float | None:
+    """Get the engine process's current resident memory in MB, or None if it cannot be measured.
+
+    Peak RSS (getrusage's ru_maxrss) is deliberately not used as a fallback: it never goes down,
+    so one spike would keep memory-based throttling engaged for the rest of the process's life.
+    Callers treat None as "no memory pressure".
+    """
+    try:
+        # Linux: second field of statm is the resident page count
+        resident_pages = int(Path("/proc/self/statm").read_text().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / _BYTES_PER_MB
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        # No /proc (macOS, Windows): psutil reports current RSS when it is installed
+        import psutil  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+    try:
+        return psutil.Process().memory_info().rss / _BYTES_PER_MB
+    except psutil.Error:
+        return None
+
+
+def load_per_cpu() -> float | None:
+    """Get the one-minute system load average per CPU, or None if it cannot be measured on this platform."""
+    try:
+        one_minute_load = os.getloadavg()[0]
+    except (AttributeError, OSError):
+        # Windows
+        return None
+    return one_minute_load / (os.cpu_count() or 1)
+
+
+class IterationScheduler:
+    """Runs loop iterations with a bounded, adaptive number in flight.
+
+    Iterations are started lazily: an iteration's coroutine is only created once a slot is
+    free, so per-iteration setup (deserializing a flow copy, spawning a subprocess) never
+    happens for more iterations than the limit at once. Outcomes are yielded as iterations
+    finish, so callers can collect results and release per-iteration resources immediately.
+
+    The limit adapts to resource pressure. While the engine's resident memory or the system
+    load per CPU is over its threshold, the limit is halved on each sample (down to 1); once
+    pressure clears, it grows back by one per sample up to max_concurrency.
+
+    With cancel_on_failure, the first failed iteration cancels those still running and no
+    further iterations are started; their indices are recorded in skipped_iterations.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        max_rss_mb: float | None = None,
+        max_load_per_cpu: float | None = None,
+        cancel_on_failure: bool = False,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: Upper bound on iterations running at once (at least 1).
+            max_rss_mb: Engine resident memory in MB above which the limit backs off. None disables the check.
+            max_load_per_cpu: Load average per CPU above which the limit backs off. None disables the check.
+            cancel_on_failure: Whether the first failed iteration stops the rest.
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_rss_mb = max_rss_mb
+        self.max_load_per_cpu = max_load_per_cpu
+        self.cancel_on_failure = cancel_on_failure
+        self.skipped_iterations: list[int] = []
+        self._limit = self.max_concurrency
+        self._last_sample_time: float | None = None
+
+    @property
+    def concurrency_limit(self) -> int:
+        """The number of iterations currently allowed to run at once."""
+        return self._limit
+
+    async def run(
+        self,
+        iteration_indices: Iterable[int],
+        run_iteration: Callable[[int], Awaitable[Any]],
+        *,
+        is_failure: Callable[[Any], bool] | None = None,
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """Run iterations and yield (iteration_index, outcome) as each one finishes.
+
+        The outcome is run_iteration's return value, or the exception it raised. Closing the
+        generator early cancels any iterations still running.
+
+        Args:
+            iteration_indices: Iterations to run, started in this order.
+            run_iteration: Creates the coroutine for one iteration.
+            is_failure: Decides whether a returned value counts as a failure for cancel_on_failure.
+                Raised exceptions always count.
+        """
+        pending = iter(iteration_indices)
+        running: dict[asyncio.Task[Any], int] = {}
+        stopped = False
+        try:
+            while True:
+                if not stopped:
+                    self._adapt_limit()
+                    self._start_iterations(pending, running, run_iteration)
+                if not running:
+                    return
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=running.__getitem__):
+                    iteration_index = running.pop(task)
+                    exception = asyncio.CancelledError() if task.cancelled() else task.exception()
+                    outcome = exception if exception is not None else task.result()
+                    failed = exception is not None or (is_failure is not None and is_failure(outcome))
+                    if failed and self.cancel_on_failure and not stopped:
+                        stopped = True
+                        await self._stop_remaining(iteration_index, pending, running, done)
+                    yield iteration_index, outcome
+        finally:
+            await self._cancel_tasks(running)
+
+    def _start_iterations(
+        self,
+        pending: Iterator[int],
+        running: dict[asyncio.Task[Any], int],
+        run_iteration: Callable[[int], Awaitable[Any]],
+    ) -> None:
+        while len(running) < self._limit:
+            iteration_index = next(pending, None)
+            if iteration_index is None:
+                return
+            running[asyncio.ensure_future(run_iteration(iteration_index))] = iteration_index
+
+    async def _stop_remaining(
+        self,
+        failed_iteration: int,
+        pending: Iterator[int],
+        running: dict[asyncio.Task[Any], int],
+        done: set[asyncio.Task[Any]],
+    ) -> None:
+        """Cancel the running iterations (except those already done) and skip the ones not yet started."""
+        logger.warning("Loop iteration %d failed; cancelling the remaining iterations", failed_iteration)
+        in_flight = {task: index for task, index in running.items() if task not in done}
+        for task in in_flight:
+            del running[task]
+        await self._cancel_tasks(in_flight)
+        self.skipped_iterations.extend(sorted(in_flight.values()))
+        self.skipped_iterations.extend(pending)
+
+    @staticmethod
+    async def _cancel_tasks(tasks: dict[asyncio.Task[Any], int]) -> None:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _adapt_limit(self) -> None:
+        if self.max_rss_mb is None and self.max_load_per_cpu is None:
+            return
+        now = time.monotonic()
+        if self._last_sample_time is not None and now - self._last_sample_time < _SAMPLE_INTERVAL_S:
+            return
+        self._last_sample_time = now
+
+        if self._is_under_pressure():
+            new_limit = max(1, self._limit // 2)
+            if new_limit != self._limit:
+                logger.debug("Reducing loop iteration concurrency from %d to %d", self._limit, new_limit)
+            self._limit = new_limit
+        elif self._limit < self.max_concurrency:
+            self._limit += 1
+
+    def _is_under_pressure(self) -> bool:
+        if self.max_rss_mb is not None:
+            rss_mb = current_rss_mb()
+            if rss_mb is not None and rss_mb > self.max_rss_mb:
+                return True
+        if self.max_load_per_cpu is not None:
+            load = load_per_cpu()
+            if load is not None and load > self.max_load_per_cpu:
+                return True
+        return False
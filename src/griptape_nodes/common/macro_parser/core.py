@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -34,6 +36,45 @@ if TYPE_CHECKING:
 # instant, with headroom for future authoring.
 MAX_OPTIONAL_VARIABLES_FOR_REVERSE_MATCH = 5
 
+# Number of distinct templates whose parsed segments are kept. Templates come
+# from project configuration and node parameters, so the working set is small,
+# but ParsedMacro is constructed for every token resolution and path match.
+_PARSED_TEMPLATE_CACHE_SIZE = 1024
+
+# Number of distinct static-text skeletons whose prefilter regexes are kept
+# (see `_compile_static_skeleton`).
+_STATIC_SKELETON_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=_PARSED_TEMPLATE_CACHE_SIZE)
+def _parse_template(template: str) -> tuple[ParsedSegment, ...]:
+    """Parse a template into segments, caching the result per template string.
+
+    Segments are never mutated after parsing, so instances built from the
+    same template share them. Syntax errors are not cached and re-raise on
+    every call.
+    """
+    segments = parse_segments(template)
+    if not segments:
+        segments.append(ParsedStaticValue(text=""))
+    return tuple(segments)
+
+
+@functools.lru_cache(maxsize=_STATIC_SKELETON_CACHE_SIZE)
+def _compile_static_skeleton(skeleton: tuple[str | None, ...]) -> re.Pattern[str]:
+    """Compile a regex matching any path that contains a skeleton's static text in order.
+
+    Args:
+        skeleton: Static texts in template order, with None for each run of
+            unresolved variables.
+
+    Returns:
+        A pattern whose fullmatch() succeeds iff the static texts appear in
+        order, anchored at the start and end where the template has no
+        variable there.
+    """
+    return re.compile("".join(".*?" if text is None else re.escape(text) for text in skeleton), re.DOTALL)
+
 
 @dataclass
 class ParsedMacro:
@@ -48,7 +89,7 @@ class ParsedMacro:
     def __post_init__(self) -> None:
         """Parse the macro template string, validating syntax."""
         try:
-            segments = parse_segments(self.template)
+            segments = _parse_template(self.template)
         except MacroSyntaxError as err:
             msg = f"Attempted to parse template string '{self.template}'. Failed due to: {err}"
             raise MacroSyntaxError(
@@ -57,9 +98,7 @@ class ParsedMacro:
                 error_position=err.error_position,
             ) from err
 
-        if not segments:
-            segments.append(ParsedStaticValue(text=""))
-        self.segments = segments
+        self.segments = list(segments)
 
     def get_variables(self) -> set[VariableInfo]:
         """Extract all VariableInfo from parsed segments."""
@@ -233,21 +272,32 @@ class ParsedMacro:
             )
             raise MacroSyntaxError(msg, failure_reason=MacroParseFailureReason.TOO_MANY_OPTIONAL_VARIABLES)
 
-        # STEP 2: Zero-optional fast path — the template's ambiguity is only
+        # STEP 2: Resolve known variables to static text once; every attempt
+        # below starts from these segments. Unbound variables (required and
+        # optional) stay as the original `ParsedVariable` objects.
+        resolved_segments = self._resolve_known_segments(known_variables, secrets_manager)
+
+        # STEP 3: Prefilter. Every match contains the template's static text
+        # (including resolved known variables) in order, so a single regex pass
+        # rejects unrelated paths before any extraction attempt. This is what
+        # keeps directory scans cheap: most scanned names fail here.
+        skeleton = _compile_static_skeleton(self._static_skeleton(resolved_segments))
+        if skeleton.fullmatch(path) is None:
+            return None
+
+        # STEP 4: Zero-optional fast path — the template's ambiguity is only
         # about which optionals emitted. With none, one extraction attempt
         # suffices (no round-trip search needed).
         if not optional_unbound:
-            partial = partial_resolve(self.template, self.segments, known_variables, secrets_manager)
-            if partial.is_fully_resolved():
-                if partial.to_string() == path:
-                    return self._merge_known_variables({}, known_variables)
-                return None
-            extracted = extract_unknown_variables(partial.segments, path)
+            if all(isinstance(seg, ParsedStaticValue) for seg in resolved_segments):
+                # The prefilter already compared the fully resolved text to the path
+                return self._merge_known_variables({}, known_variables)
+            extracted = extract_unknown_variables(resolved_segments, path)
             if extracted is None:
                 return None
             return self._merge_known_variables(extracted, known_variables)
 
-        # STEP 3: Enumerate 2^k combinations of emitted/omitted for the
+        # STEP 5: Enumerate 2^k combinations of emitted/omitted for the
         # optional-unbound variables, popcount-descending so we prefer the
         # answer that recovers the most information from the path. Bit i in
         # the mask corresponds to `optional_unbound[i]`: 1 = assume emitted
@@ -256,7 +306,10 @@ class ParsedMacro:
         masks_by_popcount_desc = sorted(range(1 << num_optionals), key=lambda m: (-m.bit_count(), m))
 
         for mask in masks_by_popcount_desc:
-            candidate = self._try_optional_mask(mask, optional_unbound, path, known_variables, secrets_manager)
+            # Use identity (id) rather than equality: `ParsedVariable` isn't
+            # hashable, but each segment in `self.segments` is a distinct object.
+            emitted_ids = {id(optional_unbound[i]) for i in range(num_optionals) if mask & (1 << i)}
+            candidate = self._try_optional_mask(emitted_ids, resolved_segments, path, known_variables, secrets_manager)
             if candidate is not None:
                 return candidate
 
@@ -264,26 +317,23 @@ class ParsedMacro:
 
     def _try_optional_mask(
         self,
-        mask: int,
-        optional_unbound: list[ParsedVariable],
+        emitted_ids: set[int],
+        resolved_segments: list[ParsedSegment],
         path: str,
         known_variables: MacroVariables,
         secrets_manager: SecretsManager | None,
     ) -> dict[VariableInfo, str | int] | None:
         """Attempt reverse-match with a specific emitted/omitted combination.
 
-        Bit ``i`` of ``mask`` decides ``optional_unbound[i]``: 1 → keep the
-        segment (assume the value is in ``path``), 0 → drop it (assume the
-        author omitted the whole slot).
+        Optional unbound variables whose ``id()`` is in ``emitted_ids`` are
+        kept (assume the value is in ``path``); the rest are dropped (assume
+        the author omitted the whole slot).
 
         Returns the extracted variable dict on success (extraction produced
         values AND the forward round-trip resolves back to ``path``
         byte-for-byte), else ``None``.
         """
-        # Use identity (id) rather than equality: `ParsedVariable` isn't
-        # hashable, but each segment in `self.segments` is a distinct object.
-        emitted_ids = {id(optional_unbound[i]) for i in range(len(optional_unbound)) if mask & (1 << i)}
-        attempt_segments = self._build_attempt_segments(emitted_ids, known_variables, secrets_manager)
+        attempt_segments = self._build_attempt_segments(emitted_ids, resolved_segments)
 
         try:
             extracted = extract_unknown_variables(attempt_segments, path)
@@ -304,33 +354,54 @@ class ParsedMacro:
 
         return self._merge_known_variables(extracted, known_variables)
 
-    def _build_attempt_segments(
+    def _resolve_known_segments(
         self,
-        emitted_ids: set[int],
         known_variables: MacroVariables,
         secrets_manager: SecretsManager | None,
     ) -> list[ParsedSegment]:
-        """Materialize the segment list for one emitted/omitted attempt.
+        """Resolve known variables to static text, keeping unbound variables as-is.
 
-        - Static segments pass through.
-        - Known variables resolve to static text.
-        - Required unbound variables stay as ``ParsedVariable`` for extraction.
-        - Optional unbound variables stay if their ``id()`` is in
-          ``emitted_ids``, else drop entirely.
+        Known optional variables that resolve to nothing are dropped.
         """
-        attempt_segments: list[ParsedSegment] = []
+        resolved_segments: list[ParsedSegment] = []
         for segment in self.segments:
-            if not isinstance(segment, ParsedVariable):
-                attempt_segments.append(segment)
-                continue
-            if segment.info.name in known_variables:
+            if isinstance(segment, ParsedVariable) and segment.info.name in known_variables:
                 resolved = resolve_variable(segment, known_variables, secrets_manager)
                 if resolved is not None:
-                    attempt_segments.append(ParsedStaticValue(text=resolved))
+                    resolved_segments.append(ParsedStaticValue(text=resolved))
                 continue
-            if segment.info.is_required or id(segment) in emitted_ids:
-                attempt_segments.append(segment)
-        return attempt_segments
+            resolved_segments.append(segment)
+        return resolved_segments
+
+    @staticmethod
+    def _static_skeleton(resolved_segments: list[ParsedSegment]) -> tuple[str | None, ...]:
+        """Reduce segments to their static texts, with None for each run of variables."""
+        skeleton: list[str | None] = []
+        for segment in resolved_segments:
+            if isinstance(segment, ParsedStaticValue):
+                previous = skeleton[-1] if skeleton else None
+                if previous is not None:
+                    skeleton[-1] = previous + segment.text
+                else:
+                    skeleton.append(segment.text)
+            elif not skeleton or skeleton[-1] is not None:
+                skeleton.append(None)
+        return tuple(skeleton)
+
+    @staticmethod
+    def _build_attempt_segments(emitted_ids: set[int], resolved_segments: list[ParsedSegment]) -> list[ParsedSegment]:
+        """Materialize the segment list for one emitted/omitted attempt.
+
+        - Static segments (including resolved known variables) pass through.
+        - Required unbound variables stay as ``ParsedVariable`` for extraction.
+        - Optional unbound variables stay if their ``id()`` is in
+          ``emitted_ids``, else drop entirely.
+        """
+        return [
+            segment
+            for segment in resolved_segments
+            if not isinstance(segment, ParsedVariable) or segment.info.is_required or id(segment) in emitted_ids
+        ]
 
     def _extraction_round_trips(
         self,
@@ -3,15 +3,19 @@ from __future__ import annotations
 import asyncio
 import logging
 import pickle
+import weakref
+from contextlib import aclosing, nullcontext
 from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, cast
 
 import anyio
 
+from griptape_nodes.bootstrap.utils.subprocess_worker_pool import SubprocessWorkerPool
 from griptape_nodes.bootstrap.workflow_publishers.subprocess_workflow_publisher import SubprocessWorkflowPublisher
+from griptape_nodes.common.iteration_scheduler import IterationScheduler
 from griptape_nodes.drivers.storage.storage_backend import StorageBackend
 from griptape_nodes.exe_types import node_types
 from griptape_nodes.exe_types.base_iterative_nodes import (
@@ -117,11 +121,21 @@ from griptape_nodes.retained_mode.managers.event_manager import (
     EventSuppressionContext,
     EventTranslationContext,
 )
+from griptape_nodes.retained_mode.managers.settings import (
+    LOOP_ITERATIONS_CANCEL_ON_FAILURE_KEY,
+    LOOP_ITERATIONS_MAX_CONCURRENCY_KEY,
+    LOOP_ITERATIONS_MAX_LOAD_PER_CPU_KEY,
+    LOOP_ITERATIONS_MAX_RSS_MB_KEY,
+    SUBPROCESS_WORKER_POOL_MAX_JOBS_PER_WORKER_KEY,
+    SUBPROCESS_WORKER_POOL_MAX_RSS_MB_KEY,
+    SUBPROCESS_WORKER_POOL_SIZE_KEY,
+)
 from griptape_nodes.retained_mode.variable_types import VariableScope
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from griptape_nodes.exe_types.flow import ControlFlow
     from griptape_nodes.retained_mode.events.node_events import SerializedNodeCommands
     from griptape_nodes.retained_mode.managers.library_manager import LibraryManager
 
@@ -213,9 +227,128 @@ class LoopBodyNodes(NamedTuple):
     node_group_name: str | None
 
 
+class LocalIterationOutcome(NamedTuple):
+    """Result of running one loop iteration on its own local flow copy."""
+
+    success: bool
+    result_values: dict[int, Any]
+    last_iteration_values: dict[str, Any] | None
+
+
+class IterationFlowSetupError(TypeError):
+    """Raised when a loop iteration's flow copy cannot be created; fails the whole loop."""
+
+
+class IterationFlow(NamedTuple):
+    """A deserialized copy of a loop body that iterations run on."""
+
+    flow_name: str
+    node_name_mappings: dict[str, str]
+
+
+class IterationFlowPool:
+    """Lends deserialized copies of a packaged loop body to parallel iterations.
+
+    Deserializing a loop body replays every node, connection, and value command through the
+    request pipeline, which for small bodies costs more than running them. The pool instead
+    deserializes a copy only when every existing copy is in use and hands copies back out once
+    an iteration finishes, so a loop deserializes at most as many copies as it runs iterations
+    at once. Re-running a copy is what the sequential loop path does with its single copy: each
+    run starts a fresh control flow machine and overwrites the Start node's values.
+
+    A copy whose iteration failed or raised is deleted rather than reused, since its nodes may
+    be left mid-run. Call close() once the loop is done to delete the idle copies.
+    """
+
+    def __init__(
+        self, package_result: PackageNodesAsSerializedFlowResultSuccess, parent_flow: ControlFlow | None
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            package_result: The packaged loop body to deserialize copies of.
+            parent_flow: The flow to create copies in, so every copy sits at the same level.
+        """
+        self._package_result = package_result
+        self._parent_flow = parent_flow
+        self._idle: list[IterationFlow] = []
+        self.flows_created = 0
+
+    def acquire(self, iteration_index: int) -> IterationFlow:
+        """Take an idle copy of the loop body, deserializing a new one if none is idle.
+
+        Raises:
+            IterationFlowSetupError: If a new copy cannot be deserialized.
+        """
+        if self._idle:
+            return self._idle.pop()
+        iteration_flow = self._deserialize(iteration_index)
+        self.flows_created += 1
+        return iteration_flow
+
+    async def release(self, iteration_flow: IterationFlow, iteration_index: int, *, reusable: bool) -> None:
+        """Return a copy for the next iteration, or delete it if it is not reusable."""
+        if reusable:
+            self._idle.append(iteration_flow)
+        else:
+            await self._delete(iteration_flow.flow_name, iteration_index)
+
+    async def close(self) -> None:
+        """Delete every idle copy."""
+        idle, self._idle = self._idle, []
+        for iteration_flow in idle:
+            await self._delete(iteration_flow.flow_name, None)
+
+    def _deserialize(self, iteration_index: int) -> IterationFlow:
+        context_manager = GriptapeNodes.ContextManager()
+        # Suppress events during deserialization to prevent sending them to websockets
+        with EventSuppressionContext(GriptapeNodes.EventManager(), LOOP_EVENTS_TO_SUPPRESS):  # noqa: SIM117
+            # Other iterations may be running, so enter the parent flow explicitly rather than
+            # relying on whichever flow is current
+            with context_manager.flow(self._parent_flow) if self._parent_flow is not None else nullcontext():
+                deserialize_request = DeserializeFlowFromCommandsRequest(
+                    serialized_flow_commands=self._package_result.serialized_flow_commands
+                )
+                deserialize_result = GriptapeNodes.handle_request(deserialize_request)
+                if not isinstance(deserialize_result, DeserializeFlowFromCommandsResultSuccess):
+                    msg = f"Failed to deserialize flow for iteration {iteration_index}. Error: {deserialize_result.result_details}"
+                    raise IterationFlowSetupError(msg)
+
+                # Pop the deserialized flow from the context stack to prevent it from staying there
+                # Deserialization pushes the flow onto the stack, but we don't want iteration flows
+                # to remain on the stack after deserialization
+                if (
+                    context_manager.has_current_flow()
+                    and context_manager.get_current_flow().name == deserialize_result.flow_name
+                ):
+                    context_manager.pop_flow()
+
+        return IterationFlow(deserialize_result.flow_name, deserialize_result.node_name_mappings)
+
+    @staticmethod
+    async def _delete(flow_name: str, iteration_index: int | None) -> None:
+        # Suppress events during deletion to prevent sending them to websockets
+        with EventSuppressionContext(GriptapeNodes.EventManager(), {DeleteFlowResultSuccess, DeleteFlowResultFailure}):
+            delete_request = DeleteFlowRequest(flow_name=flow_name)
+            delete_result = await GriptapeNodes.ahandle_request(delete_request)
+            if not isinstance(delete_result, DeleteFlowResultSuccess):
+                logger.warning(
+                    "Failed to delete iteration flow '%s' (iteration %s): %s",
+                    flow_name,
+                    iteration_index,
+                    delete_result.result_details,
+                )
+
+
 class NodeExecutor:
     """Singleton executor that executes nodes dynamically."""
 
+    # One pool per event loop, created on first use when subprocess_worker_pool.size is set; a pool's
+    # queue and futures belong to its loop. Workers exit when the engine does.
+    _subprocess_worker_pools: ClassVar[weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, SubprocessWorkerPool]] = (
+        weakref.WeakKeyDictionary()
+    )
+
     def get_workflow_handler(self, library_name: str) -> LibraryManager.RegisteredEventHandler:
         """Get the PublishWorkflowRequest handler for a library, or None if not available."""
         library_manager = GriptapeNodes.LibraryManager()
@@ -571,6 +704,8 @@ class NodeExecutor:
             serialized_flow_commands=package_result.serialized_flow_commands,
             workflow_shape=package_result.workflow_shape,
             pickle_control_flow_result=True,
+            # Published and temporary copies are handed off or deleted as a single file
+            store_large_values_externally=False,
         )
 
         workflow_result = await GriptapeNodes.ahandle_request(workflow_file_request)
@@ -648,6 +783,7 @@ class NodeExecutor:
         subprocess_executor = SubprocessWorkflowExecutor(
             workflow_path=str(published_workflow_filename),
             on_event=on_event,
+            worker_pool=self._get_subprocess_worker_pool(),
         )
         try:
             async with subprocess_executor as executor:
@@ -673,6 +809,25 @@ class NodeExecutor:
             raise ValueError(msg)
         return my_subprocess_result
 
+    def _get_subprocess_worker_pool(self) -> SubprocessWorkerPool | None:
+        """Get the warm worker pool for subprocess runs, or None when the pool is disabled."""
+        config_manager = GriptapeNodes.ConfigManager()
+        pool_size = config_manager.get_config_value(SUBPROCESS_WORKER_POOL_SIZE_KEY, default=0, cast_type=int)
+        if not pool_size:
+            return None
+        loop = asyncio.get_running_loop()
+        pool = self._subprocess_worker_pools.get(loop)
+        if pool is None:
+            pool = SubprocessWorkerPool(
+                pool_size,
+                max_jobs_per_worker=config_manager.get_config_value(
+                    SUBPROCESS_WORKER_POOL_MAX_JOBS_PER_WORKER_KEY, default=50, cast_type=int
+                ),
+                max_rss_mb=config_manager.get_config_value(SUBPROCESS_WORKER_POOL_MAX_RSS_MB_KEY, cast_type=float),
+            )
+            self._subprocess_worker_pools[loop] = pool
+        return pool
+
     def _find_loop_entry_node(
         self, start_node: BaseIterativeStartNode, node_group_name: str | None, connections: Any
     ) -> EntryNodeParameter:
@@ -693,11 +848,11 @@ class NodeExecutor:
         if start_node.name not in connections.outgoing_index:
             return EntryNodeParameter(None, None)
 
-        exec_out_connections = connections.outgoing_index[start_node.name].get(exec_out_param_name, [])
+        exec_out_connections = connections.outgoing_index[start_node.name].get(exec_out_param_name, {})
         if not exec_out_connections:
             return EntryNodeParameter(None, None)
 
-        first_conn_id = exec_out_connections[0]
+        first_conn_id = next(iter(exec_out_connections))
         first_conn = connections.connections[first_conn_id]
 
         # If connecting to a NodeGroup, find the actual internal entry node
@@ -706,9 +861,9 @@ class NodeExecutor:
             # Find the internal connection from that proxy parameter to the actual entry node
             proxy_param = first_conn.target_parameter
             if node_group_name in connections.outgoing_index:
-                proxy_connections = connections.outgoing_index[node_group_name].get(proxy_param.name, [])
+                proxy_connections = connections.outgoing_index[node_group_name].get(proxy_param.name, {})
                 if proxy_connections:
-                    internal_conn_id = proxy_connections[0]
+                    internal_conn_id = next(iter(proxy_connections))
                     internal_conn = connections.connections[internal_conn_id]
                     if internal_conn.is_node_group_internal:
                         entry_control_node_name = internal_conn.target_node.name
@@ -2041,20 +2196,20 @@ class NodeExecutor:
         flow_manager = GriptapeNodes.FlowManager()
         connections = flow_manager.get_connections()
         # Use node.on_each.name instead of a literal so renames stay in sync.
-        # Control outputs are single-target (enforced in connections.py), so index 0 is the only connection.
-        on_each_conns = connections.outgoing_index.get(node.name, {}).get(node.on_each.name, [])
+        # Control outputs are single-target (enforced in connections.py), so the first is the only connection.
+        on_each_conns = connections.outgoing_index.get(node.name, {}).get(node.on_each.name, {})
         if not on_each_conns:
             return None, None
-        first_conn = connections.connections[on_each_conns[0]]
+        first_conn = connections.connections[next(iter(on_each_conns))]
         if first_conn.target_node.name == node.name:
             # on_each is a proxy port on the group boundary. When the user wires on_each → a child node,
             # two hops are stored: group→proxy (boundary edge) then proxy→child (internal edge).
             # Follow both to find the actual entry node inside the group.
             proxy_param = first_conn.target_parameter
-            proxy_conns = connections.outgoing_index.get(node.name, {}).get(proxy_param.name, [])
+            proxy_conns = connections.outgoing_index.get(node.name, {}).get(proxy_param.name, {})
             if proxy_conns:
-                # Control outputs are single-target, so index 0 is the only connection.
-                internal_conn = connections.connections[proxy_conns[0]]
+                # Control outputs are single-target, so the first is the only connection.
+                internal_conn = connections.connections[next(iter(proxy_conns))]
                 if internal_conn.is_node_group_internal:
                     return internal_conn.target_node.name, internal_conn.target_parameter.name
             return None, None
@@ -2777,6 +2932,17 @@ class NodeExecutor:
         Returns:
             Dict mapping iteration_index -> value for that iteration
         """
+        endflow_param_name = self._get_endflow_param_name_for_results(end_loop_node, package_flow_result_success)
+        return self._extract_iteration_result_values(
+            endflow_param_name, deserialized_flows, package_flow_result_success
+        )
+
+    def _get_endflow_param_name_for_results(
+        self,
+        end_loop_node: BaseIterativeEndNode | BaseIterativeNodeGroup,
+        package_flow_result_success: PackageNodesAsSerializedFlowResultSuccess,
+    ) -> str | None:
+        """Find the EndFlow parameter carrying each iteration's result, or None if the loop collects no results."""
         # Step 1: Get incoming connections TO the end_loop_node
         list_connections_request = ListConnectionsForNodeRequest(node_name=end_loop_node.name)
         list_connections_result = GriptapeNodes.handle_request(list_connections_request)
@@ -2799,10 +2965,20 @@ class NodeExecutor:
                 "No connections found to BaseIterativeEndNode '%s' new_item_to_add parameter. No results will be collected.",
                 end_loop_node.name,
             )
+        return endflow_param_name
+
+    def _extract_iteration_result_values(
+        self,
+        endflow_param_name: str | None,
+        deserialized_flows: list[tuple[int, str, dict[str, str]]],
+        package_flow_result_success: PackageNodesAsSerializedFlowResultSuccess,
+    ) -> dict[int, Any]:
+        """Extract the value of endflow_param_name from each iteration's EndFlow node."""
+        if endflow_param_name is None:
             return {}
 
         # Step 4: Extract values from each iteration's EndFlow node
-        packaged_end_node_name = end_node_mapping.node_name
+        packaged_end_node_name = self.get_node_parameter_mappings(package_flow_result_success, "end").node_name
         iteration_results = {}
         node_manager = GriptapeNodes.NodeManager()
 
@@ -2907,7 +3083,7 @@ class NodeExecutor:
 
         return last_iteration_values
 
-    async def _execute_loop_iterations_locally(  # noqa: C901, PLR0912, PLR0915
+    async def _execute_loop_iterations_locally(  # noqa: C901, PLR0915
         self,
         package_result: PackageNodesAsSerializedFlowResultSuccess,
         total_iterations: int,
@@ -2920,6 +3096,10 @@ class NodeExecutor:
         can implement their own execution strategies (cloud, remote, etc.) by
         creating similar methods with the same signature.
 
+        Iterations run through an IterationScheduler. Each iteration borrows a flow copy from an
+        IterationFlowPool, runs it, collects its results, and hands the copy back for the next
+        iteration, so the loop body is deserialized at most once per concurrent iteration.
+
         Args:
             package_result: The packaged flow with parameter mappings
             total_iterations: Number of iterations to run
@@ -2932,180 +3112,168 @@ class NodeExecutor:
             - successful_iterations: List of iteration indices that succeeded
             - last_iteration_values: Dict mapping parameter names -> values from last iteration
         """
-        # Step 1: Deserialize N flow instances from the serialized flow
-        # Save the current context and restore it after each deserialization to prevent
-        # iteration flows from becoming children of each other
-        deserialized_flows = []
+        # Capture the current flow so every iteration flow is created at the same level
+        # (not as children of each other)
         context_manager = GriptapeNodes.ContextManager()
-        saved_context_flow = context_manager.get_current_flow() if context_manager.has_current_flow() else None
-
-        # Suppress events during deserialization to prevent sending them to websockets
+        parent_flow = context_manager.get_current_flow() if context_manager.has_current_flow() else None
         event_manager = GriptapeNodes.EventManager()
-        with EventSuppressionContext(event_manager, LOOP_EVENTS_TO_SUPPRESS):
-            for iteration_index in range(total_iterations):
-                # Restore context before each deserialization to ensure all iteration flows
-                # are created at the same level (not as children of each other)
-                if saved_context_flow is not None:
-                    # Pop any flows that were pushed during previous iteration
-                    while (
-                        context_manager.has_current_flow() and context_manager.get_current_flow() != saved_context_flow
-                    ):
-                        context_manager.pop_flow()
+        packaged_start_node_name = self.get_node_parameter_mappings(package_result, "start").node_name
+        endflow_param_name = self._get_endflow_param_name_for_results(end_loop_node, package_result)
+        last_iteration_index = total_iterations - 1
 
-                deserialize_request = DeserializeFlowFromCommandsRequest(
-                    serialized_flow_commands=package_result.serialized_flow_commands
-                )
-                deserialize_result = GriptapeNodes.handle_request(deserialize_request)
-                if not isinstance(deserialize_result, DeserializeFlowFromCommandsResultSuccess):
-                    msg = f"Failed to deserialize flow for iteration {iteration_index}. Error: {deserialize_result.result_details}"
-                    raise TypeError(msg)
+        flow_pool = IterationFlowPool(package_result, parent_flow)
 
-                deserialized_flows.append(
-                    (iteration_index, deserialize_result.flow_name, deserialize_result.node_name_mappings)
+        async def run_single_iteration(iteration_index: int) -> LocalIterationOutcome:
+            """Run one iteration on a pooled flow copy and collect its results before releasing the copy."""
+            flow_name, node_name_mappings = flow_pool.acquire(iteration_index)
+            deserialized_flow = (iteration_index, flow_name, node_name_mappings)
+            reusable = False
+            try:
+                start_node_name = node_name_mappings.get(packaged_start_node_name)
+                await self._set_iteration_start_node_values(
+                    package_result, start_node_name, parameter_values_per_iteration[iteration_index], iteration_index
                 )
 
-                # Pop the deserialized flow from the context stack to prevent it from staying there
-                # Deserialization pushes the flow onto the stack, but we don't want iteration flows
-                # to remain on the stack after deserialization
-                if (
-                    context_manager.has_current_flow()
-                    and context_manager.get_current_flow().name == deserialize_result.flow_name
-                ):
-                    context_manager.pop_flow()
-        logger.info("Successfully deserialized %d flow instances for parallel execution", total_iterations)
-        # Step 2: Define the per-iteration coroutine
-        packaged_start_node_name = self.get_node_parameter_mappings(package_result, "start").node_name
+                # Suppress execution events during parallel iteration to prevent flooding websockets
+                with EventSuppressionContext(event_manager, EXECUTION_EVENTS_TO_SUPPRESS):
+                    start_subflow_request = StartLocalSubflowRequest(
+                        flow_name=flow_name,
+                        start_node=start_node_name,
+                        pickle_control_flow_result=False,
+                    )
+                    start_subflow_result = await GriptapeNodes.ahandle_request(start_subflow_request)
 
-        async def run_single_iteration(flow_name: str, iteration_index: int, start_node_name: str) -> tuple[int, bool]:
-            """Run a single iteration flow and return success status."""
-            # Suppress execution events during parallel iteration to prevent flooding websockets
-            with EventSuppressionContext(event_manager, EXECUTION_EVENTS_TO_SUPPRESS):
-                start_subflow_request = StartLocalSubflowRequest(
-                    flow_name=flow_name,
-                    start_node=start_node_name,
-                    pickle_control_flow_result=False,
+                # Extract values BEFORE the flow copy is deleted
+                result_values = self._extract_iteration_result_values(
+                    endflow_param_name, [deserialized_flow], package_result
                 )
-                start_subflow_result = await GriptapeNodes.ahandle_request(start_subflow_request)
+                last_iteration_values = None
+                if iteration_index == last_iteration_index:
+                    last_iteration_values = self.get_last_iteration_values_for_packaged_nodes(
+                        deserialized_flows=[deserialized_flow],
+                        package_result=package_result,
+                        total_iterations=total_iterations,
+                    )
                 success = isinstance(start_subflow_result, StartLocalSubflowResultSuccess)
-                return iteration_index, success
-
-        try:
-            # Step 3: Set input values on start nodes for each iteration
-            for iteration_index, _, node_name_mappings in deserialized_flows:
-                parameter_values = parameter_values_per_iteration[iteration_index]
+                reusable = success
+                return LocalIterationOutcome(
+                    success=success,
+                    result_values=result_values,
+                    last_iteration_values=last_iteration_values,
+                )
+            finally:
+                await flow_pool.release(
+                    IterationFlow(flow_name, node_name_mappings), iteration_index, reusable=reusable
+                )
 
-                # Get Start node mapping (index 0 in the list)
-                start_node_mapping = self.get_node_parameter_mappings(package_result, "start")
-                start_node_name = start_node_mapping.node_name
-                start_params = start_node_mapping.parameter_mappings
+        scheduler = self._create_iteration_scheduler()
+        logger.info(
+            "Running %d iterations locally for loop '%s' with up to %d at a time",
+            total_iterations,
+            end_loop_node.name,
+            scheduler.max_concurrency,
+        )
 
-                # Find the deserialized name for the Start node
-                deserialized_start_node_name = node_name_mappings.get(start_node_name)
-                if deserialized_start_node_name is None:
-                    logger.warning(
-                        "Could not find deserialized Start node (original: '%s') for iteration %d",
-                        start_node_name,
-                        iteration_index,
-                    )
-                    continue
+        iteration_results: dict[int, Any] = {}
+        successful_iterations = []
+        failed_iteration_errors = {}  # Map iteration_index -> error
+        last_iteration_values: dict[str, Any] = {}
 
-                # Set all parameter values on the deserialized Start node
-                for startflow_param_name in start_params:
-                    if startflow_param_name not in parameter_values:
+        iteration_outcomes = scheduler.run(
+            range(total_iterations), run_single_iteration, is_failure=lambda outcome: not outcome.success
+        )
+        try:
+            async with aclosing(iteration_outcomes):
+                async for iteration_index, outcome in iteration_outcomes:
+                    if isinstance(outcome, IterationFlowSetupError):
+                        raise outcome
+                    if isinstance(outcome, BaseException):
+                        failed_iteration_errors[iteration_index] = str(outcome)
                         continue
-
-                    value_to_set = parameter_values[startflow_param_name]
-
-                    set_value_request = SetParameterValueRequest(
-                        node_name=deserialized_start_node_name,
-                        parameter_name=startflow_param_name,
-                        value=value_to_set,
-                    )
-                    set_value_result = await GriptapeNodes.ahandle_request(set_value_request)
-                    if not isinstance(set_value_result, SetParameterValueResultSuccess):
-                        logger.warning(
-                            "Failed to set parameter '%s' on Start node '%s' for iteration %d: %s",
-                            startflow_param_name,
-                            deserialized_start_node_name,
-                            iteration_index,
-                            set_value_result.result_details,
-                        )
-
-            logger.info("Successfully set input values for %d iterations", total_iterations)
-            # Step 4: Run all iterations concurrently
-            iteration_tasks = [
-                run_single_iteration(
-                    flow_name,
-                    iteration_index,
-                    node_name_mappings.get(packaged_start_node_name),
-                )
-                for iteration_index, flow_name, node_name_mappings in deserialized_flows
-            ]
-            iteration_results = await asyncio.gather(*iteration_tasks, return_exceptions=True)
-
-            # Step 5: Collect successful and failed iterations
-            successful_iterations = []
-            failed_iteration_indices = []
-            failed_iteration_errors = {}  # Map iteration_index -> error
-
-            for idx, result in enumerate(iteration_results):
-                if isinstance(result, Exception):
-                    # Exception doesn't include iteration_index, use enumerate index
-                    failed_iteration_indices.append(idx)
-                    failed_iteration_errors[idx] = str(result)
-                    continue
-                if isinstance(result, tuple):
-                    iteration_index, success = result
-                    if success:
+                    iteration_results.update(outcome.result_values)
+                    if outcome.last_iteration_values is not None:
+                        last_iteration_values = outcome.last_iteration_values
+                    if outcome.success:
                         successful_iterations.append(iteration_index)
                     else:
-                        failed_iteration_indices.append(iteration_index)
                         failed_iteration_errors[iteration_index] = "Iteration failed"
+        finally:
+            await flow_pool.close()
+        logger.debug(
+            "Loop '%s' ran %d iterations on %d flow copies",
+            end_loop_node.name,
+            total_iterations,
+            flow_pool.flows_created,
+        )
 
-            if failed_iteration_indices:
-                logger.warning(
-                    "Loop execution: %d of %d parallel iterations failed. Results will contain None for failed iterations. Errors: %s",
-                    len(failed_iteration_indices),
-                    total_iterations,
-                    failed_iteration_errors,
-                )
+        for skipped_index in scheduler.skipped_iterations:
+            failed_iteration_errors[skipped_index] = "Cancelled after an earlier iteration failed"
 
-            # Step 6: Extract parameter values from iterations BEFORE cleanup
-            iteration_results = self.get_parameter_values_from_iterations(
-                end_loop_node=end_loop_node,
-                deserialized_flows=deserialized_flows,
-                package_flow_result_success=package_result,
+        if failed_iteration_errors:
+            logger.warning(
+                "Loop execution: %d of %d parallel iterations failed. Results will contain None for failed iterations. Errors: %s",
+                len(failed_iteration_errors),
+                total_iterations,
+                failed_iteration_errors,
             )
 
-            # Add None values for failed iterations that didn't produce any results
-            # (e.g., nested loops may fail but still produce partial output)
-            for failed_idx in failed_iteration_indices:
-                if failed_idx not in iteration_results:
-                    iteration_results[failed_idx] = None
+        # Add None values for failed iterations that didn't produce any results
+        # (e.g., nested loops may fail but still produce partial output)
+        for failed_idx in failed_iteration_errors:
+            if failed_idx not in iteration_results:
+                iteration_results[failed_idx] = None
 
-            # Step 7: Extract last iteration values BEFORE cleanup (flows deleted in finally block)
-            last_iteration_values = self.get_last_iteration_values_for_packaged_nodes(
-                deserialized_flows=deserialized_flows,
-                package_result=package_result,
-                total_iterations=total_iterations,
+        successful_iterations.sort()
+        return iteration_results, successful_iterations, last_iteration_values
+
+    @staticmethod
+    def _create_iteration_scheduler() -> IterationScheduler:
+        """Create a scheduler for parallel loop iterations from the loop_iterations settings."""
+        config_manager = GriptapeNodes.ConfigManager()
+        return IterationScheduler(
+            config_manager.get_config_value(LOOP_ITERATIONS_MAX_CONCURRENCY_KEY, default=8, cast_type=int),
+            max_rss_mb=config_manager.get_config_value(LOOP_ITERATIONS_MAX_RSS_MB_KEY, cast_type=float),
+            max_load_per_cpu=config_manager.get_config_value(LOOP_ITERATIONS_MAX_LOAD_PER_CPU_KEY, cast_type=float),
+            cancel_on_failure=config_manager.get_config_value(
+                LOOP_ITERATIONS_CANCEL_ON_FAILURE_KEY, default=False, cast_type=bool
+            ),
+        )
+
+    async def _set_iteration_start_node_values(
+        self,
+        package_result: PackageNodesAsSerializedFlowResultSuccess,
+        deserialized_start_node_name: str | None,
+        parameter_values: dict[str, Any],
+        iteration_index: int,
+    ) -> None:
+        """Set one iteration's input values on its deserialized Start node."""
+        start_node_mapping = self.get_node_parameter_mappings(package_result, "start")
+        if deserialized_start_node_name is None:
+            logger.warning(
+                "Could not find deserialized Start node (original: '%s') for iteration %d",
+                start_node_mapping.node_name,
+                iteration_index,
             )
+            return
 
-            return iteration_results, successful_iterations, last_iteration_values
+        for startflow_param_name in start_node_mapping.parameter_mappings:
+            if startflow_param_name not in parameter_values:
+                continue
 
-        finally:
-            # Step 8: Cleanup - delete all iteration flows
-            # Suppress events during deletion to prevent sending them to websockets
-            with EventSuppressionContext(event_manager, {DeleteFlowResultSuccess, DeleteFlowResultFailure}):
-                for iteration_index, flow_name, _ in deserialized_flows:
-                    delete_request = DeleteFlowRequest(flow_name=flow_name)
-                    delete_result = await GriptapeNodes.ahandle_request(delete_request)
-                    if not isinstance(delete_result, DeleteFlowResultSuccess):
-                        logger.warning(
-                            "Failed to delete iteration flow '%s' (iteration %d): %s",
-                            flow_name,
-                            iteration_index,
-                            delete_result.result_details,
-                        )
+            set_value_request = SetParameterValueRequest(
+                node_name=deserialized_start_node_name,
+                parameter_name=startflow_param_name,
+                value=parameter_values[startflow_param_name],
+            )
+            set_value_result = await GriptapeNodes.ahandle_request(set_value_request)
+            if not isinstance(set_value_result, SetParameterValueResultSuccess):
+                logger.warning(
+                    "Failed to set parameter '%s' on Start node '%s' for iteration %d: %s",
+                    startflow_param_name,
+                    deserialized_start_node_name,
+                    iteration_index,
+                    set_value_result.result_details,
+                )
 
     async def _execute_loop_iterations_via_subprocess(  # noqa: PLR0913
         self,
@@ -3189,7 +3357,7 @@ class NodeExecutor:
                         logger.exception("Iteration %d failed for loop '%s'", iteration_index, end_loop_node.name)
                         iteration_outputs.append((iteration_index, False, None))
             else:
-                # Execute all iterations concurrently
+                # Execute iterations concurrently, bounded by the loop iteration scheduler
                 # Get subflow_node reference for event updates (scoped outside the closure)
                 subflow_node = end_loop_node if isinstance(end_loop_node, SubflowNodeGroup) else None
 
@@ -3216,8 +3384,21 @@ class NodeExecutor:
                     else:
                         return iteration_index, True, subprocess_result
 
-                iteration_tasks = [run_single_iteration(i) for i in range(total_iterations)]
-                iteration_outputs = await asyncio.gather(*iteration_tasks)
+                scheduler = self._create_iteration_scheduler()
+                iteration_outputs = []
+                scheduled_outputs = scheduler.run(
+                    range(total_iterations), run_single_iteration, is_failure=lambda output: not output[1]
+                )
+                async with aclosing(scheduled_outputs):
+                    async for iteration_index, output in scheduled_outputs:
+                        if isinstance(output, BaseException):
+                            iteration_outputs.append((iteration_index, False, None))
+                        else:
+                            iteration_outputs.append(output)
+                iteration_outputs.extend(
+                    (iteration_index, False, None) for iteration_index in scheduler.skipped_iterations
+                )
+                iteration_outputs.sort(key=lambda output: output[0])
 
             # Extract results
             iteration_results, successful_iterations, last_iteration_values = (
@@ -3335,6 +3516,7 @@ class NodeExecutor:
             serialized_flow_commands=package_result.serialized_flow_commands,
             workflow_shape=package_result.workflow_shape,
             pickle_control_flow_result=pickle_control_flow_result,
+            store_large_values_externally=False,
         )
 
         workflow_result = await GriptapeNodes.ahandle_request(workflow_file_request)
@@ -3518,6 +3700,7 @@ class NodeExecutor:
             serialized_flow_commands=package_result.serialized_flow_commands,
             workflow_shape=package_result.workflow_shape,
             pickle_control_flow_result=True,
+            store_large_values_externally=False,
         )
 
         workflow_result = await GriptapeNodes.ahandle_request(workflow_file_request)
@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import NamedTuple
@@ -20,19 +21,39 @@ class ConnectionData(NamedTuple):
     parameter: Parameter
 
 
+# Ordered set of connection IDs. Dict keys keep insertion order (the first connection on a
+# parameter is the one that counts in restricted scenarios) and support O(1) removal.
+ConnectionIds = dict[int, None]
+
+
 @dataclass
 class Connections:
     # store connections as IDs
     connections: dict[int, Connection]
-    # Store in node.name:parameter.name to connection id
-    outgoing_index: dict[str, dict[str, list[int]]]
-    incoming_index: dict[str, dict[str, list[int]]]
+    # Store in node.name:parameter.name to connection ids
+    outgoing_index: dict[str, dict[str, ConnectionIds]]
+    incoming_index: dict[str, dict[str, ConnectionIds]]
 
     # In order to get those nodes that are dirty and resolve them
     def __init__(self) -> None:
         self.connections = {}
         self.outgoing_index = {}
         self.incoming_index = {}
+        # Creation order of each connection, so results gathered through the node indices can be
+        # returned in the same order as iterating self.connections
+        self._creation_order: dict[int, int] = {}
+        self._next_creation_order = 0
+        # Downstream reachability by starting node name, cleared whenever connections change
+        self._data_downstream_cache: dict[str, tuple[BaseNode, ...]] = {}
+        self._control_reachable_cache: dict[str, frozenset[str]] = {}
+
+    def clear(self) -> None:
+        """Remove every connection."""
+        self.connections.clear()
+        self.outgoing_index.clear()
+        self.incoming_index.clear()
+        self._creation_order.clear()
+        self.invalidate_reachability_cache()
 
     def add_connection(
         self,
@@ -64,14 +85,17 @@ class Connections:
             connection_id = id(connection)
             # Add connection to our dict here
             self.connections[connection_id] = connection
+            self._creation_order[connection_id] = self._next_creation_order
+            self._next_creation_order += 1
+            self.invalidate_reachability_cache()
             # Outgoing connection
-            self.outgoing_index.setdefault(source_node.name, {}).setdefault(source_parameter.name, []).append(
+            self.outgoing_index.setdefault(source_node.name, {}).setdefault(source_parameter.name, {})[
                 connection_id
-            )
+            ] = None
             # Incoming connection
-            self.incoming_index.setdefault(target_node.name, {}).setdefault(target_parameter.name, []).append(
+            self.incoming_index.setdefault(target_node.name, {}).setdefault(target_parameter.name, {})[
                 connection_id
-            )
+            ] = None
             return connection
         msg = "Connection not allowed because of multiple connections on the same parameter input or control output parameter"
         raise ValueError(msg)
@@ -105,7 +129,7 @@ class Connections:
             connection_list = connections_from_node.get(parameter.name, None)
 
         if connection_list:
-            connection_id = connection_list[0]
+            connection_id = next(iter(connection_list))
             connection = self.connections[connection_id]
             return connection
 
@@ -131,16 +155,16 @@ class Connections:
         # Check if the BaseIterativeEndNode's control parameter is a source for an outgoing connection
         if ParameterMode.OUTPUT in control_parameter.allowed_modes:
             outgoing_connections_for_node = self.outgoing_index.get(end_loop_node.name, {})
-            connection_ids_as_source = outgoing_connections_for_node.get(control_parameter.name, [])
+            connection_ids_as_source = outgoing_connections_for_node.get(control_parameter.name, {})
             if connection_ids_as_source:
-                connection_id = connection_ids_as_source[0]
+                connection_id = next(iter(connection_ids_as_source))
                 connection = self.connections.get(connection_id)
                 if connection:
                     return ConnectionData(connection.target_node, connection.target_parameter)
         elif ParameterMode.INPUT in control_parameter.allowed_modes:
             # Check if the BaseIterativeEndNode's control parameter is a target for an incoming connection
             incoming_connections_for_node = self.incoming_index.get(end_loop_node.name, {})
-            connection_ids_as_target = incoming_connections_for_node.get(control_parameter.name, [])
+            connection_ids_as_target = incoming_connections_for_node.get(control_parameter.name, {})
             if connection_ids_as_target:
                 for connection_id in connection_ids_as_target:
                     connection = self.connections.get(connection_id)
@@ -175,7 +199,7 @@ class Connections:
                 direction = Direction.UPSTREAM
         connections_from_node = connections.get(node.name, {})
 
-        connection_id = connections_from_node.get(parameter.name, [])
+        connection_id = connections_from_node.get(parameter.name, {})
         # TODO: https://github.com/griptape-ai/griptape-nodes/issues/859
         if not len(connection_id):
             return None
@@ -191,7 +215,7 @@ class Connections:
         ):
             msg = f"There should not be more than one {direction} connection here to/from {node.name}.{parameter.name}"
             raise ValueError(msg)
-        connection_id = connection_id[0]
+        connection_id = next(iter(connection_id))
         if connection_id in self.connections:
             connection = self.connections[connection_id]
             # We don't traverse internal NodeGroup connections when include_internal is False.
@@ -233,7 +257,7 @@ class Connections:
         # Remove from outgoing
         try:
             # use copy to prevent modifying the list while it's iterating
-            outgoing_parameter_connections = self.outgoing_index[source_node][source_parameter].copy()
+            outgoing_parameter_connections = list(self.outgoing_index[source_node][source_parameter])
         except Exception:
             logger.exception("Cannot remove connection that does not exist")
             return False
@@ -256,14 +280,14 @@ class Connections:
     ) -> None:
         # Now delete from EVERYWHERE!
         # delete the parameter from the node name dictionary
-        self.outgoing_index[source_node][source_param].remove(connection_id)
+        del self.outgoing_index[source_node][source_param][connection_id]
         if not self.outgoing_index[source_node][source_param]:
             del self.outgoing_index[source_node][source_param]
             # if the node name dictionary is empty, delete it!
             if not self.outgoing_index[source_node]:
                 del self.outgoing_index[source_node]
         # delete the parameter from the node name dictionary
-        self.incoming_index[target_node][target_param].remove(connection_id)
+        del self.incoming_index[target_node][target_param][connection_id]
         if not self.incoming_index[target_node][target_param]:
             del self.incoming_index[target_node][target_param]
             # if the node name dictionary is empty, delete it!
@@ -271,44 +295,120 @@ class Connections:
                 del self.incoming_index[target_node]
         # delete from the connections dictionary
         del self.connections[connection_id]
+        del self._creation_order[connection_id]
+        self.invalidate_reachability_cache()
 
     def get_connections_between_nodes(self, node_names: set[str]) -> list[Connection]:
         """Get all connections where both source and target are in the provided set.
 
+        Only the connections of the given nodes are visited, so the cost does not grow with
+        the number of connections elsewhere in the project.
+
         Args:
             node_names: Set of node names to check for internal connections
 
         Returns:
-            List of connections that have both endpoints in the node_names set
+            List of connections that have both endpoints in the node_names set, in creation order
         """
-        internal_connections = []
+        internal_connection_ids = [
+            conn_id
+            for node_name in node_names
+            for conn_id in self._iter_connection_ids(self.outgoing_index, node_name)
+            if self.connections[conn_id].target_node.name in node_names
+        ]
+        internal_connection_ids.sort(key=self._creation_order.__getitem__)
+        return [self.connections[conn_id] for conn_id in internal_connection_ids]
 
-        for node_name in node_names:
-            if node_name not in self.outgoing_index:
-                continue
+    def iter_outgoing_connections(self, node_name: str) -> Iterator[Connection]:
+        """Iterate over the outgoing connections of a node without building a list.
 
-            for connection_ids in self.outgoing_index[node_name].values():
-                for conn_id in connection_ids:
-                    if conn_id not in self.connections:
-                        continue
-                    conn = self.connections[conn_id]
+        The connections must not be added or removed while iterating.
+
+        Args:
+            node_name: Name of the node
+
+        Yields:
+            Each connection whose source is the node
+        """
+        for conn_id in self._iter_connection_ids(self.outgoing_index, node_name):
+            yield self.connections[conn_id]
+
+    def iter_incoming_connections(self, node_name: str) -> Iterator[Connection]:
+        """Iterate over the incoming connections of a node without building a list.
+
+        The connections must not be added or removed while iterating.
+
+        Args:
+            node_name: Name of the node
 
-                    if conn.target_node.name in node_names:
-                        internal_connections.append(conn)
+        Yields:
+            Each connection whose target is the node
+        """
+        for conn_id in self._iter_connection_ids(self.incoming_index, node_name):
+            yield self.connections[conn_id]
 
-        return internal_connections
+    @staticmethod
+    def _iter_connection_ids(index: dict[str, dict[str, ConnectionIds]], node_name: str) -> Iterable[int]:
+        for connection_ids in index.get(node_name, {}).values():
+            yield from connection_ids
 
     # Used to check data connections for all future nodes to be BAD!
-    def unresolve_future_nodes(self, node: BaseNode, _visited: set[str] | None = None) -> None:
-        # Recursively traverse downstream nodes, tracking visited nodes to avoid cycles.
-        if _visited is None:
-            _visited = set()
-        if node.name in _visited:
-            return
-        _visited.add(node.name)
+    def unresolve_future_nodes(self, node: BaseNode) -> None:
+        """Mark every resolved node downstream of a node's data outputs as unresolved.
+
+        Emits an event for each node whose resolution state changes. Nodes beyond an
+        already-unresolved intermediate node are still reached and unresolved.
+
+        Args:
+            node: The node whose downstream nodes are no longer valid
+        """
+        for target_node in self._get_data_downstream_nodes(node):
+            if target_node.state == NodeResolutionState.RESOLVED:
+                target_node.make_node_unresolved(
+                    current_states_to_trigger_change_event=set(
+                        {NodeResolutionState.RESOLVED, NodeResolutionState.RESOLVING}
+                    )
+                )
+
+    def invalidate_reachability_cache(self) -> None:
+        """Forget cached downstream reachability.
+
+        Called whenever connections change. Code that edits the indices directly (such as
+        renaming a node or parameter) must call this too.
+        """
+        self._data_downstream_cache.clear()
+        self._control_reachable_cache.clear()
 
-        # There are no outgoing connections from this node.
-        if node.name not in self.outgoing_index:
+    def _get_data_downstream_nodes(self, node: BaseNode) -> tuple[BaseNode, ...]:
+        """Get the nodes reachable from a node through data output connections, in depth-first order.
+
+        The node itself is only included if a cycle leads back to it.
+        """
+        cached = self._data_downstream_cache.get(node.name)
+        if cached is not None:
+            return cached
+
+        downstream: dict[str, BaseNode] = {}
+        expanded = {node.name}
+        # Walk with an explicit stack of iterators so long chains can't hit the recursion limit
+        stack = [self._iter_data_targets(node)]
+        while stack:
+            target_node = next(stack[-1], None)
+            if target_node is None:
+                stack.pop()
+                continue
+            downstream.setdefault(target_node.name, target_node)
+            if target_node.name not in expanded:
+                expanded.add(target_node.name)
+                stack.append(self._iter_data_targets(target_node))
+
+        result = tuple(downstream.values())
+        self._data_downstream_cache[node.name] = result
+        return result
+
+    def _iter_data_targets(self, node: BaseNode) -> Iterator[BaseNode]:
+        outgoing_for_node = self.outgoing_index.get(node.name)
+        if not outgoing_for_node:
             return
         for parameter in node.parameters:
             # If it is a data connection and has an OUTPUT type
@@ -316,27 +416,10 @@ class Connections:
             if (
                 ParameterMode.OUTPUT in parameter.allowed_modes
                 and ParameterTypeBuiltin.CONTROL_TYPE.value != parameter.output_type
-                and parameter.name in self.outgoing_index[node.name]
+                and parameter.name in outgoing_for_node
             ):
-                # A connection or connections exist
-                connections = self.outgoing_index[node.name][parameter.name]
-                # For each connection, check the next node and do all the same.
-                for connection_id in connections:
-                    if connection_id in self.connections:
-                        connection = self.connections[connection_id]
-                        target_node = connection.target_node
-                        # If that node is resolved, mark it unresolved.
-                        # Emit an event so clients know this node has changed resolution state.
-                        if target_node.state == NodeResolutionState.RESOLVED:
-                            target_node.make_node_unresolved(
-                                current_states_to_trigger_change_event=set(
-                                    {NodeResolutionState.RESOLVED, NodeResolutionState.RESOLVING}
-                                )
-                            )
-                        # Always continue traversal through downstream nodes so that
-                        # resolved nodes beyond an already-unresolved intermediate are
-                        # still reached and unresolved.
-                        self.unresolve_future_nodes(target_node, _visited)
+                for connection_id in outgoing_for_node[parameter.name]:
+                    yield self.connections[connection_id].target_node
 
     def get_outgoing_connections_to_node(self, node: BaseNode, to_node: BaseNode) -> dict[str, list[Connection]]:
         connections = {}
@@ -389,12 +472,7 @@ class Connections:
         Returns:
             List of all outgoing connections from the node
         """
-        connections = []
-        if node.name in self.outgoing_index:
-            for connection_ids in self.outgoing_index[node.name].values():
-                for conn_id in connection_ids:
-                    connections.append(self.connections[conn_id])  # noqa: PERF401, Keeping loop for understanding.
-        return connections
+        return list(self.iter_outgoing_connections(node.name))
 
     def get_all_incoming_connections(self, node: BaseNode) -> list[Connection]:
         """Get all incoming connections to a node.
@@ -405,51 +483,47 @@ class Connections:
         Returns:
             List of all incoming connections to the node
         """
-        connections = []
-        if node.name in self.incoming_index:
-            for connection_ids in self.incoming_index[node.name].values():
-                for conn_id in connection_ids:
-                    connections.append(self.connections[conn_id])  # noqa: PERF401, Keeping loop for understanding.
-        return connections
+        return list(self.iter_incoming_connections(node.name))
 
-    def is_node_in_forward_control_path(
-        self, start_node: BaseNode, target_node: BaseNode, visited: set[str] | None = None
-    ) -> bool:
+    def is_node_in_forward_control_path(self, start_node: BaseNode, target_node: BaseNode) -> bool:
         """Check if target_node is reachable from start_node through control flow connections.
 
         Args:
             start_node: The node to start traversal from
             target_node: The node to check if reachable
-            visited: Set of already visited node names (used internally for recursion)
 
         Returns:
             True if target_node is in the forward control path from start_node, False otherwise
         """
-        if visited is None:
-            visited = set()
+        return target_node.name in self._get_control_reachable_names(start_node)
 
-        if start_node.name in visited:
-            return False
-        visited.add(start_node.name)
-
-        # Check ALL outgoing control connections
-        # This handles IfElse nodes that have multiple possible control outputs
-        if start_node.name in self.outgoing_index:
-            for param_name, connection_ids in self.outgoing_index[start_node.name].items():
-                # Find the parameter to check if it's a control type
-                param = start_node.get_parameter_by_name(param_name)
-                if param and param.output_type == ParameterTypeBuiltin.CONTROL_TYPE.value:
-                    # This is a control parameter - check all its connections
-                    for connection_id in connection_ids:
-                        if connection_id in self.connections:
-                            connection = self.connections[connection_id]
-                            next_node = connection.target_node
-
-                            if next_node.name == target_node.name:
-                                return True
-
-                            # Recursively check the forward path
-                            if self.is_node_in_forward_control_path(next_node, target_node, visited):
-                                return True
+    def _get_control_reachable_names(self, start_node: BaseNode) -> frozenset[str]:
+        """Get the names of the nodes reachable from start_node through control connections.
 
-        return False
+        start_node itself is only included if a cycle leads back to it.
+        """
+        cached = self._control_reachable_cache.get(start_node.name)
+        if cached is not None:
+            return cached
+
+        reachable: set[str] = set()
+        expanded = {start_node.name}
+        to_visit = [start_node]
+        while to_visit:
+            current_node = to_visit.pop()
+            # Check ALL outgoing control connections
+            # This handles IfElse nodes that have multiple possible control outputs
+            for param_name, connection_ids in self.outgoing_index.get(current_node.name, {}).items():
+                param = current_node.get_parameter_by_name(param_name)
+                if not param or param.output_type != ParameterTypeBuiltin.CONTROL_TYPE.value:
+                    continue
+                for connection_id in connection_ids:
+                    next_node = self.connections[connection_id].target_node
+                    reachable.add(next_node.name)
+                    if next_node.name not in expanded:
+                        expanded.add(next_node.name)
+                        to_visit.append(next_node)
+
+        result = frozenset(reachable)
+        self._control_reachable_cache[start_node.name] = result
+        return result
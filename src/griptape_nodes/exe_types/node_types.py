@@ -1744,8 +1744,15 @@ class TrackedParameterOutputValues(dict[str, Any]):
             from griptape_nodes.retained_mode.events.parameter_events import AlterElementEvent
             from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
-            # Create event data using the parameter's to_event method
-            event_data = parameter.to_event(self._node)
+            # Send only what changed: the element's identity and its new value. The UI merges
+            # AlterElementEvent details into the element it already has, so the rest of the
+            # parameter (and its children) would just be re-sent unchanged on every write.
+            event_data: dict[str, Any] = {
+                "element_id": parameter.element_id,
+                "element_type": parameter.element_type,
+                "name": parameter.name,
+                "node_name": self._node.name,
+            }
 
             # When a PROPERTY|OUTPUT parameter contains a variable template (e.g.
             # "{SHOT}") and substitution ran during execution, the computed output
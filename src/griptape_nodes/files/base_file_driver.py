@@ -3,6 +3,27 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+# Default size of the chunks yielded by BaseFileDriver.stream()
+DEFAULT_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def validate_byte_range(offset: int, length: int | None) -> None:
+    """Validate a byte range passed to BaseFileDriver.read_range().
+
+    Raises:
+        ValueError: If offset is negative or length is negative
+    """
+    if offset < 0:
+        msg = f"Byte range offset must not be negative, got {offset}"
+        raise ValueError(msg)
+    if length is not None and length < 0:
+        msg = f"Byte range length must not be negative, got {length}"
+        raise ValueError(msg)
 
 
 class BaseFileDriver(ABC):
@@ -63,6 +84,67 @@ class BaseFileDriver(ABC):
             PermissionError: No permission to read location
         """
 
+    async def read_range(
+        self,
+        location: str,
+        offset: int,
+        length: int | None,
+        timeout: float,  # noqa: ASYNC109
+    ) -> bytes:
+        """Read a byte range from location.
+
+        The default implementation reads the whole location and slices it.
+        Drivers that can fetch a range directly override this.
+
+        Args:
+            location: The location to read from
+            offset: Index of the first byte to read
+            length: Maximum number of bytes to read (None reads to the end)
+            timeout: Timeout in seconds for the operation
+
+        Returns:
+            The bytes in the range (fewer than length if the location ends first)
+
+        Raises:
+            ValueError: Offset or length is negative
+            FileNotFoundError: Location does not exist
+            TimeoutError: Operation exceeded timeout
+            PermissionError: No permission to read location
+        """
+        validate_byte_range(offset, length)
+        content = await self.read(location, timeout)
+        end = None if length is None else offset + length
+        return content[offset:end]
+
+    async def stream(
+        self,
+        location: str,
+        timeout: float,  # noqa: ASYNC109
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read location as a stream of chunks.
+
+        The default implementation reads the whole location and yields it in
+        chunks. Drivers that can read incrementally override this so callers
+        never hold the whole file in memory.
+
+        Args:
+            location: The location to read from
+            timeout: Timeout in seconds for the operation
+            chunk_size: Maximum size of each yielded chunk
+
+        Yields:
+            The file contents, in order, in chunks of at most chunk_size bytes
+
+        Raises:
+            FileNotFoundError: Location does not exist
+            TimeoutError: Operation exceeded timeout
+            PermissionError: No permission to read location
+        """
+        content = await self.read(location, timeout)
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
     @abstractmethod
     async def exists(self, location: str) -> bool:
         """Check if location exists and is readable.
@@ -0,0 +1,162 @@
+"""Running size accounting for directories kept under a size budget.
+
+Enforcing a size budget used to walk the whole directory to measure it, and walk it again
+after every deleted file, which is quadratic in the number of files. DirectorySizeTracker
+walks a directory once, remembers each file's size and modification time, and keeps the
+total up to date as files are written and deleted through it, so later enforcement passes
+do not walk at all. Files changed behind the tracker's back are picked up by a fresh walk
+once the last one is older than rescan_interval.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from stat import S_ISREG
+
+logger = logging.getLogger("griptape_nodes")
+
+# Tracked totals older than this are refreshed with a new walk before enforcing a budget
+DEFAULT_RESCAN_INTERVAL_SECONDS = 300.0
+
+
+@dataclass
+class _DirectoryUsage:
+    total_size: int = 0
+    # File path -> (size in bytes, modification time)
+    files: dict[str, tuple[int, float]] = field(default_factory=dict)
+    scanned_at: float = 0.0
+
+
+def _scan_directory(directory: Path) -> _DirectoryUsage:
+    """Walk a directory once, recording every regular file (symlinks excluded)."""
+    usage = _DirectoryUsage(scanned_at=time.monotonic())
+    for root, _dirs, files in os.walk(directory):
+        for file_name in files:
+            file_path = os.path.join(root, file_name)  # noqa: PTH118 - cheaper than Path for 100k+ files
+            try:
+                stat = os.lstat(file_path)
+            except OSError:
+                continue
+            if not S_ISREG(stat.st_mode):
+                continue
+            usage.files[file_path] = (stat.st_size, stat.st_mtime)
+            usage.total_size += stat.st_size
+    return usage
+
+
+class DirectorySizeTracker:
+    """Tracks the total size of directories and deletes their oldest files to meet a budget."""
+
+    def __init__(self, rescan_interval: float = DEFAULT_RESCAN_INTERVAL_SECONDS) -> None:
+        """Initialize the tracker.
+
+        Args:
+            rescan_interval: Seconds after which a tracked directory is walked again before enforcing a budget
+        """
+        self.rescan_interval = rescan_interval
+        self._lock = threading.Lock()
+        self._usages: dict[Path, _DirectoryUsage] = {}
+
+    def get_size(self, directory: Path) -> int:
+        """Get the total size in bytes of the files in a directory, walking it if it is not tracked yet."""
+        with self._lock:
+            return self._get_usage(directory.absolute()).total_size
+
+    def record_write(self, file_path: Path) -> None:
+        """Update the totals of tracked directories containing a file that was just written."""
+        file_path = file_path.absolute()
+        with self._lock:
+            containing = self._get_containing_usages(file_path)
+            if not containing:
+                return
+            key = str(file_path)
+            try:
+                stat = file_path.lstat()
+            except OSError:
+                self._forget_file(containing, key)
+                return
+            for usage in containing:
+                previous_size, _ = usage.files.get(key, (0, 0.0))
+                usage.files[key] = (stat.st_size, stat.st_mtime)
+                usage.total_size += stat.st_size - previous_size
+
+    def record_delete(self, path: Path) -> None:
+        """Update the totals of tracked directories containing a file or directory that was just deleted."""
+        path = path.absolute()
+        with self._lock:
+            for directory in [directory for directory in self._usages if directory.is_relative_to(path)]:
+                del self._usages[directory]
+            containing = self._get_containing_usages(path)
+            key = str(path)
+            prefix = os.path.join(key, "")  # noqa: PTH118
+            for usage in containing:
+                for file_key in [file_key for file_key in usage.files if file_key.startswith(prefix)]:
+                    usage.total_size -= usage.files.pop(file_key)[0]
+            self._forget_file(containing, key)
+
+    def enforce_budget(self, directory: Path, max_size_bytes: int) -> int:
+        """Delete the least recently modified files in a directory until it fits in a budget.
+
+        Args:
+            directory: Directory to clean
+            max_size_bytes: Size to get the directory's total size down to
+
+        Returns:
+            Number of files deleted.
+        """
+        with self._lock:
+            usage = self._get_usage(directory.absolute())
+            if usage.total_size <= max_size_bytes:
+                return 0
+
+            candidates = [(mtime, path) for path, (_size, mtime) in usage.files.items()]
+            heapq.heapify(candidates)
+            removed_count = 0
+            while usage.total_size > max_size_bytes and candidates:
+                _mtime, file_path = heapq.heappop(candidates)
+                try:
+                    # TODO: Replace with DeleteFileRequest https://github.com/griptape-ai/griptape-nodes/issues/3765
+                    Path(file_path).unlink()
+                except FileNotFoundError:
+                    # Deleted behind our back; it no longer counts either way
+                    pass
+                except OSError as err:
+                    logger.error(
+                        "While cleaning up old files, attempted to delete file %s. File could not be deleted; skipping. Deletion error: %s",
+                        file_path,
+                        err,
+                    )
+                    continue
+                else:
+                    removed_count += 1
+                self._forget_file(self._get_containing_usages(Path(file_path)), file_path)
+            return removed_count
+
+    def forget(self, directory: Path) -> None:
+        """Stop tracking a directory; it is walked again on next use."""
+        with self._lock:
+            self._usages.pop(directory.absolute(), None)
+
+    def _get_usage(self, directory: Path) -> _DirectoryUsage:
+        """Get a directory's usage, walking it if untracked or last walked too long ago. Called with the lock held."""
+        usage = self._usages.get(directory)
+        if usage is None or time.monotonic() - usage.scanned_at > self.rescan_interval:
+            usage = _scan_directory(directory)
+            self._usages[directory] = usage
+        return usage
+
+    def _get_containing_usages(self, file_path: Path) -> list[_DirectoryUsage]:
+        return [usage for directory, usage in self._usages.items() if file_path.is_relative_to(directory)]
+
+    @staticmethod
+    def _forget_file(usages: list[_DirectoryUsage], key: str) -> None:
+        for usage in usages:
+            entry = usage.files.pop(key, None)
+            if entry is not None:
+                usage.total_size -= entry[0]
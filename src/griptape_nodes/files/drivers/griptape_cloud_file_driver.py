@@ -1,12 +1,16 @@
 """File driver for Griptape Cloud asset locations."""
 
 import os
+from collections.abc import AsyncIterator
 from urllib.parse import urljoin, urlparse
 
 import httpx
 
 from griptape_nodes.drivers.storage.griptape_cloud_storage_driver import GriptapeCloudStorageDriver
-from griptape_nodes.files.base_file_driver import BaseFileDriver
+from griptape_nodes.files.base_file_driver import DEFAULT_STREAM_CHUNK_SIZE, BaseFileDriver, validate_byte_range
+from griptape_nodes.files.drivers.http_file_driver import read_http_range, stream_http
+from griptape_nodes.files.file_driver_registry import FileDriverRegistry
+from griptape_nodes.files.http_client import HttpClientPool
 
 # HTTP status code threshold for success
 _HTTP_SUCCESS_THRESHOLD = 400
@@ -17,6 +21,8 @@ class GriptapeCloudFileDriver(BaseFileDriver):
 
     Handles locations matching: https://cloud.griptape.ai/buckets/{id}/assets/{path}
     Reads files via signed URLs. For writing files, use storage drivers directly.
+    Requests go through a shared HttpClientPool; full downloads are cached under the
+    asset URL, since each signed URL is different.
     """
 
     @property
@@ -28,18 +34,31 @@ class GriptapeCloudFileDriver(BaseFileDriver):
         """
         return 10
 
-    def __init__(self, bucket_id: str, api_key: str, base_url: str = "https://cloud.griptape.ai") -> None:
+    def __init__(
+        self,
+        bucket_id: str,
+        api_key: str,
+        base_url: str = "https://cloud.griptape.ai",
+        http_client_pool: HttpClientPool | None = None,
+    ) -> None:
         """Initialize GriptapeCloudFileDriver.
 
         Args:
             bucket_id: Griptape Cloud bucket ID
             api_key: API key for authentication
             base_url: Base URL for Griptape Cloud API (default: https://cloud.griptape.ai)
+            http_client_pool: Pool to send requests through (default: the FileDriverRegistry's shared pool)
         """
         self.bucket_id = bucket_id
         self.api_key = api_key
         self.base_url = base_url
         self.headers = {"Authorization": f"Bearer {api_key}"}
+        self._http_client_pool = http_client_pool
+
+    @property
+    def http_client_pool(self) -> HttpClientPool:
+        """The HTTP client pool requests are sent through."""
+        return self._http_client_pool or FileDriverRegistry.get_http_client_pool()
 
     @classmethod
     def create_from_env(cls) -> "GriptapeCloudFileDriver | None":
@@ -91,6 +110,35 @@ class GriptapeCloudFileDriver(BaseFileDriver):
                 return bucket_part
         return None
 
+    def _get_asset_url_api_url(self, location: str) -> str:
+        """Get the API URL that issues signed URLs for a cloud asset.
+
+        Raises:
+            RuntimeError: If the workspace path cannot be extracted from the URL
+        """
+        workspace_path = GriptapeCloudStorageDriver.extract_workspace_path_from_cloud_url(location)
+
+        if not workspace_path:
+            msg = f"Failed to extract workspace path from cloud URL: {location}"
+            raise RuntimeError(msg)
+
+        # Extract bucket ID from URL, fallback to configured bucket_id
+        bucket_id = self._extract_bucket_id_from_url(location) or self.bucket_id
+
+        return urljoin(self.base_url, f"/api/buckets/{bucket_id}/asset-urls/{workspace_path}")
+
+    async def _get_signed_url(self, client: httpx.AsyncClient, location: str, timeout: float) -> str:  # noqa: ASYNC109
+        """Get a signed download URL for a cloud asset.
+
+        Raises:
+            RuntimeError: If the workspace path cannot be extracted from the URL
+            httpx.HTTPError: If the API request fails
+        """
+        api_url = self._get_asset_url_api_url(location)
+        response = await client.post(api_url, json={"method": "GET"}, headers=self.headers, timeout=timeout)
+        response.raise_for_status()
+        return response.json()["url"]
+
     async def read(self, location: str, timeout: float) -> bytes:  # noqa: ASYNC109
         """Download file from Griptape Cloud storage.
 
@@ -104,27 +152,68 @@ class GriptapeCloudFileDriver(BaseFileDriver):
         Raises:
             RuntimeError: If download fails or URL conversion fails
         """
-        workspace_path = GriptapeCloudStorageDriver.extract_workspace_path_from_cloud_url(location)
+        try:
+            signed_url = await self._get_signed_url(self.http_client_pool.get_async_client(), location, timeout)
+            return await self.http_client_pool.download(signed_url, timeout, cache_key=location)
+        except httpx.HTTPError as e:
+            msg = f"Failed to download from cloud storage at {location}: {e}"
+            raise RuntimeError(msg) from e
 
-        if not workspace_path:
-            msg = f"Failed to extract workspace path from cloud URL: {location}"
-            raise RuntimeError(msg)
+    async def read_range(
+        self,
+        location: str,
+        offset: int,
+        length: int | None,
+        timeout: float,  # noqa: ASYNC109
+    ) -> bytes:
+        """Download a byte range of a file from Griptape Cloud storage.
 
-        # Extract bucket ID from URL, fallback to configured bucket_id
-        bucket_id = self._extract_bucket_id_from_url(location) or self.bucket_id
+        Args:
+            location: Cloud asset URL
+            offset: Index of the first byte to read
+            length: Maximum number of bytes to read (None reads to the end)
+            timeout: Timeout in seconds for HTTP request
 
-        api_url = urljoin(self.base_url, f"/api/buckets/{bucket_id}/asset-urls/{workspace_path}")
+        Returns:
+            The bytes in the range
 
+        Raises:
+            RuntimeError: If download fails or URL conversion fails
+            ValueError: Negative offset or length
+        """
+        validate_byte_range(offset, length)
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(api_url, json={"method": "GET"}, headers=self.headers, timeout=timeout)
-                response.raise_for_status()
-                signed_url = response.json()["url"]
+            client = self.http_client_pool.get_async_client()
+            signed_url = await self._get_signed_url(client, location, timeout)
+            return await read_http_range(client, signed_url, offset, length, timeout)
+        except httpx.HTTPError as e:
+            msg = f"Failed to download from cloud storage at {location}: {e}"
+            raise RuntimeError(msg) from e
+
+    async def stream(
+        self,
+        location: str,
+        timeout: float,  # noqa: ASYNC109
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Download a file from Griptape Cloud storage as a stream of chunks.
+
+        Args:
+            location: Cloud asset URL
+            timeout: Timeout in seconds for HTTP request
+            chunk_size: Maximum size of each yielded chunk
 
-                download_response = await client.get(signed_url, timeout=timeout)
-                download_response.raise_for_status()
-                return download_response.content
+        Yields:
+            The file contents in chunks of at most chunk_size bytes
 
+        Raises:
+            RuntimeError: If download fails or URL conversion fails
+        """
+        try:
+            client = self.http_client_pool.get_async_client()
+            signed_url = await self._get_signed_url(client, location, timeout)
+            async for chunk in stream_http(client, signed_url, timeout, chunk_size):
+                yield chunk
         except httpx.HTTPError as e:
             msg = f"Failed to download from cloud storage at {location}: {e}"
             raise RuntimeError(msg) from e
@@ -148,13 +237,13 @@ class GriptapeCloudFileDriver(BaseFileDriver):
 
         api_url = urljoin(self.base_url, f"/api/buckets/{bucket_id}/asset-urls/{workspace_path}")
 
+        client = self.http_client_pool.get_async_client()
         try:
-            async with httpx.AsyncClient() as client:
-                # TODO: Standardize timeout values https://github.com/griptape-ai/griptape-nodes/issues/3958
-                response = await client.post(api_url, json={"method": "GET"}, headers=self.headers, timeout=10.0)
-                return response.status_code < _HTTP_SUCCESS_THRESHOLD
+            # TODO: Standardize timeout values https://github.com/griptape-ai/griptape-nodes/issues/3958
+            response = await client.post(api_url, json={"method": "GET"}, headers=self.headers, timeout=10.0)
         except (httpx.HTTPError, Exception):
             return False
+        return response.status_code < _HTTP_SUCCESS_THRESHOLD
 
     def get_size(self, location: str) -> int:
         """Get file size from cloud storage.
@@ -166,7 +255,7 @@ class GriptapeCloudFileDriver(BaseFileDriver):
             File size in bytes, or 0 if unavailable
 
         Note:
-            This makes a synchronous HEAD request to get Content-Length.
+            This makes a synchronous HEAD request (on the pool's sync client) to get Content-Length.
         """
         workspace_path = GriptapeCloudStorageDriver.extract_workspace_path_from_cloud_url(location)
 
@@ -179,15 +268,15 @@ class GriptapeCloudFileDriver(BaseFileDriver):
         api_url = urljoin(self.base_url, f"/api/buckets/{bucket_id}/asset-urls/{workspace_path}")
 
         try:
-            with httpx.Client() as client:
-                response = client.post(api_url, json={"method": "GET"}, headers=self.headers, timeout=10.0)
-                response.raise_for_status()
-                signed_url = response.json()["url"]
-
-                head_response = client.head(signed_url, timeout=10.0)
-                head_response.raise_for_status()
-                content_length = head_response.headers.get("content-length")
-                return int(content_length) if content_length else 0
+            client = self.http_client_pool.get_sync_client()
+            response = client.post(api_url, json={"method": "GET"}, headers=self.headers, timeout=10.0)
+            response.raise_for_status()
+            signed_url = response.json()["url"]
+
+            head_response = client.head(signed_url, timeout=10.0)
+            head_response.raise_for_status()
+            content_length = head_response.headers.get("content-length")
+            return int(content_length) if content_length else 0
 
         except (httpx.HTTPError, ValueError, Exception):
             return 0
@@ -1,20 +1,120 @@
 """File driver for HTTP/HTTPS locations."""
 
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+
 import httpx
 
-from griptape_nodes.files.base_file_driver import BaseFileDriver
+from griptape_nodes.files.base_file_driver import DEFAULT_STREAM_CHUNK_SIZE, BaseFileDriver, validate_byte_range
+from griptape_nodes.files.file_driver_registry import FileDriverRegistry
+from griptape_nodes.files.http_client import HttpClientPool
 
 # HTTP status code threshold for success
 _HTTP_SUCCESS_THRESHOLD = 400
 
 
+async def stream_http(
+    client: httpx.AsyncClient,
+    url: str,
+    timeout: float,  # noqa: ASYNC109
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    *,
+    headers: dict[str, str] | None = None,
+) -> AsyncIterator[bytes]:
+    """Download a URL as a stream of chunks without buffering the whole body.
+
+    Args:
+        client: Client to download with
+        url: URL to download
+        timeout: Timeout in seconds for the HTTP request
+        chunk_size: Maximum size of each yielded chunk
+        headers: Additional request headers
+
+    Yields:
+        The response body, in order, in chunks of at most chunk_size bytes
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns an error status
+    """
+    async with client.stream("GET", url, headers=headers, timeout=timeout) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes(chunk_size):
+            yield chunk
+
+
+async def read_http_range(  # noqa: PLR0913
+    client: httpx.AsyncClient,
+    url: str,
+    offset: int,
+    length: int | None,
+    timeout: float,  # noqa: ASYNC109
+    *,
+    headers: dict[str, str] | None = None,
+) -> bytes:
+    """Download a byte range of a URL with a Range request.
+
+    Servers that ignore the Range header send the whole body; it is streamed,
+    and only the requested range is kept.
+
+    Args:
+        client: Client to download with
+        url: URL to download
+        offset: Index of the first byte to read
+        length: Maximum number of bytes to read (None reads to the end)
+        timeout: Timeout in seconds for the HTTP request
+        headers: Additional request headers
+
+    Returns:
+        The bytes in the range (fewer than length if the body ends first)
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns an error status
+    """
+    if length == 0:
+        return b""
+    range_end = "" if length is None else str(offset + length - 1)
+    range_headers = {**(headers or {}), "Range": f"bytes={offset}-{range_end}"}
+    async with client.stream("GET", url, headers=range_headers, timeout=timeout) as response:
+        if response.status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+            # The offset is past the end of the body
+            return b""
+        response.raise_for_status()
+        if response.status_code == HTTPStatus.PARTIAL_CONTENT:
+            return await response.aread()
+
+        content = bytearray()
+        position = 0
+        async for chunk in response.aiter_bytes():
+            chunk_end = position + len(chunk)
+            if chunk_end > offset:
+                content += chunk[max(0, offset - position) :]
+            position = chunk_end
+            if length is not None and len(content) >= length:
+                break
+        return bytes(content if length is None else content[:length])
+
+
 class HttpFileDriver(BaseFileDriver):
     """Read-only file driver for HTTP/HTTPS locations.
 
     Handles locations starting with "http://" or "https://" prefix,
-    downloading content via async HTTP requests.
+    downloading content via async HTTP requests. Requests go through a shared
+    HttpClientPool, so connections are reused and full downloads are cached.
     """
 
+    def __init__(self, http_client_pool: HttpClientPool | None = None) -> None:
+        """Initialize HttpFileDriver.
+
+        Args:
+            http_client_pool: Pool to send requests through (default: the FileDriverRegistry's shared pool)
+        """
+        self._http_client_pool = http_client_pool
+
+    @property
+    def http_client_pool(self) -> HttpClientPool:
+        """The HTTP client pool requests are sent through."""
+        return self._http_client_pool or FileDriverRegistry.get_http_client_pool()
+
     def can_handle(self, location: str) -> bool:
         """Check if location is an HTTP/HTTPS URL.
 
@@ -27,7 +127,7 @@ class HttpFileDriver(BaseFileDriver):
         return location.startswith(("http://", "https://"))
 
     async def read(self, location: str, timeout: float) -> bytes:  # noqa: ASYNC109
-        """Download file from HTTP/HTTPS URL.
+        """Download file from HTTP/HTTPS URL, revalidating a cached copy if there is one.
 
         Args:
             location: HTTP/HTTPS URL to download from
@@ -40,10 +140,64 @@ class HttpFileDriver(BaseFileDriver):
             RuntimeError: If download fails or HTTP error occurs
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(location, timeout=timeout)
-                response.raise_for_status()
-                return response.content
+            return await self.http_client_pool.download(location, timeout)
+        except httpx.HTTPError as e:
+            msg = f"Failed to download from {location}: {e}"
+            raise RuntimeError(msg) from e
+
+    async def read_range(
+        self,
+        location: str,
+        offset: int,
+        length: int | None,
+        timeout: float,  # noqa: ASYNC109
+    ) -> bytes:
+        """Download a byte range from an HTTP/HTTPS URL.
+
+        Args:
+            location: HTTP/HTTPS URL to download from
+            offset: Index of the first byte to read
+            length: Maximum number of bytes to read (None reads to the end)
+            timeout: Timeout in seconds for HTTP request
+
+        Returns:
+            The bytes in the range
+
+        Raises:
+            RuntimeError: If download fails or HTTP error occurs
+            ValueError: Negative offset or length
+        """
+        validate_byte_range(offset, length)
+        try:
+            client = self.http_client_pool.get_async_client()
+            return await read_http_range(client, location, offset, length, timeout)
+        except httpx.HTTPError as e:
+            msg = f"Failed to download from {location}: {e}"
+            raise RuntimeError(msg) from e
+
+    async def stream(
+        self,
+        location: str,
+        timeout: float,  # noqa: ASYNC109
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Download an HTTP/HTTPS URL as a stream of chunks.
+
+        Args:
+            location: HTTP/HTTPS URL to download from
+            timeout: Timeout in seconds for HTTP request
+            chunk_size: Maximum size of each yielded chunk
+
+        Yields:
+            The response body in chunks of at most chunk_size bytes
+
+        Raises:
+            RuntimeError: If download fails or HTTP error occurs
+        """
+        try:
+            client = self.http_client_pool.get_async_client()
+            async for chunk in stream_http(client, location, timeout, chunk_size):
+                yield chunk
         except httpx.HTTPError as e:
             msg = f"Failed to download from {location}: {e}"
             raise RuntimeError(msg) from e
@@ -57,12 +211,12 @@ class HttpFileDriver(BaseFileDriver):
         Returns:
             True if URL returns 2xx status code
         """
+        client = self.http_client_pool.get_async_client()
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.head(location, timeout=10.0)
-                return response.status_code < _HTTP_SUCCESS_THRESHOLD
+            response = await client.head(location, timeout=10.0)
         except (httpx.HTTPError, Exception):
             return False
+        return response.status_code < _HTTP_SUCCESS_THRESHOLD
 
     def get_size(self, location: str) -> int:
         """Get size of HTTP resource (Content-Length header).
@@ -74,14 +228,13 @@ class HttpFileDriver(BaseFileDriver):
             Size in bytes from Content-Length header, or 0 if unavailable
 
         Note:
-            This is a synchronous operation but uses httpx sync client.
+            This is a synchronous operation using the pool's sync client.
             Returns 0 if Content-Length header is not available.
         """
         try:
-            with httpx.Client() as client:
-                response = client.head(location, timeout=10.0)
-                response.raise_for_status()
-                content_length = response.headers.get("content-length")
-                return int(content_length) if content_length else 0
+            response = self.http_client_pool.get_sync_client().head(location, timeout=10.0)
+            response.raise_for_status()
+            content_length = response.headers.get("content-length")
+            return int(content_length) if content_length else 0
         except (httpx.HTTPError, ValueError, Exception):
             return 0
@@ -1,10 +1,14 @@
 """File driver for local filesystem locations."""
 
+import asyncio
+import mmap
+import os
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 import anyio
 
-from griptape_nodes.files.base_file_driver import BaseFileDriver
+from griptape_nodes.files.base_file_driver import DEFAULT_STREAM_CHUNK_SIZE, BaseFileDriver, validate_byte_range
 from griptape_nodes.files.path_utils import (
     expand_path,
     normalize_path_for_platform,
@@ -14,6 +18,45 @@ from griptape_nodes.files.path_utils import (
 )
 
 
+def read_file_range(path: Path, offset: int, length: int | None) -> bytes:
+    """Read a byte range from a local file through a memory map.
+
+    Only the pages covering the range are read from disk, so reading the
+    header of a multi-gigabyte video costs a few kilobytes of memory.
+
+    Args:
+        path: Path of the file
+        offset: Index of the first byte to read
+        length: Maximum number of bytes to read (None reads to the end)
+
+    Returns:
+        The bytes in the range (fewer than length if the file ends first)
+    """
+    with path.open("rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        end = size if length is None else min(size, offset + length)
+        if offset >= end:
+            # Also covers empty files, which cannot be memory mapped
+            return b""
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped[offset:end]
+
+
+async def stream_file(path: Path, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read a local file as a stream of chunks without loading it whole.
+
+    Args:
+        path: Path of the file
+        chunk_size: Maximum size of each yielded chunk
+
+    Yields:
+        The file contents, in order, in chunks of at most chunk_size bytes
+    """
+    async with await anyio.open_file(path, "rb") as file:
+        while chunk := await file.read(chunk_size):
+            yield chunk
+
+
 class LocalFileDriver(BaseFileDriver):
     """File driver for local filesystem locations.
 
@@ -87,6 +130,26 @@ class LocalFileDriver(BaseFileDriver):
         # Normalize for platform (Windows long paths, etc.)
         return Path(normalize_path_for_platform(path))
 
+    async def _get_file_path(self, location: str) -> anyio.Path:
+        """Resolve a location and check that it is an existing file.
+
+        Raises:
+            FileNotFoundError: File does not exist
+            IsADirectoryError: Path is a directory
+            ValueError: Invalid file:// URI
+        """
+        path = anyio.Path(self._resolve_path(location))
+
+        if not await path.exists():
+            msg = f"File not found: {location}"
+            raise FileNotFoundError(msg)
+
+        if not await path.is_file():
+            msg = f"Path is a directory, not a file: {location}"
+            raise IsADirectoryError(msg)
+
+        return path
+
     async def read(self, location: str, timeout: float) -> bytes:  # noqa: ARG002, ASYNC109
         """Read file from local filesystem with validation.
 
@@ -103,17 +166,62 @@ class LocalFileDriver(BaseFileDriver):
             PermissionError: No read permission
             ValueError: Invalid file:// URI
         """
-        path = anyio.Path(self._resolve_path(location))
+        path = await self._get_file_path(location)
+        return await path.read_bytes()
 
-        if not await path.exists():
-            msg = f"File not found: {location}"
-            raise FileNotFoundError(msg)
+    async def read_range(
+        self,
+        location: str,
+        offset: int,
+        length: int | None,
+        timeout: float,  # noqa: ARG002, ASYNC109
+    ) -> bytes:
+        """Read a byte range from a local file through a memory map.
 
-        if not await path.is_file():
-            msg = f"Path is a directory, not a file: {location}"
-            raise IsADirectoryError(msg)
+        Args:
+            location: Absolute file path, file:// URI, or path with ~
+            offset: Index of the first byte to read
+            length: Maximum number of bytes to read (None reads to the end)
+            timeout: Ignored for local files
 
-        return await path.read_bytes()
+        Returns:
+            The bytes in the range (fewer than length if the file ends first)
+
+        Raises:
+            FileNotFoundError: File does not exist
+            IsADirectoryError: Path is a directory
+            PermissionError: No read permission
+            ValueError: Invalid file:// URI, or negative offset or length
+        """
+        validate_byte_range(offset, length)
+        path = await self._get_file_path(location)
+        return await asyncio.to_thread(read_file_range, Path(path), offset, length)
+
+    async def stream(
+        self,
+        location: str,
+        timeout: float,  # noqa: ARG002, ASYNC109
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a local file as a stream of chunks.
+
+        Args:
+            location: Absolute file path, file:// URI, or path with ~
+            timeout: Ignored for local files
+            chunk_size: Maximum size of each yielded chunk
+
+        Yields:
+            The file contents, in order, in chunks of at most chunk_size bytes
+
+        Raises:
+            FileNotFoundError: File does not exist
+            IsADirectoryError: Path is a directory
+            PermissionError: No read permission
+            ValueError: Invalid file:// URI
+        """
+        path = await self._get_file_path(location)
+        async for chunk in stream_file(Path(path), chunk_size):
+            yield chunk
 
     async def exists(self, location: str) -> bool:
         """Check if file exists on local filesystem.
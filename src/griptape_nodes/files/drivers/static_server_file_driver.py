@@ -5,12 +5,15 @@ directly from the workspace directory on disk, avoiding unnecessary
 HTTP round-trips through the dev server.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
 from pathlib import Path
 from urllib.parse import urlparse
 
 import anyio
 
-from griptape_nodes.files.base_file_driver import BaseFileDriver
+from griptape_nodes.files.base_file_driver import DEFAULT_STREAM_CHUNK_SIZE, BaseFileDriver, validate_byte_range
+from griptape_nodes.files.drivers.local_file_driver import read_file_range, stream_file
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
 
@@ -71,6 +74,25 @@ class StaticServerFileDriver(BaseFileDriver):
         workspace_path = GriptapeNodes.ConfigManager().workspace_path
         return workspace_path / workspace_relative_path
 
+    async def _get_file_path(self, location: str) -> anyio.Path:
+        """Resolve a localhost URL and check that it points to an existing file.
+
+        Raises:
+            FileNotFoundError: File does not exist at resolved path
+            IsADirectoryError: Path is a directory
+        """
+        anyio_path = anyio.Path(self._resolve_to_local_path(location))
+
+        if not await anyio_path.exists():
+            msg = f"Attempted to read file from localhost URL. Failed with url='{location}' because file not found at resolved path: {anyio_path}"
+            raise FileNotFoundError(msg)
+
+        if not await anyio_path.is_file():
+            msg = f"Attempted to read file from localhost URL. Failed with url='{location}' because path is a directory: {anyio_path}"
+            raise IsADirectoryError(msg)
+
+        return anyio_path
+
     async def read(self, location: str, timeout: float) -> bytes:  # noqa: ARG002, ASYNC109
         """Read file from workspace path resolved from localhost URL.
 
@@ -85,17 +107,59 @@ class StaticServerFileDriver(BaseFileDriver):
             FileNotFoundError: File does not exist at resolved path
             IsADirectoryError: Path is a directory
         """
-        anyio_path = anyio.Path(self._resolve_to_local_path(location))
+        anyio_path = await self._get_file_path(location)
+        return await anyio_path.read_bytes()
 
-        if not await anyio_path.exists():
-            msg = f"Attempted to read file from localhost URL. Failed with url='{location}' because file not found at resolved path: {anyio_path}"
-            raise FileNotFoundError(msg)
+    async def read_range(
+        self,
+        location: str,
+        offset: int,
+        length: int | None,
+        timeout: float,  # noqa: ARG002, ASYNC109
+    ) -> bytes:
+        """Read a byte range from the workspace file behind a localhost URL.
 
-        if not await anyio_path.is_file():
-            msg = f"Attempted to read file from localhost URL. Failed with url='{location}' because path is a directory: {anyio_path}"
-            raise IsADirectoryError(msg)
+        Args:
+            location: Localhost workspace URL
+            offset: Index of the first byte to read
+            length: Maximum number of bytes to read (None reads to the end)
+            timeout: Ignored for local file reads
 
-        return await anyio_path.read_bytes()
+        Returns:
+            The bytes in the range (fewer than length if the file ends first)
+
+        Raises:
+            FileNotFoundError: File does not exist at resolved path
+            IsADirectoryError: Path is a directory
+            ValueError: Negative offset or length
+        """
+        validate_byte_range(offset, length)
+        anyio_path = await self._get_file_path(location)
+        return await asyncio.to_thread(read_file_range, Path(anyio_path), offset, length)
+
+    async def stream(
+        self,
+        location: str,
+        timeout: float,  # noqa: ARG002, ASYNC109
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read the workspace file behind a localhost URL as a stream of chunks.
+
+        Args:
+            location: Localhost workspace URL
+            timeout: Ignored for local file reads
+            chunk_size: Maximum size of each yielded chunk
+
+        Yields:
+            The file contents, in order, in chunks of at most chunk_size bytes
+
+        Raises:
+            FileNotFoundError: File does not exist at resolved path
+            IsADirectoryError: Path is a directory
+        """
+        anyio_path = await self._get_file_path(location)
+        async for chunk in stream_file(Path(anyio_path), chunk_size):
+            yield chunk
 
     async def exists(self, location: str) -> bool:
         """Check if file exists at resolved workspace path.
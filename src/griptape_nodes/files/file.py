@@ -8,10 +8,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple, Protocol, cast, runtime_checkable
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from griptape_nodes.retained_mode.events.base_events import ResultPayload
 
 from griptape_nodes.common.macro_parser import MacroSyntaxError, ParsedMacro
-from griptape_nodes.files.path_utils import parse_file_uri, resolve_file_path
+from griptape_nodes.files.base_file_driver import DEFAULT_STREAM_CHUNK_SIZE
+from griptape_nodes.files.file_driver_registry import FileDriverNotFoundError, FileDriverRegistry
+from griptape_nodes.files.path_utils import parse_file_uri, resolve_file_path, sanitize_path_string
 from griptape_nodes.retained_mode.events.os_events import (
     ExistingFilePolicy,
     FileIOFailureReason,
@@ -96,6 +100,10 @@ _PATH_FAILURE_TO_FILE_IO: dict[PathResolutionFailureReason, FileIOFailureReason]
 }
 
 
+# Timeout for each driver operation while streaming, matching OSManager's reads
+_STREAM_TIMEOUT_SECONDS = 120.0
+
+
 def _make_file_load_error(result: ResultPayload) -> FileLoadError:
     if isinstance(result, GetPathForMacroResultFailure):
         return FileLoadError(
@@ -572,11 +580,75 @@ class File:
         fc = await self._aread()
         return _to_data_uri(fc, fallback_mime)
 
-    def _read(self, encoding: str = "utf-8") -> FileContent:
+    def read_range(self, offset: int, length: int | None = None) -> bytes:
+        """Read a byte range of the file without reading the rest of it.
+
+        Args:
+            offset: Index of the first byte to read.
+            length: Maximum number of bytes to read. None reads to the end.
+
+        Returns:
+            The bytes in the range (fewer than length if the file ends first).
+
+        Raises:
+            FileLoadError: If the file cannot be read or the range is invalid.
+        """
+        fc = self._read(byte_offset=offset, byte_length=length)
+        return _to_bytes(fc)
+
+    async def aread_range(self, offset: int, length: int | None = None) -> bytes:
+        """Async version of read_range().
+
+        Args:
+            offset: Index of the first byte to read.
+            length: Maximum number of bytes to read. None reads to the end.
+
+        Returns:
+            The bytes in the range (fewer than length if the file ends first).
+
+        Raises:
+            FileLoadError: If the file cannot be read or the range is invalid.
+        """
+        fc = await self._aread(byte_offset=offset, byte_length=length)
+        return _to_bytes(fc)
+
+    async def astream(self, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Read the file as a stream of byte chunks without loading it into memory.
+
+        Args:
+            chunk_size: Maximum size of each chunk.
+
+        Yields:
+            The file content, in order, in chunks of at most chunk_size bytes.
+
+        Raises:
+            FileLoadError: If the file cannot be read.
+        """
+        location = sanitize_path_string(await _aresolve_file_path(self._file_path))
+        try:
+            driver = FileDriverRegistry.get_driver(location)
+            async for chunk in driver.stream(location, timeout=_STREAM_TIMEOUT_SECONDS, chunk_size=chunk_size):
+                yield chunk
+        except (FileDriverNotFoundError, ValueError) as e:
+            raise FileLoadError(failure_reason=FileIOFailureReason.INVALID_PATH, result_details=str(e)) from e
+        except FileNotFoundError as e:
+            raise FileLoadError(failure_reason=FileIOFailureReason.FILE_NOT_FOUND, result_details=str(e)) from e
+        except PermissionError as e:
+            raise FileLoadError(failure_reason=FileIOFailureReason.PERMISSION_DENIED, result_details=str(e)) from e
+        except IsADirectoryError as e:
+            raise FileLoadError(failure_reason=FileIOFailureReason.IS_DIRECTORY, result_details=str(e)) from e
+        except (OSError, RuntimeError, TimeoutError) as e:
+            raise FileLoadError(
+                failure_reason=FileIOFailureReason.IO_ERROR, result_details=f"Error reading from {location}: {e}"
+            ) from e
+
+    def _read(self, encoding: str = "utf-8", byte_offset: int = 0, byte_length: int | None = None) -> FileContent:
         """Perform the sync file read and return a FileContent.
 
         Args:
             encoding: Text encoding to use if file is detected as text.
+            byte_offset: Index of the first byte to read.
+            byte_length: Maximum number of bytes to read (None reads to the end).
 
         Raises:
             FileLoadError: If the file cannot be read.
@@ -585,6 +657,8 @@ class File:
             file_path=_resolve_file_path(self._file_path),
             encoding=encoding,
             should_transform_image_content_to_thumbnail=False,
+            byte_offset=byte_offset,
+            byte_length=byte_length,
         )
         result = GriptapeNodes.handle_request(request)
 
@@ -602,11 +676,15 @@ class File:
             size=success.file_size,
         )
 
-    async def _aread(self, encoding: str = "utf-8") -> FileContent:
+    async def _aread(
+        self, encoding: str = "utf-8", byte_offset: int = 0, byte_length: int | None = None
+    ) -> FileContent:
         """Perform the async file read and return a FileContent.
 
         Args:
             encoding: Text encoding to use if file is detected as text.
+            byte_offset: Index of the first byte to read.
+            byte_length: Maximum number of bytes to read (None reads to the end).
 
         Raises:
             FileLoadError: If the file cannot be read.
@@ -615,6 +693,8 @@ class File:
             file_path=await _aresolve_file_path(self._file_path),
             encoding=encoding,
             should_transform_image_content_to_thumbnail=False,
+            byte_offset=byte_offset,
+            byte_length=byte_length,
         )
         result = await GriptapeNodes.ahandle_request(request)
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import atexit
 from typing import TYPE_CHECKING, ClassVar
 
+from griptape_nodes.files.http_client import HttpClientPool, HttpResponseCache
+
 if TYPE_CHECKING:
     from griptape_nodes.files.base_file_driver import BaseFileDriver
 
@@ -21,6 +24,29 @@ class FileDriverRegistry:
     """
 
     _drivers: ClassVar[list[BaseFileDriver]] = []
+    _http_client_pool: ClassVar[HttpClientPool | None] = None
+
+    @classmethod
+    def get_http_client_pool(cls) -> HttpClientPool:
+        """Get the HTTP client pool shared by the network drivers (created on first use).
+
+        Returns:
+            The shared pool, with an on-disk response cache
+        """
+        if cls._http_client_pool is None:
+            cls._http_client_pool = HttpClientPool(response_cache=HttpResponseCache())
+            # Async clients close with their event loops; the synchronous one is closed here
+            atexit.register(cls._http_client_pool.close)
+        return cls._http_client_pool
+
+    @classmethod
+    def set_http_client_pool(cls, pool: HttpClientPool | None) -> None:
+        """Replace the shared HTTP client pool (None creates a default one on next use).
+
+        Args:
+            pool: The pool network drivers should use
+        """
+        cls._http_client_pool = pool
 
     @classmethod
     def register(cls, driver: BaseFileDriver) -> None:
@@ -0,0 +1,323 @@
+"""Shared HTTP clients and an on-disk response cache for the network file drivers.
+
+Network drivers used to open a new client per call, paying a TCP and TLS handshake on every
+read. HttpClientPool keeps keep-alive clients that the drivers share, and downloads full
+responses through HttpResponseCache: bodies are kept on disk with their ETag/Last-Modified
+validators, and later reads send a conditional request so an unchanged asset is served from
+disk after a 304. Concurrent downloads of the same asset are coalesced into one request, so
+a flow that reads one remote file from many nodes downloads it once.
+
+Each event loop's client is closed when that loop shuts down (asyncio.run() cancels the task
+holding it), and the synchronous client when the process exits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import weakref
+from http import HTTPStatus
+from typing import TYPE_CHECKING, NamedTuple
+
+import httpx
+from xdg_base_dirs import xdg_cache_home
+
+from griptape_nodes.files.directory_size_tracker import DirectorySizeTracker
+from griptape_nodes.utils.file_utils import atomic_write_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+logger = logging.getLogger("griptape_nodes")
+
+# Connection limits shared by every pooled client. Idle keep-alive connections are
+# reused for up to keepalive_expiry seconds.
+HTTP_CLIENT_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0)
+
+# Responses larger than this are returned but not cached
+MAX_CACHED_RESPONSE_SIZE = 256 * 1024 * 1024
+
+# Least recently used responses are evicted once the cache exceeds this size
+DEFAULT_HTTP_CACHE_MAX_SIZE = 2 * 1024 * 1024 * 1024
+
+_CACHE_ENTRY_SUFFIX = ".response"
+
+
+def get_http_cache_dir() -> Path:
+    """Get the directory holding cached HTTP responses."""
+    return xdg_cache_home() / "griptape_nodes" / "http_cache"
+
+
+class CachedResponseValidators(NamedTuple):
+    """Validators a cached response was stored with."""
+
+    etag: str | None
+    last_modified: str | None
+
+    def to_request_headers(self) -> dict[str, str]:
+        """Get the headers for a conditional request revalidating the response."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpResponseCache:
+    """On-disk cache of response bodies, revalidated with ETag/Last-Modified.
+
+    Each entry is a single file holding a JSON header line (the validators) followed by the
+    body, written atomically so readers never see a body paired with another response's
+    validators. Only responses carrying a validator and not marked no-store are cached.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, max_size: int = DEFAULT_HTTP_CACHE_MAX_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: get_http_cache_dir())
+            max_size: Total size in bytes above which least recently used entries are evicted
+        """
+        self.cache_dir = cache_dir if cache_dir is not None else get_http_cache_dir()
+        self.max_size = max_size
+        # Keeps the cache's total size current so storing an entry does not list the directory
+        self._size_tracker = DirectorySizeTracker()
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}{_CACHE_ENTRY_SUFFIX}"
+
+    def get_validators(self, key: str) -> CachedResponseValidators | None:
+        """Get the validators of a cached response without reading its body.
+
+        Returns:
+            The validators, or None if the response is not cached or the entry is unreadable.
+        """
+        try:
+            with self._get_entry_path(key).open("rb") as entry:
+                header = json.loads(entry.readline())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as err:
+            logger.debug("Ignoring unreadable HTTP cache entry for '%s': %s", key, err)
+            return None
+        return CachedResponseValidators(etag=header.get("etag"), last_modified=header.get("last_modified"))
+
+    def read_body(self, key: str) -> bytes | None:
+        """Read the body of a cached response and mark it as recently used.
+
+        Returns:
+            The body, or None if the response is not cached.
+        """
+        entry_path = self._get_entry_path(key)
+        try:
+            data = entry_path.read_bytes()
+            os.utime(entry_path)
+        except OSError:
+            return None
+        self._size_tracker.record_write(entry_path)
+        _header, separator, body = data.partition(b"\n")
+        if not separator:
+            return None
+        return body
+
+    def store(self, key: str, headers: Mapping[str, str], body: bytes) -> bool:
+        """Cache a response if it is cacheable.
+
+        Args:
+            key: Cache key of the response
+            headers: Response headers
+            body: Response body
+
+        Returns:
+            True if the response was cached.
+        """
+        validators = CachedResponseValidators(etag=headers.get("etag"), last_modified=headers.get("last-modified"))
+        if validators.etag is None and validators.last_modified is None:
+            return False
+        if "no-store" in headers.get("cache-control", "").lower() or len(body) > MAX_CACHED_RESPONSE_SIZE:
+            return False
+
+        header = json.dumps({"etag": validators.etag, "last_modified": validators.last_modified}).encode()
+        entry_path = self._get_entry_path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(entry_path, header + b"\n" + body)
+        except OSError as err:
+            logger.debug("Could not cache HTTP response for '%s': %s", key, err)
+            return False
+        self._size_tracker.record_write(entry_path)
+        # Least recently used entries go first; the directory is only listed on first use
+        # and after the tracker's rescan interval
+        self._size_tracker.enforce_budget(self.cache_dir, self.max_size)
+        return True
+
+
+class HttpClientPool:
+    """Keep-alive HTTP clients shared by the network file drivers.
+
+    An httpx async client is bound to the event loop it first runs on, so the pool keeps
+    one per loop, along with a task on that loop that closes the client when the loop shuts
+    down and cancels it. One synchronous client serves the drivers' synchronous calls
+    (get_size); close() closes it.
+    """
+
+    def __init__(
+        self,
+        response_cache: HttpResponseCache | None = None,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+        sync_transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        """Initialize the pool. Clients are created on first use.
+
+        Args:
+            response_cache: Cache for download(); None disables caching
+            transport: Transport for the async clients (default: httpx's)
+            sync_transport: Transport for the synchronous client (default: httpx's)
+        """
+        self.response_cache = response_cache
+        self._transport = transport
+        self._sync_transport = sync_transport
+        self._lock = threading.Lock()
+        self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._downloads: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Future[bytes]]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sync_client: httpx.Client | None = None
+        # Async client -> the task closing it when its loop shuts down
+        self._closers: dict[httpx.AsyncClient, asyncio.Task[None]] = {}
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        """Get the pooled async client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is not None and not client.is_closed:
+                return client
+            client = httpx.AsyncClient(limits=HTTP_CLIENT_LIMITS, transport=self._transport)
+            self._async_clients[loop] = client
+            self._closers[client] = loop.create_task(self._close_when_loop_ends(loop, client))
+            return client
+
+    def get_sync_client(self) -> httpx.Client:
+        """Get the pooled synchronous client."""
+        with self._lock:
+            if self._sync_client is None or self._sync_client.is_closed:
+                self._sync_client = httpx.Client(limits=HTTP_CLIENT_LIMITS, transport=self._sync_transport)
+            return self._sync_client
+
+    async def download(
+        self,
+        url: str,
+        timeout: float,  # noqa: ASYNC109
+        *,
+        cache_key: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> bytes:
+        """Download a full response body through the response cache.
+
+        Concurrent downloads with the same cache key share one request.
+
+        Args:
+            url: URL to download
+            timeout: Timeout in seconds for the HTTP request
+            cache_key: Key the response is cached and coalesced under (default: url). Pass a
+                stable key when url changes between requests for the same asset (signed URLs).
+            headers: Additional request headers
+
+        Returns:
+            The response body.
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        key = cache_key if cache_key is not None else url
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            downloads = self._downloads.setdefault(loop, {})
+        download = downloads.get(key)
+        if download is None:
+            download = asyncio.ensure_future(self._download(url, key, timeout, headers))
+            downloads[key] = download
+
+            def forget_download(finished: asyncio.Future[bytes]) -> None:
+                if downloads.get(key) is finished:
+                    del downloads[key]
+
+            download.add_done_callback(forget_download)
+        # Shielded so one caller giving up does not cancel the download for the others
+        return await asyncio.shield(download)
+
+    async def _download(
+        self,
+        url: str,
+        key: str,
+        timeout: float,  # noqa: ASYNC109
+        headers: dict[str, str] | None,
+    ) -> bytes:
+        request_headers = dict(headers or {})
+        validators = None
+        if self.response_cache is not None:
+            validators = await asyncio.to_thread(self.response_cache.get_validators, key)
+            if validators is not None:
+                request_headers.update(validators.to_request_headers())
+
+        client = self.get_async_client()
+        response = await client.get(url, headers=request_headers, timeout=timeout)
+
+        if (
+            validators is not None
+            and self.response_cache is not None
+            and response.status_code == HTTPStatus.NOT_MODIFIED
+        ):
+            body = await asyncio.to_thread(self.response_cache.read_body, key)
+            if body is not None:
+                return body
+            # Evicted since it was revalidated; fetch it again unconditionally
+            response = await client.get(url, headers=headers, timeout=timeout)
+
+        response.raise_for_status()
+        if self.response_cache is not None:
+            await asyncio.to_thread(self.response_cache.store, key, response.headers, response.content)
+        return response.content
+
+    async def _close_when_loop_ends(self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+        """Wait until cancelled, by aclose() or by the loop shutting down, then close a loop's client."""
+        try:
+            await loop.create_future()
+        finally:
+            with self._lock:
+                if self._async_clients.get(loop) is client:
+                    del self._async_clients[loop]
+                self._closers.pop(client, None)
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """Close the running loop's async client and the synchronous client.
+
+        Clients are created again on next use.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.pop(loop, None)
+            closer = self._closers.pop(client, None) if client is not None else None
+        if closer is not None:
+            closer.cancel()
+        if client is not None:
+            await client.aclose()
+        self.close()
+
+    def close(self) -> None:
+        """Close the synchronous client. Called when the process exits; created again on next use."""
+        with self._lock:
+            sync_client, self._sync_client = self._sync_client, None
+        if sync_client is not None:
+            sync_client.close()
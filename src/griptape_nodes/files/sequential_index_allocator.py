@@ -0,0 +1,160 @@
+"""Cached allocation of the next free numeric suffix for sequentially named files.
+
+Finding the next free index for a name like ``render_{_index}.png`` used to list the whole
+directory on every write, so writing frame N of a batch listed the N-1 frames before it.
+SequentialIndexAllocator lists a directory once per (directory, pattern), remembers which
+indices are taken, and hands out the lowest free one, reserving it so concurrent writers in
+this process are given different indices.
+
+The cache is revalidated (the directory listed again) only when the directory's
+modification time differs from the one recorded, or after a writer reports a collision.
+Writes made through the allocator record the new modification time, so they do not
+invalidate it. Writers in other processes are not coordinated here: the exclusive create
+and lock taken by the write itself detect them, and the collision triggers a revalidation.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+    from pathlib import Path
+
+# Reserved indices that were neither written nor released within this many seconds are handed out again
+DEFAULT_RESERVATION_TIMEOUT_SECONDS = 60.0
+
+# Number of (directory, pattern) entries kept; least recently used ones are dropped
+DEFAULT_MAX_CACHED_PATTERNS = 256
+
+
+@dataclass
+class _IndexState:
+    # Modification time of the directory when last listed or written through us; None if it did not exist
+    directory_mtime_ns: int | None
+    used: set[int]
+    # Index -> time.monotonic() it was reserved at
+    reserved: dict[int, float] = field(default_factory=dict)
+    # Every index below this one is used or reserved
+    lowest_free: int = 1
+    stale: bool = False
+
+
+def _get_directory_mtime_ns(directory: Path) -> int | None:
+    try:
+        return directory.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class SequentialIndexAllocator:
+    """Hands out the lowest free index per (directory, pattern), listing the directory only when it changed.
+
+    Indices are filled from 1 upward, filling gaps: if 1, 2, and 4 are taken, 3 is next.
+    """
+
+    def __init__(
+        self,
+        reservation_timeout: float = DEFAULT_RESERVATION_TIMEOUT_SECONDS,
+        max_cached_patterns: int = DEFAULT_MAX_CACHED_PATTERNS,
+    ) -> None:
+        """Initialize the allocator.
+
+        Args:
+            reservation_timeout: Seconds after which an unconfirmed reservation lapses
+            max_cached_patterns: Number of (directory, pattern) entries kept
+        """
+        self.reservation_timeout = reservation_timeout
+        self.max_cached_patterns = max_cached_patterns
+        self._lock = threading.Lock()
+        self._states: OrderedDict[tuple[Path, Hashable], _IndexState] = OrderedDict()
+
+    def next_index(
+        self,
+        directory: Path,
+        pattern: Hashable,
+        scan: Callable[[], Iterable[int]],
+        *,
+        reserve: bool = False,
+    ) -> int:
+        """Get the lowest free index for a pattern in a directory.
+
+        Args:
+            directory: Directory the indexed files live in
+            pattern: Identifies which files in the directory share the index sequence
+            scan: Lists the directory, returning the indices in use; called only when the cache is invalid
+            reserve: Reserve the index for the caller until record_write(), release(), or the reservation times out
+
+        Returns:
+            The lowest index (1-based) that is neither in use nor reserved.
+        """
+        with self._lock:
+            state = self._get_state(directory, pattern, scan)
+            now = time.monotonic()
+            lapsed = [
+                index for index, reserved_at in state.reserved.items() if now - reserved_at > self.reservation_timeout
+            ]
+            for index in lapsed:
+                del state.reserved[index]
+                state.lowest_free = min(state.lowest_free, index)
+            while state.lowest_free in state.used or state.lowest_free in state.reserved:
+                state.lowest_free += 1
+            index = state.lowest_free
+            if reserve:
+                state.reserved[index] = now
+            return index
+
+    def record_write(self, directory: Path, pattern: Hashable, index: int) -> None:
+        """Record that the caller created the file with an index, consuming its reservation."""
+        with self._lock:
+            state = self._states.get((directory, pattern))
+            if state is None:
+                return
+            state.used.add(index)
+            state.reserved.pop(index, None)
+            # Our own write changed the directory's mtime; adopt it so it does not force a rescan
+            if not state.stale:
+                state.directory_mtime_ns = _get_directory_mtime_ns(directory)
+
+    def record_collision(self, directory: Path, pattern: Hashable, index: int) -> None:
+        """Record that a file with an index turned out to exist already; the directory is listed on next use."""
+        with self._lock:
+            state = self._states.get((directory, pattern))
+            if state is None:
+                return
+            state.used.add(index)
+            state.reserved.pop(index, None)
+            state.stale = True
+
+    def release(self, directory: Path, pattern: Hashable, index: int) -> None:
+        """Give back a reserved index that was not written."""
+        with self._lock:
+            state = self._states.get((directory, pattern))
+            if state is None or state.reserved.pop(index, None) is None:
+                return
+            state.lowest_free = min(state.lowest_free, index)
+
+    def clear(self) -> None:
+        """Drop all cached state."""
+        with self._lock:
+            self._states.clear()
+
+    def _get_state(self, directory: Path, pattern: Hashable, scan: Callable[[], Iterable[int]]) -> _IndexState:
+        """Get the cached state, listing the directory if it is missing or invalid. Called with the lock held."""
+        key = (directory, pattern)
+        directory_mtime_ns = _get_directory_mtime_ns(directory)
+        state = self._states.get(key)
+        if state is None or state.stale or state.directory_mtime_ns != directory_mtime_ns:
+            used = set(scan()) if directory_mtime_ns is not None else set()
+            # Reservations outstanding in this process survive a rescan
+            reserved = state.reserved if state is not None else {}
+            state = _IndexState(directory_mtime_ns=directory_mtime_ns, used=used, reserved=reserved)
+            self._states[key] = state
+        self._states.move_to_end(key)
+        while len(self._states) > self.max_cached_patterns:
+            self._states.popitem(last=False)
+        return state
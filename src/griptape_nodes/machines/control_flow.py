@@ -172,15 +172,21 @@ class ControlFlowMachine(FSM[ControlFlowContext]):
         *,
         pickle_control_flow_result: bool = False,
         is_isolated: bool = False,
+        max_nodes_in_parallel: int | None = None,
+        report_involved_nodes: bool = True,
     ) -> None:
-        execution_type = GriptapeNodes.ConfigManager().get_config_value(
-            "workflow_execution_mode", default=WorkflowExecutionMode.SEQUENTIAL
-        )
-        max_nodes_in_parallel = GriptapeNodes.ConfigManager().get_config_value("max_nodes_in_parallel", default=5)
+        # Disabled when the caller reports involved nodes itself (e.g. across concurrently executing flows)
+        self._report_involved_nodes = report_involved_nodes
+        # An explicit budget (e.g. for a concurrently executing flow) overrides the configured execution mode
+        if max_nodes_in_parallel is None:
+            execution_type = GriptapeNodes.ConfigManager().get_config_value(
+                "workflow_execution_mode", default=WorkflowExecutionMode.SEQUENTIAL
+            )
+            max_nodes_in_parallel = GriptapeNodes.ConfigManager().get_config_value("max_nodes_in_parallel", default=5)
 
-        # SEQUENTIAL mode uses ParallelResolutionMachine with max_nodes_in_parallel=1
-        if execution_type == WorkflowExecutionMode.SEQUENTIAL:
-            max_nodes_in_parallel = 1
+            # SEQUENTIAL mode uses ParallelResolutionMachine with max_nodes_in_parallel=1
+            if execution_type == WorkflowExecutionMode.SEQUENTIAL:
+                max_nodes_in_parallel = 1
 
         context = ControlFlowContext(
             flow_name,
@@ -204,7 +210,7 @@ class ControlFlowMachine(FSM[ControlFlowContext]):
         self._context.paused = debug_mode
         flow_manager = GriptapeNodes.FlowManager()
         flow = flow_manager.get_flow_by_name(self._context.flow_name)
-        if start_node != end_node:
+        if start_node != end_node and self._report_involved_nodes:
             # This blocks all nodes in the entire flow from running. If we're just resolving one node, we don't want to block that.
             involved_nodes = list(flow.nodes.keys())
             GriptapeNodes.EventManager().put_event(
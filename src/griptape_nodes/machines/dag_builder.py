@@ -170,7 +170,7 @@ class DagBuilder:
             # Add start_node and its dependencies
             _add_node_recursive(node.start_node, set(), graph)
             # Add edge from start_node to end_node
-            if node.start_node.name in graph.nodes() and node.name in graph.nodes():
+            if node.start_node.name in graph and node.name in graph:
                 graph.add_edge(node.start_node.name, node.name)
 
         return added_nodes
@@ -214,11 +214,11 @@ class DagBuilder:
         """
         for graph in self.graphs.values():
             # If the length of the graph is 0, skip it. it's either reached it or it's a dead end.
-            if len(graph.nodes()) == 0:
+            if len(graph) == 0:
                 continue
 
             # If graph has nodes, the root node (not the leaf, the root), check forward path from that
-            root_nodes = [n for n in graph.nodes() if graph.out_degree(n) == 0]
+            root_nodes = [n for n in graph if graph.out_degree(n) == 0]
             for root_node_name in root_nodes:
                 if root_node_name in self.node_to_reference:
                     root_node = self.node_to_reference[root_node_name].node_reference
@@ -244,11 +244,9 @@ class DagBuilder:
         # Check if node has any DAG predecessors (dependencies) still in the graph
         node_name = node.node_reference.name
         for graph in self.graphs.values():
-            if node_name in graph.nodes():
-                # If any predecessors exist, they haven't completed yet (completed nodes are removed)
-                predecessors = graph._predecessors.get(node_name, set())
-                if predecessors:
-                    return False
+            # If any predecessors exist, they haven't completed yet (completed nodes are removed)
+            if node_name in graph and graph.in_degree(node_name) > 0:
+                return False
 
         if len(self.graphs) == 1:
             # If there's only one graph, we aren't looking for a control flow connection from elsewhere! We can queue. We've already looked at data dependencies.
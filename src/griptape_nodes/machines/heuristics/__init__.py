@@ -3,11 +3,13 @@
 from griptape_nodes.machines.heuristics.base_heuristic import NodeHeuristic
 from griptape_nodes.machines.heuristics.distance_to_node import DistanceToNode
 from griptape_nodes.machines.heuristics.has_connection_from_previous import HasConnectionFromPrevious
+from griptape_nodes.machines.heuristics.spatial_index import SpatialIndex
 from griptape_nodes.machines.heuristics.top_left_to_bottom_right import TopLeftToBottomRight
 
 __all__ = [
     "DistanceToNode",
     "HasConnectionFromPrevious",
     "NodeHeuristic",
+    "SpatialIndex",
     "TopLeftToBottomRight",
 ]
@@ -5,9 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from griptape_nodes.machines.heuristics.base_heuristic import NodeHeuristic
+from griptape_nodes.machines.heuristics.spatial_index import SpatialIndex
 
 if TYPE_CHECKING:
     from griptape_nodes.machines.dag_builder import DagNode
+    from griptape_nodes.machines.parallel_resolution import ParallelResolutionContext
 
 
 class DistanceToNode(NodeHeuristic):
@@ -20,40 +22,24 @@ class DistanceToNode(NodeHeuristic):
     - Nodes closer to the previous node receive higher scores (approaching max_value)
     - Nodes farther away receive lower scores (approaching 1.0)
     - When no previous node exists, all nodes receive a neutral score (max_value/2)
-    - Distances are normalized across all available nodes to ensure consistent scoring
+    - Distances are normalized across all nodes in the DAG using a cached SpatialIndex, so a
+      node's score does not depend on which other nodes are being scored alongside it
 
     This encourages execution flow that follows the visual layout of the workflow.
     """
 
-    def calculate_priority(self, dag_node: DagNode, **kwargs) -> float:
-        previous_executed_node = kwargs.get("previous_executed_node")
-        if previous_executed_node is None:
-            return self.max_value / 2
-
-        current_pos = dag_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
-        prev_pos = previous_executed_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
-
-        distance_squared = (current_pos["x"] - prev_pos["x"]) ** 2 + (current_pos["y"] - prev_pos["y"]) ** 2
-
-        # Track min/max distances in a single pass
-        min_distance_squared = float("inf")
-        max_distance_squared = 0.0
-        node_count = 0
-        for node_ref in self._context.node_to_reference.values():
-            pos = node_ref.node_reference.metadata.get("position", {"x": 0, "y": 0})
-            d_squared = (pos["x"] - prev_pos["x"]) ** 2 + (pos["y"] - prev_pos["y"]) ** 2
-            min_distance_squared = min(min_distance_squared, d_squared)
-            max_distance_squared = max(max_distance_squared, d_squared)
-            node_count += 1
-
-        if node_count in {0, 1}:
-            return self.max_value / 2
+    def __init__(
+        self,
+        context: ParallelResolutionContext,
+        weight: float = 1,
+        max_value: float = 100.0,
+        spatial_index: SpatialIndex | None = None,
+    ) -> None:
+        super().__init__(context, weight=weight, max_value=max_value)
+        self._spatial_index = spatial_index if spatial_index is not None else SpatialIndex(context)
 
-        if max_distance_squared == min_distance_squared:
-            return self.max_value / 2
-
-        normalized = (distance_squared - min_distance_squared) / (max_distance_squared - min_distance_squared)
-        return self.max_value - (normalized * 99.0)
+    def calculate_priority(self, dag_node: DagNode, **kwargs) -> float:
+        return self.calculate_priorities_batch([dag_node], **kwargs)[dag_node.node_reference.name]
 
     def calculate_priorities_batch(self, dag_nodes: list[DagNode], **kwargs) -> dict[str, float]:
         previous_executed_node = kwargs.get("previous_executed_node")
@@ -63,19 +49,16 @@ class DistanceToNode(NodeHeuristic):
         if not dag_nodes:
             return {}
 
-        if len(dag_nodes) == 1:
-            return {dag_nodes[0].node_reference.name: self.max_value / 2}
-
-        prev_pos = previous_executed_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
-
-        # Track min/max while building the list to avoid additional passes
+        prev_pos = self._spatial_index.position(previous_executed_node)
         distances_squared = []
-        min_distance_squared = float("inf")
-        max_distance_squared = 0.0
         for dag_node in dag_nodes:
-            pos = dag_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
-            d_squared = (pos["x"] - prev_pos["x"]) ** 2 + (pos["y"] - prev_pos["y"]) ** 2
-            distances_squared.append((dag_node, d_squared))
+            pos = self._spatial_index.position(dag_node)
+            distances_squared.append((dag_node, (pos[0] - prev_pos[0]) ** 2 + (pos[1] - prev_pos[1]) ** 2))
+
+        # DAG-wide min/max come from the cached spatial summary; only nodes outside the DAG can widen them
+        bounds = self._spatial_index.distance_squared_bounds(prev_pos)
+        min_distance_squared, max_distance_squared = bounds if bounds is not None else (float("inf"), 0.0)
+        for _, d_squared in distances_squared:
             min_distance_squared = min(min_distance_squared, d_squared)
             max_distance_squared = max(max_distance_squared, d_squared)
 
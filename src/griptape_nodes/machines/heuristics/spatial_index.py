@@ -0,0 +1,143 @@
+"""Cached spatial summary of a DAG's node positions for priority heuristics."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from griptape_nodes.machines.dag_builder import DagNode
+    from griptape_nodes.machines.parallel_resolution import ParallelResolutionContext
+
+Point = tuple[float, float]
+
+
+class SpatialIndex:
+    """Caches the canvas positions of every node in a DAG and the bounds derived from them.
+
+    Spatial heuristics normalize each node's score against the whole DAG. Recomputing those
+    bounds by scanning every node's metadata for every scored node makes prioritization
+    O(N^2); this summary is built once and reused until the DAG changes, so scoring a node
+    is O(1).
+
+    The summary is rebuilt lazily when nodes are added to, removed from, or replaced in the
+    DAG, or when a node being scored is found to have moved. Call invalidate() to force a rebuild after
+    moving nodes that are not being scored.
+
+    Besides reading-order bounds, the summary keeps the convex hull of the node positions.
+    The farthest node from any point is always a hull vertex, so the maximum distance used
+    by DistanceToNode only needs to check the hull instead of every node.
+    """
+
+    def __init__(self, context: ParallelResolutionContext) -> None:
+        self._context = context
+        self._positions: dict[str, Point] = {}
+        # The DAG's membership when the summary was built, to detect nodes swapped out under the same count
+        self._members: dict[str, DagNode] = {}
+        self._occupied_positions: set[Point] = set()
+        self._hull: list[Point] = []
+        self._reading_order_bounds: tuple[float, float] | None = None
+        self._distance_bounds_cache: dict[Point, tuple[float, float]] = {}
+        self._stale = True
+        # Incremented on every rebuild so callers can tell when previously computed scores are out of date
+        self.version = 0
+
+    @staticmethod
+    def read_position(dag_node: DagNode) -> Point:
+        """Read a node's position from its metadata, defaulting to the origin."""
+        pos = dag_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
+        return (pos["x"], pos["y"])
+
+    def invalidate(self) -> None:
+        """Discard the cached summary; it is rebuilt on next use."""
+        self._stale = True
+
+    def refresh(self) -> None:
+        """Rebuild the summary if the DAG's membership has changed since it was built."""
+        node_to_reference = self._context.node_to_reference
+        if self._stale or not self._has_same_members(node_to_reference):
+            self._rebuild(node_to_reference)
+
+    def _has_same_members(self, node_to_reference: dict[str, DagNode]) -> bool:
+        """Check the DAG holds exactly the DagNode objects the summary was built from."""
+        if len(node_to_reference) != len(self._members):
+            return False
+        members = self._members
+        return all(members.get(name) is dag_node for name, dag_node in node_to_reference.items())
+
+    def position(self, dag_node: DagNode) -> Point:
+        """Get a node's current position, invalidating the summary if the node moved or is new."""
+        current = self.read_position(dag_node)
+        name = dag_node.node_reference.name
+        if name in self._context.node_to_reference and self._positions.get(name) != current:
+            self._stale = True
+        return current
+
+    def reading_order_bounds(self) -> tuple[float, float] | None:
+        """Get the (min, max) of x + y across the DAG, or None if the DAG has no nodes."""
+        self.refresh()
+        return self._reading_order_bounds
+
+    def distance_squared_bounds(self, origin: Point) -> tuple[float, float] | None:
+        """Get the (min, max) squared distance from origin to any node in the DAG, or None if it has no nodes."""
+        self.refresh()
+        if not self._positions:
+            return None
+
+        bounds = self._distance_bounds_cache.get(origin)
+        if bounds is None:
+            max_distance_squared = max(_distance_squared(origin, vertex) for vertex in self._hull)
+            if origin in self._occupied_positions:
+                min_distance_squared = 0.0
+            else:
+                # Only reached when scoring against a node outside the DAG.
+                min_distance_squared = min(_distance_squared(origin, pos) for pos in self._positions.values())
+            bounds = (min_distance_squared, max_distance_squared)
+            self._distance_bounds_cache[origin] = bounds
+        return bounds
+
+    def _rebuild(self, node_to_reference: dict[str, DagNode]) -> None:
+        self._members = dict(node_to_reference)
+        self._positions = {name: self.read_position(dag_node) for name, dag_node in node_to_reference.items()}
+        self._occupied_positions = set(self._positions.values())
+        self._hull = _convex_hull(self._occupied_positions)
+        if self._positions:
+            reading_orders = [x + y for x, y in self._occupied_positions]
+            self._reading_order_bounds = (min(reading_orders), max(reading_orders))
+        else:
+            self._reading_order_bounds = None
+        self._distance_bounds_cache.clear()
+        self._stale = False
+        self.version += 1
+
+
+def _distance_squared(a: Point, b: Point) -> float:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
+
+
+def _convex_hull(points: set[Point]) -> list[Point]:
+    """Compute the convex hull of a set of points using Andrew's monotone chain algorithm.
+
+    Returns:
+        The hull vertices in counter-clockwise order. Fewer than three distinct points are
+        returned as-is.
+    """
+    sorted_points = sorted(points)
+    if len(sorted_points) <= 2:  # noqa: PLR2004
+        return sorted_points
+
+    def cross(o: Point, a: Point, b: Point) -> float:
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower: list[Point] = []
+    for point in sorted_points:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], point) <= 0:  # noqa: PLR2004
+            lower.pop()
+        lower.append(point)
+
+    upper: list[Point] = []
+    for point in reversed(sorted_points):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], point) <= 0:  # noqa: PLR2004
+            upper.pop()
+        upper.append(point)
+
+    return lower[:-1] + upper[:-1]
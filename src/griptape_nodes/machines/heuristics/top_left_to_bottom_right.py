@@ -5,9 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from griptape_nodes.machines.heuristics.base_heuristic import NodeHeuristic
+from griptape_nodes.machines.heuristics.spatial_index import SpatialIndex
 
 if TYPE_CHECKING:
     from griptape_nodes.machines.dag_builder import DagNode
+    from griptape_nodes.machines.parallel_resolution import ParallelResolutionContext
 
 
 class TopLeftToBottomRight(NodeHeuristic):
@@ -21,49 +23,42 @@ class TopLeftToBottomRight(NodeHeuristic):
     - Reading order is calculated as: y_position + x_position
     - Nodes with smaller reading order values (top-left) receive higher scores
     - Nodes with larger reading order values (bottom-right) receive lower scores
-    - Scores are normalized across all nodes to ensure consistent priority distribution
+    - Scores are normalized across all nodes in the DAG using a cached SpatialIndex
 
     This creates a predictable execution pattern that follows visual layout conventions,
     making workflow execution more intuitive for users.
     """
 
-    def calculate_priority(self, dag_node: DagNode, **kwargs) -> float:  # noqa: ARG002
-        current_pos = dag_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
-        current_reading_order = current_pos["y"] + current_pos["x"]
+    def __init__(
+        self,
+        context: ParallelResolutionContext,
+        weight: float = 1,
+        max_value: float = 100.0,
+        spatial_index: SpatialIndex | None = None,
+    ) -> None:
+        super().__init__(context, weight=weight, max_value=max_value)
+        self._spatial_index = spatial_index if spatial_index is not None else SpatialIndex(context)
 
-        all_reading_orders = []
-        for node_ref in self._context.node_to_reference.values():
-            pos = node_ref.node_reference.metadata.get("position", {"x": 0, "y": 0})
-            reading_order = pos["y"] + pos["x"]
-            all_reading_orders.append(reading_order)
-
-        if not all_reading_orders or len(all_reading_orders) == 1:
-            return self.max_value / 2
-
-        min_reading_order = min(all_reading_orders)
-        max_reading_order = max(all_reading_orders)
-
-        if max_reading_order == min_reading_order:
-            return self.max_value / 2
-
-        normalized = (current_reading_order - min_reading_order) / (max_reading_order - min_reading_order)
-        return self.max_value - (normalized * 99.0)
+    def calculate_priority(self, dag_node: DagNode, **kwargs) -> float:
+        return self.calculate_priorities_batch([dag_node], **kwargs)[dag_node.node_reference.name]
 
     def calculate_priorities_batch(self, dag_nodes: list[DagNode], **kwargs) -> dict[str, float]:  # noqa: ARG002
         if not dag_nodes:
             return {}
 
-        if len(dag_nodes) == 1:
-            return {dag_nodes[0].node_reference.name: self.max_value / 2}
-
         reading_orders = []
         for dag_node in dag_nodes:
-            pos = dag_node.node_reference.metadata.get("position", {"x": 0, "y": 0})
-            reading_order = pos["y"] + pos["x"]
-            reading_orders.append((dag_node, reading_order))
-
-        min_reading_order = min(ro for _, ro in reading_orders)
-        max_reading_order = max(ro for _, ro in reading_orders)
+            x, y = self._spatial_index.position(dag_node)
+            reading_orders.append((dag_node, y + x))
+
+        # Normalizing against the whole DAG (rather than only the nodes being scored) keeps a
+        # node's score independent of which other nodes happen to be queued, so the priority
+        # queue can re-score nodes individually. Only nodes outside the DAG can widen the bounds.
+        bounds = self._spatial_index.reading_order_bounds()
+        min_reading_order, max_reading_order = bounds if bounds is not None else (float("inf"), float("-inf"))
+        for _, reading_order in reading_orders:
+            min_reading_order = min(min_reading_order, reading_order)
+            max_reading_order = max(max_reading_order, reading_order)
 
         results = {}
         for dag_node, reading_order in reading_orders:
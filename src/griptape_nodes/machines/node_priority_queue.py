@@ -2,21 +2,46 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Any
 
-from griptape_nodes.machines.heuristics import DistanceToNode, HasConnectionFromPrevious, TopLeftToBottomRight
+from griptape_nodes.machines.heuristics import (
+    DistanceToNode,
+    HasConnectionFromPrevious,
+    SpatialIndex,
+    TopLeftToBottomRight,
+)
 
 if TYPE_CHECKING:
     from griptape_nodes.machines.dag_builder import DagNode
     from griptape_nodes.machines.heuristics import NodeHeuristic
     from griptape_nodes.machines.parallel_resolution import ParallelResolutionContext
 
+# Sentinel written into a heap entry's name slot when the entry is invalidated.
+# Invalidated entries stay in the heap and are skipped when popped (lazy deletion).
+_REMOVED = object()
+
+# Compact the heap once invalidated entries outnumber live ones by this factor.
+_COMPACTION_FACTOR = 2
+
 
 class NodePriorityQueue:
     """Manages priority-based ordering of nodes ready for execution.
 
-    This is a simple framework that stores nodes and returns them in priority order.
-    The _calculate_priority() method is the extension point for future heuristics.
+    Queued nodes live in a binary heap of [negated priority, insertion order, node name]
+    entries, with a dict from node name to its live entry for O(1) membership checks.
+    Removing or re-scoring a node invalidates its old entry in place rather than searching
+    the heap for it; invalidated entries are discarded when they reach the top.
+
+    Priorities are recalculated lazily. A node is only re-scored when its own scoring
+    inputs change: when it is first queued, or when it enters or leaves the set of
+    successors of the last resolved node. Every queued node is re-scored only when the
+    last resolved node itself changes, since spatial heuristics are measured from it, or
+    when the DAG's cached spatial summary is rebuilt because nodes were added or moved.
+
+    Blocked nodes (those whose can_queue_for_execution() returned False) are re-checked
+    when a node completes, not on every reorder.
     """
 
     def __init__(self, context: ParallelResolutionContext) -> None:
@@ -26,18 +51,37 @@ class NodePriorityQueue:
             context: The execution context containing node references and DAG state
         """
         self._context = context
-        self._queued_nodes: list[str] = []  # Node names, sorted by priority (highest first)
-        self._blocked_nodes: list[str] = []  # Node names blocked from queuing (not ready yet)
+        self._heap: list[list[Any]] = []  # [-priority, insertion order, node name] entries
+        self._entry_finder: dict[str, list[Any]] = {}  # Node name -> live heap entry
+        self._insertion_counter = itertools.count()
+        self._blocked_nodes: dict[str, None] = {}  # Node names blocked from queuing (not ready yet), in arrival order
+        self._blocked_nodes_stale = False  # Set when a completion may have unblocked a node
+        self._dirty_nodes: set[str] = set()  # Queued nodes that have not been scored yet
         self._needs_reorder = False  # Lazy reorder flag
         self._last_resolved_successors: set[str] = set()  # Nodes connected to last resolved node
+        # Scoring inputs the live heap entries were computed against
+        self._scored_previous_node: str | None = None
+        self._scored_successors: set[str] = set()
+        self._scored_spatial_version: int | None = None
+
+        # Spatial heuristics share one cached summary of the DAG's node positions
+        self._spatial_index = SpatialIndex(context)
 
         # Initialize heuristics with fixed weights
         self._heuristics: list[NodeHeuristic] = [
             HasConnectionFromPrevious(context, weight=1.0),
-            DistanceToNode(context, weight=0.75),
-            TopLeftToBottomRight(context, weight=1.0),
+            DistanceToNode(context, weight=0.75, spatial_index=self._spatial_index),
+            TopLeftToBottomRight(context, weight=1.0, spatial_index=self._spatial_index),
         ]
 
+    def __len__(self) -> int:
+        """Return the number of queued (not blocked) nodes."""
+        return len(self._entry_finder)
+
+    def __contains__(self, node_name: object) -> bool:
+        """Return True if the node is queued or blocked."""
+        return node_name in self._entry_finder or node_name in self._blocked_nodes
+
     def add_node(self, dag_node: DagNode) -> str:
         """Add a node to the priority queue or blocked list based on readiness.
 
@@ -52,14 +96,13 @@ class NodePriorityQueue:
         """
         node_name = dag_node.node_reference.name
 
-        if node_name in self._queued_nodes or node_name in self._blocked_nodes:
+        if node_name in self:
             return node_name
 
         if dag_node.node_reference.can_queue_for_execution():
-            self._queued_nodes.append(node_name)
-            self._needs_reorder = True
+            self._enqueue(node_name)
         else:
-            self._blocked_nodes.append(node_name)
+            self._blocked_nodes[node_name] = None
 
         return node_name
 
@@ -73,8 +116,12 @@ class NodePriorityQueue:
             self._reorder()
             self._needs_reorder = False
 
-        if self._queued_nodes:
-            return self._queued_nodes.pop(0)
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            node_name = entry[-1]
+            if node_name is not _REMOVED:
+                del self._entry_finder[node_name]
+                return node_name
         return None
 
     def remove_node(self, node_name: str) -> None:
@@ -83,18 +130,24 @@ class NodePriorityQueue:
         Args:
             node_name: Name of the node to remove
         """
-        if node_name in self._queued_nodes:
-            self._queued_nodes.remove(node_name)
-        if node_name in self._blocked_nodes:
-            self._blocked_nodes.remove(node_name)
+        entry = self._entry_finder.pop(node_name, None)
+        if entry is not None:
+            entry[-1] = _REMOVED
+        self._blocked_nodes.pop(node_name, None)
+        self._dirty_nodes.discard(node_name)
 
     def mark_priorities_stale(self) -> None:
         """Mark priorities as needing recalculation.
 
         Called when context.last_resolved_node changes and existing
         queued nodes need reprioritization based on the new context.
+        A node completing may also unblock blocked nodes, so they are
+        re-checked on the next reorder.
         """
-        if self._queued_nodes:
+        if self._blocked_nodes:
+            self._blocked_nodes_stale = True
+            self._needs_reorder = True
+        if self._entry_finder:
             self._needs_reorder = True
 
     def check_blocked_nodes(self) -> int:
@@ -103,49 +156,44 @@ class NodePriorityQueue:
         Returns:
             The number of nodes that were promoted from blocked to queued
         """
+        self._blocked_nodes_stale = False
         if not self._blocked_nodes:
             return 0
 
-        promoted_count = 0
-        nodes_still_blocked = []
-
+        promoted = []
         for node_name in self._blocked_nodes:
-            if node_name in self._context.node_to_reference:
-                dag_node = self._context.node_to_reference[node_name]
-                if dag_node.node_reference.can_queue_for_execution():
-                    self._queued_nodes.append(node_name)
-                    self._needs_reorder = True
-                    promoted_count += 1
-                else:
-                    nodes_still_blocked.append(node_name)
-            else:
-                nodes_still_blocked.append(node_name)
-
-        self._blocked_nodes = nodes_still_blocked
-        return promoted_count
+            dag_node = self._context.node_to_reference.get(node_name)
+            if dag_node is not None and dag_node.node_reference.can_queue_for_execution():
+                promoted.append(node_name)
+
+        for node_name in promoted:
+            del self._blocked_nodes[node_name]
+            self._enqueue(node_name)
+
+        return len(promoted)
+
+    def _enqueue(self, node_name: str) -> None:
+        """Push a node with a placeholder priority and mark it for scoring on the next reorder."""
+        entry = [0.0, next(self._insertion_counter), node_name]
+        self._entry_finder[node_name] = entry
+        heapq.heappush(self._heap, entry)
+        self._dirty_nodes.add(node_name)
+        self._needs_reorder = True
 
     def _reorder(self) -> None:
-        """Reorder the queue based on current node priorities."""
+        """Re-score the queued nodes whose priority inputs changed."""
         # Check if any blocked nodes have become unblocked
-        if len(self._blocked_nodes) > 0:
+        if self._blocked_nodes_stale:
             self.check_blocked_nodes()
 
-        if not self._queued_nodes:
-            return
-
-        if len(self._queued_nodes) == 1:
+        previous_executed_node = self._get_previous_executed_node()
+        names_to_score = self._collect_nodes_to_score(previous_executed_node)
+        if not names_to_score:
             return
 
         # Look up DagNodes from context only during reorder
-        dag_nodes = [self._context.node_to_reference[name] for name in self._queued_nodes]
-
-        previous_executed_node = None
-        if self._context.last_resolved_node is not None:
-            node_name = self._context.last_resolved_node.name
-            if node_name in self._context.node_to_reference:
-                previous_executed_node = self._context.node_to_reference[node_name]
-
-        combined_priorities: dict[str, float] = {node.node_reference.name: 0.0 for node in dag_nodes}
+        dag_nodes = [self._context.node_to_reference[name] for name in names_to_score]
+        combined_priorities: dict[str, float] = dict.fromkeys(names_to_score, 0.0)
 
         for heuristic in self._heuristics:
             scores = heuristic.calculate_priorities_batch(
@@ -157,5 +205,53 @@ class NodePriorityQueue:
             for node_name, score in scores.items():
                 combined_priorities[node_name] += score * heuristic.weight
 
-        # Sort the string names directly
-        self._queued_nodes.sort(key=lambda name: combined_priorities[name], reverse=True)
+        if len(names_to_score) == len(self._entry_finder):
+            self._rebuild_heap(combined_priorities)
+            return
+
+        for node_name, priority in combined_priorities.items():
+            old_entry = self._entry_finder[node_name]
+            old_entry[-1] = _REMOVED
+            # Keep the original insertion order so ties still favor the node queued first
+            entry = [-priority, old_entry[1], node_name]
+            self._entry_finder[node_name] = entry
+            heapq.heappush(self._heap, entry)
+
+        if len(self._heap) > _COMPACTION_FACTOR * len(self._entry_finder):
+            self._rebuild_heap({name: -entry[0] for name, entry in self._entry_finder.items()})
+
+    def _get_previous_executed_node(self) -> DagNode | None:
+        if self._context.last_resolved_node is None:
+            return None
+        return self._context.node_to_reference.get(self._context.last_resolved_node.name)
+
+    def _collect_nodes_to_score(self, previous_executed_node: DagNode | None) -> set[str]:
+        """Work out which queued nodes need new scores and record the inputs they will be scored against."""
+        previous_node_name = previous_executed_node.node_reference.name if previous_executed_node else None
+        self._spatial_index.refresh()
+
+        if (
+            previous_node_name != self._scored_previous_node
+            or self._spatial_index.version != self._scored_spatial_version
+        ):
+            # Distances are measured from the previous node and scores are normalized against
+            # the DAG's spatial bounds, so a change to either puts every queued score out of date.
+            names_to_score = set(self._entry_finder)
+        else:
+            changed_successors = self._last_resolved_successors ^ self._scored_successors
+            names_to_score = self._dirty_nodes | (changed_successors & self._entry_finder.keys())
+
+        self._dirty_nodes.clear()
+        self._scored_previous_node = previous_node_name
+        self._scored_successors = set(self._last_resolved_successors)
+        self._scored_spatial_version = self._spatial_index.version
+        return names_to_score
+
+    def _rebuild_heap(self, priorities: dict[str, float]) -> None:
+        """Replace the heap with fresh entries for every queued node, dropping invalidated entries."""
+        self._heap = []
+        for node_name, old_entry in self._entry_finder.items():
+            entry = [-priorities[node_name], old_entry[1], node_name]
+            self._entry_finder[node_name] = entry
+            self._heap.append(entry)
+        heapq.heapify(self._heap)
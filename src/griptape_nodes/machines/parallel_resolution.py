@@ -29,8 +29,8 @@ from griptape_nodes.retained_mode.events.execution_events import (
     ParameterValueUpdateEvent,
 )
 from griptape_nodes.retained_mode.events.parameter_events import (
+    BatchSetParameterValuesRequest,
     SetParameterValueRequest,
-    SetParameterValueResultFailure,
 )
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
@@ -163,8 +163,7 @@ class ExecuteDagState(State):
 
             # Remove start node from ALL networks where it appears
             for network in list(context.networks.values()):
-                if current_node.name in network.nodes():
-                    network.remove_node(current_node.name)
+                network.remove_node(current_node.name)
 
             return
 
@@ -367,7 +366,7 @@ class ExecuteDagState(State):
 
         This method iterates through all input parameters of the current node, finds their
         connected upstream nodes, and if those nodes are resolved, retrieves their output
-        values and passes them through using SetParameterValueRequest.
+        values and passes them all through in one BatchSetParameterValuesRequest.
 
         Args:
             node_reference (DagOrchestrator.DagNode): The node to collect values for.
@@ -384,6 +383,7 @@ class ExecuteDagState(State):
 
         connections = GriptapeNodes.FlowManager().get_connections()
 
+        set_value_requests = []
         for parameter in current_node.parameters:
             # Get the connected upstream node for this parameter
             upstream_connection = connections.get_connected_node(current_node, parameter, direction=Direction.UPSTREAM)
@@ -397,7 +397,7 @@ class ExecuteDagState(State):
                     output_value = upstream_node.get_parameter_value(upstream_parameter.name)
 
                 # Pass the value through using the same mechanism as normal resolution
-                result = await GriptapeNodes.get_instance().ahandle_request(
+                set_value_requests.append(
                     SetParameterValueRequest(
                         parameter_name=parameter.name,
                         node_name=current_node.name,
@@ -407,10 +407,18 @@ class ExecuteDagState(State):
                         incoming_connection_source_parameter_name=upstream_parameter.name,
                     )
                 )
-                if isinstance(result, SetParameterValueResultFailure):
-                    msg = f"Failed to set parameter value for node '{current_node.name}' and parameter '{parameter.name}'. Details: {result.result_details}"
-                    logger.error(msg)
-                    raise RuntimeError(msg)
+
+        if not set_value_requests:
+            return
+
+        result = await GriptapeNodes.get_instance().ahandle_request(
+            BatchSetParameterValuesRequest(node_name=current_node.name, set_value_requests=set_value_requests)
+        )
+        if result.failed():
+            failed_parameter_name = getattr(result, "failed_parameter_name", None)
+            msg = f"Failed to set parameter value for node '{current_node.name}' and parameter '{failed_parameter_name}'. Details: {result.result_details}"
+            logger.error(msg)
+            raise RuntimeError(msg)
 
     @staticmethod
     def build_node_states(context: ParallelResolutionContext) -> NodeStatesResult:
@@ -421,8 +429,7 @@ class ExecuteDagState(State):
             # Reinitialize leaf nodes since maybe we changed things up.
             # We removed nodes from the network. There may be new leaf nodes.
             # Add all leaf nodes from all networks (using set union to avoid duplicates)
-            network_leaf_nodes = [n for n in network.nodes() if network.in_degree(n) == 0]
-            leaf_nodes.update(network_leaf_nodes)
+            leaf_nodes.update(network.leaf_nodes())
         canceled_nodes = set()
         for node in leaf_nodes:
             node_reference = context.node_to_reference[node]
@@ -446,22 +453,16 @@ class ExecuteDagState(State):
             # Check and see if there are leaf nodes that are cancelled.
             # Reinitialize leaf nodes since maybe we changed things up.
             # We removed nodes from the network. There may be new leaf nodes.
-            leaf_nodes = [n for n in network.nodes() if network.in_degree(n) == 0]
-            for node in leaf_nodes:
+            # The network tracks its leaves incrementally, so this does not scan every node.
+            for node in network.leaf_nodes():
                 node_reference = context.node_to_reference[node]
                 node_state = node_reference.node_state
                 # If the node is locked, mark it as done so it skips execution
                 if node_reference.node_reference.lock or node_state == NodeState.DONE:
                     node_reference.node_state = NodeState.DONE
 
-                    # Initialize successors set with data successors from this network
-                    successors = set()
-                    for other_node in network.nodes():
-                        if node in network._predecessors.get(other_node, set()):
-                            successors.add(other_node)
-
                     # Set initial data successors (control successors will be added in handle_done_nodes)
-                    context.node_priority_queue._last_resolved_successors = successors
+                    context.node_priority_queue._last_resolved_successors = network.successors(node)
 
                     network.remove_node(node)
 
@@ -472,11 +473,7 @@ class ExecuteDagState(State):
                         await ExecuteDagState.handle_done_nodes(context, context.node_to_reference[node], network_name)
 
             # After processing completions in this network, check if any remaining leaf nodes can now be queued
-            remaining_leaf_nodes = [n for n in network.nodes() if network.in_degree(n) == 0]
-
-            for leaf_node in remaining_leaf_nodes:
-                if leaf_node in context.node_to_reference:
-                    node_state = context.node_to_reference[leaf_node].node_state
+            for leaf_node in network.leaf_nodes():
                 ExecuteDagState._try_queue_waiting_node(context, leaf_node)
 
     @staticmethod
@@ -0,0 +1,163 @@
+"""Persisted manifest of a library's node classes, used to import node modules lazily.
+
+Loading a library used to import every node module up front, even for nodes a session never
+uses. After a library's node modules are imported once, the manifest records where each node
+class lives and which classes it derives from. While the library's files are unchanged, later
+loads register each node from the manifest and import its module on first use.
+
+The manifest is keyed by a fingerprint of the library's JSON file and Python sources (paths,
+sizes, and modification times), its venv's site-packages directory, and the engine version, so
+editing any of them or changing the installed dependencies rebuilds it.
+
+Until a lazily registered node's module is imported, a LazyModuleAlias stands in for it under
+its stable "griptape_nodes.node_libraries..." name, so saved workflows and pickles that import
+the module by that name still find it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ValidationError
+from xdg_base_dirs import xdg_cache_home
+
+from griptape_nodes.utils.file_utils import atomic_write_bytes
+from griptape_nodes.utils.version_utils import engine_version
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger("griptape_nodes")
+
+# Bump when the manifest layout changes so manifests written by older engines are rebuilt
+LIBRARY_MANIFEST_VERSION = 2
+
+# Directories skipped when fingerprinting a library's Python sources (as are directories starting with '.')
+_EXCLUDED_FINGERPRINT_DIRECTORIES = frozenset({"venv", "__pycache__"})
+
+
+class NodeManifestEntry(BaseModel):
+    """Where a node class lives and the classes it derives from."""
+
+    class_name: str
+    file_path: str
+    # "module.QualifiedName" of every class in the node class's MRO
+    base_classes: list[str]
+
+
+class LibraryManifest(BaseModel):
+    """The node classes of one library, as of the fingerprinted sources."""
+
+    manifest_version: int = LIBRARY_MANIFEST_VERSION
+    fingerprint: str
+    nodes: list[NodeManifestEntry]
+
+
+def get_class_path(cls: type) -> str:
+    """Get the "module.QualifiedName" a manifest records for a class."""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def get_library_manifest_path(library_file_path: str | Path) -> Path:
+    """Get where the manifest for a library JSON file is stored."""
+    key = hashlib.sha256(str(Path(library_file_path).absolute()).encode()).hexdigest()
+    return xdg_cache_home() / "griptape_nodes" / "library_manifests" / f"{key}.json"
+
+
+def compute_library_fingerprint(
+    library_file_path: str | Path, base_dir: Path, site_packages: Path | None = None
+) -> str:
+    """Fingerprint a library's JSON file, Python sources, and installed dependencies.
+
+    Args:
+        library_file_path: Path to the library JSON file.
+        base_dir: The library's base directory, scanned for Python sources.
+        site_packages: The library venv's site-packages directory, if it has one. Installing,
+            upgrading, or removing a package changes its entries and so its modification time.
+
+    Returns:
+        A digest that changes when any source is added, removed, resized, or modified, or when
+        the venv's packages change.
+    """
+    hasher = hashlib.sha256(f"{LIBRARY_MANIFEST_VERSION}:{engine_version}".encode())
+    paths = [Path(library_file_path)]
+    for root, dirs, files_found in os.walk(base_dir):
+        dirs[:] = sorted(d for d in dirs if d not in _EXCLUDED_FINGERPRINT_DIRECTORIES and not d.startswith("."))
+        paths.extend(Path(root) / file for file in sorted(files_found) if file.endswith(".py"))
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        hasher.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    if site_packages is not None:
+        try:
+            stat = site_packages.stat()
+        except OSError:
+            hasher.update(f"site-packages:{site_packages}\0missing\n".encode())
+        else:
+            hasher.update(f"site-packages:{site_packages}\0{stat.st_ino}\0{stat.st_mtime_ns}\n".encode())
+    return hasher.hexdigest()
+
+
+def load_library_manifest(library_file_path: str | Path, fingerprint: str) -> LibraryManifest | None:
+    """Load the manifest for a library if it matches the library's current fingerprint.
+
+    Returns:
+        The manifest, or None if there is none or it is stale or unreadable.
+    """
+    manifest_path = get_library_manifest_path(library_file_path)
+    try:
+        manifest = LibraryManifest.model_validate_json(manifest_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError) as err:
+        logger.debug("Ignoring unreadable library manifest '%s': %s", manifest_path, err)
+        return None
+    if manifest.manifest_version != LIBRARY_MANIFEST_VERSION or manifest.fingerprint != fingerprint:
+        return None
+    return manifest
+
+
+def write_library_manifest(library_file_path: str | Path, manifest: LibraryManifest) -> None:
+    """Store the manifest for a library. Failures are logged, since the manifest is only a cache."""
+    manifest_path = get_library_manifest_path(library_file_path)
+    try:
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(manifest_path, manifest.model_dump_json().encode())
+    except OSError as err:
+        logger.debug("Could not write library manifest '%s': %s", manifest_path, err)
+
+
+class LazyModuleAlias(ModuleType):
+    """Stands in for a library node module under its stable name until the module is used.
+
+    Importing the stable name finds this placeholder in sys.modules. Reading any attribute
+    from it loads the real module, which registers itself under the same name and replaces
+    the placeholder, and returns the attribute from the real module.
+    """
+
+    def __init__(self, name: str, load_module: Callable[[], ModuleType]) -> None:
+        """Create the placeholder.
+
+        Args:
+            name: The stable module name the placeholder is registered under.
+            load_module: Loads the real module and registers it under the stable name.
+        """
+        super().__init__(name)
+        self.__load_module = load_module
+
+    def __getattr__(self, attribute_name: str) -> Any:
+        # The import system probes dunders like __path__ on every import; those must not load
+        if attribute_name.startswith("__") and attribute_name.endswith("__"):
+            raise AttributeError(attribute_name)
+        module = sys.modules.get(self.__name__)
+        if module is None or isinstance(module, LazyModuleAlias):
+            module = self.__load_module()
+        return getattr(module, attribute_name)
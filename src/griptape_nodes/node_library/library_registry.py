@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
@@ -42,6 +43,14 @@ logger = logging.getLogger("griptape_nodes")
 _constructing_node: ContextVar[bool] = ContextVar("_library_registry_constructing_node", default=False)
 
 
+class LazyNodeType(NamedTuple):
+    """A node type whose class is imported on first use."""
+
+    load_node_class: Callable[[], type[BaseNode]]
+    # "module.QualifiedName" of every class in the node class's MRO
+    base_classes: frozenset[str]
+
+
 class LibraryNameAndVersion(NamedTuple):
     library_name: str
     library_version: str
@@ -524,6 +533,9 @@ class Library:
     # Maintain fast lookups for node class name to class and to its metadata.
     _node_types: dict[str, type[BaseNode]]
     _node_metadata: dict[str, NodeMetadata]
+    # Node types registered without importing their class yet. Moved into _node_types on first use.
+    _lazy_node_types: dict[str, LazyNodeType]
+    _lazy_node_types_lock: threading.Lock
     _advanced_library: AdvancedNodeLibrary | None
     # Tracks handlers registered on behalf of this library so they can be
     # deregistered automatically when the library is unloaded.
@@ -548,6 +560,8 @@ class Library:
 
         self._node_types = {}
         self._node_metadata = {}
+        self._lazy_node_types = {}
+        self._lazy_node_types_lock = threading.Lock()
         self._advanced_library = advanced_library
         self._registered_app_event_listeners = []
         self._registered_pre_dispatch_hooks = []
@@ -584,9 +598,41 @@ class Library:
         )
 
         self._node_types[node_class_as_str] = node_class
+        self._lazy_node_types.pop(node_class_as_str, None)
         self._node_metadata[node_class_as_str] = metadata
         return library_problem
 
+    def register_lazy_node_type(
+        self, node_class_name: str, metadata: NodeMetadata, lazy_node_type: LazyNodeType
+    ) -> LibraryProblem | None:
+        """Register a node type whose class is imported the first time it is needed.
+
+        Returns a LibraryProblem if registration fails, or None if all clear.
+        """
+        library_problem = LibraryRegistry.register_node_type_from_library(library=self, node_class_name=node_class_name)
+
+        self._lazy_node_types[node_class_name] = lazy_node_type
+        self._node_metadata[node_class_name] = metadata
+        return library_problem
+
+    def _get_node_class(self, node_type: str) -> type[BaseNode] | None:
+        """Get a registered node class, importing it if it was registered lazily."""
+        node_class = self._node_types.get(node_type)
+        if node_class is not None or node_type not in self._lazy_node_types:
+            return node_class
+        # Nodes can be created from worker threads; import each class only once.
+        with self._lazy_node_types_lock:
+            node_class = self._node_types.get(node_type)
+            if node_class is not None:
+                return node_class
+            lazy_node_type = self._lazy_node_types.get(node_type)
+            if lazy_node_type is None:
+                return None
+            node_class = lazy_node_type.load_node_class()
+            self._node_types[node_type] = node_class
+            del self._lazy_node_types[node_type]
+        return node_class
+
     def unregister_node_type(self, node_class_name: str) -> None:
         """Remove a single node type from this library.
 
@@ -595,13 +641,14 @@ class Library:
         class that are already living in a flow; callers are responsible for deleting and
         recreating them if they want the new class to take effect.
         """
-        if node_class_name not in self._node_types:
+        if node_class_name not in self._node_types and node_class_name not in self._lazy_node_types:
             msg = (
                 f"Node type '{node_class_name}' was requested to be unregistered from library "
                 f"'{self._library_data.name}', but it wasn't registered in the first place."
             )
             raise KeyError(msg)
-        del self._node_types[node_class_name]
+        self._node_types.pop(node_class_name, None)
+        self._lazy_node_types.pop(node_class_name, None)
         self._node_metadata.pop(node_class_name, None)
 
     def get_library_data(self) -> LibrarySchema:
@@ -634,7 +681,7 @@ class Library:
         metadata: dict[Any, Any] | None = None,
     ) -> BaseNode:
         """Create a new node instance of the specified type."""
-        node_class = self._node_types.get(node_type)
+        node_class = self._get_node_class(node_type)
         if not node_class:
             msg = f"Node type '{node_type}' not found in library '{self._library_data.name}'"
             raise KeyError(msg)
@@ -660,10 +707,14 @@ class Library:
 
     def get_registered_nodes(self) -> list[str]:
         """Get a list of all registered node types."""
-        return list(self._node_types.keys())
+        return [
+            node_type
+            for node_type in self._node_metadata
+            if node_type in self._node_types or node_type in self._lazy_node_types
+        ]
 
     def has_node_type(self, node_type: str) -> bool:
-        return node_type in self._node_types
+        return node_type in self._node_types or node_type in self._lazy_node_types
 
     def get_node_metadata(self, node_type: str) -> NodeMetadata:
         if node_type not in self._node_metadata:
@@ -677,9 +728,10 @@ class Library:
         `allow_outgoing_connection_by_class`, rather than an instance produced
         by `create_node`.
         """
-        if node_type not in self._node_types:
+        node_class = self._get_node_class(node_type)
+        if node_class is None:
             raise KeyError(self._library_data.name, node_type)
-        return self._node_types[node_type]
+        return node_class
 
     def get_categories(self) -> list[dict[str, CategoryDefinition]]:
         return self._library_data.categories
@@ -707,9 +759,16 @@ class Library:
         Returns:
             List of node type names that extend the base type
         """
+        # Lazily registered node types are matched by name, so checking them doesn't import them.
+        base_class = f"{base_type.__module__}.{base_type.__qualname__}"
         matching_nodes = []
-        for node_type, node_class in self._node_types.items():
-            if issubclass(node_class, base_type):
+        for node_type in self.get_registered_nodes():
+            lazy_node_type = self._lazy_node_types.get(node_type)
+            if lazy_node_type is not None:
+                matches = base_class in lazy_node_type.base_classes
+            else:
+                matches = issubclass(self._node_types[node_type], base_type)
+            if matches:
                 matching_nodes.append(node_type)
         return matching_nodes
 
@@ -13,6 +13,7 @@ from griptape_nodes.retained_mode.events.base_events import (
 from griptape_nodes.retained_mode.events.payload_registry import PayloadRegistry
 from griptape_nodes.retained_mode.events.project_events import MacroPath
 from griptape_nodes.retained_mode.managers.authorization_checkpoint import CheckpointDenial
+from griptape_nodes.utils.preview_executor import PreviewPriority
 
 
 class ArtifactFailureReason(StrEnum):
@@ -61,6 +62,7 @@ class GeneratePreviewRequest(RequestPayload):
         preview_generator_name: Preview generator to use (None for provider default)
         preview_generator_parameters: Parameters for the preview generator (e.g., max_width, max_height)
         generate_preview_metadata_json: Whether to generate metadata JSON file alongside preview
+        preview_priority: Scheduling priority of the preview render against other queued previews
 
     Results: GeneratePreviewResultSuccess | GeneratePreviewResultFailure
     """
@@ -71,6 +73,7 @@ class GeneratePreviewRequest(RequestPayload):
     preview_generator_name: str | None = None
     preview_generator_parameters: dict[str, Any] = field(default_factory=dict)
     generate_preview_metadata_json: bool = False
+    preview_priority: PreviewPriority = PreviewPriority.NORMAL
 
 
 @dataclass
@@ -108,12 +111,14 @@ class GeneratePreviewFromDefaultsRequest(RequestPayload):
     Args:
         macro_path: MacroPath with parsed macro and variables
         artifact_provider_name: Specific provider to use
+        preview_priority: Scheduling priority of the preview render against other queued previews
 
     Results: GeneratePreviewFromDefaultsResultSuccess | GeneratePreviewFromDefaultsResultFailure
     """
 
     macro_path: MacroPath
     artifact_provider_name: str
+    preview_priority: PreviewPriority = PreviewPriority.NORMAL
 
 
 @dataclass
@@ -146,6 +151,8 @@ class GetPreviewForArtifactRequest(RequestPayload):
         macro_path: MacroPath with parsed macro and variables
         artifact_provider_name: Provider to use for generation (required - no auto-detection)
         preview_generation_policy: When to generate/regenerate the preview
+        preview_priority: Scheduling priority of a preview generated by this request (default
+            VISIBLE, as the preview is being requested for display)
 
     Results: GetPreviewForArtifactResultSuccess | GetPreviewForArtifactResultFailure
     """
@@ -153,6 +160,7 @@ class GetPreviewForArtifactRequest(RequestPayload):
     macro_path: MacroPath
     artifact_provider_name: str
     preview_generation_policy: PreviewGenerationPolicy = PreviewGenerationPolicy.IF_DOES_NOT_MATCH_USER_PREVIEW_SETTINGS
+    preview_priority: PreviewPriority = PreviewPriority.VISIBLE
 
 
 @dataclass
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from griptape_nodes.retained_mode.events.event_codec import get_event_codec
 from griptape_nodes.retained_mode.events.event_converter import (
     converter,
     register_polymorphic_dataclass,
@@ -336,9 +337,14 @@ class BaseEvent(BaseModel, ABC):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # Fields that subclasses serialize themselves in dict(), so the base pass skips them
+    _serialized_separately: ClassVar[frozenset[str]] = frozenset()
+
     def dict(self, *args, **kwargs) -> dict[str, Any]:
         """Override dict to handle payload serialization and add event_type."""
-        result = super().dict(*args, **kwargs)
+        if self._serialized_separately and "exclude" not in kwargs:
+            kwargs["exclude"] = set(self._serialized_separately)
+        result = self.model_dump(*args, **kwargs)
 
         # Add event type based on class name
         result["event_type"] = self.__class__.__name__
@@ -361,7 +367,10 @@ class BaseEvent(BaseModel, ABC):
             )
             return str(obj)
 
-        return json.dumps(self.dict(), default=_default, **kwargs)
+        if kwargs:
+            # Formatting options such as indent are only supported by the stdlib encoder
+            return json.dumps(self.dict(), default=_default, **kwargs)
+        return get_event_codec().dumps(self.dict(), default=_default)
 
     @abstractmethod
     def get_request(self) -> Payload:
@@ -379,6 +388,8 @@ class EventRequest[P: Payload](BaseEvent):
     request_id: str | None = None
     response_topic: str | None = None
 
+    _serialized_separately: ClassVar[frozenset[str]] = frozenset({"request"})
+
     def __init__(self, **data) -> None:
         """Initialize an EventRequest, inferring the generic type if needed."""
         # Call the parent class initializer
@@ -425,6 +436,8 @@ class EventRequestBatch(BaseEvent):
 
     requests: list[EventRequest] = Field(default_factory=list)
 
+    _serialized_separately: ClassVar[frozenset[str]] = frozenset({"requests"})
+
     def dict(self, *args, **kwargs) -> dict[str, Any]:
         """Serialize the envelope, recursing into each inner request's own serializer."""
         result = super().dict(*args, **kwargs)
@@ -457,6 +470,8 @@ class EventResult[P: RequestPayload, R: ResultPayload](BaseEvent, ABC):
     response_topic: str | None = None
     retained_mode: str | None = None
 
+    _serialized_separately: ClassVar[frozenset[str]] = frozenset({"request", "result"})
+
     def __init__(self, **data) -> None:
         """Initialize an EventResult, inferring the generic types if needed."""
         # Call the parent class initializer
@@ -549,6 +564,8 @@ class EventResultFailure(EventResult[P, R]):
 class ExecutionEvent[E: ExecutionPayload](BaseEvent):
     payload: E
 
+    _serialized_separately: ClassVar[frozenset[str]] = frozenset({"payload"})
+
     def __init__(self, **data) -> None:
         """Initialize an ExecutionEvent, inferring the generic type if needed."""
         # Call the parent class initializer
@@ -583,6 +600,8 @@ class ExecutionEvent[E: ExecutionPayload](BaseEvent):
 class AppEvent[A: AppPayload](BaseEvent):
     payload: A
 
+    _serialized_separately: ClassVar[frozenset[str]] = frozenset({"payload"})
+
     def __init__(self, **data) -> None:
         """Initialize an AppEvent, inferring the generic type if needed."""
         # Call the parent class initializer
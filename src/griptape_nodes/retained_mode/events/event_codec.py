@@ -0,0 +1,155 @@
+"""Pluggable JSON codecs for serializing events on the wire.
+
+Every event sent to the editor, to workers, or between a subprocess and its parent is
+encoded as JSON text, and every received message is decoded from it. The stdlib json module
+is used unless GTN_EVENT_CODEC names another registered codec, such as orjson when it is
+installed. All codecs produce standard JSON text, so each end picks its own codec without
+negotiation.
+
+Faster codecs are opt-in because their output is not byte-for-byte the stdlib's: orjson, for
+example, writes NaN and infinities as null where the stdlib writes NaN and Infinity.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+EVENT_CODEC_ENV_VAR = "GTN_EVENT_CODEC"
+
+# Codec used when GTN_EVENT_CODEC is unset or names a codec that is not available
+DEFAULT_EVENT_CODEC = "json"
+
+
+class EventCodec(ABC):
+    """Encodes values to JSON text and decodes JSON text back to values."""
+
+    name: ClassVar[str]
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Return whether this codec's dependencies are installed."""
+        return True
+
+    @abstractmethod
+    def dumps(self, value: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+        """Encode a value as JSON text.
+
+        Args:
+            value: Value made of dicts, lists, and JSON scalars.
+            default: Called for objects the codec can't encode; returns an encodable replacement.
+        """
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any:
+        """Decode JSON text.
+
+        Raises:
+            json.JSONDecodeError: If the data is not valid JSON.
+        """
+
+
+class StdlibJsonCodec(EventCodec):
+    """Codec backed by the stdlib json module."""
+
+    name = "json"
+
+    def dumps(self, value: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+        return json.dumps(value, default=default)
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(EventCodec):
+    """Codec backed by orjson, used when GTN_EVENT_CODEC=orjson and it is installed.
+
+    Datetimes and dataclasses are passed to ``default`` as the stdlib codec does, rather than
+    encoded in orjson's own format. Unlike the stdlib codec, NaN and infinities are encoded as
+    null and enums as their value.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        self._fallback = StdlibJsonCodec()
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return importlib.util.find_spec("orjson") is not None
+
+    def dumps(self, value: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+        try:
+            return self._orjson.dumps(value, default=default, option=self._options).decode()
+        except TypeError:
+            # orjson rejects some values the stdlib accepts, such as integers over 64 bits
+            return self._fallback.dumps(value, default=default)
+
+    def loads(self, data: str | bytes) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return self._orjson.loads(data)
+
+
+_codec_types: dict[str, type[EventCodec]] = {}
+_active_codec: EventCodec | None = None
+
+
+def register_event_codec(codec_type: type[EventCodec]) -> type[EventCodec]:
+    """Register a codec so it can be selected by name.
+
+    Args:
+        codec_type: The codec class to register.
+
+    Returns:
+        The registered class (for decorator use).
+    """
+    _codec_types[codec_type.name] = codec_type
+    return codec_type
+
+
+register_event_codec(StdlibJsonCodec)
+register_event_codec(OrjsonCodec)
+
+
+def get_event_codec() -> EventCodec:
+    """Get the codec used for events in this process, choosing it on first use."""
+    global _active_codec  # noqa: PLW0603
+    if _active_codec is None:
+        _active_codec = _select_event_codec(os.getenv(EVENT_CODEC_ENV_VAR))
+    return _active_codec
+
+
+def set_event_codec(name: str | None) -> EventCodec:
+    """Choose the codec used for events in this process.
+
+    Args:
+        name: Name of a registered codec, or None to use the default stdlib codec.
+
+    Returns:
+        The codec now in use.
+    """
+    global _active_codec  # noqa: PLW0603
+    _active_codec = _select_event_codec(name)
+    return _active_codec
+
+
+def _select_event_codec(name: str | None) -> EventCodec:
+    if name:
+        codec_type = _codec_types.get(name)
+        if codec_type is not None and codec_type.is_available():
+            return codec_type()
+        logger.warning("Event codec '%s' is not available; using the '%s' codec instead.", name, DEFAULT_EVENT_CODEC)
+    return _codec_types[DEFAULT_EVENT_CODEC]()
@@ -71,6 +71,12 @@ class StartFlowRequest(RequestPayload):
             can read output values immediately afterwards without polling node state themselves.
         completion_timeout_ms: Only meaningful when wait_for_completion=True. Maximum time to
             wait for the flow to resolve. None means wait indefinitely.
+        run_concurrently: When True, the flow runs on its own control flow machine instead of the
+            global one, so it can execute alongside other flows. The handler returns once the flow
+            finishes. At most max_concurrent_flows such flows execute at once; the rest wait for a
+            slot. Not supported with debug_mode.
+        max_nodes_in_parallel: Only meaningful when run_concurrently=True. Maximum number of this
+            flow's nodes executing at a time. None uses the configured execution mode.
 
     Results: StartFlowResultSuccess | StartFlowResultFailure (with validation exceptions)
     """
@@ -83,6 +89,8 @@ class StartFlowRequest(RequestPayload):
     pickle_control_flow_result: bool = False
     wait_for_completion: bool = False
     completion_timeout_ms: int | None = None
+    run_concurrently: bool = False
+    max_nodes_in_parallel: int | None = None
 
 
 @dataclass
@@ -525,6 +525,9 @@ class SerializedParameterValueTracker:
             A dictionary mapping value hashes to their unique UUIDs when they are serializable.
         _non_serializable_value_hashes (set[Any]):
             A set of value hashes that are not serializable.
+        _pickled_values (dict[bytes, bytes]):
+            The pickles recorded so far, keyed by their contents, so equal but distinct values
+            share one copy of their bytes while keeping their own unique UUIDs.
     """
 
     class TrackerState(Enum):
@@ -538,6 +541,7 @@ class SerializedParameterValueTracker:
         default_factory=dict
     )
     _non_serializable_value_hashes: set[Any] = field(default_factory=set)
+    _pickled_values: dict[bytes, bytes] = field(default_factory=dict)
 
     def get_tracker_state(self, value_hash: Any) -> TrackerState:
         if value_hash in self._non_serializable_value_hashes:
@@ -557,6 +561,10 @@ class SerializedParameterValueTracker:
     def get_uuid_for_value_hash(self, value_hash: Any) -> SerializedNodeCommands.UniqueParameterValueUUID:
         return self._value_hash_to_unique_value_uuid[value_hash]
 
+    def intern_pickled_value(self, pickled_bytes: bytes) -> bytes:
+        """Get the recorded pickle with the same contents, recording this one if there is none."""
+        return self._pickled_values.setdefault(pickled_bytes, pickled_bytes)
+
     def get_serializable_count(self) -> int:
         return len(self._value_hash_to_unique_value_uuid)
 
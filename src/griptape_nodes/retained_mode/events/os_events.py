@@ -477,6 +477,11 @@ class ReadFileRequest(RequestPayload):
                         TODO: Remove workspace_only parameter - see https://github.com/griptape-ai/griptape-nodes/issues/2753
         should_transform_image_content_to_thumbnail: If True, convert image files to thumbnail data URLs.
                         If False, return raw image bytes. Default True for backwards compatibility.
+        byte_offset: Index of the first byte to read (default: 0)
+        byte_length: Maximum number of bytes to read. None reads to the end of the file.
+                        When a range is requested (byte_offset or byte_length set), only that range is
+                        read, images are never transformed to thumbnails, and file_size in the result is
+                        the size of the returned range.
 
     Results: ReadFileResultSuccess (with content) | ReadFileResultFailure (file not found, permission denied)
     """
@@ -487,6 +492,8 @@ class ReadFileRequest(RequestPayload):
     encoding: str = "utf-8"
     workspace_only: bool | None = True  # TODO: Remove - see https://github.com/griptape-ai/griptape-nodes/issues/2753
     should_transform_image_content_to_thumbnail: bool = True
+    byte_offset: int = 0
+    byte_length: int | None = None
 
 
 @dataclass
@@ -282,6 +282,50 @@ class SetParameterValueResultFailure(ResultPayloadFailure):
     """
 
 
+@dataclass
+@PayloadRegistry.register
+class BatchSetParameterValuesRequest(RequestPayload):
+    """Set several parameter values on one node in a single request.
+
+    Use when: Passing resolved upstream values into a node before it runs, or setting many
+    values on one node at once. Each value goes through the same checks, converters, and
+    validators as a SetParameterValueRequest, but the batch is dispatched and broadcast once.
+
+    Args:
+        node_name: Name of the node to set values on
+        set_value_requests: Values to set, applied in order. Each request's node_name must be None or node_name.
+
+    Results: BatchSetParameterValuesResultSuccess (with finalized values) | BatchSetParameterValuesResultFailure (stops at the first value that fails)
+    """
+
+    node_name: str
+    set_value_requests: list[SetParameterValueRequest]
+
+
+@dataclass
+@PayloadRegistry.register
+class BatchSetParameterValuesResultSuccess(WorkflowAlteredMixin, ResultPayloadSuccess):
+    """All parameter values set successfully.
+
+    Args:
+        finalized_values: The value stored for each parameter after processing, by parameter name
+    """
+
+    finalized_values: dict[str, Any]
+
+
+@dataclass
+@PayloadRegistry.register
+class BatchSetParameterValuesResultFailure(ResultPayloadFailure):
+    """A parameter value in the batch could not be set. Values before it in the batch remain set.
+
+    Args:
+        failed_parameter_name: Name of the parameter that failed, or None if the batch was rejected as a whole
+    """
+
+    failed_parameter_name: str | None = None
+
+
 @dataclass
 @PayloadRegistry.register
 class GetParameterDetailsRequest(RequestPayload):
@@ -38,9 +38,9 @@ class PayloadRegistry(metaclass=SingletonMeta):
         Returns:
             The payload class or None if not found
         """
-        # Ensure we have an instance
-        instance = cls()
-        return instance._registry.get(type_name)
+        # Looked up on every deserialized event, so read the class-level registry directly
+        # rather than going through the singleton instance
+        return cls._registry.get(type_name)
 
     @classmethod
     def get_registry(cls) -> dict:
@@ -1124,6 +1124,8 @@ class SaveWorkflowFileFromSerializedFlowRequest(RequestPayload):
         workflow_shape: Optional workflow shape defining inputs and outputs for external callers
         file_path: Optional specific file path to use (defaults to workspace path if not provided)
         pickle_control_flow_result: Whether to pickle control flow results in generated execution code (defaults to False)
+        store_large_values_externally: Whether large parameter values are stored next to the file instead of embedded in it.
+            Set to False for temporary or published files that are copied or deleted on their own (defaults to True)
 
     Results: SaveWorkflowFileFromSerializedFlowResultSuccess (with file path) | SaveWorkflowFileFromSerializedFlowResultFailure (save error)
     """
@@ -1139,6 +1141,7 @@ class SaveWorkflowFileFromSerializedFlowRequest(RequestPayload):
     branched_from: str | None = None
     workflow_shape: WorkflowShape | None = None
     pickle_control_flow_result: bool = False
+    store_large_values_externally: bool = True
 
 
 @dataclass
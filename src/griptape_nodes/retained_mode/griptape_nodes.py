@@ -402,7 +402,10 @@ class GriptapeNodes(metaclass=SingletonMeta):
         # Cancel any running flow so the delete path doesn't race with execution.
         flow_manager = GriptapeNodes.FlowManager()
         for flow_name in GriptapeNodes.ObjectManager().get_filtered_subset(type=ControlFlow):
-            if flow_manager.check_for_existing_running_flow():
+            if (
+                flow_manager.check_for_existing_running_flow()
+                or flow_manager.flow_execution_registry.get_context(flow_name) is not None
+            ):
                 GriptapeNodes.handle_request(CancelFlowRequest(flow_name=flow_name))
 
         # Delete all orphan (top-level) flows. We can't rely on
@@ -59,6 +59,7 @@ from griptape_nodes.retained_mode.events.config_events import (
 from griptape_nodes.retained_mode.events.os_events import (
     DeleteFileRequest,
     ExistingFilePolicy,
+    FileSystemEntry,
     GetFileInfoRequest,
     GetFileInfoResultSuccess,
     ReadFileRequest,
@@ -102,12 +103,19 @@ from griptape_nodes.retained_mode.managers.artifact_providers.artifact_schema_mo
     PreviewGeneratorSchema,
     ProviderSchema,
 )
+from griptape_nodes.retained_mode.managers.artifact_providers.preview_index import (
+    IndexedPreview,
+    PreviewIndex,
+    compute_preview_key,
+    hash_source_file,
+)
 from griptape_nodes.retained_mode.managers.artifact_providers.utils import (
     normalize_friendly_name_to_key,
 )
 from griptape_nodes.retained_mode.managers.authorization_checkpoint import CheckpointDenial
 from griptape_nodes.retained_mode.managers.event_manager import EventManager
 from griptape_nodes.utils.async_utils import to_thread
+from griptape_nodes.utils.preview_executor import preview_priority
 
 logger = logging.getLogger("griptape_nodes")
 
@@ -181,6 +189,9 @@ class ArtifactManager:
         # Provider registry for managing artifact providers
         self._registry = ProviderRegistry()
 
+        # Generated previews by source content, shared across paths and projects
+        self._preview_index = PreviewIndex()
+
         if event_manager is not None:
             event_manager.assign_manager_to_request_type(
                 GeneratePreviewRequest, self.on_handle_generate_preview_request
@@ -488,14 +499,15 @@ class ArtifactManager:
 
         # FAILURE CASE: Call provider and get returned filenames
         try:
-            preview_file_names = await provider_instance.attempt_generate_preview(
-                preview_generator_friendly_name=generator_name,
-                source_file_location=source_path,
-                preview_format=preview_format,
-                destination_preview_directory=str(destination_dir),
-                destination_preview_file_name=preview_file_name,
-                params=request.preview_generator_parameters,
-            )
+            with preview_priority(request.preview_priority):
+                preview_file_names = await provider_instance.attempt_generate_preview(
+                    preview_generator_friendly_name=generator_name,
+                    source_file_location=source_path,
+                    preview_format=preview_format,
+                    destination_preview_directory=str(destination_dir),
+                    destination_preview_file_name=preview_file_name,
+                    params=request.preview_generator_parameters,
+                )
         except Exception as e:
             return GeneratePreviewResultFailure(
                 result_details=f"Attempted to generate preview for '{source_path}'. Failed due to: {e}"
@@ -503,6 +515,7 @@ class ArtifactManager:
 
         # OPTIONAL: Generate metadata if requested
         metadata_path = None
+        artifact_metadata = None
         if request.generate_preview_metadata_json:
             # Helper to clean up preview file(s) on metadata failure
             def fail_with_cleanup(error_details: str) -> GeneratePreviewResultFailure:
@@ -531,6 +544,7 @@ class ArtifactManager:
             # Run in a thread because video providers shell out to ffprobe synchronously,
             # which would otherwise block the event loop.
             _artifact_metadata = await to_thread(provider_class.get_artifact_metadata, source_path)
+            artifact_metadata = _artifact_metadata.model_dump() if _artifact_metadata else None
             metadata = PreviewMetadata(
                 version=PreviewMetadata.LATEST_SCHEMA_VERSION,
                 source_macro_path=request.macro_path.parsed_macro.template,
@@ -539,7 +553,7 @@ class ArtifactManager:
                 preview_file_names=preview_file_names,
                 preview_generator_name=generator_name,
                 preview_generator_parameters=deepcopy(request.preview_generator_parameters),
-                artifact_metadata=_artifact_metadata.model_dump() if _artifact_metadata else None,
+                artifact_metadata=artifact_metadata,
             )
 
             # Step 2: Serialize to JSON
@@ -574,6 +588,23 @@ class ArtifactManager:
         else:
             paths_to_preview = {key: str(destination_dir / filename) for key, filename in preview_file_names.items()}
 
+        # Index the preview so copies of this content elsewhere find it
+        content_hash = await self._get_source_content_hash(
+            source_path, file_info_result.file_entry.size, file_info_result.file_entry.modified_time
+        )
+        if content_hash is not None:
+            preview_key = self._get_preview_key(
+                content_hash,
+                request.artifact_provider_name,
+                generator_name,
+                request.preview_generator_parameters,
+                preview_format,
+            )
+            self._preview_index.put_preview(
+                preview_key,
+                IndexedPreview.from_files(paths_to_preview=paths_to_preview, artifact_metadata=artifact_metadata),
+            )
+
         result_message = f"Successfully generated preview of {source_path}"
         if metadata_path is not None:
             result_message += f". Metadata at {metadata_path}"
@@ -625,6 +656,7 @@ class ArtifactManager:
             preview_generator_name=settings.generator_name,
             preview_generator_parameters=settings.generator_params.model_dump(),
             generate_preview_metadata_json=True,
+            preview_priority=request.preview_priority,
         )
 
         result = await self.on_handle_generate_preview_request(generate_request)
@@ -710,6 +742,18 @@ class ArtifactManager:
 
         # EARLY CASE: Missing metadata - match on policy
         if not metadata_exists:
+            # A preview of identical content (from any other path or project) may be indexed. Only a
+            # generating policy hashes an unseen source, since generating hashes it anyway.
+            if request.preview_generation_policy != PreviewGenerationPolicy.ALWAYS:
+                indexed_result = await self._get_indexed_preview_result(
+                    source_path,
+                    file_info_result.file_entry,
+                    provider_class,
+                    request.artifact_provider_name,
+                    hash_unseen_source=request.preview_generation_policy != PreviewGenerationPolicy.DO_NOT_GENERATE,
+                )
+                if indexed_result is not None:
+                    return indexed_result
             match request.preview_generation_policy:
                 case PreviewGenerationPolicy.DO_NOT_GENERATE:
                     return GetPreviewForArtifactResultFailure(
@@ -724,6 +768,7 @@ class ArtifactManager:
                     generate_request = GeneratePreviewFromDefaultsRequest(
                         macro_path=request.macro_path,
                         artifact_provider_name=request.artifact_provider_name,
+                        preview_priority=request.preview_priority,
                     )
                     generate_result = await self.on_handle_generate_preview_from_defaults_request(generate_request)
 
@@ -873,11 +918,22 @@ class ArtifactManager:
                     result_details=f"Attempted to get preview for '{source_path}'. Failed due to: unknown policy '{request.preview_generation_policy}'"
                 )
 
-        # If regeneration needed, generate from defaults
+        # If regeneration needed, serve an indexed preview of identical content or generate from defaults
         if should_regenerate_preview:
+            if request.preview_generation_policy != PreviewGenerationPolicy.ALWAYS:
+                indexed_result = await self._get_indexed_preview_result(
+                    source_path,
+                    file_info_result.file_entry,
+                    provider_class,
+                    request.artifact_provider_name,
+                    hash_unseen_source=True,
+                )
+                if indexed_result is not None:
+                    return indexed_result
             generate_request = GeneratePreviewFromDefaultsRequest(
                 macro_path=request.macro_path,
                 artifact_provider_name=request.artifact_provider_name,
+                preview_priority=request.preview_priority,
             )
             generate_result = await self.on_handle_generate_preview_from_defaults_request(generate_request)
 
@@ -1570,6 +1626,114 @@ class ArtifactManager:
         # Compare the normalized Pydantic models
         return metadata_params_model == current_generator_params
 
+    async def _get_source_content_hash(self, source_path: str, size: int, modified_time: float) -> str | None:
+        """Get the content hash of a source file, hashing it only if it changed since last hashed.
+
+        Returns:
+            The content hash, or None if the source is not a readable local file.
+        """
+        content_hash = await self._preview_index.aget_source_hash(source_path, size, modified_time)
+        if content_hash is not None:
+            return content_hash
+        try:
+            content_hash = await to_thread(hash_source_file, source_path)
+        except OSError as e:
+            logger.debug("Could not hash '%s' for the preview index: %s", source_path, e)
+            return None
+        self._preview_index.set_source_hash(source_path, size, modified_time, content_hash)
+        return content_hash
+
+    def _get_preview_key(
+        self,
+        content_hash: str,
+        provider_name: str,
+        generator_name: str,
+        generator_parameters: dict[str, Any],
+        preview_format: str,
+    ) -> str:
+        """Get the preview index key for previews of content generated with the given settings."""
+        return compute_preview_key(
+            content_hash,
+            provider_name=provider_name,
+            generator_name=generator_name,
+            generator_parameters=generator_parameters,
+            preview_format=preview_format,
+            metadata_version=PreviewMetadata.LATEST_SCHEMA_VERSION,
+        )
+
+    async def _get_indexed_preview_result(
+        self,
+        source_path: str,
+        file_entry: FileSystemEntry,
+        provider_class: type[BaseArtifactProvider],
+        provider_name: str,
+        *,
+        hash_unseen_source: bool,
+    ) -> GetPreviewForArtifactResultSuccess | None:
+        """Get a result serving the indexed preview of the source's content, if there is a usable one."""
+        indexed_preview = await self._find_indexed_preview(
+            source_path,
+            file_entry.size,
+            file_entry.modified_time,
+            provider_class,
+            provider_name,
+            hash_unseen_source=hash_unseen_source,
+        )
+        if indexed_preview is None:
+            return None
+        return GetPreviewForArtifactResultSuccess(
+            result_details=f"Preview retrieved for '{source_path}'",
+            paths_to_preview=indexed_preview.paths_to_preview,
+            artifact_metadata=indexed_preview.artifact_metadata,
+        )
+
+    async def _find_indexed_preview(  # noqa: PLR0913
+        self,
+        source_path: str,
+        size: int,
+        modified_time: float,
+        provider_class: type[BaseArtifactProvider],
+        provider_name: str,
+        *,
+        hash_unseen_source: bool,
+    ) -> IndexedPreview | None:
+        """Find an indexed preview of the source's content generated with the current preview settings.
+
+        Args:
+            source_path: Path of the source file
+            size: Size of the source file in bytes
+            modified_time: Modification time of the source file
+            provider_class: Provider generating the source's previews
+            provider_name: Friendly name of the provider
+            hash_unseen_source: Hash the source if its content hash is not indexed yet; otherwise
+                a source whose hash is not indexed has no indexed preview
+
+        Returns:
+            The preview, or None if there is none or its files were deleted or regenerated since.
+        """
+        try:
+            settings = self._get_preview_settings_from_config(provider_class, provider_name)
+        except RuntimeError:
+            return None
+        if hash_unseen_source:
+            content_hash = await self._get_source_content_hash(source_path, size, modified_time)
+        else:
+            content_hash = await self._preview_index.aget_source_hash(source_path, size, modified_time)
+        if content_hash is None:
+            return None
+        preview_key = self._get_preview_key(
+            content_hash,
+            provider_name,
+            settings.generator_name,
+            settings.generator_params.model_dump(),
+            settings.format,
+        )
+        indexed_preview = await self._preview_index.aget_preview(preview_key)
+        # Preview files are named after the source path, so a newer preview may have overwritten these
+        if indexed_preview is None or not indexed_preview.files_unchanged():
+            return None
+        return indexed_preview
+
     def _resolve_preview_path(
         self,
         source_path: str,
@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-from io import BytesIO
 from pathlib import Path
 from typing import Any
 
-from PIL import Image, ImageDraw, ImageOps
 from pydantic import PositiveInt  # noqa: TC002 - Runtime validation, not type-only
 
 from griptape_nodes.retained_mode.events.os_events import (
@@ -24,6 +22,8 @@ from griptape_nodes.retained_mode.managers.artifact_providers.base_generator_par
     BaseGeneratorParameters,
     Field,
 )
+from griptape_nodes.utils.image_preview import render_rounded_image_preview
+from griptape_nodes.utils.preview_executor import run_preview_job
 
 
 class PILRoundedParameters(BaseGeneratorParameters):
@@ -154,39 +154,16 @@ class PILRoundedPreviewGenerator(BaseArtifactPreviewGenerator):
             msg = "Source file is text, not binary image data"
             raise TypeError(msg)
 
-        # Step 3: Process image with PIL
-        with Image.open(BytesIO(image_data)) as raw_img:
-            # Apply EXIF orientation so rotated images (e.g. phone photos) display correctly
-            img = ImageOps.exif_transpose(raw_img)
-            # Resize to fit max dimensions (preserves aspect ratio)
-            # Access validated parameters via self.params - fully type-safe
-            img.thumbnail((self.params.max_width, self.params.max_height), Image.Resampling.LANCZOS)
-
-            # Convert to RGBA for alpha channel support
-            if img.mode != "RGBA":
-                rgba_img = img.convert("RGBA")
-            else:
-                rgba_img = img
-
-            # Apply rounded corners
-            rounded_img = self._apply_rounded_corners(rgba_img)
-
-            # Handle format-specific output
-            if self.preview_format.lower() in ("jpg", "jpeg"):
-                # JPEG doesn't support transparency - composite onto white background
-                white_background = Image.new("RGB", rounded_img.size, (255, 255, 255))
-                white_background.paste(rounded_img, (0, 0), rounded_img)
-                final_img = white_background
-            else:
-                # PNG/WEBP support transparency
-                final_img = rounded_img
-
-            # Save to buffer
-            output_buffer = BytesIO()
-            # Normalize format for PIL (JPG -> JPEG)
-            pil_format = "JPEG" if self.preview_format.lower() == "jpg" else self.preview_format.upper()
-            final_img.save(output_buffer, format=pil_format)
-            output_bytes = output_buffer.getvalue()
+        # Step 3: Process image with PIL in a preview worker process
+        # Access validated parameters via self.params - fully type-safe
+        output_bytes = await run_preview_job(
+            render_rounded_image_preview,
+            image_data,
+            self.params.max_width,
+            self.params.max_height,
+            self.preview_format,
+            self.params.corner_radius_percent,
+        )
 
         # Step 4: Write output file
         destination_path = str(Path(self.destination_preview_directory) / self.destination_preview_file_name)
@@ -204,33 +181,3 @@ class PILRoundedPreviewGenerator(BaseArtifactPreviewGenerator):
             raise OSError(msg)
 
         return self.destination_preview_file_name
-
-    def _apply_rounded_corners(self, img: Image.Image) -> Image.Image:
-        """Apply rounded corners to image using alpha mask.
-
-        Args:
-            img: Source image (RGBA mode)
-
-        Returns:
-            RGBA image with transparent rounded corners
-        """
-        # Calculate pixel radius from percentage of smaller dimension
-        smaller_dimension = min(img.width, img.height)
-        radius_pixels = int((self.params.corner_radius_percent / 100.0) * smaller_dimension)
-
-        # Skip if no rounding requested (0% or rounds to 0 pixels)
-        if radius_pixels <= 0:
-            return img
-
-        # Clamp radius to prevent over-rounding
-        max_radius = smaller_dimension // 2
-        effective_radius = min(radius_pixels, max_radius)
-
-        # Create mask for rounded corners
-        mask = Image.new("L", img.size, 0)
-        draw = ImageDraw.Draw(mask)
-        draw.rounded_rectangle([(0, 0), (img.width - 1, img.height - 1)], radius=effective_radius, fill=255)
-
-        # Apply mask to alpha channel
-        img.putalpha(mask)
-        return img
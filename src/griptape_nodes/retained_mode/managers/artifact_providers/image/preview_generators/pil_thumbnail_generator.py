@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-from io import BytesIO
 from pathlib import Path
 from typing import Any
 
-from PIL import Image, ImageOps
 from pydantic import PositiveInt  # noqa: TC002 - Runtime validation, not type-only
 
 from griptape_nodes.retained_mode.events.os_events import (
@@ -24,6 +22,8 @@ from griptape_nodes.retained_mode.managers.artifact_providers.base_generator_par
     BaseGeneratorParameters,
     Field,
 )
+from griptape_nodes.utils.image_preview import render_image_preview
+from griptape_nodes.utils.preview_executor import run_preview_job
 
 
 class PILThumbnailParameters(BaseGeneratorParameters):
@@ -124,17 +124,15 @@ class PILThumbnailGenerator(BaseArtifactPreviewGenerator):
             msg = "Source file is text, not binary image data"
             raise TypeError(msg)
 
-        with Image.open(BytesIO(image_data)) as raw_img:
-            # Apply EXIF orientation so rotated images (e.g. phone photos) display correctly
-            img = ImageOps.exif_transpose(raw_img)
-            # Calculate thumbnail size (preserves aspect ratio, fits within max dimensions)
-            # Access validated parameters via self.params - fully type-safe
-            img.thumbnail((self.params.max_width, self.params.max_height), Image.Resampling.LANCZOS)
-
-            # Save to BytesIO
-            output_buffer = BytesIO()
-            img.save(output_buffer, format=self.preview_format.upper())
-            output_bytes = output_buffer.getvalue()
+        # Resize in a preview worker process (preserves aspect ratio, fits within max dimensions)
+        # Access validated parameters via self.params - fully type-safe
+        output_bytes = await run_preview_job(
+            render_image_preview,
+            image_data,
+            self.params.max_width,
+            self.params.max_height,
+            self.preview_format.upper(),
+        )
 
         # Construct full path for writing
         destination_path = str(Path(self.destination_preview_directory) / self.destination_preview_file_name)
@@ -0,0 +1,343 @@
+"""Persistent index of generated previews, keyed by source content.
+
+Looking up a preview used to resolve the project's preview path, read the preview's metadata
+JSON, and stat the source and preview files on every request, and two copies of one asset
+at different paths (or in different projects) each got their own preview. The index maps
+the content hash of a source plus the provider, generator, parameters, and format used to
+an existing preview, so identical sources share previews and a fresh preview is found with
+one in-memory lookup.
+
+Preview files are named after their source's path, not its content, so regenerating the
+preview of an edited source overwrites the file an older content hash's entry points at.
+Each entry therefore records the size and modification time of its preview files, and an
+entry whose files no longer match is ignored.
+
+Content hashes are themselves cached by (path, size, modification time), so unchanged
+sources are hashed once. Entries live in a SQLite database in the user cache directory,
+fronted by an in-memory LRU. Writes update the LRU at once and are committed to the database
+in batches by a background thread; reads that miss the LRU should go through the async
+methods, which query the database in a worker thread, so the event loop never waits on
+SQLite. The index is only a cache: entries whose preview files have been deleted or replaced
+are ignored, and database errors are logged and treated as misses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from xdg_base_dirs import xdg_cache_home
+
+logger = logging.getLogger("griptape_nodes")
+
+# Bump when the schema or key derivation changes so databases written by older engines are rebuilt
+PREVIEW_INDEX_VERSION = 2
+
+# Number of source hashes and previews kept in memory in front of the database
+DEFAULT_MEMORY_CACHE_SIZE = 4096
+
+# Writes arriving within this many seconds of each other are committed together
+WRITE_BATCH_DELAY_SECONDS = 0.1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    modified_time REAL NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS previews (
+    preview_key TEXT PRIMARY KEY,
+    paths_to_preview TEXT NOT NULL,
+    artifact_metadata TEXT,
+    preview_file_stamps TEXT NOT NULL
+);
+"""
+
+
+def get_preview_index_path() -> Path:
+    """Get where the preview index database is stored."""
+    return xdg_cache_home() / "griptape_nodes" / "preview_index.sqlite3"
+
+
+def hash_source_file(path: str | Path) -> str:
+    """Hash a source file's content. Blocking; run it in a thread."""
+    with Path(path).open("rb") as source:
+        return hashlib.file_digest(source, "sha256").hexdigest()
+
+
+def compute_preview_key(  # noqa: PLR0913
+    content_hash: str,
+    *,
+    provider_name: str,
+    generator_name: str,
+    generator_parameters: dict[str, Any],
+    preview_format: str,
+    metadata_version: str,
+) -> str:
+    """Compute the key a preview is indexed under.
+
+    Args:
+        content_hash: Content hash of the source file
+        provider_name: Friendly name of the artifact provider
+        generator_name: Friendly name of the preview generator
+        generator_parameters: Parameters the preview was generated with
+        preview_format: Format of the preview
+        metadata_version: Preview metadata schema version
+
+    Returns:
+        A digest identifying previews of this content generated this way.
+    """
+    key_fields = [
+        PREVIEW_INDEX_VERSION,
+        metadata_version,
+        content_hash,
+        provider_name,
+        generator_name,
+        generator_parameters,
+        preview_format,
+    ]
+    return hashlib.sha256(json.dumps(key_fields, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _get_file_stamp(path: str) -> tuple[int, int] | None:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class IndexedPreview(NamedTuple):
+    """A generated preview recorded in the index."""
+
+    paths_to_preview: str | dict[str, str]
+    artifact_metadata: dict[str, Any] | None = None
+    # Preview file path -> (size, modification time in ns) when the preview was indexed
+    preview_file_stamps: dict[str, tuple[int, int]] | None = None
+
+    @classmethod
+    def from_files(
+        cls, paths_to_preview: str | dict[str, str], artifact_metadata: dict[str, Any] | None = None
+    ) -> IndexedPreview:
+        """Describe a just-generated preview, recording the current state of its files."""
+        paths = [paths_to_preview] if isinstance(paths_to_preview, str) else list(paths_to_preview.values())
+        stamps = {path: stamp for path in paths if (stamp := _get_file_stamp(path)) is not None}
+        return cls(paths_to_preview=paths_to_preview, artifact_metadata=artifact_metadata, preview_file_stamps=stamps)
+
+    def files_unchanged(self) -> bool:
+        """Check that every preview file is still on disk as it was when the preview was indexed."""
+        if self.preview_file_stamps is None:
+            return False
+        stamps = self.preview_file_stamps
+        paths = [self.paths_to_preview] if isinstance(self.paths_to_preview, str) else self.paths_to_preview.values()
+        return all((stamp := stamps.get(path)) is not None and _get_file_stamp(path) == stamp for path in paths)
+
+
+class PreviewIndex:
+    """SQLite-backed index of previews by source content, with an in-memory LRU in front."""
+
+    def __init__(self, db_path: Path | None = None, memory_cache_size: int = DEFAULT_MEMORY_CACHE_SIZE) -> None:
+        """Initialize the index. The database is opened on first use.
+
+        Args:
+            db_path: Database file (default: get_preview_index_path(), resolved on first use)
+            memory_cache_size: Number of source hashes and previews kept in memory
+        """
+        self._db_path = db_path
+        self._memory_cache_size = memory_cache_size
+        self._memory: OrderedDict[tuple, Any] = OrderedDict()
+        # Guards the LRU and the pending writes; never held while the database is in use
+        self._memory_lock = threading.Lock()
+        # Guards the connection, which is shared by the writer thread and to_thread readers
+        self._db_lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pending_writes: list[tuple[str, tuple]] = []
+        self._writer: threading.Thread | None = None
+
+    def get_source_hash(self, path: str, size: int, modified_time: float) -> str | None:
+        """Get the recorded content hash of a source file, if it is unchanged since it was hashed.
+
+        Blocking on a memory miss; use aget_source_hash() from the event loop.
+        """
+        memory_key = ("source", path, size, modified_time)
+        with self._memory_lock:
+            content_hash = self._get_from_memory(memory_key)
+        if content_hash is not None:
+            return content_hash
+        row = self._query(
+            "SELECT content_hash FROM source_hashes WHERE path = ? AND size = ? AND modified_time = ?",
+            (path, size, modified_time),
+        )
+        if row is None:
+            return None
+        with self._memory_lock:
+            self._put_in_memory(memory_key, row[0])
+        return row[0]
+
+    async def aget_source_hash(self, path: str, size: int, modified_time: float) -> str | None:
+        """Like get_source_hash(), reading the database in a worker thread on a memory miss."""
+        with self._memory_lock:
+            content_hash = self._get_from_memory(("source", path, size, modified_time))
+        if content_hash is not None:
+            return content_hash
+        return await asyncio.to_thread(self.get_source_hash, path, size, modified_time)
+
+    def set_source_hash(self, path: str, size: int, modified_time: float, content_hash: str) -> None:
+        """Record the content hash of a source file as of its size and modification time."""
+        with self._memory_lock:
+            self._put_in_memory(("source", path, size, modified_time), content_hash)
+            self._queue_write(
+                "INSERT OR REPLACE INTO source_hashes (path, size, modified_time, content_hash) VALUES (?, ?, ?, ?)",
+                (path, size, modified_time, content_hash),
+            )
+
+    def get_preview(self, preview_key: str) -> IndexedPreview | None:
+        """Get the preview recorded under a key, without checking its files.
+
+        Blocking on a memory miss; use aget_preview() from the event loop.
+        """
+        memory_key = ("preview", preview_key)
+        with self._memory_lock:
+            preview = self._get_from_memory(memory_key)
+        if preview is not None:
+            return preview
+        row = self._query(
+            "SELECT paths_to_preview, artifact_metadata, preview_file_stamps FROM previews WHERE preview_key = ?",
+            (preview_key,),
+        )
+        if row is None:
+            return None
+        try:
+            preview = IndexedPreview(
+                paths_to_preview=json.loads(row[0]),
+                artifact_metadata=json.loads(row[1]) if row[1] is not None else None,
+                preview_file_stamps={path: (size, mtime_ns) for path, (size, mtime_ns) in json.loads(row[2]).items()},
+            )
+        except (ValueError, TypeError, AttributeError) as err:
+            logger.debug("Ignoring unreadable preview index entry '%s': %s", preview_key, err)
+            return None
+        with self._memory_lock:
+            self._put_in_memory(memory_key, preview)
+        return preview
+
+    async def aget_preview(self, preview_key: str) -> IndexedPreview | None:
+        """Like get_preview(), reading the database in a worker thread on a memory miss."""
+        with self._memory_lock:
+            preview = self._get_from_memory(("preview", preview_key))
+        if preview is not None:
+            return preview
+        return await asyncio.to_thread(self.get_preview, preview_key)
+
+    def put_preview(self, preview_key: str, preview: IndexedPreview) -> None:
+        """Record a preview under a key, replacing any previous one."""
+        artifact_metadata = (
+            json.dumps(preview.artifact_metadata, default=str) if preview.artifact_metadata is not None else None
+        )
+        with self._memory_lock:
+            self._put_in_memory(("preview", preview_key), preview)
+            self._queue_write(
+                "INSERT OR REPLACE INTO previews (preview_key, paths_to_preview, artifact_metadata, preview_file_stamps) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    preview_key,
+                    json.dumps(preview.paths_to_preview),
+                    artifact_metadata,
+                    json.dumps(preview.preview_file_stamps or {}),
+                ),
+            )
+
+    def flush(self) -> None:
+        """Wait until every recorded entry has been written to the database. Blocking."""
+        with self._memory_lock:
+            writer = self._writer
+        if writer is not None:
+            writer.join()
+
+    def close(self) -> None:
+        """Write pending entries and close the database. It is reopened on next use."""
+        self.flush()
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+        with self._memory_lock:
+            self._memory.clear()
+
+    def _get_from_memory(self, memory_key: tuple) -> Any:
+        value = self._memory.get(memory_key)
+        if value is not None:
+            self._memory.move_to_end(memory_key)
+        return value
+
+    def _put_in_memory(self, memory_key: tuple, value: Any) -> None:
+        self._memory[memory_key] = value
+        self._memory.move_to_end(memory_key)
+        while len(self._memory) > self._memory_cache_size:
+            self._memory.popitem(last=False)
+
+    def _queue_write(self, sql: str, parameters: tuple) -> None:
+        """Queue a statement for the writer thread, starting it if it is idle. Called with the memory lock held."""
+        self._pending_writes.append((sql, parameters))
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_pending, name="preview-index-writer", daemon=True)
+            self._writer.start()
+
+    def _write_pending(self) -> None:
+        """Commit queued statements in batches until the queue stays empty."""
+        while True:
+            # Let a burst of writes (such as a folder of thumbnails) gather into one transaction
+            time.sleep(WRITE_BATCH_DELAY_SECONDS)
+            with self._memory_lock:
+                batch = self._pending_writes
+                self._pending_writes = []
+                if not batch:
+                    self._writer = None
+                    return
+            with self._db_lock:
+                try:
+                    connection = self._connect()
+                    with connection:
+                        for sql, parameters in batch:
+                            connection.execute(sql, parameters)
+                except (sqlite3.Error, OSError) as err:
+                    logger.debug("Preview index write of %d entries failed: %s", len(batch), err)
+
+    def _query(self, sql: str, parameters: tuple) -> tuple | None:
+        """Run one read, returning the first row. Blocking."""
+        with self._db_lock:
+            try:
+                return self._connect().execute(sql, parameters).fetchone()
+            except (sqlite3.Error, OSError) as err:
+                logger.debug("Preview index read failed: %s", err)
+                return None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the connection, opening the database if needed. Called with the database lock held."""
+        if self._connection is not None:
+            return self._connection
+        db_path = self._db_path if self._db_path is not None else get_preview_index_path()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared by the writer thread and to_thread readers; access is serialized by self._db_lock
+        connection = sqlite3.connect(db_path, check_same_thread=False, timeout=5.0)
+        try:
+            (user_version,) = connection.execute("PRAGMA user_version").fetchone()
+            if user_version != PREVIEW_INDEX_VERSION:
+                connection.executescript("DROP TABLE IF EXISTS source_hashes; DROP TABLE IF EXISTS previews;")
+                connection.execute(f"PRAGMA user_version = {PREVIEW_INDEX_VERSION}")
+            # Several engines may share the database; WAL lets readers proceed during writes
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.executescript(_SCHEMA)
+        except sqlite3.Error:
+            connection.close()
+            raise
+        self._connection = connection
+        return connection
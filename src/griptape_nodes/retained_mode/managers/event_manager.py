@@ -32,7 +32,9 @@ from griptape_nodes.retained_mode.events.base_events import (
     StrictModeViolationDetail,
 )
 from griptape_nodes.retained_mode.events.event_converter import converter
+from griptape_nodes.retained_mode.events.execution_events import ParameterValueUpdateEvent
 from griptape_nodes.retained_mode.events.generic_events import GenericResultFailure
+from griptape_nodes.retained_mode.events.parameter_events import AlterElementEvent
 from griptape_nodes.retained_mode.events.payload_registry import PayloadRegistry
 from griptape_nodes.retained_mode.managers.authorization_checkpoint import (
     AuthorizationCheckpoint,
@@ -75,6 +77,11 @@ def current_request_type() -> type[RequestPayload] | None:
 # the flush operation itself, or other internal operations that don't modify workflow state).
 RESULT_TYPES_THAT_SKIP_FLUSH = {}
 
+# How long repeated UI updates to the same element are held and merged before being queued.
+# Streaming nodes and progress bars can update an element thousands of times a second; the
+# UI only needs the latest state once per frame.
+COALESCE_WINDOW_S = 0.05
+
 
 def _running_loop() -> asyncio.AbstractEventLoop | None:
     """Return the currently running event loop, or None if not inside one."""
@@ -105,6 +112,11 @@ class EventManager:
         self._execution_event_listeners_lock = threading.Lock()
         # Event queue for publishing events
         self._event_queue: asyncio.Queue | None = None
+        # UI update events held back for coalescing, keyed by the element they update, in the
+        # order their element was first updated. Only touched on the event loop's thread.
+        self.coalesce_window_s = COALESCE_WINDOW_S
+        self._coalesced_events: dict[tuple[str, ...], ExecutionGriptapeNodeEvent] = {}
+        self._coalesce_flush_handle: asyncio.TimerHandle | None = None
         # Keep track of which thread the event loop runs on
         self._loop_thread_id: int | None = None
         # Keep a reference to the event loop for thread-safe operations
@@ -199,6 +211,7 @@ class EventManager:
         Args:
             queue: The asyncio.Queue to use for events, or None to clear
         """
+        self._discard_coalesced_events()
         if queue is not None:
             self._event_queue = queue
             # Track which thread the event loop is running on and store loop reference
@@ -236,6 +249,8 @@ class EventManager:
         """Put event into async queue from sync context (non-blocking).
 
         Automatically detects if we're in a different thread and uses thread-safe operations.
+        Repeated UI updates to the same element may be merged before they reach the queue;
+        see _enqueue_event.
 
         Args:
             event: The event to publish to the queue
@@ -246,10 +261,10 @@ class EventManager:
         if self._is_cross_thread_call() and self._event_loop is not None:
             # We're in a different thread from the event loop, use thread-safe method
             # _is_cross_thread_call() guarantees _event_loop is not None
-            self._event_loop.call_soon_threadsafe(self._event_queue.put_nowait, event)
+            self._event_loop.call_soon_threadsafe(self._enqueue_event, event)
         else:
             # We're on the same thread as the event loop or no loop thread tracked, use direct method
-            self._event_queue.put_nowait(event)
+            self._enqueue_event(event)
 
         # Dispatch after enqueuing so a callback that re-enters put_event (e.g. writing a
         # streamed token to a parameter) enqueues its own events *after* the triggering
@@ -270,15 +285,87 @@ class EventManager:
         if self._is_cross_thread_call() and self._event_loop is not None:
             # We're in a different thread from the event loop, use thread-safe method
             # _is_cross_thread_call() guarantees _event_loop is not None
-            self._event_loop.call_soon_threadsafe(self._event_queue.put_nowait, event)
+            self._event_loop.call_soon_threadsafe(self._enqueue_event, event)
         else:
-            # We're on the same thread as the event loop or no loop thread tracked, use async method
-            await self._event_queue.put(event)
+            # We're on the same thread as the event loop or no loop thread tracked. The queue is
+            # unbounded, so enqueueing never has to wait.
+            self._enqueue_event(event)
 
         # Dispatch after enqueuing so a re-entrant emission from a callback lands on the
         # queue after its triggering event (see put_event).
         self._dispatch_to_execution_listeners(event)
 
+    def flush_coalesced_events(self) -> None:
+        """Queue every UI update held back for coalescing, in the order their elements were first updated."""
+        if self._coalesce_flush_handle is not None:
+            self._coalesce_flush_handle.cancel()
+            self._coalesce_flush_handle = None
+        if not self._coalesced_events or self._event_queue is None:
+            return
+        pending, self._coalesced_events = self._coalesced_events, {}
+        for event in pending.values():
+            self._event_queue.put_nowait(event)
+
+    def _enqueue_event(self, event: Any) -> None:
+        """Queue an event, merging repeated UI updates to the same element within a frame window.
+
+        AlterElementEvents for the same element are merged into one carrying the union of
+        their changed fields, and ParameterValueUpdateEvents for the same parameter collapse to
+        the latest value. Any other event first flushes everything held back, so every update
+        still reaches the queue before whatever followed it (node resolution, flow completion,
+        and so on) and those state transitions are never reordered.
+        """
+        if self._event_queue is None:
+            return
+        loop = _running_loop()
+        key = self._coalesce_key(event) if self.coalesce_window_s > 0 and loop is not None else None
+        if key is None or loop is None:
+            self.flush_coalesced_events()
+            self._event_queue.put_nowait(event)
+            return
+
+        held_event = self._coalesced_events.get(key)
+        self._coalesced_events[key] = event if held_event is None else self._merge_coalesced_events(held_event, event)
+        if self._coalesce_flush_handle is None:
+            self._coalesce_flush_handle = loop.call_later(self.coalesce_window_s, self.flush_coalesced_events)
+
+    def _discard_coalesced_events(self) -> None:
+        if self._coalesce_flush_handle is not None:
+            self._coalesce_flush_handle.cancel()
+            self._coalesce_flush_handle = None
+        self._coalesced_events.clear()
+
+    @staticmethod
+    def _coalesce_key(event: Any) -> tuple[str, ...] | None:
+        """Identify the element a coalescable UI update targets, or None if the event must not be merged."""
+        if not isinstance(event, ExecutionGriptapeNodeEvent):
+            return None
+        payload = event.wrapped_event.payload
+        if isinstance(payload, AlterElementEvent):
+            node_name = payload.element_details.get("node_name")
+            element_id = payload.element_details.get("element_id")
+            if node_name is None or element_id is None:
+                return None
+            return ("element", node_name, element_id)
+        if isinstance(payload, ParameterValueUpdateEvent):
+            return ("value", payload.node_name, payload.parameter_name)
+        return None
+
+    @staticmethod
+    def _merge_coalesced_events(
+        held_event: ExecutionGriptapeNodeEvent, event: ExecutionGriptapeNodeEvent
+    ) -> ExecutionGriptapeNodeEvent:
+        held_payload = held_event.wrapped_event.payload
+        payload = event.wrapped_event.payload
+        if not isinstance(held_payload, AlterElementEvent) or not isinstance(payload, AlterElementEvent):
+            # A newer value replaces the older one outright
+            return event
+        # Later fields win; fields only the earlier update changed are kept. Build a new event
+        # rather than mutating, since listeners were handed the originals.
+        merged_payload = AlterElementEvent(element_details={**held_payload.element_details, **payload.element_details})
+        wrapped_event = event.wrapped_event.model_copy(update={"payload": merged_payload})
+        return ExecutionGriptapeNodeEvent(wrapped_event=wrapped_event)
+
     def add_pre_dispatch_hook(
         self,
         hook: Callable[[RequestPayload, ResultContext], ResultPayload | None],
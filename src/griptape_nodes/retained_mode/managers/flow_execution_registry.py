@@ -0,0 +1,157 @@
+"""Registry of flows executing concurrently, each on its own control flow machine.
+
+The global control flow machine runs one top-level execution at a time. A flow started
+with StartFlowRequest(run_concurrently=True) instead gets a FlowExecutionContext that owns
+an isolated ControlFlowMachine (and with it a private DagBuilder and ParallelResolutionMachine),
+its own max_nodes_in_parallel budget, and its own cancellation scope. Any number of contexts
+can be registered; at most max_concurrent_flows of them execute at once, and the rest wait
+for a slot in arrival order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from griptape_nodes.exe_types.node_types import BaseNode
+    from griptape_nodes.machines.control_flow import ControlFlowMachine
+
+logger = logging.getLogger("griptape_nodes")
+
+
+@dataclass(kw_only=True)
+class FlowExecutionContext:
+    """A flow executing on its own control flow machine.
+
+    Attributes:
+        flow_name: Name of the flow being executed.
+        control_flow_machine: Isolated machine that executes the flow.
+        task: Task running the machine, or None while waiting for a concurrency slot.
+        cancel_requested: Set when the flow was cancelled through the registry, so the
+            resulting CancelledError is treated as a clean stop rather than propagated.
+        involved_nodes: Names of the nodes the flow involves, reported to the UI while it is registered.
+    """
+
+    flow_name: str
+    control_flow_machine: ControlFlowMachine
+    task: asyncio.Task[None] | None = None
+    cancel_requested: bool = False
+    involved_nodes: frozenset[str] = frozenset()
+
+    def is_running(self) -> bool:
+        """Return True once the flow has a concurrency slot and has not finished."""
+        return self.task is not None and not self.task.done()
+
+    def owns_node(self, node_name: str) -> bool:
+        """Return True if the node is part of this flow's execution DAG."""
+        dag_builder = self.control_flow_machine.resolution_machine.context.dag_builder
+        return dag_builder is not None and node_name in dag_builder.node_to_reference
+
+
+class FlowExecutionRegistry:
+    """Tracks concurrently executing flows and enforces the global concurrency cap."""
+
+    def __init__(self) -> None:
+        self._contexts: dict[str, FlowExecutionContext] = {}
+        self._running_count = 0
+        self._slot_released = asyncio.Condition()
+
+    def get_context(self, flow_name: str) -> FlowExecutionContext | None:
+        """Get the context for a flow, or None if the flow is not executing concurrently."""
+        return self._contexts.get(flow_name)
+
+    def contexts(self) -> list[FlowExecutionContext]:
+        """Get every registered context, including those still waiting for a slot."""
+        return list(self._contexts.values())
+
+    def find_context_for_node(self, node_name: str) -> FlowExecutionContext | None:
+        """Get the context whose execution DAG contains the node, if any."""
+        for context in self._contexts.values():
+            if context.owns_node(node_name):
+                return context
+        return None
+
+    async def run(self, context: FlowExecutionContext, start_node: BaseNode, *, max_concurrent_flows: int) -> None:
+        """Register a context and execute its flow once a concurrency slot is free.
+
+        Returns when the flow completes, errors (the error is recorded on the resolution
+        machine, as for any other run), or is cancelled through cancel().
+
+        Args:
+            context: The context to execute. Its flow must not already be registered.
+            start_node: Node to start the flow from.
+            max_concurrent_flows: Maximum number of registered flows that may execute at once.
+
+        Raises:
+            RuntimeError: If the flow already has a registered context.
+        """
+        if context.flow_name in self._contexts:
+            msg = f"Flow '{context.flow_name}' is already executing."
+            raise RuntimeError(msg)
+
+        self._contexts[context.flow_name] = context
+        try:
+            async with self._slot_released:
+                await self._slot_released.wait_for(
+                    lambda: context.cancel_requested or self._running_count < max(1, max_concurrent_flows)
+                )
+                if context.cancel_requested:
+                    return
+                self._running_count += 1
+
+            try:
+                await self._execute(context, start_node)
+            finally:
+                async with self._slot_released:
+                    self._running_count -= 1
+                    self._slot_released.notify_all()
+        finally:
+            self._contexts.pop(context.flow_name, None)
+
+    async def cancel(self, flow_name: str) -> bool:
+        """Cancel a registered flow, whether it is executing or still waiting for a slot.
+
+        Returns:
+            True if the flow had a registered context, False otherwise.
+        """
+        context = self._contexts.get(flow_name)
+        if context is None:
+            return False
+
+        context.cancel_requested = True
+        if context.task is None:
+            # Still waiting for a slot; wake it so it can give up its place.
+            async with self._slot_released:
+                self._slot_released.notify_all()
+            return True
+
+        await self._stop(context)
+        return True
+
+    async def cancel_all(self) -> None:
+        """Cancel every registered flow."""
+        for flow_name in list(self._contexts):
+            await self.cancel(flow_name)
+
+    async def _execute(self, context: FlowExecutionContext, start_node: BaseNode) -> None:
+        logger.debug("Starting concurrent execution of flow '%s'", context.flow_name)
+        context.task = asyncio.create_task(context.control_flow_machine.start_flow(start_node))
+        try:
+            await context.task
+        except asyncio.CancelledError:
+            if not context.cancel_requested:
+                # The caller was cancelled (e.g. it timed out waiting); stop the flow's nodes too.
+                await self._stop(context)
+                raise
+            logger.debug("Cancelled concurrent execution of flow '%s'", context.flow_name)
+
+    @staticmethod
+    async def _stop(context: FlowExecutionContext) -> None:
+        machine = context.control_flow_machine
+        await machine.cancel_flow()
+        if context.task is not None and not context.task.done():
+            context.task.cancel()
+        machine.reset_machine(cancel=True)
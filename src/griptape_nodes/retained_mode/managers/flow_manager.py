@@ -173,10 +173,13 @@ from griptape_nodes.retained_mode.events.workflow_events import (
 )
 from griptape_nodes.retained_mode.file_metadata.workflow_metadata import FLOW_COMMANDS_KEY
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+from griptape_nodes.retained_mode.managers.flow_execution_registry import FlowExecutionContext, FlowExecutionRegistry
 from griptape_nodes.retained_mode.managers.settings import WorkflowExecutionMode
 from griptape_nodes.retained_mode.variable_types import VariableScope
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from griptape_nodes.retained_mode.events.base_events import ResultPayload
     from griptape_nodes.retained_mode.managers.event_manager import EventManager
     from griptape_nodes.retained_mode.managers.workflow_manager import WorkflowShapeNodes
@@ -262,6 +265,8 @@ class FlowManager:
     _global_single_node_resolution: bool
     _global_dag_builder: DagBuilder
     _node_executor: NodeExecutor
+    # Flows started with run_concurrently, each on its own control flow machine
+    _flow_execution_registry: FlowExecutionRegistry
 
     def __init__(self, event_manager: EventManager) -> None:
         event_manager.assign_manager_to_request_type(CreateFlowRequest, self.on_create_flow_request)
@@ -314,6 +319,7 @@ class FlowManager:
         self._global_single_node_resolution = False
         self._global_dag_builder = DagBuilder()
         self._node_executor = NodeExecutor()
+        self._flow_execution_registry = FlowExecutionRegistry()
 
     @property
     def global_single_node_resolution(self) -> bool:
@@ -327,6 +333,10 @@ class FlowManager:
     def global_dag_builder(self) -> DagBuilder:
         return self._global_dag_builder
 
+    @property
+    def flow_execution_registry(self) -> FlowExecutionRegistry:
+        return self._flow_execution_registry
+
     @property
     def node_executor(self) -> NodeExecutor:
         return self._node_executor
@@ -388,7 +398,6 @@ class FlowManager:
         For parent flows, this includes cross-flow connections between the parent and its children.
         For child flows, this only includes connections within that specific flow.
         """
-        flow_connections = []
         flow_name = flow.name
 
         # Get all child flow names for this flow
@@ -407,14 +416,7 @@ class FlowManager:
                 all_node_names.update(child_flow.nodes.keys())
 
         # Include connections where both nodes are in this flow hierarchy
-        for connection in self._connections.connections.values():
-            source_in_hierarchy = connection.source_node.name in all_node_names
-            target_in_hierarchy = connection.target_node.name in all_node_names
-
-            if source_in_hierarchy and target_in_hierarchy:
-                flow_connections.append(connection)
-
-        return flow_connections
+        return self._connections.get_connections_between_nodes(all_node_names)
 
     def get_parent_flow(self, flow_name: str) -> str | None:
         if flow_name in self._name_to_parent_name:
@@ -639,14 +641,15 @@ class FlowManager:
             result = DeleteFlowResultFailure(result_details=details)
             return result
 
-        # Only cancel if the flow being deleted is the one tracked by the global control flow machine.
-        # Isolated subflows (e.g., ForEach loop iterations) have their own separate ControlFlowMachine
-        # and should not trigger cancellation of the global machine.
-        if (
+        # Only cancel if the flow being deleted is the one tracked by the global control flow machine,
+        # or is running concurrently on its own machine. Isolated subflows (e.g., ForEach loop iterations)
+        # have their own separate ControlFlowMachine and should not trigger cancellation of the global machine.
+        is_global_flow = (
             self.check_for_existing_running_flow()
             and self._global_control_flow_machine is not None
             and self._global_control_flow_machine.context.flow_name == flow.name
-        ):
+        )
+        if is_global_flow or self._flow_execution_registry.get_context(flow.name) is not None:
             result = GriptapeNodes.handle_request(CancelFlowRequest(flow_name=flow.name))
             if result.failed():
                 details = f"Attempted to delete flow '{flow_name}'. Failed because running flow could not cancel."
@@ -731,7 +734,10 @@ class FlowManager:
             result = GetIsFlowRunningResultFailure(result_details=details)
             return result
         try:
-            is_running = self.check_for_existing_running_flow()
+            is_running = (
+                self.check_for_existing_running_flow()
+                or self._flow_execution_registry.get_context(flow.name) is not None
+            )
         except Exception:
             details = f"Error while trying to get status of '{request.flow_name}'."
             result = GetIsFlowRunningResultFailure(result_details=details)
@@ -2638,9 +2644,15 @@ class FlowManager:
             details = f"Cannot start flow. Error: {err}"
             return StartFlowResultFailure(validation_exceptions=[err], result_details=details)
         # Check to see if the flow is already running.
-        if self.check_for_existing_running_flow():
+        if request.run_concurrently:
+            concurrency_error = self._get_concurrent_start_error(flow, debug_mode=request.debug_mode)
+            if concurrency_error is not None:
+                return StartFlowResultFailure(validation_exceptions=[], result_details=concurrency_error)
+        elif self.check_for_existing_running_flow():
             details = "Cannot start flow. Flow is already running."
             return StartFlowResultFailure(validation_exceptions=[], result_details=details)
+        # Start nodes whose nodes a concurrent run involves; the run itself starts from start_node
+        concurrent_start_nodes: list[BaseNode] = []
         # A node has been provided to either start or to run up to.
         if request.flow_node_name:
             flow_node_name = request.flow_node_name
@@ -2656,6 +2668,15 @@ class FlowManager:
                 return StartFlowResultFailure(validation_exceptions=[], result_details=details)
             if start_node != flow_node:
                 flow_node.stop_flow = True
+            concurrent_start_nodes = [start_node]
+        elif request.run_concurrently:
+            # A concurrent run is scoped to this flow, so it starts from the flow's own start node
+            # rather than the global queue, which spans every flow.
+            concurrent_start_nodes = self.get_start_nodes_in_flow(flow)
+            if not concurrent_start_nodes:
+                details = f"Cannot start flow '{flow_name}'. No start nodes found in flow."
+                return StartFlowResultFailure(validation_exceptions=[], result_details=details)
+            start_node = concurrent_start_nodes[0]
         else:
             # we wont hit this if we dont have a request id, our requests always have nodes
             # If there is a request, reinitialize the queue
@@ -2681,6 +2702,8 @@ class FlowManager:
             details = f"Couldn't start flow with name {flow_name}. Flow Validation Failed: {e}"
             return StartFlowResultFailure(validation_exceptions=[e], result_details=details)
         # By now, it has been validated with no exceptions.
+        if request.run_concurrently and start_node is not None:
+            return await self._start_flow_concurrently(flow, concurrent_start_nodes, request)
         try:
             await self.start_flow(
                 flow,
@@ -2732,6 +2755,109 @@ class FlowManager:
 
         return StartFlowResultSuccess(result_details=details)
 
+    def _get_concurrent_start_error(self, flow: ControlFlow, *, debug_mode: bool) -> str | None:
+        """Check whether a flow can be started on its own control flow machine.
+
+        Returns:
+            A description of why the flow cannot run concurrently, or None if it can.
+        """
+        if debug_mode:
+            return f"Cannot start flow '{flow.name}' concurrently. Debug mode requires the global control flow machine."
+        if self._flow_execution_registry.get_context(flow.name) is not None:
+            return f"Cannot start flow '{flow.name}'. Flow is already running."
+        is_global_flow_running = self.check_for_existing_running_flow()
+        for node_name in flow.nodes:
+            if is_global_flow_running and node_name in self._global_dag_builder.node_to_reference:
+                return f"Cannot start flow '{flow.name}' concurrently. Node '{node_name}' is part of the running flow."
+            context = self._flow_execution_registry.find_context_for_node(node_name)
+            if context is not None:
+                return (
+                    f"Cannot start flow '{flow.name}' concurrently. "
+                    f"Node '{node_name}' is part of running flow '{context.flow_name}'."
+                )
+        return None
+
+    async def _start_flow_concurrently(
+        self, flow: ControlFlow, start_nodes: list[BaseNode], request: StartFlowRequest
+    ) -> ResultPayload:
+        """Run a flow on its own control flow machine, alongside any other running flows.
+
+        Waits for a slot under the max_concurrent_flows cap, then for the flow to finish. The
+        run starts from the first start node; the machine seeds its DAG from the rest.
+        """
+        start_node = start_nodes[0]
+        # The machine's own InvolvedNodesEvent would replace every other running flow's
+        # involved nodes, so they are reported here for all running flows together.
+        machine = ControlFlowMachine(
+            flow.name,
+            pickle_control_flow_result=request.pickle_control_flow_result,
+            is_isolated=True,
+            max_nodes_in_parallel=request.max_nodes_in_parallel,
+            report_involved_nodes=False,
+        )
+        involved_nodes = {
+            node.name
+            for flow_start_node in start_nodes
+            for node in self.get_all_connected_nodes(flow_start_node)
+            if node.name in flow.nodes
+        }
+        involved_nodes.update(flow_start_node.name for flow_start_node in start_nodes)
+        context = FlowExecutionContext(
+            flow_name=flow.name, control_flow_machine=machine, involved_nodes=frozenset(involved_nodes)
+        )
+        self._put_running_flows_involved_nodes_event(involved_nodes)
+        max_concurrent_flows = GriptapeNodes.ConfigManager().get_config_value("max_concurrent_flows", default=4)
+        timeout_ms = request.completion_timeout_ms if request.wait_for_completion else None
+
+        try:
+            async with asyncio.timeout(timeout_ms / 1000 if timeout_ms is not None else None):
+                await self._flow_execution_registry.run(context, start_node, max_concurrent_flows=max_concurrent_flows)
+        except TimeoutError as e:
+            details = f"Flow '{flow.name}' did not complete cleanly: Timed out waiting for flow completion after {timeout_ms} ms."
+            return StartFlowResultFailure(validation_exceptions=[e], result_details=details)
+        except Exception as e:
+            details = f"Failed to kick off flow with name {flow.name}. Exception occurred: {e} "
+            return StartFlowResultFailure(validation_exceptions=[e], result_details=details)
+        finally:
+            # Release the nodes locked by this run, keeping those of flows still running;
+            # the list only ends up empty once the last running flow has finished.
+            self._put_running_flows_involved_nodes_event()
+
+        if context.cancel_requested:
+            details = f"Flow '{flow.name}' was cancelled before it completed."
+            return StartFlowResultFailure(validation_exceptions=[], result_details=details)
+
+        resolution_machine = machine.resolution_machine
+        if resolution_machine.is_errored():
+            error_message = resolution_machine.get_error_message()
+            result_details = f"Failed to kick off flow with name {flow.name}. Exception occurred: {error_message} "
+            exception = RuntimeError(error_message)
+            return StartFlowResultFailure(
+                validation_exceptions=[exception] if error_message else [], result_details=result_details
+            )
+
+        return StartFlowResultSuccess(result_details=f"Flow '{flow.name}' kicked off and completed successfully.")
+
+    def _put_running_flows_involved_nodes_event(
+        self, extra_nodes: Iterable[str] = (), *, include_global_flow: bool = True
+    ) -> None:
+        """Report the nodes involved in every running flow, so one flow's update does not clear another's.
+
+        Args:
+            extra_nodes: Nodes of a flow that is about to start and is not registered yet
+            include_global_flow: Whether to include the global run's nodes; False when it just finished
+        """
+        involved_nodes = set(extra_nodes)
+        for context in self._flow_execution_registry.contexts():
+            involved_nodes.update(context.involved_nodes)
+        if include_global_flow and self.check_for_existing_running_flow():
+            involved_nodes.update(self._global_dag_builder.node_to_reference)
+        GriptapeNodes.EventManager().put_event(
+            ExecutionGriptapeNodeEvent(
+                wrapped_event=ExecutionEvent(payload=InvolvedNodesEvent(involved_nodes=sorted(involved_nodes)))
+            )
+        )
+
     async def on_start_flow_from_node_request(self, request: StartFlowFromNodeRequest) -> ResultPayload:  # noqa: C901, PLR0911, PLR0912
         # Resolve the node first, falling back to the current-context node when node_name is
         # omitted. flow_name on this request is deprecated; when not supplied we derive it
@@ -3029,7 +3155,9 @@ class FlowManager:
 
             return CancelFlowResultFailure(result_details=details)
         try:
-            await self.cancel_flow_run()
+            # Flows running on their own control flow machine are cancelled independently of the global run
+            if not await self._flow_execution_registry.cancel(flow_name):
+                await self.cancel_flow_run()
         except Exception as e:
             details = f"Could not cancel flow execution. Exception: {e}"
 
@@ -3220,7 +3348,7 @@ class FlowManager:
         node_name_set = set(node_names)
         incoming: dict[str, set[str]] = {name: set() for name in node_names}
         outgoing: dict[str, set[str]] = {name: set() for name in node_names}
-        for connection in self._connections.connections.values():
+        for connection in self._connections.get_connections_between_nodes(node_name_set):
             src = connection.source_node.name
             tgt = connection.target_node.name
             if src in node_name_set and tgt in node_name_set and src != tgt:
@@ -4095,9 +4223,8 @@ class FlowManager:
             if self.check_for_existing_running_flow():
                 await self.cancel_flow_run()
             raise
-        GriptapeNodes.EventManager().put_event(
-            ExecutionGriptapeNodeEvent(wrapped_event=ExecutionEvent(payload=InvolvedNodesEvent(involved_nodes=[])))
-        )
+        # Flows running concurrently keep their involved nodes
+        self._put_running_flows_involved_nodes_event(include_global_flow=False)
 
     def on_extract_flow_commands_from_image_metadata(  # noqa: PLR0911, C901
         self, request: ExtractFlowCommandsFromImageMetadataRequest
@@ -4271,9 +4398,8 @@ class FlowManager:
         self._global_dag_builder.clear()
         logger.debug("Cancelling flow run")
 
-        GriptapeNodes.EventManager().put_event(
-            ExecutionGriptapeNodeEvent(wrapped_event=ExecutionEvent(payload=InvolvedNodesEvent(involved_nodes=[])))
-        )
+        # Flows running concurrently keep their involved nodes
+        self._put_running_flows_involved_nodes_event(include_global_flow=False)
         GriptapeNodes.EventManager().put_event(
             ExecutionGriptapeNodeEvent(wrapped_event=ExecutionEvent(payload=ControlFlowCancelledEvent()))
         )
@@ -4290,9 +4416,7 @@ class FlowManager:
         self._global_single_node_resolution = False
 
         # Clear all connections to prevent memory leaks and stale references
-        self._connections.connections.clear()
-        self._connections.outgoing_index.clear()
-        self._connections.incoming_index.clear()
+        self._connections.clear()
 
         logger.debug("Reset global execution state")
 
@@ -4409,20 +4533,16 @@ class FlowManager:
                 logger.error("Node '%s' failed: %s", node.name, error_message)
                 self._global_single_node_resolution = False
                 self._global_control_flow_machine.context.current_nodes = []
-                GriptapeNodes.EventManager().put_event(
-                    ExecutionGriptapeNodeEvent(
-                        wrapped_event=ExecutionEvent(payload=InvolvedNodesEvent(involved_nodes=[]))
-                    )
-                )
+                # Flows running concurrently keep their involved nodes
+                self._put_running_flows_involved_nodes_event(include_global_flow=False)
                 # Re-raise with the original error message
                 raise RuntimeError(error_message or "Node resolution failed")
 
             if resolution_machine.is_complete():
                 self._global_single_node_resolution = False
                 self._global_control_flow_machine.context.current_nodes = []
-            GriptapeNodes.EventManager().put_event(
-                ExecutionGriptapeNodeEvent(wrapped_event=ExecutionEvent(payload=InvolvedNodesEvent(involved_nodes=[])))
-            )
+            # Flows running concurrently keep their involved nodes
+            self._put_running_flows_involved_nodes_event(include_global_flow=False)
 
     async def single_execution_step(self, flow: ControlFlow, change_debug_mode: bool) -> None:  # noqa: FBT001
         # do a granular step
@@ -4545,6 +4665,9 @@ class FlowManager:
         for current_flow in all_flows.values():
             if self.is_referenced_workflow(current_flow):
                 continue
+            # Flows running concurrently on their own control flow machine are not part of the global run.
+            if self._flow_execution_registry.get_context(current_flow.name) is not None:
+                continue
             scope_nodes.extend(current_flow.nodes.values())
         scope_nodes = self.exclude_subflow_group_children(scope_nodes)
 
@@ -4725,25 +4848,13 @@ class FlowManager:
         # get all of the connection ids
         connected_nodes = []
         # Handle outgoing connections
-        if node.name in connections.outgoing_index:
-            outgoing_params = connections.outgoing_index[node.name]
-            outgoing_connection_ids = []
-            for connection_ids in outgoing_params.values():
-                outgoing_connection_ids = outgoing_connection_ids + connection_ids
-            for connection_id in outgoing_connection_ids:
-                connection = connections.connections[connection_id]
-                if connection.source_node not in connected_nodes:
-                    connected_nodes.append(connection.target_node)
+        for connection in connections.iter_outgoing_connections(node.name):
+            if connection.source_node not in connected_nodes:
+                connected_nodes.append(connection.target_node)
         # Handle incoming connections
-        if node.name in connections.incoming_index:
-            incoming_params = connections.incoming_index[node.name]
-            incoming_connection_ids = []
-            for connection_ids in incoming_params.values():
-                incoming_connection_ids = incoming_connection_ids + connection_ids
-            for connection_id in incoming_connection_ids:
-                connection = connections.connections[connection_id]
-                if connection.source_node not in connected_nodes:
-                    connected_nodes.append(connection.source_node)
+        for connection in connections.iter_incoming_connections(node.name):
+            if connection.source_node not in connected_nodes:
+                connected_nodes.append(connection.source_node)
         # Return all connected nodes. No duplicates
         return connected_nodes
 
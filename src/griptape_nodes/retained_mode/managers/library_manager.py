@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
 import importlib.util
 import json
@@ -45,8 +46,18 @@ from griptape_nodes.node_library.library_declarations import (
     WorkerModeCompatibility,
     requires_worker_process,
 )
+from griptape_nodes.node_library.library_manifest import (
+    LazyModuleAlias,
+    LibraryManifest,
+    NodeManifestEntry,
+    compute_library_fingerprint,
+    get_class_path,
+    load_library_manifest,
+    write_library_manifest,
+)
 from griptape_nodes.node_library.library_registry import (
     CategoryDefinition,
+    LazyNodeType,
     Library,
     LibraryMetadata,
     LibraryNameAndVersion,
@@ -232,6 +243,7 @@ from griptape_nodes.retained_mode.managers.settings import (
     LIBRARIES_TO_DOWNLOAD_KEY,
     LIBRARIES_TO_REGISTER_KEY,
     LIBRARY_DEPENDENCY_INSTALL_BEHAVIOR_KEY,
+    LIBRARY_LAZY_NODE_IMPORTS_KEY,
     LIBRARY_MINIMUM_RELEASE_AGE_KEY,
     REQUIRES_ENGINE_KEY,
     WORKER_HEARTBEAT_STARTUP_GRACE_KEY,
@@ -292,6 +304,9 @@ logger = logging.getLogger("griptape_nodes")
 # Directories to exclude when scanning for Python source files (in addition to any directory starting with '.')
 EXCLUDED_SCAN_DIRECTORIES = frozenset({"venv", "__pycache__"})
 
+# Libraries whose metadata, dependency downloads, and venv installs run at the same time during startup
+MAX_CONCURRENT_LIBRARY_PREPARATIONS = 4
+
 TRegisteredEventData = TypeVar("TRegisteredEventData")
 
 
@@ -2035,6 +2050,8 @@ class LibraryManager:
         library_info: LibraryManager.LibraryInfo,
         file_path: str,
         request: RegisterLibraryFromFileRequest,
+        *,
+        stop_before_registration: bool = False,
     ) -> None | RegisterLibraryFromFileResultFailure:
         """Progress library through lifecycle states until LOADED.
 
@@ -2044,12 +2061,25 @@ class LibraryManager:
 
         Modifies library_info in place as it progresses through states.
 
+        Args:
+            library_info: The library to progress.
+            file_path: Path to the library's JSON file.
+            request: The registration request driving the progression.
+            stop_before_registration: Stop once dependencies are installed (or delegated to a
+                worker), before anything is added to sys.path or LibraryRegistry. A later call
+                resumes from that state.
+
         Returns:
-            None: Successfully progressed to LOADED state
+            None: Successfully progressed to LOADED state (or to the stopping state)
             RegisterLibraryFromFileResultFailure: Failed during progression
         """
         while True:
             current_state = library_info.lifecycle_state
+            if stop_before_registration and current_state in (
+                LibraryManager.LibraryLifecycleState.DEPENDENCIES_INSTALLED,
+                LibraryManager.LibraryLifecycleState.WORKER_DELEGATED,
+            ):
+                return None
 
             match current_state:
                 case LibraryManager.LibraryLifecycleState.LOADED:
@@ -2171,7 +2201,7 @@ class LibraryManager:
                                 normalized_url = normalize_github_url(parsed.url)
                                 repo_name = extract_repo_name_from_url(normalized_url)
                                 already_registered = any(
-                                    (info.library_name == repo_name or repo_name in Path(info.library_path).parts)
+                                    self._library_info_matches_repo_name(info, repo_name)
                                     and info.lifecycle_state != LibraryManager.LibraryLifecycleState.FAILURE
                                     and info.fitness
                                     not in (
@@ -2736,6 +2766,11 @@ class LibraryManager:
         # Create venv relative to the xdg data home
         return xdg_data_home() / "griptape_nodes" / "libraries" / clean_library_name / ".venv"
 
+    @staticmethod
+    def _get_library_site_packages_path(venv_path: Path) -> Path:
+        """Get the site-packages directory of a library's virtual environment."""
+        return Path(sysconfig.get_path("purelib", vars={"base": str(venv_path), "platbase": str(venv_path)}))
+
     async def _add_library_paths_to_sys_path(self, library_name: str, library_file_path: str, base_dir: Path) -> None:
         """Add a library's directory and venv site-packages to sys.path.
 
@@ -2748,14 +2783,7 @@ class LibraryManager:
 
         venv_path = self._get_library_venv_path(library_name, library_file_path)
         if await anyio.Path(venv_path).exists():
-            site_packages = str(
-                Path(
-                    sysconfig.get_path(
-                        "purelib",
-                        vars={"base": str(venv_path), "platbase": str(venv_path)},
-                    )
-                )
-            )
+            site_packages = str(self._get_library_site_packages_path(venv_path))
             sys.path.insert(0, site_packages)
             logger.debug("Added library '%s' venv to sys.path: %s", library_name, site_packages)
 
@@ -3100,6 +3128,37 @@ class LibraryManager:
         """
         return module_name.startswith("gtn_dynamic_module_")
 
+    @staticmethod
+    def _get_library_manifest_entries(
+        library: Library, library_info: LibraryInfo, base_dir: Path, site_packages: Path
+    ) -> tuple[str, dict[str, NodeManifestEntry]] | None:
+        """Get the manifest entries a library's nodes can be registered lazily from.
+
+        Args:
+            library: The library being loaded
+            library_info: The library's load state
+            base_dir: The library's base directory
+            site_packages: The library venv's site-packages directory, part of the fingerprint
+
+        Returns:
+            None if the library's node modules must be imported as it loads. Otherwise the
+            library's current fingerprint and the manifest entries by class name, which are
+            empty when the manifest is missing or stale.
+        """
+        # Sandbox nodes are discovered by importing their modules, and an advanced library's
+        # callbacks may expect the node modules to have been imported.
+        if library_info.is_sandbox or library.get_advanced_library() is not None:
+            return None
+        if not GriptapeNodes.ConfigManager().get_config_value(
+            LIBRARY_LAZY_NODE_IMPORTS_KEY, default=True, cast_type=bool
+        ):
+            return None
+        fingerprint = compute_library_fingerprint(library_info.library_path, base_dir, site_packages)
+        manifest = load_library_manifest(library_info.library_path, fingerprint)
+        if manifest is None:
+            return fingerprint, {}
+        return fingerprint, {entry.class_name: entry for entry in manifest.nodes}
+
     @staticmethod
     def _get_root_cause_from_exception(exception: BaseException) -> BaseException:
         """Walk the exception chain to find the root cause.
@@ -3166,7 +3225,10 @@ class LibraryManager:
         file_path = Path(file_path)
 
         # Generate a unique module name
-        module_name = f"gtn_dynamic_module_{file_path.name.replace('.', '_')}_{hash(str(file_path))}"
+        # Derived from a digest rather than hash(), which varies between processes, so class paths
+        # recorded in a library manifest still match in later sessions
+        path_digest = hashlib.sha256(str(file_path).encode()).hexdigest()[:16]
+        module_name = f"gtn_dynamic_module_{file_path.name.replace('.', '_')}_{path_digest}"
 
         # Create stable namespace
         stable_namespace = self._create_stable_namespace(library_name, file_path)
@@ -3229,13 +3291,42 @@ class LibraryManager:
 
         return module
 
-    def _load_class_from_file(self, file_path: Path | str, class_name: str, library_name: str) -> type[BaseNode]:
+    def _get_or_load_module(self, file_path: Path, library_name: str) -> ModuleType:
+        """Get a library module already loaded under its stable namespace, loading it if it is not.
+
+        Raises:
+            ImportError: If the module cannot be imported
+        """
+        stable_namespace = self._create_stable_namespace(library_name, file_path)
+        module = sys.modules.get(stable_namespace)
+        if (
+            module is not None
+            and not isinstance(module, LazyModuleAlias)
+            and getattr(module, "__file__", None) == str(file_path)
+        ):
+            return module
+        return self._load_module_from_file(file_path, library_name)
+
+    def _register_lazy_module_alias(self, file_path: Path, library_name: str) -> None:
+        """Make a lazily registered node's module importable under its stable namespace before it is loaded."""
+        stable_namespace = self._create_stable_namespace(library_name, file_path)
+        if stable_namespace in sys.modules:
+            return
+        sys.modules[stable_namespace] = LazyModuleAlias(
+            stable_namespace, functools.partial(self._get_or_load_module, file_path, library_name)
+        )
+        self._library_to_stable_modules.setdefault(library_name, set()).add(stable_namespace)
+
+    def _load_class_from_file(
+        self, file_path: Path | str, class_name: str, library_name: str, *, reuse_loaded_module: bool = False
+    ) -> type[BaseNode]:
         """Dynamically load a class from a Python file with support for hot reloading.
 
         Args:
             file_path: Path to the Python file
             class_name: Name of the class to load
             library_name: Name of the library
+            reuse_loaded_module: Use the module if it is already loaded instead of reloading it
 
         Returns:
             The loaded class
@@ -3246,7 +3337,10 @@ class LibraryManager:
             TypeError: If the loaded class isn't a BaseNode-derived class
         """
         try:
-            module = self._load_module_from_file(file_path, library_name)
+            if reuse_loaded_module:
+                module = self._get_or_load_module(Path(file_path), library_name)
+            else:
+                module = self._load_module_from_file(file_path, library_name)
         except ImportError as err:
             msg = f"Attempted to load class '{class_name}'. Error: {err}"
             raise ImportError(msg) from err
@@ -3265,11 +3359,10 @@ class LibraryManager:
 
         return node_class
 
-    async def _load_and_track_library(self, lib_path: str, index: int, total: int) -> None:
-        """Load a single library and emit the corresponding progress event."""
-        # Emit the LOADING event BEFORE registering: register_library_from_file_request installs
-        # the library's dependencies (a slow pip/uv step), so emitting after it would leave the
-        # GUI with no progress signal during the longest part of startup. The library name is
+    def _emit_library_loading_progress(self, lib_path: str, index: int, total: int) -> None:
+        """Emit the LOADING progress event for a library that is about to be loaded."""
+        # Emitted before the library's dependencies are installed (a slow pip/uv step), so the
+        # GUI has a progress signal during the longest part of startup. The library name is
         # populated during discovery; fall back to a path-derived name if it isn't set yet.
         pre_register_info = self._library_file_path_to_info.get(lib_path)
         pending_library_name = (
@@ -3290,13 +3383,10 @@ class LibraryManager:
             )
         )
 
-        load_result = await self.register_library_from_file_request(
-            RegisterLibraryFromFileRequest(
-                file_path=lib_path,
-                load_as_default_library=False,
-            )
-        )
-
+    def _emit_library_load_result_progress(
+        self, lib_path: str, load_result: ResultPayload, index: int, total: int
+    ) -> None:
+        """Emit the COMPLETE or FAILED progress event for a library that finished loading."""
         if isinstance(load_result, RegisterLibraryFromFileResultFailure):
             logger.warning("Failed to load library at '%s': %s", lib_path, load_result.result_details)
             error_message = (
@@ -3331,6 +3421,120 @@ class LibraryManager:
                 )
             )
 
+    async def _prepare_library_for_registration(self, lib_path: str) -> RegisterLibraryFromFileResultFailure | None:
+        """Load a library's metadata, evaluate its fitness, and install its dependencies.
+
+        Stops before the library touches sys.path or LibraryRegistry; a later
+        register_library_from_file_request resumes from where this left off.
+
+        Returns:
+            The failure if the library cannot be loaded, otherwise None.
+        """
+        request = RegisterLibraryFromFileRequest(file_path=lib_path, load_as_default_library=False)
+        prereq_result = await self._establish_register_library_prerequisites(request)
+        if isinstance(prereq_result, RegisterLibraryFromFileResultFailure):
+            return prereq_result
+        if isinstance(prereq_result, RegisterLibraryFromFileResultSuccess):
+            # Already loaded; registration reports it.
+            return None
+        return await self._progress_library_through_lifecycle(
+            library_info=prereq_result.library_info,
+            file_path=prereq_result.file_path,
+            request=request,
+            stop_before_registration=True,
+        )
+
+    def _get_library_dependency_declarations(self, lib_path: str) -> list[LibraryDependencyDeclaration]:
+        """Get the griptape libraries a library declares it depends on."""
+        metadata_result = self.load_library_metadata_from_file_request(
+            LoadLibraryMetadataFromFileRequest(file_path=lib_path)
+        )
+        if isinstance(metadata_result, LoadLibraryMetadataFromFileResultFailure):
+            return []
+        return [
+            declaration
+            for declaration in (metadata_result.library_schema.metadata.declarations or [])
+            if isinstance(declaration, LibraryDependencyDeclaration)
+        ]
+
+    @staticmethod
+    def _library_info_matches_repo_name(library_info: LibraryManager.LibraryInfo, repo_name: str) -> bool:
+        """Return whether a tracked library is the one provided by a dependency's repository."""
+        return library_info.library_name == repo_name or repo_name in Path(library_info.library_path).parts
+
+    def _order_libraries_by_dependencies(
+        self, lib_paths: list[str], dependencies: dict[str, list[LibraryDependencyDeclaration]]
+    ) -> list[str]:
+        """Order libraries so each one comes after the libraries it depends on.
+
+        Otherwise the given order is kept. Libraries in a dependency cycle keep their given order.
+        """
+        depends_on: dict[str, set[str]] = {}
+        for lib_path in lib_paths:
+            repo_names = [
+                extract_repo_name_from_url(normalize_github_url(parse_git_url_with_ref(dependency.url).url))
+                for dependency in dependencies.get(lib_path, [])
+            ]
+            depends_on[lib_path] = {
+                other_path
+                for other_path in lib_paths
+                if other_path != lib_path
+                and (other_info := self._library_file_path_to_info.get(other_path)) is not None
+                and any(self._library_info_matches_repo_name(other_info, repo_name) for repo_name in repo_names)
+            }
+
+        ordered: list[str] = []
+        remaining = list(lib_paths)
+        while remaining:
+            # Fall back to the given order when every remaining library waits on another (a cycle).
+            ready = next((lib_path for lib_path in remaining if depends_on[lib_path].issubset(ordered)), remaining[0])
+            remaining.remove(ready)
+            ordered.append(ready)
+        return ordered
+
+    async def _load_libraries(self, libraries_to_load: list[tuple[int, str]], total: int) -> None:
+        """Load libraries, preparing them concurrently and registering them one at a time.
+
+        Preparing a library (metadata, fitness evaluation, library dependency downloads, and
+        venv installs) mostly waits on disk, git, and uv, so libraries are prepared concurrently.
+        Libraries that declare library dependencies are prepared one at a time, so two of them
+        never download the same dependency at once. Registering a library adds to sys.path,
+        imports its node modules, and adds it to LibraryRegistry, so registration waits for
+        every library to be prepared and then runs one library at a time, in config order with
+        each library's dependencies ahead of it.
+
+        Args:
+            libraries_to_load: (progress index, library path) pairs in config order.
+            total: Total number of libraries, for progress events.
+        """
+        index_by_path = {lib_path: index for index, lib_path in libraries_to_load}
+        dependencies = {lib_path: self._get_library_dependency_declarations(lib_path) for lib_path in index_by_path}
+        preparation_slots = asyncio.Semaphore(MAX_CONCURRENT_LIBRARY_PREPARATIONS)
+        dependency_download_lock = asyncio.Lock()
+
+        async def prepare(lib_path: str) -> RegisterLibraryFromFileResultFailure | None:
+            if dependencies[lib_path]:
+                async with dependency_download_lock, preparation_slots:
+                    self._emit_library_loading_progress(lib_path, index_by_path[lib_path], total)
+                    return await self._prepare_library_for_registration(lib_path)
+            async with preparation_slots:
+                self._emit_library_loading_progress(lib_path, index_by_path[lib_path], total)
+                return await self._prepare_library_for_registration(lib_path)
+
+        async with asyncio.TaskGroup() as tg:
+            preparations = {lib_path: tg.create_task(prepare(lib_path)) for lib_path in index_by_path}
+
+        for lib_path in self._order_libraries_by_dependencies(list(index_by_path), dependencies):
+            load_result = preparations[lib_path].result()
+            if load_result is None:
+                load_result = await self.register_library_from_file_request(
+                    RegisterLibraryFromFileRequest(
+                        file_path=lib_path,
+                        load_as_default_library=False,
+                    )
+                )
+            self._emit_library_load_result_progress(lib_path, load_result, index_by_path[lib_path], total)
+
     async def load_all_libraries_from_config(self, target_library_names: list[str] | None = None) -> list[str]:
         """Reconcile sourced libraries, then discover and load every enabled library.
 
@@ -3375,6 +3579,7 @@ class LibraryManager:
         # Calculate total libraries for progress tracking
         total_libraries = len(libraries_to_load)
 
+        indexed_libraries_to_load = []
         for current_library_index, lib_path in enumerate(libraries_to_load, start=1):
             # When running as a dedicated library worker, skip libraries that don't match the target.
             # library_name is already populated in _library_file_path_to_info from the discovery phase.
@@ -3384,7 +3589,9 @@ class LibraryManager:
             ):
                 continue
 
-            await self._load_and_track_library(lib_path, current_library_index, total_libraries)
+            indexed_libraries_to_load.append((current_library_index, lib_path))
+
+        await self._load_libraries(indexed_libraries_to_load, total_libraries)
 
         # Remove any missing libraries AFTER we've loaded them for the user.
         user_libraries_section = LIBRARIES_TO_REGISTER_KEY
@@ -4279,11 +4486,49 @@ class LibraryManager:
                 )
                 logger.error(details)
 
+        # Nodes listed in an up-to-date manifest are registered without importing their modules.
+        lazy_import_state = self._get_library_manifest_entries(
+            library,
+            library_info,
+            base_dir,
+            self._get_library_site_packages_path(
+                self._get_library_venv_path(library_data.name, library_info.library_path)
+            ),
+        )
+        loaded_manifest_entries: list[NodeManifestEntry] = []
+        any_nodes_imported = False
+
         # Process each node in the metadata
         for node_definition in library_data.nodes:
             # Resolve relative path to absolute path
             node_file_path = resolve_workspace_path(Path(node_definition.file_path), base_dir)
 
+            manifest_entry = (
+                lazy_import_state[1].get(node_definition.class_name) if lazy_import_state is not None else None
+            )
+            if manifest_entry is not None and manifest_entry.file_path == str(node_file_path):
+                library_problem = library.register_lazy_node_type(
+                    node_definition.class_name,
+                    node_definition.metadata,
+                    LazyNodeType(
+                        load_node_class=functools.partial(
+                            self._load_class_from_file,
+                            node_file_path,
+                            node_definition.class_name,
+                            library_data.name,
+                            reuse_loaded_module=True,
+                        ),
+                        base_classes=frozenset(manifest_entry.base_classes),
+                    ),
+                )
+                if library_problem is not None:
+                    library_info.problems.append(library_problem)
+                # Saved workflows and pickles import node modules by their stable namespace
+                self._register_lazy_module_alias(node_file_path, library_data.name)
+                loaded_manifest_entries.append(manifest_entry)
+                any_nodes_loaded_successfully = True
+                continue
+
             try:
                 # Dynamically load the module containing the node class
                 node_class = self._load_class_from_file(node_file_path, node_definition.class_name, library_data.name)
@@ -4322,6 +4567,21 @@ class LibraryManager:
 
             # If we got here, at least one node came in.
             any_nodes_loaded_successfully = True
+            any_nodes_imported = True
+            if node_class.__name__ == node_definition.class_name:
+                loaded_manifest_entries.append(
+                    NodeManifestEntry(
+                        class_name=node_definition.class_name,
+                        file_path=str(node_file_path),
+                        base_classes=[get_class_path(cls) for cls in node_class.__mro__],
+                    )
+                )
+
+        if lazy_import_state is not None and any_nodes_imported:
+            write_library_manifest(
+                library_info.library_path,
+                LibraryManifest(fingerprint=lazy_import_state[0], nodes=loaded_manifest_entries),
+            )
 
         # Register widgets and check for duplicates
         if library_data.widgets:
@@ -191,6 +191,9 @@ from griptape_nodes.retained_mode.events.parameter_events import (
     AlterParameterGroupDetailsRequest,
     AlterParameterGroupDetailsResultFailure,
     AlterParameterGroupDetailsResultSuccess,
+    BatchSetParameterValuesRequest,
+    BatchSetParameterValuesResultFailure,
+    BatchSetParameterValuesResultSuccess,
     GetCompatibleParametersRequest,
     GetCompatibleParametersResultFailure,
     GetCompatibleParametersResultSuccess,
@@ -366,6 +369,9 @@ class NodeManager:
         )
         event_manager.assign_manager_to_request_type(GetParameterValueRequest, self.on_get_parameter_value_request)
         event_manager.assign_manager_to_request_type(SetParameterValueRequest, self.on_set_parameter_value_request)
+        event_manager.assign_manager_to_request_type(
+            BatchSetParameterValuesRequest, self.on_batch_set_parameter_values_request
+        )
         event_manager.assign_manager_to_request_type(RenameParameterRequest, self.on_rename_parameter_request)
         event_manager.assign_manager_to_request_type(
             ReorderParameterListItemRequest, self.on_reorder_parameter_list_item_request
@@ -431,6 +437,7 @@ class NodeManager:
                     connection.source_node.name = new_name
             temp = connections.outgoing_index.pop(old_name)
             connections.outgoing_index[new_name] = temp
+        connections.invalidate_reachability_cache()
 
         # Update parent group membership if node belongs to a group
         parent_group = node.parent_group
@@ -2670,6 +2677,29 @@ class NodeManager:
         )
         return result
 
+    def on_batch_set_parameter_values_request(self, request: BatchSetParameterValuesRequest) -> ResultPayload:
+        # Each value runs through the single-value handler directly, so it gets the same checks,
+        # converters, validators, and downstream propagation without a bus round trip and
+        # broadcast per value.
+        finalized_values: dict[str, Any] = {}
+        for set_value_request in request.set_value_requests:
+            parameter_name = set_value_request.parameter_name
+            if set_value_request.node_name not in (None, request.node_name):
+                details = f"Attempted to set parameter values on node '{request.node_name}'. Failed because the value for '{parameter_name}' targets node '{set_value_request.node_name}'."
+                return BatchSetParameterValuesResultFailure(result_details=details)
+            set_value_request.node_name = request.node_name
+
+            set_value_result = self.on_set_parameter_value_request(set_value_request)
+            if not isinstance(set_value_result, SetParameterValueResultSuccess):
+                details = f"Attempted to set parameter values on node '{request.node_name}'. Failed to set '{parameter_name}': {set_value_result.result_details}"
+                return BatchSetParameterValuesResultFailure(
+                    result_details=details, failed_parameter_name=parameter_name
+                )
+            finalized_values[parameter_name] = set_value_result.finalized_value
+
+        details = f"Successfully set {len(finalized_values)} parameter values on Node '{request.node_name}'."
+        return BatchSetParameterValuesResultSuccess(finalized_values=finalized_values, result_details=details)
+
     def _set_and_pass_through_values(self, request: SetParameterValueRequest, node: BaseNode) -> ModifiedReturnValue:
         """Set the parameter value on the node according to the specifications."""
         modified = False
@@ -2950,6 +2980,12 @@ class NodeManager:
             errormsg = f"This workflow is already in progress. Please wait for the current control process to finish before starting {node.name} again."
             return ResolveNodeResultFailure(validation_exceptions=[RuntimeError(errormsg)], result_details=errormsg)
 
+        # Nodes in a flow running concurrently on its own control flow machine belong to that run
+        concurrent_context = flow_mgr.flow_execution_registry.find_context_for_node(node.name)
+        if concurrent_context is not None:
+            errormsg = f"Node '{node.name}' is part of flow '{concurrent_context.flow_name}', which is already in progress. Please wait for it to finish before starting {node.name} again."
+            return ResolveNodeResultFailure(validation_exceptions=[RuntimeError(errormsg)], result_details=errormsg)
+
         # Check if the node is already in the DAG - if so, skip this resolution. It's already queued or has been resolved.
         if node.name in flow_mgr._global_dag_builder.node_to_reference:
             logger.error("Node %s is already executing. Cannot start execution.", node.name)
@@ -4260,22 +4296,18 @@ class NodeManager:
                     serialized_parameter_value_tracker.add_as_not_serializable(value_id)
                     return None
 
-                # Check if we can serialize it.
-                try:
-                    pickle.dumps(value)
-                except Exception:
-                    # Not serializable; don't waste time on future attempts.
-                    serialized_parameter_value_tracker.add_as_not_serializable(value_id)
-                    # Bail.
+                # Pickling the value both checks that it serializes and produces its bytes.
+                tracked = NodeManager._pickle_and_track_value(value, value_id, serialized_parameter_value_tracker)
+                if tracked is None:
+                    # Not serializable. Bail.
                     return None
-                # The value should be serialized. Add it to the map of uniques.
-                unique_uuid = SerializedNodeCommands.UniqueParameterValueUUID(str(uuid4()))
-
+                unique_uuid, pickled_bytes = tracked
                 if use_pickling:
-                    # Use pickle serialization via WorkflowManager
-                    workflow_manager = GriptapeNodes.WorkflowManager()
-                    pickled_bytes = workflow_manager._patch_and_pickle_object(value)
                     unique_parameter_uuid_to_values[unique_uuid] = pickled_bytes
+                elif GriptapeNodes.WorkflowManager()._record_pickled_unique_value(unique_uuid, pickled_bytes):
+                    # A save is in progress and will write these bytes; they already are the
+                    # snapshot of the value, so don't pay for a deep copy as well.
+                    unique_parameter_uuid_to_values[unique_uuid] = value
                 else:
                     # Use existing deep copy approach
                     try:
@@ -4284,7 +4316,6 @@ class NodeManager:
                         details = f"Attempted to serialize parameter '{parameter_name}` on node '{node_name}'. The parameter value could not be copied. It will be serialized by value. If problems arise from this, ensure the type '{type(value)}' works with copy.deepcopy()."
                         logger.warning(details)
                         unique_parameter_uuid_to_values[unique_uuid] = value
-                serialized_parameter_value_tracker.add_as_serializable(value_id, unique_uuid)
 
         # Serialize it
         set_value_command = SetParameterValueRequest(
@@ -4299,6 +4330,31 @@ class NodeManager:
         )
         return indirect_set_value_command
 
+    @staticmethod
+    def _pickle_and_track_value(
+        value: Any, value_id: Any, tracker: SerializedParameterValueTracker
+    ) -> tuple[SerializedNodeCommands.UniqueParameterValueUUID, bytes] | None:
+        """Pickle a value not yet in the tracker and give it a new unique value UUID.
+
+        Equal but distinct values pickle to the same bytes. They keep their own UUIDs, so each
+        parameter gets its own object back when the values are loaded, but share one copy of
+        the bytes.
+
+        Returns:
+            None if the value can't be pickled (it is recorded as not serializable). Otherwise the
+            value's unique UUID and its pickled bytes.
+        """
+        try:
+            pickled_bytes = GriptapeNodes.WorkflowManager()._patch_and_pickle_object(value)
+        except Exception:
+            # Not serializable; don't waste time on future attempts.
+            tracker.add_as_not_serializable(value_id)
+            return None
+
+        unique_uuid = SerializedNodeCommands.UniqueParameterValueUUID(str(uuid4()))
+        tracker.add_as_serializable(value_id, unique_uuid)
+        return unique_uuid, tracker.intern_pickled_value(pickled_bytes)
+
     @staticmethod
     def handle_parameter_value_saving(  # noqa: PLR0913
         parameter: Parameter,
@@ -4590,17 +4646,13 @@ class NodeManager:
         except TypeError:
             value_id = id(param_value)
 
-        try:
-            workflow_manager = GriptapeNodes.WorkflowManager()
-            pickled_bytes = workflow_manager._patch_and_pickle_object(param_value)
-        except Exception:
-            tracker.add_as_not_serializable(value_id)
+        tracked = NodeManager._pickle_and_track_value(param_value, value_id, tracker)
+        if tracked is None:
             uuid_referenced_values[param_name] = None
             return None
 
-        unique_uuid = SerializedNodeCommands.UniqueParameterValueUUID(str(uuid4()))
+        unique_uuid, pickled_bytes = tracked
         unique_parameter_uuid_to_values[unique_uuid] = pickled_bytes
-        tracker.add_as_serializable(value_id, unique_uuid)
         return unique_uuid
 
     def on_rename_parameter_request(self, request: RenameParameterRequest) -> ResultPayload:  # noqa: C901, PLR0911, PLR0912
@@ -4680,6 +4732,7 @@ class NodeManager:
                         connection.source_parameter.name = request.new_parameter_name
                 # Update the index key from old name to new name
                 outgoing_connections[request.new_parameter_name] = outgoing_connections.pop(request.parameter_name)
+        connections.invalidate_reachability_cache()
 
         # Update parameter name
         old_name = parameter.name
@@ -46,6 +46,7 @@ from griptape_nodes.common.sequences.scan import (
     scan_sequences_from_filenames,
 )
 from griptape_nodes.files import os_utils
+from griptape_nodes.files.directory_size_tracker import DirectorySizeTracker
 from griptape_nodes.files.drivers.base64_file_driver import Base64FileDriver
 from griptape_nodes.files.drivers.data_uri_file_driver import DataUriFileDriver
 from griptape_nodes.files.drivers.griptape_cloud_file_driver import GriptapeCloudFileDriver
@@ -63,6 +64,7 @@ from griptape_nodes.files.path_utils import (
     sanitize_path_string,
     strip_surrounding_quotes,
 )
+from griptape_nodes.files.sequential_index_allocator import SequentialIndexAllocator
 from griptape_nodes.retained_mode.events.base_events import ResultDetails, ResultPayload
 from griptape_nodes.retained_mode.events.os_events import (
     CopyFileRequest,
@@ -151,7 +153,8 @@ if TYPE_CHECKING:
     from griptape_nodes.retained_mode.managers.authorization_checkpoint import CheckpointDenial
 
 # File is not in static directory (or not a local file), create small preview
-from griptape_nodes.utils.image_preview import create_image_preview_from_bytes
+from griptape_nodes.utils.image_preview import acreate_image_preview_from_bytes
+from griptape_nodes.utils.preview_executor import PreviewPriority
 
 console = Console()
 
@@ -308,6 +311,9 @@ class OSManager:
         "music": 0x000D,  # CSIDL_MYMUSIC
     }
 
+    # Shared so sizes recorded by file writes are seen by the static cleanup helpers
+    _directory_size_tracker: ClassVar[DirectorySizeTracker] = DirectorySizeTracker()
+
     @staticmethod
     def normalize_path_parts_for_special_folder(path_str: str) -> list[str]:
         r"""Parse a path string into normalized parts for special folder detection.
@@ -372,6 +378,8 @@ class OSManager:
         return WindowsSpecialFolderResult(special_path=special_path, remaining_parts=remaining)
 
     def __init__(self, event_manager: EventManager | None = None):
+        self._index_allocator = SequentialIndexAllocator()
+
         if event_manager is not None:
             event_manager.assign_manager_to_request_type(
                 request_type=OpenAssociatedFileRequest, callback=self.on_open_associated_file_request
@@ -1094,30 +1102,6 @@ class OSManager:
             result_details=msg,
         )
 
-    def _find_next_index_with_gap_fill(self, existing_indices: list[int]) -> int:
-        """Find next available index using fill-gaps strategy.
-
-        Args:
-            existing_indices: List of existing indices
-
-        Returns:
-            Next available index (1-based)
-
-        Examples:
-            [] -> 1
-            [1, 2, 3] -> 4
-            [1, 3, 4] -> 2 (fills gap)
-        """
-        if not existing_indices:
-            return 1
-
-        existing_indices.sort()
-        for i in range(1, max(existing_indices) + 1):
-            if i not in existing_indices:
-                return i
-
-        return max(existing_indices) + 1
-
     def _convert_str_path_to_macro_with_index(self, path_str: str) -> MacroPath:
         """Convert string path to MacroPath with required {_index} variable for indexed filenames.
 
@@ -1278,6 +1262,8 @@ class OSManager:
         parsed_macro: ParsedMacro,
         variables: MacroVariables,
         index_var: ParsedVariable,
+        *,
+        reserve: bool = False,
     ) -> int | None:
         """Scan existing files and return next available index (preview only - no file creation).
 
@@ -1285,12 +1271,16 @@ class OSManager:
         If index variable is optional and base filename is free, returns None.
 
         This is a preview method - it ONLY scans the filesystem and returns a suggestion.
-        It does NOT create any files or acquire any locks.
+        It does NOT create any files or acquire any locks. The directory is listed once and
+        the indices found are cached by ``self._index_allocator`` until the directory changes,
+        so repeated calls for the same sequence do not list it again.
 
         Args:
             parsed_macro: Parsed macro template
             variables: Known variable values (index variable NOT included)
             index_var: The parsed variable to use for auto-incrementing
+            reserve: Reserve the returned index so concurrent writers in this process skip it.
+                Report the outcome with ``_record_indexed_write_attempt``.
 
         Returns:
             Next available index (1, 2, 3...), or None if index is optional and base filename is free
@@ -1333,28 +1323,63 @@ class OSManager:
                 # Cannot resolve without index - treat as required
                 pass
 
-        # Build glob pattern by partially resolving with known variables
-        partial = partial_resolve(parsed_macro.template, parsed_macro.segments, variables, secrets_manager)
-        glob_pattern = self._build_glob_pattern_from_partially_resolved(partial.segments, index_var_name)
+        glob_path, sequence_key = self._get_index_sequence(parsed_macro, variables, index_var_name)
 
-        # Scan existing files matching pattern
-        glob_path = Path(glob_pattern)
-        if not glob_path.parent.exists():
-            # Parent directory doesn't exist - start at index 1
-            return 1
+        def scan_existing_indices() -> list[int]:
+            existing_indices = []
+            for filepath in glob_path.parent.glob(glob_path.name):
+                # Pass the full path string. _extract_index_from_filename matches against the
+                # FULL template (parent-directory segments and all), so the basename never
+                # matches and the scan would return 1 every call.
+                extracted_index = self._extract_index_from_filename(
+                    str(filepath), parsed_macro, index_var_name, variables
+                )
+                if extracted_index is not None:
+                    existing_indices.append(extracted_index)
+            return existing_indices
 
-        existing_files = list(glob_path.parent.glob(glob_path.name))
-        existing_indices = []
+        # A missing parent directory scans as empty, starting at index 1
+        return self._index_allocator.next_index(glob_path.parent, sequence_key, scan_existing_indices, reserve=reserve)
 
-        for filepath in existing_files:
-            # Pass the full path string. _extract_index_from_filename matches against the
-            # FULL template (parent-directory segments and all), so the basename never
-            # matches and the scan would return 1 every call.
-            extracted_index = self._extract_index_from_filename(str(filepath), parsed_macro, index_var_name, variables)
-            if extracted_index is not None:
-                existing_indices.append(extracted_index)
+    def _get_index_sequence(
+        self, parsed_macro: ParsedMacro, variables: MacroVariables, index_var_name: str
+    ) -> tuple[Path, tuple[str, ...]]:
+        """Get the glob matching a macro's indexed files and the key its indices are cached under.
 
-        return self._find_next_index_with_gap_fill(existing_indices)
+        Args:
+            parsed_macro: Parsed macro template
+            variables: Known variable values (index variable NOT included)
+            index_var_name: Name of the index variable
+
+        Returns:
+            Tuple of (glob path whose parent is the directory to scan, allocator key for the sequence)
+        """
+        secrets_manager = GriptapeNodes.SecretsManager()
+        # Build glob pattern by partially resolving with known variables
+        partial = partial_resolve(parsed_macro.template, parsed_macro.segments, variables, secrets_manager)
+        glob_path = Path(self._build_glob_pattern_from_partially_resolved(partial.segments, index_var_name))
+        # Variables feed the reverse-match in the scan, so sequences differing only in them are kept apart
+        variables_key = repr(sorted((name, repr(value)) for name, value in variables.items()))
+        return glob_path, (glob_path.name, parsed_macro.template, index_var_name, variables_key)
+
+    def _record_indexed_write_attempt(
+        self,
+        parsed_macro: ParsedMacro,
+        variables: MacroVariables,
+        index_var: ParsedVariable,
+        index: int,
+        *,
+        written: bool,
+    ) -> None:
+        """Tell the index cache whether writing an index succeeded or collided with an existing file.
+
+        Successful writes keep the cache valid; collisions make the next scan list the directory again.
+        """
+        glob_path, sequence_key = self._get_index_sequence(parsed_macro, variables, index_var.info.name)
+        if written:
+            self._index_allocator.record_write(glob_path.parent, sequence_key, index)
+        else:
+            self._index_allocator.record_collision(glob_path.parent, sequence_key, index)
 
     @staticmethod
     def platform() -> str:
@@ -2093,8 +2118,12 @@ class OSManager:
             # Get appropriate driver
             driver = FileDriverRegistry.get_driver(location)
 
-            # Driver validates and reads
-            content = await driver.read(location, timeout=120.0)
+            # Driver validates and reads (only the requested range, if any)
+            is_range_read = request.byte_offset != 0 or request.byte_length is not None
+            if is_range_read:
+                content = await driver.read_range(location, request.byte_offset, request.byte_length, timeout=120.0)
+            else:
+                content = await driver.read(location, timeout=120.0)
 
             # Add basic metadata
             file_size = len(content)
@@ -2102,9 +2131,14 @@ class OSManager:
             is_text = self._is_text_content(content, mime_type)
             encoding = "utf-8" if is_text else None
 
-            # Handle image thumbnail generation (if requested)
-            if mime_type.startswith("image/") and request.should_transform_image_content_to_thumbnail and not is_text:
-                content = self._generate_thumbnail_from_image_content(content, location, mime_type)
+            # Handle image thumbnail generation (if requested; a partial image cannot be decoded)
+            if (
+                mime_type.startswith("image/")
+                and request.should_transform_image_content_to_thumbnail
+                and not is_text
+                and not is_range_read
+            ):
+                content = await self._generate_thumbnail_from_image_content(content, location, mime_type)
                 # Thumbnail returns a string (URL or data URI), not bytes
                 decoded_content: str | bytes = content
                 encoding = None
@@ -2164,7 +2198,9 @@ class OSManager:
         # Read via driver system (driver handles all validation and I/O)
         return await self._read_via_driver(location, request)
 
-    def _generate_thumbnail_from_image_content(self, content: bytes, file_path: Path | str, mime_type: str) -> str:
+    async def _generate_thumbnail_from_image_content(
+        self, content: bytes, file_path: Path | str, mime_type: str
+    ) -> str:
         """Handle image content by creating previews or returning static URLs.
 
         Args:
@@ -2205,12 +2241,14 @@ class OSManager:
             # Not a valid local path (might be URL or data URI), continue to preview
             pass
 
-        preview_data_url = create_image_preview_from_bytes(
-            original_image_bytes,  # type: ignore[arg-type]
+        # Thumbnails are read to be displayed, so they go ahead of queued background previews
+        preview_data_url = await acreate_image_preview_from_bytes(
+            original_image_bytes,
             max_width=200,
             max_height=200,
             quality=85,
             image_format="WEBP",
+            priority=PreviewPriority.VISIBLE,
         )
 
         if preview_data_url:
@@ -2637,7 +2675,9 @@ class OSManager:
                             # Optional + unbound: seed didn't fire; this loop is the first try.
                             start_idx = 1
                     else:
-                        starting_index = self._scan_for_next_available_index(parsed_macro, variables, index_info)
+                        starting_index = self._scan_for_next_available_index(
+                            parsed_macro, variables, index_info, reserve=True
+                        )
                         start_idx = starting_index if starting_index is not None else 1
 
                     # Try indexed candidates on-demand (up to max attempts)
@@ -2738,6 +2778,12 @@ class OSManager:
                                 failure_reason=result.failure_reason,
                                 result_details=result.error_message,  # type: ignore[arg-type]
                             )
+                        if not walking_original:
+                            # Keep the cached indices current so the next write of this
+                            # sequence does not have to list the directory again
+                            self._record_indexed_write_attempt(
+                                parsed_macro, variables, index_info, idx, written=result.bytes_written is not None
+                            )
                         if result.bytes_written is not None:
                             # Success with indexed path!
                             final_file_path = candidate_path
@@ -2780,6 +2826,9 @@ class OSManager:
         if request.file_metadata is not None:
             write_sidecar(final_file_path, request.file_metadata)
 
+        # Keep the sizes of directories under a cleanup budget current without re-walking them
+        OSManager._directory_size_tracker.record_write(final_file_path)
+
         if used_indexed_fallback:
             msg = f"File written to indexed path: {final_file_path} (original path '{path_display}' already existed)"
             result_details = ResultDetails(message=msg, level=logging.DEBUG)
@@ -3430,18 +3479,11 @@ class OSManager:
         Returns:
             Total size in GB
         """
-        total_size = 0.0
-
         if not path.exists():
             logger.error("Directory %s does not exist. Skipping cleanup.", path)
             return 0.0
 
-        for _, _, files in os.walk(path):
-            for f in files:
-                fp = path / f
-                if not fp.is_symlink():
-                    total_size += fp.stat().st_size
-        return total_size / (1024 * 1024 * 1024)  # Convert to GB
+        return OSManager._directory_size_tracker.get_size(path) / (1024**3)  # Convert to GB
 
     @staticmethod
     def _cleanup_old_files(directory_path: Path, target_size_gb: float) -> bool:
@@ -3458,55 +3500,8 @@ class OSManager:
             logger.error("Directory %s does not exist. Skipping cleanup.", directory_path)
             return False
 
-        # Get all files with their modification times
-        files_with_times: list[tuple[Path, float]] = []
-
-        for file_path in directory_path.rglob("*"):
-            if file_path.is_file():
-                try:
-                    mtime = file_path.stat().st_mtime
-                    files_with_times.append((file_path, mtime))
-                except (OSError, FileNotFoundError) as err:
-                    # Skip files that can't be accessed
-                    logger.error(
-                        "While cleaning up old files, saw file %s. File could not be accessed; skipping. Error: %s",
-                        file_path,
-                        err,
-                    )
-                    continue
-
-        if not files_with_times:
-            logger.error(
-                "Attempted to clean up files to get below a target directory size, but no suitable files were found that could be deleted."
-            )
-            return False
-
-        # Sort by modification time (oldest first)
-        files_with_times.sort(key=lambda x: x[1])
-
-        # Remove files until we're under the target size
-        removed_count = 0
-
-        for file_path, _ in files_with_times:
-            try:
-                # Delete the file.
-                # TODO: Replace with DeleteFileRequest https://github.com/griptape-ai/griptape-nodes/issues/3765
-                file_path.unlink()
-                removed_count += 1
-
-                # Check if we're now under the target size
-                current_size_gb = OSManager._get_directory_size_gb(directory_path)
-                if current_size_gb <= target_size_gb:
-                    # We're done!
-                    break
-
-            except (OSError, FileNotFoundError) as err:
-                # Skip files that can't be deleted
-                logger.error(
-                    "While cleaning up old files, attempted to delete file %s. File could not be deleted; skipping. Deletion error: %s",
-                    file_path,
-                    err,
-                )
+        # Deletes oldest first from the tracked sizes, without re-walking the directory per deletion
+        removed_count = OSManager._directory_size_tracker.enforce_budget(directory_path, int(target_size_gb * 1024**3))
 
         if removed_count > 0:
             final_size_gb = OSManager._get_directory_size_gb(directory_path)
@@ -3518,7 +3513,7 @@ class OSManager:
             )
         else:
             # None deleted.
-            logger.error("Attempted to clean up old files from %s, but no files could be deleted.")
+            logger.error("Attempted to clean up old files from %s, but no files could be deleted.", directory_path)
 
         return removed_count > 0
 
@@ -3943,6 +3938,8 @@ class OSManager:
                 msg = f"Unknown/unsupported deletion behavior: {request.deletion_behavior}"
                 raise ValueError(msg)
 
+        OSManager._directory_size_tracker.record_delete(resolved_path)
+
         # SUCCESS PATH AT END
         return DeleteFileResultSuccess(
             deleted_path=str(resolved_path),
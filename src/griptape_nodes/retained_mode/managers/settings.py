@@ -20,9 +20,17 @@ EVENTS_TO_ECHO_KEY = "app_events.events_to_echo_as_retained_mode"
 WORKER_HEARTBEAT_INTERVAL_KEY = "worker.heartbeat_interval_s"
 WORKER_HEARTBEAT_TIMEOUT_KEY = "worker.heartbeat_timeout_s"
 WORKER_HEARTBEAT_STARTUP_GRACE_KEY = "worker.heartbeat_startup_grace_s"
+LOOP_ITERATIONS_MAX_CONCURRENCY_KEY = "loop_iterations.max_concurrency"
+LOOP_ITERATIONS_MAX_RSS_MB_KEY = "loop_iterations.max_rss_mb"
+LOOP_ITERATIONS_MAX_LOAD_PER_CPU_KEY = "loop_iterations.max_load_per_cpu"
+LOOP_ITERATIONS_CANCEL_ON_FAILURE_KEY = "loop_iterations.cancel_on_failure"
+SUBPROCESS_WORKER_POOL_SIZE_KEY = "subprocess_worker_pool.size"
+SUBPROCESS_WORKER_POOL_MAX_JOBS_PER_WORKER_KEY = "subprocess_worker_pool.max_jobs_per_worker"
+SUBPROCESS_WORKER_POOL_MAX_RSS_MB_KEY = "subprocess_worker_pool.max_rss_mb"
 DISCOVERY_MAX_DEPTH_KEY = "discovery_max_depth"
 LIBRARY_DEPENDENCY_INSTALL_BEHAVIOR_KEY = "library.dependency_install_behavior"
 LIBRARY_MINIMUM_RELEASE_AGE_KEY = "library.minimum_release_age"
+LIBRARY_LAZY_NODE_IMPORTS_KEY = "library.lazy_node_imports"
 
 
 class Category(BaseModel):
@@ -277,6 +285,56 @@ class WorkerSettings(BaseModel):
     )
 
 
+class LoopIterationSettings(BaseModel):
+    max_concurrency: int = Field(
+        default=8,
+        description="Maximum number of loop iterations that run at the same time when a loop runs its iterations in parallel.",
+    )
+    max_rss_mb: float | None = Field(
+        default=None,
+        description=(
+            "Engine memory (resident set size, in MB) above which parallel loop iterations back off and start "
+            "fewer iterations at once. Unset disables the memory check."
+        ),
+    )
+    max_load_per_cpu: float | None = Field(
+        default=1.5,
+        description=(
+            "System load average per CPU above which parallel loop iterations back off and start fewer "
+            "iterations at once. Unset disables the load check."
+        ),
+    )
+    cancel_on_failure: bool = Field(
+        default=False,
+        description=(
+            "Stop a parallel loop as soon as one iteration fails, cancelling iterations in progress and skipping "
+            "the rest. When off, every iteration runs and failed iterations produce no result."
+        ),
+    )
+
+
+class SubprocessWorkerPoolSettings(BaseModel):
+    size: int = Field(
+        default=0,
+        description=(
+            "Number of warm worker processes kept ready to run subprocess workflow executions, such as loop "
+            "iterations in private execution. Workers start once with libraries loaded and run many workflows. "
+            "0 disables the pool and starts a fresh process for every run."
+        ),
+    )
+    max_jobs_per_worker: int = Field(
+        default=50,
+        description="Number of workflows a pooled worker runs before it is replaced with a fresh process.",
+    )
+    max_rss_mb: float | None = Field(
+        default=2048,
+        description=(
+            "Memory (resident set size, in MB) above which a pooled worker is replaced with a fresh process after "
+            "its current workflow. Unset disables the memory check."
+        ),
+    )
+
+
 class AgentSettings(BaseModel):
     system_prompt: str = Field(
         default="",
@@ -313,6 +371,15 @@ class LibrarySettings(BaseModel):
             "time."
         ),
     )
+    lazy_node_imports: bool = Field(
+        default=True,
+        description=(
+            "Import a library's node modules the first time each node is used instead of when the library "
+            "loads. Which classes a library provides is read from a manifest cached after the library's "
+            "modules were last imported, and the manifest is rebuilt whenever the library's files change. "
+            "Libraries with an advanced library module always import their node modules when they load."
+        ),
+    )
 
     @field_validator("dependency_install_behavior", mode="before")
     @classmethod
@@ -402,10 +469,23 @@ class Settings(BaseModel):
         default=5,
         description="Maximum number of nodes executing at a time for parallel execution.",
     )
+    max_concurrent_flows: int = Field(
+        category=EXECUTION,
+        default=4,
+        description="Maximum number of flows started with run_concurrently that may execute at the same time. Each runs on its own control flow machine; further flows wait for a free slot.",
+    )
     worker: WorkerSettings = Field(
         category=EXECUTION,
         default_factory=WorkerSettings,
     )
+    loop_iterations: LoopIterationSettings = Field(
+        category=EXECUTION,
+        default_factory=LoopIterationSettings,
+    )
+    subprocess_worker_pool: SubprocessWorkerPoolSettings = Field(
+        category=EXECUTION,
+        default_factory=SubprocessWorkerPoolSettings,
+    )
     storage_backend: Literal["local", "gtc"] = Field(
         category=STORAGE,
         default="local",
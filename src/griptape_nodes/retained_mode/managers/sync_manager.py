@@ -106,7 +106,9 @@ class SyncManager:
             return False
 
         try:
-            actual_hash = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+            # Hash in chunks so large files are never held in memory whole
+            with Path(path).open("rb") as file:
+                actual_hash = hashlib.file_digest(file, "sha256").hexdigest()
 
             if actual_hash == expected_hash:
                 # Content matches - this was our own write, clean up and ignore
@@ -7,6 +7,8 @@ import pickle
 import re
 import sys
 from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import UTC, datetime
 from enum import StrEnum
@@ -211,9 +213,18 @@ from griptape_nodes.retained_mode.managers.settings import WORKFLOWS_TO_REGISTER
 from griptape_nodes.utils.ast_utils import rewrite_string_comments
 from griptape_nodes.utils.file_utils import find_files_recursive
 from griptape_nodes.utils.string_utils import normalize_display_name
+from griptape_nodes.utils.workflow_value_store import (
+    DEFAULT_MIN_EXTERNAL_VALUE_SIZE,
+    WORKFLOW_VALUES_DIR_NAME,
+    collect_unreferenced_workflow_values,
+    copy_workflow_values,
+    get_value_digest,
+    move_workflow_values,
+    write_workflow_values,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterator, Sequence
     from types import TracebackType
 
     from griptape_nodes.exe_types.core_types import Parameter
@@ -233,6 +244,11 @@ WorkflowShapeNodes = dict[str, NodeParameterMap]  # {node_name: {param_name: par
 
 logger = logging.getLogger("griptape_nodes")
 
+# Pickles of unique parameter values made while serializing a flow for a save, keyed by unique
+# value UUID, so the workflow writer reuses them instead of pickling every value again. Set only
+# for the duration of a save, and only visible to the save's own call chain.
+_pickled_unique_values: ContextVar[dict[str, bytes] | None] = ContextVar("_pickled_unique_values", default=None)
+
 
 class WorkflowRegistrationResult(NamedTuple):
     """Result of processing workflows for registration."""
@@ -497,6 +513,14 @@ class WorkflowManager:
         """Remove the substitution flag when a workflow is permanently deleted."""
         self._variable_substitution_enabled.pop(workflow_key, None)
 
+    @staticmethod
+    def _collect_unreferenced_workflow_values(workflow_dir: Path) -> None:
+        """Delete stored values no workflow file in a directory references, logging rather than failing."""
+        try:
+            collect_unreferenced_workflow_values(workflow_dir)
+        except OSError as err:
+            logger.warning("Failed to clean up stored workflow values in '%s': %s", workflow_dir, err)
+
     def _rekey_substitution_flag(self, old_key: str, new_key: str) -> None:
         """Transfer the substitution flag when a workflow registry key changes.
 
@@ -1150,6 +1174,7 @@ class WorkflowManager:
         if isinstance(delete_result, DeleteFileResultFailure):
             details = f"Failed to delete workflow file with path '{workflow_file_path}'. {delete_result.result_details}"
             return DeleteWorkflowResultFailure(result_details=details)
+        self._collect_unreferenced_workflow_values(full_path.parent)
         self._drop_substitution_flag(request.name)
         return DeleteWorkflowResultSuccess(
             result_details=ResultDetails(message=f"Successfully deleted workflow: {request.name}", level=logging.INFO)
@@ -1729,6 +1754,8 @@ class WorkflowManager:
         try:
             # Move the file
             Path(current_file_path).rename(new_absolute_path)
+            # Large values stored next to the workflow have to follow it to its new directory
+            move_workflow_values(current_file_path, new_absolute_path)
 
             # Update workflow registry with new file path
             workflow.file_path = new_relative_path
@@ -2359,62 +2386,64 @@ class WorkflowManager:
             return SaveWorkflowResultFailure(result_details=details)
         top_level_flow_name = top_level_flow_result.flow_name
 
-        serialized_flow_result = await GriptapeNodes.ahandle_request(
-            SerializeFlowToCommandsRequest(flow_name=top_level_flow_name, include_create_flow_command=True)
-        )
-        if not isinstance(serialized_flow_result, SerializeFlowToCommandsResultSuccess):
-            details = f"Attempted to save workflow '{relative_file_path}'. Failed when serializing flow."
-            return SaveWorkflowResultFailure(result_details=details)
-        commands = serialized_flow_result.serialized_flow_commands
-
-        # Extract workflow shape if available; ignore failures
-        try:
-            workflow_shape_dict = self.extract_workflow_shape(workflow_name=registry_key)
-            workflow_shape = WorkflowShape(
-                inputs=workflow_shape_dict["input"],
-                outputs=workflow_shape_dict["output"],
+        # The flow serialization and the workflow writer share value pickles, so each value is pickled once
+        with self._share_pickled_unique_values():
+            serialized_flow_result = await GriptapeNodes.ahandle_request(
+                SerializeFlowToCommandsRequest(flow_name=top_level_flow_name, include_create_flow_command=True)
             )
-        except ValueError:
-            workflow_shape = None
-
-        # Build save request inline (preserve existing display_name/description/image/is_template if present)
-        existing = self._get_existing_metadata(registry_key)
-        # Display name precedence (high to low):
-        # 1. Caller-supplied request.display_name — explicit intent always wins.
-        # 2. existing.display_name from the registry — preserves the human-readable label
-        #    across re-saves and version bumps (one workflow named "a" with v001, v002, ...).
-        # 3. The resolved local file_name from _determine_save_target — this is either the
-        #    user's typed Save-As stem (so "a" stays "a" and doesn't become "a_v001"), or
-        #    the sanitized display-name-derived stem for a first-save-of-unsaved-workflow
-        #    (so the synthetic "unsaved:<uuid>" key never leaks to metadata.name). Read the
-        #    local `file_name`, NOT `request.file_name` — the latter is un-normalized and
-        #    can still be "unsaved:<uuid>" on the wire for the fresh-save case.
-        # 4. Resolved file_name fallback inside _generate_workflow_metadata_from_commands
-        #    (last-resort safety net for code paths that supply nothing).
-        if request.display_name is not None:
-            resolved_display_name = request.display_name
-        elif existing.display_name is not None:
-            resolved_display_name = existing.display_name
-        elif file_name:
-            resolved_display_name = file_name
-        else:
-            resolved_display_name = None
+            if not isinstance(serialized_flow_result, SerializeFlowToCommandsResultSuccess):
+                details = f"Attempted to save workflow '{relative_file_path}'. Failed when serializing flow."
+                return SaveWorkflowResultFailure(result_details=details)
+            commands = serialized_flow_result.serialized_flow_commands
 
-        save_file_result = self._save_workflow_file_inline(
-            destination=destination,
-            serialized_flow_commands=commands,
-            file_name=file_name,
-            creation_date=creation_date,
-            display_name=resolved_display_name,
-            image_path=request.image_path if request.image_path is not None else existing.image,
-            description=existing.description,
-            is_template=existing.is_template,
-            branched_from=branched_from,
-            workflow_shape=workflow_shape,
-            pickle_control_flow_result=(
-                request.pickle_control_flow_result if request.pickle_control_flow_result is not None else False
-            ),
-        )
+            # Extract workflow shape if available; ignore failures
+            try:
+                workflow_shape_dict = self.extract_workflow_shape(workflow_name=registry_key)
+                workflow_shape = WorkflowShape(
+                    inputs=workflow_shape_dict["input"],
+                    outputs=workflow_shape_dict["output"],
+                )
+            except ValueError:
+                workflow_shape = None
+
+            # Build save request inline (preserve existing display_name/description/image/is_template if present)
+            existing = self._get_existing_metadata(registry_key)
+            # Display name precedence (high to low):
+            # 1. Caller-supplied request.display_name — explicit intent always wins.
+            # 2. existing.display_name from the registry — preserves the human-readable label
+            #    across re-saves and version bumps (one workflow named "a" with v001, v002, ...).
+            # 3. The resolved local file_name from _determine_save_target — this is either the
+            #    user's typed Save-As stem (so "a" stays "a" and doesn't become "a_v001"), or
+            #    the sanitized display-name-derived stem for a first-save-of-unsaved-workflow
+            #    (so the synthetic "unsaved:<uuid>" key never leaks to metadata.name). Read the
+            #    local `file_name`, NOT `request.file_name` — the latter is un-normalized and
+            #    can still be "unsaved:<uuid>" on the wire for the fresh-save case.
+            # 4. Resolved file_name fallback inside _generate_workflow_metadata_from_commands
+            #    (last-resort safety net for code paths that supply nothing).
+            if request.display_name is not None:
+                resolved_display_name = request.display_name
+            elif existing.display_name is not None:
+                resolved_display_name = existing.display_name
+            elif file_name:
+                resolved_display_name = file_name
+            else:
+                resolved_display_name = None
+
+            save_file_result = self._save_workflow_file_inline(
+                destination=destination,
+                serialized_flow_commands=commands,
+                file_name=file_name,
+                creation_date=creation_date,
+                display_name=resolved_display_name,
+                image_path=request.image_path if request.image_path is not None else existing.image,
+                description=existing.description,
+                is_template=existing.is_template,
+                branched_from=branched_from,
+                workflow_shape=workflow_shape,
+                pickle_control_flow_result=(
+                    request.pickle_control_flow_result if request.pickle_control_flow_result is not None else False
+                ),
+            )
         # _save_workflow_file_inline returns a SaveWorkflowFileFromSerializedFlowResult*
         # (its native result family). on_save_workflow_request's public contract
         # returns SaveWorkflowResult*. The check here translates between the two
@@ -2936,9 +2965,10 @@ class WorkflowManager:
             branched_from=request.branched_from,
             workflow_shape=request.workflow_shape,
             pickle_control_flow_result=request.pickle_control_flow_result,
+            store_large_values_externally=request.store_large_values_externally,
         )
 
-    def _save_workflow_file_inline(  # noqa: PLR0913
+    def _save_workflow_file_inline(  # noqa: C901, PLR0913
         self,
         *,
         destination: ProjectFileDestination,
@@ -2952,13 +2982,15 @@ class WorkflowManager:
         branched_from: str | None,
         workflow_shape: WorkflowShape | None,
         pickle_control_flow_result: bool,
+        store_large_values_externally: bool = True,
     ) -> ResultPayload:
         """Generate the workflow file content and write it to ``destination``.
 
         Shared by ``on_save_workflow_request`` and
         ``on_save_workflow_file_from_serialized_flow_request``. Callers with a
         pre-resolved Path wrap it as ``ProjectFileDestination(str(path), ...)``
-        before calling this helper.
+        before calling this helper. With ``store_large_values_externally`` False,
+        every value is embedded in the file so it stays self-contained.
         """
         if creation_date is None:
             creation_date = datetime.now(tz=UTC)
@@ -2979,11 +3011,14 @@ class WorkflowManager:
             details = f"Attempted to save workflow file '{file_name}' from serialized flow commands. Failed during metadata generation: {err}"
             return SaveWorkflowFileFromSerializedFlowResultFailure(result_details=details)
 
+        # Large values go to the sidecar value store once the file's final location is known
+        external_values: dict[str, bytes] | None = {} if store_large_values_externally else None
         try:
             final_code_output = self._generate_workflow_file_content(
                 serialized_flow_commands=serialized_flow_commands,
                 workflow_metadata=workflow_metadata,
                 pickle_control_flow_result=pickle_control_flow_result,
+                external_values=external_values,
             )
         except Exception as err:
             details = f"Attempted to save workflow file '{file_name}' from serialized flow commands. Failed during content generation: {err}"
@@ -2996,12 +3031,14 @@ class WorkflowManager:
         # Prefer the post-write location from ``_write_workflow_file`` — for
         # macro-driven saves this reflects the resolved-and-possibly-seeded
         # filename (e.g. ``..._v001.py``), not the unresolved template.
+        resolved_file_path: str | None = None
         if write_result.written_file is not None:
             try:
                 # Re-resolve to get the absolute on-disk path the write actually
                 # landed at (``_map_to_macro_file`` may have rewritten the
                 # ``File`` to its portable macro form like ``{workspace_dir}/...``).
                 final_file_path = write_result.written_file.resolve()
+                resolved_file_path = final_file_path
             except FileLoadError:
                 # Re-resolution failed (project unloaded between the write and
                 # this re-resolve, or the macro form references a directory that
@@ -3012,6 +3049,20 @@ class WorkflowManager:
                 final_file_path = write_result.written_file.location
         else:
             final_file_path = destination.location
+            resolved_file_path = final_file_path
+
+        if external_values:
+            if resolved_file_path is None:
+                details = f"Attempted to save workflow file '{file_name}'. Failed to store large parameter values because the saved file's location could not be resolved."
+                return SaveWorkflowFileFromSerializedFlowResultFailure(result_details=details)
+            try:
+                write_workflow_values(resolved_file_path, external_values)
+            except OSError as err:
+                details = f"Attempted to save workflow file '{file_name}'. Failed to store large parameter values next to '{final_file_path}': {err}"
+                return SaveWorkflowFileFromSerializedFlowResultFailure(result_details=details)
+        if resolved_file_path is not None:
+            # An overwritten file may have dropped values only its previous content referenced
+            self._collect_unreferenced_workflow_values(Path(resolved_file_path).parent)
 
         details = f"Successfully saved workflow file at: {final_file_path}"
         return SaveWorkflowFileFromSerializedFlowResultSuccess(
@@ -3043,56 +3094,62 @@ class WorkflowManager:
         file_path = WorkflowRegistry.get_complete_file_path(workflow.file_path)
         file_name = Path(file_path).stem
 
-        # Serialize the subflow.
-        serialized_flow_result = await GriptapeNodes.ahandle_request(
-            SerializeFlowToCommandsRequest(flow_name=request.flow_name, include_create_flow_command=True)
-        )
-        if not isinstance(serialized_flow_result, SerializeFlowToCommandsResultSuccess):
-            details = f"Attempted to save subflow '{request.flow_name}' to '{file_path}'. Failed when serializing flow."
-            return SaveSubflowToWorkflowResultFailure(result_details=details)
-        commands = serialized_flow_result.serialized_flow_commands
-
-        # Strip parent_flow_name so the saved file stands alone as a top-level workflow.
-        # If the subflow is tracked as a referenced workflow, replace the self-referential
-        # import command with a plain CreateFlowRequest for the standalone save.
-        if isinstance(commands.flow_initialization_command, ImportWorkflowAsReferencedSubFlowRequest):
-            commands.flow_initialization_command = CreateFlowRequest(
-                flow_name=request.flow_name,
-                parent_flow_name=None,
-                set_as_new_context=False,
-                metadata=commands.flow_initialization_command.imported_flow_metadata,
+        # The flow serialization and the workflow writer share value pickles, so each value is pickled once
+        with self._share_pickled_unique_values():
+            # Serialize the subflow.
+            serialized_flow_result = await GriptapeNodes.ahandle_request(
+                SerializeFlowToCommandsRequest(flow_name=request.flow_name, include_create_flow_command=True)
             )
-        elif isinstance(commands.flow_initialization_command, CreateFlowRequest):
-            commands.flow_initialization_command.parent_flow_name = None
+            if not isinstance(serialized_flow_result, SerializeFlowToCommandsResultSuccess):
+                details = (
+                    f"Attempted to save subflow '{request.flow_name}' to '{file_path}'. Failed when serializing flow."
+                )
+                return SaveSubflowToWorkflowResultFailure(result_details=details)
+            commands = serialized_flow_result.serialized_flow_commands
+
+            # Strip parent_flow_name so the saved file stands alone as a top-level workflow.
+            # If the subflow is tracked as a referenced workflow, replace the self-referential
+            # import command with a plain CreateFlowRequest for the standalone save.
+            if isinstance(commands.flow_initialization_command, ImportWorkflowAsReferencedSubFlowRequest):
+                commands.flow_initialization_command = CreateFlowRequest(
+                    flow_name=request.flow_name,
+                    parent_flow_name=None,
+                    set_as_new_context=False,
+                    metadata=commands.flow_initialization_command.imported_flow_metadata,
+                )
+            elif isinstance(commands.flow_initialization_command, CreateFlowRequest):
+                commands.flow_initialization_command.parent_flow_name = None
 
-        # Extract workflow shape from the specific subflow (not the top-level flow).
-        try:
-            workflow_shape_dict = self.extract_workflow_shape(workflow_name=registry_key, flow_name=request.flow_name)
-            workflow_shape = WorkflowShape(
-                inputs=workflow_shape_dict["input"],
-                outputs=workflow_shape_dict["output"],
-            )
-        except ValueError:
-            workflow_shape = None
-            msg = f"The workflow {registry_key} is being saved without Start and End Flow parameters. It will no longer be a callable workflow."
-            logger.warning(msg)
+            # Extract workflow shape from the specific subflow (not the top-level flow).
+            try:
+                workflow_shape_dict = self.extract_workflow_shape(
+                    workflow_name=registry_key, flow_name=request.flow_name
+                )
+                workflow_shape = WorkflowShape(
+                    inputs=workflow_shape_dict["input"],
+                    outputs=workflow_shape_dict["output"],
+                )
+            except ValueError:
+                workflow_shape = None
+                msg = f"The workflow {registry_key} is being saved without Start and End Flow parameters. It will no longer be a callable workflow."
+                logger.warning(msg)
 
-        # Preserve existing metadata from the registry.
-        existing = self._get_existing_metadata(registry_key)
-        resolved_display_name = existing.display_name
+            # Preserve existing metadata from the registry.
+            existing = self._get_existing_metadata(registry_key)
+            resolved_display_name = existing.display_name
 
-        # Delegate file generation and writing to the existing lower-level handler.
-        save_file_request = SaveWorkflowFileFromSerializedFlowRequest(
-            serialized_flow_commands=commands,
-            file_name=file_name,
-            file_path=file_path,
-            display_name=resolved_display_name,
-            description=existing.description,
-            image_path=existing.image,
-            is_template=existing.is_template,
-            workflow_shape=workflow_shape,
-        )
-        save_file_result = await self.on_save_workflow_file_from_serialized_flow_request(save_file_request)
+            # Delegate file generation and writing to the existing lower-level handler.
+            save_file_request = SaveWorkflowFileFromSerializedFlowRequest(
+                serialized_flow_commands=commands,
+                file_name=file_name,
+                file_path=file_path,
+                display_name=resolved_display_name,
+                description=existing.description,
+                image_path=existing.image,
+                is_template=existing.is_template,
+                workflow_shape=workflow_shape,
+            )
+            save_file_result = await self.on_save_workflow_file_from_serialized_flow_request(save_file_request)
         if not isinstance(save_file_result, SaveWorkflowFileFromSerializedFlowResultSuccess):
             details = (
                 f"Attempted to save subflow '{request.flow_name}' to '{file_path}'. "
@@ -3169,8 +3226,13 @@ class WorkflowManager:
         workflow_metadata: WorkflowMetadata,
         *,
         pickle_control_flow_result: bool = False,
+        external_values: dict[str, bytes] | None = None,
     ) -> str:
-        """Generate workflow file content from serialized commands and metadata."""
+        """Generate workflow file content from serialized commands and metadata.
+
+        When ``external_values`` is given, large unique values are added to it keyed by digest
+        instead of being embedded in the content; the caller must store them next to the file.
+        """
         metadata_block = self._generate_workflow_metadata_header(workflow_metadata=workflow_metadata)
         if metadata_block is None:
             details = f"Failed to generate metadata block for workflow '{workflow_metadata.name}'."
@@ -3221,6 +3283,7 @@ class WorkflowManager:
             prefix="top_level",
             import_recorder=import_recorder,
             deferred_imports=deferred_imports,
+            external_values=external_values,
         )
         # Emit deferred library imports inside build_workflow(), after sys.path is set up.
         main_body.extend(self._build_deferred_import_statements(deferred_imports))
@@ -4543,12 +4606,17 @@ class WorkflowManager:
         prefix: str,
         import_recorder: ImportRecorder,
         deferred_imports: dict[str, set[str]] | None = None,
+        external_values: dict[str, bytes] | None = None,
     ) -> ast.Module:
+        """Generate the dictionary of a flow's unique parameter values.
+
+        When ``external_values`` is given, large pickles are added to it keyed by digest and
+        the generated code loads them from the workflow's sidecar value store instead of
+        embedding them inline.
+        """
         if len(unique_parameter_uuid_to_values) == 0:
             return ast.Module(body=[], type_ignores=[])
 
-        import_recorder.add_import("pickle")
-
         # Get the list of manually-curated, globally available modules
         global_modules_set = {"builtins", "__main__"}
 
@@ -4556,6 +4624,7 @@ class WorkflowManager:
         # IMPORTANT: We patch dynamic module names to stable namespaces before pickling
         # to ensure generated workflows can reliably import the required classes.
         unique_parameter_dict = {}
+        pickled_values = _pickled_unique_values.get() or {}
 
         for uuid, unique_parameter_value in unique_parameter_uuid_to_values.items():
             # Dynamic Module Patching Strategy:
@@ -4573,12 +4642,13 @@ class WorkflowManager:
             #
             # This includes recursive patching for nested objects in containers (lists, tuples, dicts)
 
-            # Apply recursive dynamic module patching, pickle, then restore
-            unique_parameter_bytes = self._patch_and_pickle_object(unique_parameter_value)
+            # Apply recursive dynamic module patching, pickle, then restore. Values serialized
+            # as part of this save were already pickled that way; reuse those bytes.
+            unique_parameter_bytes = pickled_values.get(uuid)
+            if unique_parameter_bytes is None:
+                unique_parameter_bytes = self._patch_and_pickle_object(unique_parameter_value)
 
-            # Encode the bytes as a string using latin1
-            unique_parameter_byte_str = unique_parameter_bytes.decode("latin1")
-            unique_parameter_dict[uuid] = unique_parameter_byte_str
+            unique_parameter_dict[uuid] = unique_parameter_bytes
 
             # Collect import statements for all classes in the object tree
             self._collect_object_imports(unique_parameter_value, import_recorder, global_modules_set, deferred_imports)
@@ -4595,6 +4665,15 @@ class WorkflowManager:
             "#    them consistently save and load. It allows us to serialize complex objects like custom classes, which otherwise",
             "#    would be difficult to serialize.",
         ]
+        value_exprs = [
+            self._generate_unique_value_expr(unique_parameter_bytes, import_recorder, external_values)
+            for unique_parameter_bytes in unique_parameter_dict.values()
+        ]
+        if external_values is not None and len(external_values) > 0:
+            comment_lines.append(
+                f"# 4. Large values are stored next to this file in '{WORKFLOW_VALUES_DIR_NAME}', named by the SHA-256 digest"
+            )
+            comment_lines.append("#    of their pickle, and are loaded from there when the workflow is built.")
 
         # Generate the dictionary of unique values
         unique_values_dict_name = f"{prefix}_unique_values_dict"
@@ -4602,22 +4681,7 @@ class WorkflowManager:
             targets=[ast.Name(id=unique_values_dict_name, ctx=ast.Store(), lineno=1, col_offset=0)],
             value=ast.Dict(
                 keys=[ast.Constant(value=str(uuid), lineno=1, col_offset=0) for uuid in unique_parameter_dict],
-                values=[
-                    ast.Call(
-                        func=ast.Attribute(
-                            value=ast.Name(id="pickle", ctx=ast.Load(), lineno=1, col_offset=0),
-                            attr="loads",
-                            ctx=ast.Load(),
-                            lineno=1,
-                            col_offset=0,
-                        ),
-                        args=[ast.Constant(value=byte_str.encode("latin1"), lineno=1, col_offset=0)],
-                        keywords=[],
-                        lineno=1,
-                        col_offset=0,
-                    )
-                    for byte_str in unique_parameter_dict.values()
-                ],
+                values=value_exprs,
                 lineno=1,
                 col_offset=0,
             ),
@@ -4634,6 +4698,48 @@ class WorkflowManager:
         full_ast = ast.Module(body=module_body, type_ignores=[])
         return full_ast
 
+    @staticmethod
+    def _generate_unique_value_expr(
+        unique_parameter_bytes: bytes,
+        import_recorder: ImportRecorder,
+        external_values: dict[str, bytes] | None,
+    ) -> ast.expr:
+        """Generate the expression that recreates one pickled unique value.
+
+        Small values (or all values, when ``external_values`` is None) become an inline
+        ``pickle.loads(b'...')``. Large values become ``load_workflow_value(__file__, digest)``
+        and their pickle is added to ``external_values``.
+        """
+        if external_values is None or len(unique_parameter_bytes) < DEFAULT_MIN_EXTERNAL_VALUE_SIZE:
+            import_recorder.add_import("pickle")
+            return ast.Call(
+                func=ast.Attribute(
+                    value=ast.Name(id="pickle", ctx=ast.Load(), lineno=1, col_offset=0),
+                    attr="loads",
+                    ctx=ast.Load(),
+                    lineno=1,
+                    col_offset=0,
+                ),
+                args=[ast.Constant(value=unique_parameter_bytes, lineno=1, col_offset=0)],
+                keywords=[],
+                lineno=1,
+                col_offset=0,
+            )
+
+        digest = get_value_digest(unique_parameter_bytes)
+        external_values[digest] = unique_parameter_bytes
+        import_recorder.add_from_import("griptape_nodes.utils.workflow_value_store", "load_workflow_value")
+        return ast.Call(
+            func=ast.Name(id="load_workflow_value", ctx=ast.Load(), lineno=1, col_offset=0),
+            args=[
+                ast.Name(id="__file__", ctx=ast.Load(), lineno=1, col_offset=0),
+                ast.Constant(value=digest, lineno=1, col_offset=0),
+            ],
+            keywords=[],
+            lineno=1,
+            col_offset=0,
+        )
+
     def _build_deferred_import_statements(self, deferred_imports: dict[str, set[str]]) -> list[ast.stmt]:
         """Convert deferred library imports into ast.ImportFrom statements for insertion into build_workflow().
 
@@ -5979,6 +6085,7 @@ class WorkflowManager:
             # Write branch workflow file to disk BEFORE registering in registry
             branch_full_path = WorkflowRegistry.get_complete_file_path(branch_file_path)
             Path(branch_full_path).write_text(branch_content, encoding="utf-8")
+            copy_workflow_values(source_file_path, branch_full_path, branch_content)
 
             # Now create the branch workflow in registry (file must exist on disk first)
             WorkflowRegistry.generate_new_workflow(
@@ -6068,6 +6175,7 @@ class WorkflowManager:
 
         new_full_path = WorkflowRegistry.get_complete_file_path(relative_file_path)
         Path(new_full_path).write_text(new_content, encoding="utf-8")
+        copy_workflow_values(source_file_path, new_full_path, new_content)
         WorkflowRegistry.generate_new_workflow(
             registry_key=derive_registry_key(relative_file_path),
             metadata=new_metadata,
@@ -6148,6 +6256,8 @@ class WorkflowManager:
             # Write the updated content to the source workflow file
             source_file_path = WorkflowRegistry.get_complete_file_path(source_file_path_rel)
             Path(source_file_path).write_text(merged_content, encoding="utf-8")
+            copy_workflow_values(branch_content_file_path, source_file_path, merged_content)
+            self._collect_unreferenced_workflow_values(Path(source_file_path).parent)
 
             # Update the registry with new metadata for the source workflow
             source_workflow.metadata = merged_metadata
@@ -6159,6 +6269,7 @@ class WorkflowManager:
                 self._drop_substitution_flag(request.workflow_name)
                 # TODO: Replace with DeleteFileRequest https://github.com/griptape-ai/griptape-nodes/issues/3765
                 Path(branch_content_file_path).unlink()
+                self._collect_unreferenced_workflow_values(Path(branch_content_file_path).parent)
                 cleanup_message = f"Deleted branch workflow file and registry entry for '{request.workflow_name}'"
                 result_messages.append(ResultDetail(message=cleanup_message, level=logging.INFO))
             except Exception as delete_error:
@@ -6245,6 +6356,8 @@ class WorkflowManager:
             # Write the updated content to the branch workflow file
             branch_content_file_path = WorkflowRegistry.get_complete_file_path(branch_file_path_rel)
             Path(branch_content_file_path).write_text(reset_content, encoding="utf-8")
+            copy_workflow_values(source_content_file_path, branch_content_file_path, reset_content)
+            self._collect_unreferenced_workflow_values(Path(branch_content_file_path).parent)
 
             # Update the registry with new metadata for the branch workflow
             branch_workflow.metadata = reset_metadata
@@ -6376,6 +6489,31 @@ class WorkflowManager:
             for attr_value in obj.__dict__.values():
                 self._walk_object_tree(attr_value, process_class_fn, visited)
 
+    @staticmethod
+    @contextmanager
+    def _share_pickled_unique_values() -> Iterator[None]:
+        """Let the flow serialization and the workflow writer of one save share value pickles."""
+        token = _pickled_unique_values.set({})
+        try:
+            yield
+        finally:
+            _pickled_unique_values.reset(token)
+
+    @staticmethod
+    def _record_pickled_unique_value(
+        unique_uuid: SerializedNodeCommands.UniqueParameterValueUUID, pickled_bytes: bytes
+    ) -> bool:
+        """Keep a unique value's pickle for the workflow writer of the save in progress.
+
+        Returns:
+            True if a save is in progress and kept the pickle, False otherwise.
+        """
+        pickled_values = _pickled_unique_values.get()
+        if pickled_values is None:
+            return False
+        pickled_values[unique_uuid] = pickled_bytes
+        return True
+
     def _patch_and_pickle_object(self, obj: Any) -> bytes:
         """Patch dynamic module references to stable namespaces, pickle object, then restore.
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+import stat
 import tempfile
 from dataclasses import dataclass
 from fnmatch import fnmatch
@@ -61,6 +62,31 @@ def atomic_write_bytes(path: Path, data: bytes) -> None:
         raise
 
 
+def ensure_private_directory(directory: Path) -> None:
+    """Create a directory readable and writable only by the current user.
+
+    An existing directory is accepted only if it is a real directory (not a symlink) owned by
+    the current user; its permissions are tightened to 0700 if needed.
+
+    Args:
+        directory: Directory to create or check.
+
+    Raises:
+        PermissionError: If the path is not a directory or is owned by another user.
+    """
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    directory_stat = directory.lstat()
+    if not stat.S_ISDIR(directory_stat.st_mode):
+        msg = f"Directory '{directory}' is not a directory"
+        raise PermissionError(msg)
+    # Windows has no uids; per-user directories there live in the user's profile
+    if hasattr(os, "getuid") and directory_stat.st_uid != os.getuid():
+        msg = f"Directory '{directory}' is owned by another user"
+        raise PermissionError(msg)
+    if stat.S_IMODE(directory_stat.st_mode) & 0o077:
+        directory.chmod(0o700)
+
+
 def find_file_in_directory(directory: Path, pattern: str) -> Path | None:
     """Search directory recursively for a file matching the given pattern.
 
@@ -1,12 +1,162 @@
-"""Image preview utilities for generating thumbnails and previews."""
+"""Image preview utilities for generating thumbnails and previews.
+
+The render_* functions do the pixel work and run in preview worker processes (see
+utils.preview_executor), so this module only imports what they need.
+"""
 
 import base64
 import io
+import logging
 from pathlib import Path
 
-from PIL import Image, ImageOps
+from PIL import Image, ImageDraw, ImageOps
+
+from griptape_nodes.utils.preview_executor import PreviewPriority, run_preview_job
+
+logger = logging.getLogger("griptape_nodes")
+
+# JPEGs are decoded at no less than this multiple of the preview size, the same margin
+# Image.thumbnail() leaves, so the final LANCZOS resample stays sharp
+_DRAFT_REDUCING_GAP = 2.0
+
+
+def open_preview_image(raw_img: Image.Image, max_width: int, max_height: int) -> Image.Image:
+    """Decode an opened image for downscaling to fit within max_width x max_height.
+
+    JPEGs are decoded at a reduced scale (Image.draft()), so a 50-megapixel photo is not fully
+    decoded to make a small preview. EXIF orientation is then applied so rotated images (e.g.
+    phone photos) display correctly.
+
+    Args:
+        raw_img: Image as returned by Image.open(), not yet loaded
+        max_width: Maximum width of the preview
+        max_height: Maximum height of the preview
+
+    Returns:
+        The decoded, upright image.
+    """
+    # Either side may become the width once EXIF orientation is applied
+    draft_side = int(max(max_width, max_height) * _DRAFT_REDUCING_GAP)
+    raw_img.draft(None, (draft_side, draft_side))
+    return ImageOps.exif_transpose(raw_img)
+
+
+def render_image_preview(
+    image_bytes: bytes,
+    max_width: int,
+    max_height: int,
+    image_format: str,
+    quality: int | None = None,
+) -> bytes:
+    """Render a preview that fits within max_width x max_height, preserving aspect ratio.
+
+    Args:
+        image_bytes: Source image content
+        max_width: Maximum width of the preview
+        max_height: Maximum height of the preview
+        image_format: PIL output format (WEBP, JPEG, PNG, etc.)
+        quality: Lossy encoder quality (1-100). When set, images with transparency are
+            flattened to RGB for WEBP/JPEG output and the encoder is asked to optimize.
+
+    Returns:
+        The encoded preview.
+    """
+    with Image.open(io.BytesIO(image_bytes)) as raw_img:
+        img = open_preview_image(raw_img, max_width, max_height)
+        if quality is not None and image_format.upper() in ("WEBP", "JPEG") and img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGB")
+        img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+
+        buffer = io.BytesIO()
+        if quality is None:
+            img.save(buffer, format=image_format)
+        else:
+            img.save(buffer, format=image_format, quality=quality, optimize=True)
+        return buffer.getvalue()
+
+
+def render_rounded_image_preview(
+    image_bytes: bytes,
+    max_width: int,
+    max_height: int,
+    preview_format: str,
+    corner_radius_percent: float,
+) -> bytes:
+    """Render a preview with rounded corners that fits within max_width x max_height.
+
+    Corners are transparent for PNG/WEBP output, or composited onto a white background for JPEG.
+
+    Args:
+        image_bytes: Source image content
+        max_width: Maximum width of the preview
+        max_height: Maximum height of the preview
+        preview_format: Output format (e.g., "png", "jpg", "webp")
+        corner_radius_percent: Corner radius as a percentage of the smaller dimension
+
+    Returns:
+        The encoded preview.
+    """
+    with Image.open(io.BytesIO(image_bytes)) as raw_img:
+        img = open_preview_image(raw_img, max_width, max_height)
+        img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+
+        # Convert to RGBA for alpha channel support
+        rounded_img = apply_rounded_corners(img.convert("RGBA") if img.mode != "RGBA" else img, corner_radius_percent)
+
+        if preview_format.lower() in ("jpg", "jpeg"):
+            # JPEG doesn't support transparency - composite onto white background
+            final_img = Image.new("RGB", rounded_img.size, (255, 255, 255))
+            final_img.paste(rounded_img, (0, 0), rounded_img)
+        else:
+            final_img = rounded_img
+
+        buffer = io.BytesIO()
+        # Normalize format for PIL (JPG -> JPEG)
+        pil_format = "JPEG" if preview_format.lower() == "jpg" else preview_format.upper()
+        final_img.save(buffer, format=pil_format)
+        return buffer.getvalue()
+
+
+def apply_rounded_corners(img: Image.Image, corner_radius_percent: float) -> Image.Image:
+    """Apply rounded corners to an image using an alpha mask.
+
+    Args:
+        img: Source image (RGBA mode)
+        corner_radius_percent: Corner radius as a percentage of the smaller dimension
+
+    Returns:
+        RGBA image with transparent rounded corners
+    """
+    # Calculate pixel radius from percentage of smaller dimension
+    smaller_dimension = min(img.width, img.height)
+    radius_pixels = int((corner_radius_percent / 100.0) * smaller_dimension)
+
+    # Skip if no rounding requested (0% or rounds to 0 pixels)
+    if radius_pixels <= 0:
+        return img
+
+    # Clamp radius to prevent over-rounding
+    effective_radius = min(radius_pixels, smaller_dimension // 2)
+
+    # Create mask for rounded corners
+    mask = Image.new("L", img.size, 0)
+    draw = ImageDraw.Draw(mask)
+    draw.rounded_rectangle([(0, 0), (img.width - 1, img.height - 1)], radius=effective_radius, fill=255)
+
+    # Apply mask to alpha channel
+    img.putalpha(mask)
+    return img
+
+
+def _is_svg(image_bytes: bytes) -> bool:
+    # TODO: Add SVG support using cairosvg or similar library to rasterize SVG files: https://github.com/griptape-ai/griptape-nodes/issues/3721
+    # before creating previews
+    return "<svg" in image_bytes[:100].decode("utf-8", errors="ignore").lower()
 
-from griptape_nodes.retained_mode.griptape_nodes import logger
+
+def _to_data_url(preview_bytes: bytes, image_format: str) -> str:
+    base64_data = base64.b64encode(preview_bytes).decode("utf-8")
+    return f"data:image/{image_format.lower()};base64,{base64_data}"
 
 
 def create_image_preview(
@@ -28,14 +178,15 @@ def create_image_preview(
     # TODO: Add SVG support using cairosvg or similar library to rasterize SVG files: https://github.com/griptape-ai/griptape-nodes/issues/3721
     # before creating previews
     if image_path.suffix.lower() == ".svg":
-        logger.debug(f"SVG file detected, cannot create preview with PIL (vector graphics not supported): {image_path}")
+        logger.debug(
+            "SVG file detected, cannot create preview with PIL (vector graphics not supported): %s", image_path
+        )
         return None
 
     try:
         # Open and resize the image
         with Image.open(image_path) as raw_img:
-            # Apply EXIF orientation so rotated images (e.g. phone photos) display correctly
-            img = ImageOps.exif_transpose(raw_img)
+            img = open_preview_image(raw_img, max_width, max_height)
             # Convert to RGB if necessary (for WebP/JPEG output)
             if image_format.upper() in ("WEBP", "JPEG") and img.mode in ("RGBA", "LA", "P"):
                 converted_img = img.convert("RGB")
@@ -58,17 +209,17 @@ def create_image_preview(
             mime_type = f"image/{image_format.lower()}"
             data_url = f"data:{mime_type};base64,{base64_data}"
 
-            logger.debug(f"Created preview for {image_path}: {img.size} -> {len(image_bytes)} bytes")
+            logger.debug("Created preview for %s: %s -> %d bytes", image_path, img.size, len(image_bytes))
             return data_url
 
     except Exception as e:
         # Check if error is due to SVG format
         if "cannot identify image file" in str(e).lower() and image_path.suffix.lower() == ".svg":
             logger.debug(
-                f"SVG file detected, cannot create preview with PIL (vector graphics not supported): {image_path}"
+                "SVG file detected, cannot create preview with PIL (vector graphics not supported): %s", image_path
             )
             return None
-        logger.warning(f"Failed to create preview for {image_path}: {e}")
+        logger.warning("Failed to create preview for %s: %s", image_path, e)
         return None
 
 
@@ -77,6 +228,8 @@ def create_image_preview_from_bytes(
 ) -> str | None:
     """Create a small preview image from bytes.
 
+    Renders in the calling thread; from async code use acreate_image_preview_from_bytes().
+
     Args:
         image_bytes: Raw image bytes
         max_width: Maximum width for the preview
@@ -87,53 +240,52 @@ def create_image_preview_from_bytes(
     Returns:
         Base64 encoded data URL of the preview, or None if failed
     """
+    if _is_svg(image_bytes):
+        logger.debug("SVG file detected, cannot create preview with PIL (vector graphics not supported)")
+        return None
     try:
-        # Check if content might be SVG by looking at first few bytes
-        # TODO: Add SVG support using cairosvg or similar library to rasterize SVG files: https://github.com/griptape-ai/griptape-nodes/issues/3721
-        # before creating previews
-        content_start = image_bytes[:100].decode("utf-8", errors="ignore").lower()
-        if "<svg" in content_start:
-            logger.debug("SVG file detected, cannot create preview with PIL (vector graphics not supported)")
-            return None
-
-        # Open image from bytes
-        with Image.open(io.BytesIO(image_bytes)) as raw_img:
-            # Apply EXIF orientation so rotated images (e.g. phone photos) display correctly
-            img = ImageOps.exif_transpose(raw_img)
-            # Convert to RGB if necessary (for WebP/JPEG output)
-            if image_format.upper() in ("WEBP", "JPEG") and img.mode in ("RGBA", "LA", "P"):
-                converted_img = img.convert("RGB")
-            else:
-                converted_img = img
-
-            # Calculate new size maintaining aspect ratio
-            converted_img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-
-            # Save to bytes buffer
-            buffer = io.BytesIO()
-            converted_img.save(buffer, format=image_format, quality=quality, optimize=True)
-            buffer.seek(0)
+        preview_bytes = render_image_preview(image_bytes, max_width, max_height, image_format, quality)
+    except Exception as e:
+        logger.warning("Failed to create preview from bytes: %s", e)
+        return None
+    logger.debug("Created preview from bytes: %d -> %d bytes", len(image_bytes), len(preview_bytes))
+    return _to_data_url(preview_bytes, image_format)
 
-            # Convert to base64
-            preview_bytes = buffer.getvalue()
-            base64_data = base64.b64encode(preview_bytes).decode("utf-8")
 
-            # Create data URL
-            mime_type = f"image/{image_format.lower()}"
-            data_url = f"data:{mime_type};base64,{base64_data}"
+async def acreate_image_preview_from_bytes(  # noqa: PLR0913
+    image_bytes: bytes,
+    max_width: int = 512,
+    max_height: int = 512,
+    quality: int = 85,
+    image_format: str = "WEBP",
+    *,
+    priority: PreviewPriority | None = None,
+) -> str | None:
+    """Create a small preview image from bytes in a preview worker process.
 
-            logger.debug(f"Created preview from bytes: {len(image_bytes)} -> {len(preview_bytes)} bytes")
-            return data_url
+    Args:
+        image_bytes: Raw image bytes
+        max_width: Maximum width for the preview
+        max_height: Maximum height for the preview
+        quality: WebP quality (1-100)
+        image_format: Output format (WEBP, JPEG, PNG, etc.)
+        priority: Scheduling priority of the render (default: the caller's preview_priority())
 
+    Returns:
+        Base64 encoded data URL of the preview, or None if failed
+    """
+    if _is_svg(image_bytes):
+        logger.debug("SVG file detected, cannot create preview with PIL (vector graphics not supported)")
+        return None
+    try:
+        preview_bytes = await run_preview_job(
+            render_image_preview, image_bytes, max_width, max_height, image_format, quality, priority=priority
+        )
     except Exception as e:
-        # Check if error is due to SVG format
-        if "cannot identify image file" in str(e).lower():
-            content_start = image_bytes[:100].decode("utf-8", errors="ignore").lower()
-            if "<svg" in content_start:
-                logger.debug("SVG file detected, cannot create preview with PIL (vector graphics not supported)")
-                return None
-        logger.warning(f"Failed to create preview from bytes: {e}")
+        logger.warning("Failed to create preview from bytes: %s", e)
         return None
+    logger.debug("Created preview from bytes: %d -> %d bytes", len(image_bytes), len(preview_bytes))
+    return _to_data_url(preview_bytes, image_format)
 
 
 def get_image_info(image_path: Path) -> dict | None:
@@ -156,5 +308,5 @@ def get_image_info(image_path: Path) -> dict | None:
                 "size_bytes": image_path.stat().st_size,
             }
     except Exception as e:
-        logger.warning(f"Failed to get image info for {image_path}: {e}")
+        logger.warning("Failed to get image info for %s: %s", image_path, e)
         return None
@@ -0,0 +1,242 @@
+"""Off-loop execution of image preview and thumbnail rendering.
+
+Decoding and resampling a large image takes seconds of CPU time. Run on the engine's event
+loop (or in a thread, holding the GIL for much of it) that stalls every other request, so
+preview rendering runs in a bounded pool of worker processes instead.
+
+Jobs are queued in front of the pool rather than handed to it directly, so that previews for
+items the user is looking at (PreviewPriority.VISIBLE) start before queued background work.
+Concurrent jobs with the same key share one execution.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import heapq
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterator
+
+logger = logging.getLogger("griptape_nodes")
+
+# Upper bound on worker processes; each one can hold a fully decoded source image in memory
+MAX_PREVIEW_WORKERS = 4
+
+
+class PreviewPriority(StrEnum):
+    """Scheduling priority of a preview job."""
+
+    VISIBLE = "visible"  # Shown to the user right now
+    NORMAL = "normal"
+    BACKGROUND = "background"  # Speculative or bulk work
+
+
+_PRIORITY_RANKS = {PreviewPriority.VISIBLE: 0, PreviewPriority.NORMAL: 1, PreviewPriority.BACKGROUND: 2}
+
+_current_preview_priority: ContextVar[PreviewPriority] = ContextVar(
+    "current_preview_priority", default=PreviewPriority.NORMAL
+)
+
+
+@contextmanager
+def preview_priority(priority: PreviewPriority) -> Iterator[None]:
+    """Run preview jobs submitted within the block (without an explicit priority) at the given priority.
+
+    Lets request handlers set the priority of previews rendered by generators several calls down.
+    """
+    token = _current_preview_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_preview_priority.reset(token)
+
+
+def get_default_preview_worker_count() -> int:
+    """Get the number of worker processes used when none is configured."""
+    return max(1, min(MAX_PREVIEW_WORKERS, (os.cpu_count() or 1) - 1))
+
+
+def _create_process_pool(max_workers: int) -> Executor:
+    # Spawned rather than forked: forking copies the engine's threads' locks in whatever state they are in
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+@dataclass
+class _PreviewJob:
+    key: Hashable
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    rank: int
+    future: Future = field(default_factory=Future)
+    started: bool = False
+
+
+class PreviewExecutor:
+    """Runs preview jobs in a bounded worker pool, highest priority first.
+
+    At most max_workers jobs are handed to the pool at a time; the rest wait in a priority
+    queue. Submitting a job whose key is already queued or running returns the existing job's
+    future, raising the queued job's priority if the new request's is higher.
+
+    Job functions and their arguments must be picklable: module-level functions taking and
+    returning plain data such as bytes.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        executor_factory: Callable[[int], Executor] = _create_process_pool,
+    ) -> None:
+        """Initialize the executor. The pool is created on first use.
+
+        Args:
+            max_workers: Maximum number of jobs running at once (default: get_default_preview_worker_count())
+            executor_factory: Creates the pool given max_workers (default: a spawning process pool)
+        """
+        self.max_workers = max_workers if max_workers is not None else get_default_preview_worker_count()
+        self._executor_factory = executor_factory
+        self._executor: Executor | None = None
+        self._lock = threading.RLock()
+        self._jobs: dict[Hashable, _PreviewJob] = {}
+        self._queue: list[tuple[int, int, Hashable]] = []
+        self._sequence = itertools.count()
+        self._running = 0
+
+    def submit(
+        self, key: Hashable, fn: Callable[..., Any], /, *args: Any, priority: PreviewPriority | None = None
+    ) -> Future:
+        """Queue a job, or join the queued or running job with the same key.
+
+        Args:
+            key: Identifies the job's output; jobs with equal keys must produce equal results
+            fn: Picklable function to run
+            *args: Picklable arguments for fn
+            priority: Scheduling priority (default: the priority set by preview_priority(), else NORMAL)
+
+        Returns:
+            A future for fn's result.
+        """
+        rank = _PRIORITY_RANKS[priority if priority is not None else _current_preview_priority.get()]
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                job = _PreviewJob(key=key, fn=fn, args=args, rank=rank)
+                self._jobs[key] = job
+                heapq.heappush(self._queue, (rank, next(self._sequence), key))
+            elif not job.started and rank < job.rank:
+                # The entry at the old rank is left in the queue and skipped when popped
+                job.rank = rank
+                heapq.heappush(self._queue, (rank, next(self._sequence), key))
+            future = job.future
+            self._dispatch()
+        return future
+
+    async def run(
+        self, key: Hashable, fn: Callable[..., Any], /, *args: Any, priority: PreviewPriority | None = None
+    ) -> Any:
+        """Run a job and wait for its result without blocking the event loop.
+
+        Cancelling the caller does not cancel the job, which may be shared with other callers.
+
+        Raises:
+            Exception: Whatever fn raised, or BrokenProcessPool if a worker process died
+        """
+        return await asyncio.shield(asyncio.wrap_future(self.submit(key, fn, *args, priority=priority)))
+
+    def shutdown(self) -> None:
+        """Shut down the pool, failing queued jobs. Running jobs are allowed to finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            queued = [job for job in self._jobs.values() if not job.started]
+            for job in queued:
+                del self._jobs[job.key]
+            self._queue.clear()
+        for job in queued:
+            job.future.set_exception(RuntimeError("Preview executor was shut down"))
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _dispatch(self) -> None:
+        """Hand queued jobs to the pool while it has free workers. Called with the lock held."""
+        while self._running < self.max_workers and self._queue:
+            rank, _sequence, key = heapq.heappop(self._queue)
+            job = self._jobs.get(key)
+            if job is None or job.started or job.rank != rank:
+                continue
+            job.started = True
+            if self._executor is None:
+                self._executor = self._executor_factory(self.max_workers)
+            try:
+                pool_future = self._executor.submit(job.fn, *job.args)
+            except (BrokenProcessPool, RuntimeError) as err:
+                self._executor = None
+                del self._jobs[key]
+                job.future.set_exception(err)
+                continue
+            self._running += 1
+            pool_future.add_done_callback(functools.partial(self._on_job_done, key))
+
+    def _on_job_done(self, key: Hashable, pool_future: Future) -> None:
+        with self._lock:
+            self._running -= 1
+            job = self._jobs.pop(key)
+            error = pool_future.exception()
+            if isinstance(error, BrokenProcessPool):
+                # Replaced on next dispatch; a worker killed (e.g. out of memory) breaks the whole pool
+                logger.warning("Preview worker process died; restarting the preview worker pool.")
+                self._executor = None
+            self._dispatch()
+        if error is not None:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(pool_future.result())
+
+
+_preview_executor: PreviewExecutor | None = None
+_preview_executor_lock = threading.Lock()
+
+
+def get_preview_executor() -> PreviewExecutor:
+    """Get the shared preview executor, creating it on first use."""
+    global _preview_executor  # noqa: PLW0603
+    with _preview_executor_lock:
+        if _preview_executor is None:
+            _preview_executor = PreviewExecutor()
+        return _preview_executor
+
+
+async def run_preview_job(
+    fn: Callable[..., Any], image_bytes: bytes, /, *args: Any, priority: PreviewPriority | None = None
+) -> Any:
+    """Run fn(image_bytes, *args) on the shared preview executor.
+
+    Concurrent calls rendering the same image with the same arguments share one execution.
+
+    Args:
+        fn: Picklable module-level function rendering a preview from image bytes
+        image_bytes: Source image content
+        *args: Picklable, hashable arguments for fn
+        priority: Scheduling priority (default: the priority set by preview_priority(), else NORMAL)
+
+    Returns:
+        fn's result.
+    """
+    # Hashing large images off the loop; hashlib releases the GIL while hashing
+    digest = await asyncio.to_thread(lambda: hashlib.sha256(image_bytes).hexdigest())
+    key = (fn.__module__, fn.__qualname__, digest, args)
+    return await get_preview_executor().run(key, fn, image_bytes, *args, priority=priority)
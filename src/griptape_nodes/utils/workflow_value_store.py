@@ -0,0 +1,236 @@
+"""Content-addressed sidecar store for large pickled workflow values.
+
+Saved workflows embed each unique parameter value as a pickle literal. Large values such as
+images or tensors would make the workflow file many megabytes, slow to parse and import, and
+slow to diff. Those values are instead written once to a directory next to the workflow file,
+named by the SHA-256 digest of their pickle, and the generated code loads them by digest when
+build_workflow() runs. Unchanged values keep their digest, so re-saving does not rewrite them.
+
+Workflow files in a directory share its value directory, so a stored value is deleted only once
+no workflow file in that directory references it any more.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import re
+import shutil
+from pathlib import Path
+from typing import Any
+
+from griptape_nodes.utils.file_utils import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+# Directory next to a workflow file holding its externalized values
+WORKFLOW_VALUES_DIR_NAME = ".griptape_values"
+
+# Additional directories (os.pathsep separated) searched for values, for workflows that run
+# from a copy of the workflow file in another directory
+WORKFLOW_VALUE_DIRS_ENV_VAR = "GTN_WORKFLOW_VALUE_DIRS"
+
+# Pickled values at least this many bytes are stored next to the workflow instead of inline
+DEFAULT_MIN_EXTERNAL_VALUE_SIZE = 262_144
+
+_VALUE_FILE_SUFFIX = ".pickle"
+# Matches references in generated code and after reformatting (other quotes, wrapped calls)
+_VALUE_REFERENCE_PATTERN = re.compile(r"load_workflow_value\(\s*__file__\s*,\s*[\"']([0-9a-f]{64})[\"']\s*,?\s*\)")
+
+
+class WorkflowValueNotFoundError(FileNotFoundError):
+    """Exception raised when a workflow references a stored value that cannot be found."""
+
+
+def get_workflow_values_dir(workflow_file: str | Path) -> Path:
+    """Get the directory holding the externalized values of a workflow file."""
+    return Path(workflow_file).parent / WORKFLOW_VALUES_DIR_NAME
+
+
+def get_value_digest(data: bytes) -> str:
+    """Get the digest a pickled value is stored under."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_workflow_values(workflow_file: str | Path, values: dict[str, bytes]) -> int:
+    """Store pickled values next to a workflow file, skipping values that are already stored.
+
+    Args:
+        workflow_file: Path of the workflow file that references the values.
+        values: Pickled values keyed by their digest.
+
+    Returns:
+        The number of values written.
+    """
+    if not values:
+        return 0
+    values_dir = get_workflow_values_dir(workflow_file)
+    values_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for digest, data in values.items():
+        path = values_dir / f"{digest}{_VALUE_FILE_SUFFIX}"
+        if path.exists():
+            continue
+        atomic_write_bytes(path, data)
+        written += 1
+    return written
+
+
+def copy_workflow_values(
+    source_workflow_file: str | Path, target_workflow_file: str | Path, content: str | None = None
+) -> int:
+    """Copy the values referenced by workflow content to the directory of another workflow file.
+
+    Used when a workflow file is moved or copied to another directory, so the copy can still
+    find its values.
+
+    Args:
+        source_workflow_file: Path of the workflow file the content came from.
+        target_workflow_file: Path the content was written to.
+        content: The workflow file content (read from target_workflow_file if not given).
+
+    Returns:
+        The number of values copied.
+    """
+    source_dir = get_workflow_values_dir(source_workflow_file)
+    target_dir = get_workflow_values_dir(target_workflow_file)
+    if not source_dir.is_dir() or source_dir.resolve() == target_dir.resolve():
+        return 0
+    if content is None:
+        content = Path(target_workflow_file).read_text(encoding="utf-8")
+    copied = 0
+    for digest in dict.fromkeys(_VALUE_REFERENCE_PATTERN.findall(content)):
+        file_name = f"{digest}{_VALUE_FILE_SUFFIX}"
+        if (target_dir / file_name).exists():
+            continue
+        if not (source_dir / file_name).exists():
+            logger.warning("Stored workflow value '%s' is missing from '%s'.", digest, source_dir)
+            continue
+        target_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source_dir / file_name, target_dir / file_name)
+        copied += 1
+    return copied
+
+
+def move_workflow_values(
+    source_workflow_file: str | Path, target_workflow_file: str | Path, content: str | None = None
+) -> int:
+    """Move the values referenced by a moved workflow file to the directory of its new location.
+
+    Values that other workflow files left in the source directory still reference are copied
+    instead of moved, and values no longer referenced there are deleted.
+
+    Args:
+        source_workflow_file: Path the workflow file was moved from.
+        target_workflow_file: Path the workflow file was moved to.
+        content: The workflow file content (read from target_workflow_file if not given).
+
+    Returns:
+        The number of values moved or copied.
+    """
+    source_dir = get_workflow_values_dir(source_workflow_file)
+    target_dir = get_workflow_values_dir(target_workflow_file)
+    if not source_dir.is_dir() or source_dir.resolve() == target_dir.resolve():
+        return 0
+    if content is None:
+        content = Path(target_workflow_file).read_text(encoding="utf-8")
+    still_referenced = _get_referenced_digests(Path(source_workflow_file).parent)
+    transferred = 0
+    for digest in dict.fromkeys(_VALUE_REFERENCE_PATTERN.findall(content)):
+        file_name = f"{digest}{_VALUE_FILE_SUFFIX}"
+        if (target_dir / file_name).exists():
+            continue
+        if not (source_dir / file_name).exists():
+            logger.warning("Stored workflow value '%s' is missing from '%s'.", digest, source_dir)
+            continue
+        target_dir.mkdir(parents=True, exist_ok=True)
+        # Without a readable view of the source directory, err on the side of keeping the source copy
+        if still_referenced is None or digest in still_referenced:
+            shutil.copy2(source_dir / file_name, target_dir / file_name)
+        else:
+            shutil.move(source_dir / file_name, target_dir / file_name)
+        transferred += 1
+    collect_unreferenced_workflow_values(Path(source_workflow_file).parent)
+    return transferred
+
+
+def collect_unreferenced_workflow_values(workflow_dir: str | Path) -> int:
+    """Delete the stored values that no workflow file in a directory references.
+
+    Called after a workflow file is deleted, moved away, or overwritten. Nothing is deleted if
+    any workflow file in the directory cannot be read.
+
+    Args:
+        workflow_dir: Directory holding the workflow files and their value directory.
+
+    Returns:
+        The number of values deleted.
+    """
+    values_dir = Path(workflow_dir) / WORKFLOW_VALUES_DIR_NAME
+    if not values_dir.is_dir():
+        return 0
+    referenced = _get_referenced_digests(workflow_dir)
+    if referenced is None:
+        return 0
+    removed = 0
+    for value_file in values_dir.glob(f"*{_VALUE_FILE_SUFFIX}"):
+        if value_file.stem in referenced:
+            continue
+        try:
+            value_file.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError as err:
+            logger.warning("Failed to delete unreferenced workflow value '%s': %s", value_file, err)
+            continue
+        removed += 1
+    if not any(values_dir.iterdir()):
+        values_dir.rmdir()
+    return removed
+
+
+def _get_referenced_digests(workflow_dir: str | Path) -> set[str] | None:
+    """Get the digests referenced by the workflow files in a directory, or None if one cannot be read."""
+    referenced: set[str] = set()
+    for workflow_file in Path(workflow_dir).glob("*.py"):
+        try:
+            content = workflow_file.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            continue
+        except (OSError, UnicodeDecodeError) as err:
+            logger.warning("Failed to read workflow file '%s' while collecting stored values: %s", workflow_file, err)
+            return None
+        referenced.update(_VALUE_REFERENCE_PATTERN.findall(content))
+    return referenced
+
+
+def load_workflow_value(workflow_file: str, digest: str) -> Any:
+    """Load a value stored for a workflow file. Called by generated workflow code.
+
+    The directory next to the workflow file is searched first, then the directories listed
+    in the GTN_WORKFLOW_VALUE_DIRS environment variable.
+
+    Args:
+        workflow_file: The workflow file's __file__.
+        digest: Digest the value was stored under.
+
+    Returns:
+        The unpickled value.
+
+    Raises:
+        WorkflowValueNotFoundError: If no searched directory holds the value.
+    """
+    file_name = f"{digest}{_VALUE_FILE_SUFFIX}"
+    search_dirs = [get_workflow_values_dir(workflow_file)]
+    search_dirs.extend(Path(entry) for entry in os.getenv(WORKFLOW_VALUE_DIRS_ENV_VAR, "").split(os.pathsep) if entry)
+    for values_dir in search_dirs:
+        try:
+            data = (values_dir / file_name).read_bytes()
+        except FileNotFoundError:
+            continue
+        return pickle.loads(data)  # noqa: S301
+    searched = ", ".join(str(values_dir) for values_dir in search_dirs)
+    msg = f"Stored workflow value '{digest}' was not found. Searched: {searched}"
+    raise WorkflowValueNotFoundError(msg)
@@ -0,0 +1,97 @@
+"""Tests for BlobSpool."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from griptape_nodes.api_client.blob_spool import BLOB_REFERENCE_KEY, BlobSpool, BlobSpoolError, get_blob_spool_dir
+
+
+class TestBlobSpool:
+    @pytest.fixture
+    def spool(self, tmp_path: Path) -> BlobSpool:
+        return BlobSpool(tmp_path / "blobs", min_blob_size=10)
+
+    def test_put_is_content_addressed(self, spool: BlobSpool) -> None:
+        first = spool.put(b"hello")
+        second = spool.put(b"hello")
+
+        assert first == second
+        assert spool.get(first) == b"hello"
+        assert len(list(spool.directory.iterdir())) == 1
+
+    def test_externalize_replaces_only_large_strings(self, spool: BlobSpool) -> None:
+        value = {"small": "abc", "large": "z" * 10, "nested": [1, {"image": "y" * 20}], "flag": True}
+
+        externalized, replaced = spool.externalize(value)
+
+        assert replaced == 2  # noqa: PLR2004
+        assert externalized["small"] == "abc"
+        assert externalized["flag"] is True
+        assert externalized["large"] == {BLOB_REFERENCE_KEY: spool.put(b"z" * 10), "size": 10}
+        assert spool.rehydrate(externalized) == value
+
+    def test_externalize_returns_unchanged_value_when_nothing_is_large(self, spool: BlobSpool) -> None:
+        value = {"items": ["a", "b"]}
+
+        externalized, replaced = spool.externalize(value)
+
+        assert replaced == 0
+        assert externalized is value
+
+    def test_get_rejects_malformed_and_corrupt_references(self, spool: BlobSpool) -> None:
+        digest = spool.put(b"original")
+        (spool.directory / digest).write_bytes(b"tampered")
+
+        with pytest.raises(BlobSpoolError, match="corrupt"):
+            spool.get(digest)
+        with pytest.raises(BlobSpoolError, match="Invalid"):
+            spool.get("../../etc/passwd")
+
+    def test_prune_removes_only_old_values(self, spool: BlobSpool) -> None:
+        old = spool.put(b"old value")
+        new = spool.put(b"new value")
+        stale_time = time.time() - 7200
+        os.utime(spool.directory / old, (stale_time, stale_time))
+
+        spool.prune(max_age_s=3600)
+
+        assert not (spool.directory / old).exists()
+        assert spool.get(new) == b"new value"
+
+    def test_prune_removes_only_digest_named_files(self, spool: BlobSpool) -> None:
+        spool.put(b"value")
+        stale_time = time.time() - 7200
+        unrelated = spool.directory / "notes.txt"
+        unrelated.write_bytes(b"keep me")
+        os.utime(unrelated, (stale_time, stale_time))
+
+        spool.prune(max_age_s=3600)
+
+        assert unrelated.exists()
+
+    def test_default_directory_is_private(self) -> None:
+        spool = BlobSpool()
+        spool.put(b"value")
+
+        assert spool.directory == get_blob_spool_dir()
+        assert spool.directory.stat().st_mode & 0o777 == 0o700  # noqa: PLR2004
+
+    def test_symlinked_directory_is_refused(self, tmp_path: Path) -> None:
+        victim = tmp_path / "victim"
+        victim.mkdir()
+        victim_file = victim / ("a" * 64)
+        victim_file.write_bytes(b"precious")
+        stale_time = time.time() - 7200
+        os.utime(victim_file, (stale_time, stale_time))
+        link = tmp_path / "blobs"
+        link.symlink_to(victim)
+        spool = BlobSpool(link)
+
+        spool.prune(max_age_s=3600)
+
+        assert victim_file.exists()
+        with pytest.raises(PermissionError, match="not a directory"):
+            spool.put(b"value")
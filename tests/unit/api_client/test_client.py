@@ -1,15 +1,20 @@
-"""Tests for WebSocket client large payload warning."""
+"""Tests for WebSocket client large payload handling."""
 
 from __future__ import annotations
 
 import json
 import logging
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock
 
 import pytest
 
+from griptape_nodes.api_client.blob_spool import BLOB_REFERENCE_KEY, BlobSpool
 from griptape_nodes.api_client.client import LARGE_PAYLOAD_WARNING_THRESHOLD, Client
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class TestClientLargePayloadWarning:
     @pytest.fixture
@@ -51,3 +56,85 @@ class TestClientLargePayloadWarning:
         await client._send_message(message)
 
         client._websocket.send.assert_called_once_with(json.dumps(message))
+
+
+class TestClientBlobSpool:
+    @pytest.fixture
+    def client(self, tmp_path: Path) -> Client:
+        """Client with a mocked WebSocket and a blob spool in a per-test directory."""
+        c = Client(api_key="test_key", url="ws://localhost", blob_spool=BlobSpool(tmp_path / "blobs"))
+        c._websocket = AsyncMock()
+        return c
+
+    @pytest.mark.asyncio
+    async def test_large_values_are_sent_as_references(self, client: Client) -> None:
+        large_data = "x" * (LARGE_PAYLOAD_WARNING_THRESHOLD + 1)
+        message = {"type": "test_event", "payload": {"data": large_data, "name": "small"}, "topic": "test/topic"}
+
+        await client._send_message(message)
+
+        sent = json.loads(client._websocket.send.call_args.args[0])
+        assert sent["payload"]["name"] == "small"
+        assert BLOB_REFERENCE_KEY in sent["payload"]["data"]
+        assert message["payload"]["data"] == large_data
+
+    @pytest.mark.asyncio
+    async def test_small_messages_are_sent_inline(self, client: Client) -> None:
+        message = {"type": "test_event", "payload": {"data": "y" * 20_000}, "topic": "test/topic"}
+
+        await client._send_message(message)
+
+        client._websocket.send.assert_called_once_with(json.dumps(message))
+
+    @pytest.mark.asyncio
+    async def test_received_references_are_rehydrated(self, client: Client) -> None:
+        large_data = "x" * (LARGE_PAYLOAD_WARNING_THRESHOLD + 1)
+        message = {"type": "test_event", "payload": {"items": [large_data]}, "topic": "test/topic"}
+        await client._send_message(message)
+        client._websocket.__aiter__.return_value = [client._websocket.send.call_args.args[0]]
+
+        await client._receive_messages(client._websocket)
+
+        assert client._message_queue.get_nowait() == message
+
+    @pytest.mark.asyncio
+    async def test_message_with_missing_spooled_value_is_dropped(
+        self, client: Client, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        message = {"type": "test_event", "payload": {"data": {BLOB_REFERENCE_KEY: "0" * 64, "size": 1}}}
+        client._websocket.__aiter__.return_value = [json.dumps(message)]
+
+        with caplog.at_level(logging.ERROR, logger="griptape_nodes_client"):
+            await client._receive_messages(client._websocket)
+
+        assert client._message_queue.empty()
+        assert any("spooled value" in record.message for record in caplog.records)
+
+
+class TestClientPublishSerialized:
+    @pytest.fixture
+    def client(self) -> Client:
+        """Client with a mocked WebSocket so messages can be sent without a real connection."""
+        c = Client(api_key="test_key", url="ws://localhost")
+        c._websocket = AsyncMock()
+        return c
+
+    @pytest.mark.asyncio
+    async def test_splices_payload_into_envelope(self, client: Client) -> None:
+        payload = {"event_type": "ExecutionEvent", "payload": {"node_name": "n"}}
+
+        await client.publish_serialized("execution_event", json.dumps(payload), "sessions/1/response")
+
+        sent = json.loads(client._websocket.send.call_args.args[0])
+        assert sent == {"type": "execution_event", "payload": payload, "topic": "sessions/1/response"}
+
+    @pytest.mark.asyncio
+    async def test_large_payload_still_warns_with_event_type(
+        self, client: Client, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        payload = {"data": "x" * (LARGE_PAYLOAD_WARNING_THRESHOLD + 1)}
+
+        with caplog.at_level(logging.WARNING, logger="griptape_nodes_client"):
+            await client.publish_serialized("execution_event", json.dumps(payload), "topic")
+
+        assert any("execution_event" in record.message for record in caplog.records)
@@ -0,0 +1,191 @@
+"""Tests for SubprocessWorkerPool, using a lightweight fake worker that speaks the pool protocol."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from griptape_nodes.bootstrap.utils import subprocess_worker_pool
+from griptape_nodes.bootstrap.utils.subprocess_worker_pool import (
+    WORKER_MESSAGE_PREFIX,
+    SubprocessWorkerPool,
+    SubprocessWorkerPoolError,
+)
+from griptape_nodes.drivers.storage import StorageBackend
+
+# Answers each job with its PID as rss_mb so tests can tell workers apart. A workflow_path
+# of "fail" reports a workflow error, "crash" exits mid-job, "hang" never answers, and
+# "wrong_job" answers with another job's id.
+_FAKE_WORKER_SCRIPT = f"""
+import json
+import os
+import sys
+import time
+
+PREFIX = {WORKER_MESSAGE_PREFIX!r}
+print("warming up")
+print(PREFIX + json.dumps({{"type": "ready"}}), flush=True)
+for line in sys.stdin:
+    job = json.loads(line)
+    if job["workflow_path"] == "crash":
+        sys.exit(3)
+    if job["workflow_path"] == "hang":
+        time.sleep(60)
+    error = "boom" if job["workflow_path"] == "fail" else None
+    job_id = "other" if job["workflow_path"] == "wrong_job" else job["job_id"]
+    result = {{"type": "job_result", "job_id": job_id, "error": error, "healthy": True, "rss_mb": os.getpid()}}
+    print(PREFIX + json.dumps(result), flush=True)
+"""
+
+
+@pytest.fixture
+def fake_worker_script(tmp_path: Path):  # noqa: ANN201
+    """Point the pool at the fake worker script."""
+    script_path = tmp_path / "fake_worker.py"
+    script_path.write_text(_FAKE_WORKER_SCRIPT)
+    with patch.object(subprocess_worker_pool, "_WORKER_SCRIPT_PATH", script_path):
+        yield script_path
+
+
+async def _run(pool: SubprocessWorkerPool, workflow_path: str = "ok") -> None:
+    await pool.run_job(
+        workflow_path=workflow_path,
+        flow_input={},
+        session_id="session",
+        storage_backend=StorageBackend.LOCAL,
+        pickle_control_flow_result=True,
+    )
+
+
+def _worker_pids(pool: SubprocessWorkerPool) -> set[int]:
+    return {worker.process.pid for worker in pool._workers}
+
+
+@pytest.mark.usefixtures("fake_worker_script")
+class TestSubprocessWorkerPool:
+    @pytest.mark.asyncio
+    async def test_reuses_warm_workers(self) -> None:
+        pool = SubprocessWorkerPool(1)
+        try:
+            await pool.start()
+            pids = _worker_pids(pool)
+
+            for _ in range(3):
+                await _run(pool)
+
+            assert _worker_pids(pool) == pids
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_workflow_error_is_raised_and_worker_kept(self) -> None:
+        pool = SubprocessWorkerPool(1)
+        try:
+            await pool.start()
+            pids = _worker_pids(pool)
+
+            with pytest.raises(SubprocessWorkerPoolError, match="boom"):
+                await _run(pool, "fail")
+            await _run(pool)
+
+            assert _worker_pids(pool) == pids
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_recycles_worker_after_max_jobs(self) -> None:
+        pool = SubprocessWorkerPool(1, max_jobs_per_worker=2)
+        try:
+            await pool.start()
+            first_pids = _worker_pids(pool)
+
+            await _run(pool)
+            await _run(pool)
+            await _run(pool)
+
+            assert _worker_pids(pool).isdisjoint(first_pids)
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_recycles_worker_over_memory_ceiling(self) -> None:
+        # The fake worker reports its PID as its memory, which is always above 1 MB
+        pool = SubprocessWorkerPool(1, max_rss_mb=1)
+        try:
+            await pool.start()
+            first_pids = _worker_pids(pool)
+
+            await _run(pool)
+            await _run(pool)
+
+            assert _worker_pids(pool).isdisjoint(first_pids)
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_replaces_worker_that_dies_mid_job(self) -> None:
+        pool = SubprocessWorkerPool(1)
+        try:
+            await pool.start()
+
+            with pytest.raises(SubprocessWorkerPoolError, match="exited"):
+                await _run(pool, "crash")
+            await _run(pool)
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_replaces_worker(self) -> None:
+        pool = SubprocessWorkerPool(1)
+        try:
+            await pool.start()
+            first_pids = _worker_pids(pool)
+
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.5):
+                    await _run(pool, "hang")
+            await _run(pool)
+
+            assert _worker_pids(pool).isdisjoint(first_pids)
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_pool_rejects_jobs(self) -> None:
+        pool = SubprocessWorkerPool(1)
+        await pool.start()
+        await pool.close()
+
+        assert not pool._workers
+        with pytest.raises(SubprocessWorkerPoolError, match="closed"):
+            await _run(pool)
+
+    @pytest.mark.asyncio
+    async def test_worker_answering_wrong_job_is_replaced(self) -> None:
+        pool = SubprocessWorkerPool(1)
+        try:
+            await pool.start()
+            first_pids = _worker_pids(pool)
+
+            with pytest.raises(SubprocessWorkerPoolError, match="answered job"):
+                await _run(pool, "wrong_job")
+            await _run(pool)
+
+            assert _worker_pids(pool).isdisjoint(first_pids)
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_pool_is_bound_to_the_loop_it_started_on(self) -> None:
+        pool = SubprocessWorkerPool(1)
+        try:
+            await pool.start()
+
+            def start_on_other_loop() -> None:
+                asyncio.run(pool.start())
+
+            with pytest.raises(SubprocessWorkerPoolError, match="different event loop"):
+                await asyncio.to_thread(start_on_other_loop)
+        finally:
+            await pool.close()
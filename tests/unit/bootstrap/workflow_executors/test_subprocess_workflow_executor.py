@@ -0,0 +1,212 @@
+"""Tests for SubprocessWorkflowExecutor's file-based input/output transport and workflow staging."""
+
+import json
+import os
+import pickle
+import stat
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from griptape_nodes.bootstrap.workflow_executors import subprocess_workflow_executor
+from griptape_nodes.bootstrap.workflow_executors.local_session_workflow_executor import LocalSessionWorkflowExecutor
+from griptape_nodes.bootstrap.workflow_executors.subprocess_workflow_executor import (
+    SubprocessWorkflowExecutor,
+    SubprocessWorkflowExecutorError,
+    _staged_workflow,
+)
+from griptape_nodes.retained_mode.events.base_events import ExecutionEvent, ExecutionGriptapeNodeEvent
+from griptape_nodes.retained_mode.events.execution_events import ControlFlowResolvedEvent, NodeResolvedEvent
+from griptape_nodes.retained_mode.events.node_events import SerializedNodeCommands
+from griptape_nodes.utils.workflow_value_store import WORKFLOW_VALUE_DIRS_ENV_VAR, get_workflow_values_dir
+
+
+@pytest.fixture
+def staged_root(tmp_path: Path):  # noqa: ANN201
+    """Stage workflows under a per-test root."""
+    root = tmp_path / "staged"
+    with (
+        patch.object(subprocess_workflow_executor, "_get_staged_workflows_root", return_value=root),
+        patch.object(subprocess_workflow_executor, "_staged_workflow_hashes", {}),
+    ):
+        yield root
+
+
+def _resolved_event() -> ExecutionGriptapeNodeEvent:
+    uuid = SerializedNodeCommands.UniqueParameterValueUUID("uuid-1")
+    payload = ControlFlowResolvedEvent(
+        end_node_name="EndFlow",
+        parameter_output_values={"result": uuid},
+        unique_parameter_uuid_to_values={uuid: pickle.dumps({"answer": 42})},
+    )
+    return ExecutionGriptapeNodeEvent(wrapped_event=ExecutionEvent(payload=payload))
+
+
+async def _stage(workflow_path: Path) -> Path:
+    """Stage a workflow without keeping it in use."""
+    async with _staged_workflow(workflow_path) as staged_dir:
+        return staged_dir
+
+
+def _age(path: Path, mtime: float) -> None:
+    os.utime(path, (mtime, mtime))
+
+
+class TestStageWorkflow:
+    @pytest.mark.asyncio
+    async def test_unchanged_workflow_reuses_staged_directory(self, tmp_path: Path, staged_root: Path) -> None:
+        workflow_path = tmp_path / "my_workflow.py"
+        workflow_path.write_text("print('hi')")
+
+        first = await _stage(workflow_path)
+        second = await _stage(workflow_path)
+
+        assert first == second
+        assert first.parent == staged_root
+        assert (first / "workflow.py").read_text() == "print('hi')"
+        assert (first / "subprocess_script.py").exists()
+
+    @pytest.mark.asyncio
+    async def test_changed_workflow_gets_new_directory(self, tmp_path: Path, staged_root: Path) -> None:  # noqa: ARG002
+        workflow_path = tmp_path / "my_workflow.py"
+        workflow_path.write_text("print('one')")
+        first = await _stage(workflow_path)
+
+        workflow_path.write_text("print('two, longer')")
+        second = await _stage(workflow_path)
+
+        assert first != second
+        assert (second / "workflow.py").read_text() == "print('two, longer')"
+
+    @pytest.mark.asyncio
+    async def test_identical_content_shares_directory(self, tmp_path: Path, staged_root: Path) -> None:  # noqa: ARG002
+        (tmp_path / "a.py").write_text("same")
+        (tmp_path / "b.py").write_text("same")
+
+        assert await _stage(tmp_path / "a.py") == await _stage(tmp_path / "b.py")
+
+    @pytest.mark.asyncio
+    async def test_staging_root_is_private(self, tmp_path: Path, staged_root: Path) -> None:
+        workflow_path = tmp_path / "my_workflow.py"
+        workflow_path.write_text("print('hi')")
+
+        await _stage(workflow_path)
+
+        assert stat.S_IMODE(staged_root.stat().st_mode) == 0o700  # noqa: ASYNC240, PLR2004
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership check")
+    async def test_staging_root_owned_by_another_user_is_refused(self, tmp_path: Path, staged_root: Path) -> None:
+        staged_root.mkdir(mode=0o700)  # noqa: ASYNC240
+        workflow_path = tmp_path / "my_workflow.py"
+        workflow_path.write_text("print('hi')")
+
+        with (
+            patch.object(subprocess_workflow_executor.os, "getuid", return_value=os.getuid() + 1),
+            pytest.raises(SubprocessWorkflowExecutorError, match="owned by another user"),
+        ):
+            await _stage(workflow_path)
+
+    @pytest.mark.asyncio
+    async def test_altered_staged_copy_is_restaged(self, tmp_path: Path, staged_root: Path) -> None:  # noqa: ARG002
+        workflow_path = tmp_path / "my_workflow.py"
+        workflow_path.write_text("print('hi')")
+        staged_dir = await _stage(workflow_path)
+
+        (staged_dir / "workflow.py").write_text("print('planted')")
+
+        assert await _stage(workflow_path) == staged_dir
+        assert (staged_dir / "workflow.py").read_text() == "print('hi')"
+
+    @pytest.mark.asyncio
+    async def test_prunes_least_recently_used_staged_directories(self, tmp_path: Path, staged_root: Path) -> None:
+        workflow_paths = []
+        staged_dirs = []
+        for index in range(2):
+            workflow_path = tmp_path / f"workflow_{index}.py"
+            workflow_path.write_text(f"# {index}")
+            workflow_paths.append(workflow_path)
+            staged_dirs.append(await _stage(workflow_path))
+            _age(staged_dirs[-1], 1000 + index)
+
+        # Reusing the older directory makes it the most recently used
+        await _stage(workflow_paths[0])
+        new_workflow_path = tmp_path / "workflow_new.py"
+        new_workflow_path.write_text("# new")
+        with patch.object(subprocess_workflow_executor, "_MAX_STAGED_WORKFLOWS", 2):
+            latest = await _stage(new_workflow_path)
+
+        assert set(staged_root.iterdir()) == {staged_dirs[0], latest}  # noqa: ASYNC240
+
+    @pytest.mark.asyncio
+    async def test_in_use_staged_directory_is_not_pruned(self, tmp_path: Path, staged_root: Path) -> None:
+        in_use_workflow_path = tmp_path / "in_use.py"
+        in_use_workflow_path.write_text("# in use")
+        with patch.object(subprocess_workflow_executor, "_MAX_STAGED_WORKFLOWS", 1):
+            async with _staged_workflow(in_use_workflow_path) as in_use_dir:
+                _age(in_use_dir, 1000)
+                other_workflow_path = tmp_path / "other.py"
+                other_workflow_path.write_text("# other")
+                latest = await _stage(other_workflow_path)
+
+                assert set(staged_root.iterdir()) == {in_use_dir, latest}  # noqa: ASYNC240
+
+
+class TestOutputFileTransport:
+    def test_session_executor_writes_result_to_file_and_strips_websocket_copy(self, tmp_path: Path) -> None:
+        output_path = tmp_path / "flow_output.json"
+        executor = LocalSessionWorkflowExecutor(session_id="session", output_path=output_path)
+
+        event_json = executor._execution_event_json(_resolved_event())
+
+        sent_payload = json.loads(event_json)["payload"]
+        assert sent_payload["end_node_name"] == "EndFlow"
+        assert sent_payload["parameter_output_values"] == {}
+        assert sent_payload["unique_parameter_uuid_to_values"] is None
+        assert json.loads(output_path.read_text())["payload"]["parameter_output_values"] == {"result": "uuid-1"}
+
+    def test_session_executor_sends_other_events_unchanged(self, tmp_path: Path) -> None:
+        output_path = tmp_path / "flow_output.json"
+        executor = LocalSessionWorkflowExecutor(session_id="session", output_path=output_path)
+        event = ExecutionGriptapeNodeEvent(
+            wrapped_event=ExecutionEvent(
+                payload=NodeResolvedEvent(node_name="n", parameter_output_values={}, node_type="Node")
+            )
+        )
+
+        assert executor._execution_event_json(event) == event.wrapped_event.json()
+        assert not output_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_subprocess_executor_loads_result_from_file(self, tmp_path: Path) -> None:
+        output_path = tmp_path / "flow_output.json"
+        output_path.write_text(_resolved_event().wrapped_event.json())
+        executor = SubprocessWorkflowExecutor(workflow_path="unused.py")
+
+        await executor._load_output_file(output_path)
+
+        assert executor.output is not None
+        result = executor.output["EndFlow"]
+        assert result["parameter_output_values"] == {"result": "uuid-1"}
+        assert pickle.loads(result["unique_parameter_uuid_to_values"]["uuid-1"]) == {"answer": 42}  # noqa: S301
+
+    @pytest.mark.asyncio
+    async def test_subprocess_executor_passes_input_by_file(self, tmp_path: Path, staged_root: Path) -> None:  # noqa: ARG002
+        workflow_path = tmp_path / "my_workflow.py"
+        workflow_path.write_text("# workflow")
+        executor = SubprocessWorkflowExecutor(workflow_path=str(workflow_path))
+        seen_input: dict = {}
+
+        async def fake_execute(*, script_path: Path, args: list[str], env: dict[str, str], **_: object) -> None:
+            assert "--json-input" not in args
+            input_file = Path(args[args.index("--json-input-file") + 1])
+            seen_input.update(json.loads(input_file.read_text()))  # noqa: ASYNC240
+            assert script_path.name == "subprocess_script.py"
+            # The staged copy must still find values stored next to the original workflow
+            assert env[WORKFLOW_VALUE_DIRS_ENV_VAR].split(os.pathsep)[0] == str(get_workflow_values_dir(workflow_path))
+
+        with patch.object(executor, "execute_python_script", MagicMock(side_effect=fake_execute)):
+            await executor.arun(flow_input={"Start": {"value": "x" * 1_000_000}})
+
+        assert seen_input == {"Start": {"value": "x" * 1_000_000}}
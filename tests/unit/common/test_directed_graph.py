@@ -232,3 +232,97 @@ class TestDirectedGraph:
         # These operations should not raise errors
         graph.remove_node("nonexistent")
         graph.clear()
+
+    def test_out_degree_with_edges(self) -> None:
+        """Test out_degree is tracked from successor sets."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("A", "C")
+        graph.add_edge("B", "C")
+
+        assert graph.out_degree("A") == 2
+        assert graph.out_degree("B") == 1
+        assert graph.out_degree("C") == 0
+
+        graph.remove_node("C")
+
+        assert graph.out_degree("A") == 1
+        assert graph.out_degree("B") == 0
+
+    def test_predecessors_and_successors(self) -> None:
+        """Test that predecessors and successors are kept symmetric."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+        graph.add_edge("A", "C")
+        graph.add_edge("B", "C")
+
+        assert graph.successors("A") == {"B", "C"}
+        assert graph.predecessors("C") == {"A", "B"}
+
+        graph.remove_node("B")
+
+        assert graph.successors("A") == {"C"}
+        assert graph.predecessors("C") == {"A"}
+
+    def test_successors_nonexistent_node(self) -> None:
+        """Test that successors raises KeyError for nodes that don't exist."""
+        graph = DirectedGraph()
+
+        import pytest
+
+        with pytest.raises(KeyError, match="Node nonexistent not found in graph"):
+            graph.successors("nonexistent")
+
+    def test_leaf_nodes_tracked_incrementally(self) -> None:
+        """Test that leaf_nodes matches the nodes with in_degree 0 as the graph changes."""
+        graph = DirectedGraph()
+        graph.add_edge("root1", "middle")
+        graph.add_edge("root2", "middle")
+        graph.add_edge("middle", "leaf1")
+        graph.add_node("isolated")
+
+        assert graph.leaf_nodes() == {"root1", "root2", "isolated"}
+
+        graph.remove_node("root1")
+        assert graph.leaf_nodes() == {"root2", "isolated"}
+
+        # Removing the last predecessor turns the successor into a leaf
+        graph.remove_node("root2")
+        assert graph.leaf_nodes() == {"middle", "isolated"}
+
+        graph.remove_node("middle")
+        assert graph.leaf_nodes() == {"leaf1", "isolated"}
+
+        assert graph.leaf_nodes() == {n for n in graph.nodes() if graph.in_degree(n) == 0}
+
+    def test_leaf_nodes_returns_copy(self) -> None:
+        """Test that leaf_nodes() can be iterated while removing nodes from the graph."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+        graph.add_node("C")
+
+        for node in graph.leaf_nodes():
+            graph.remove_node(node)
+
+        assert graph.nodes() == {"B"}
+        assert graph.leaf_nodes() == {"B"}
+
+    def test_contains_and_iter(self) -> None:
+        """Test membership and iteration without copying the node set."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+
+        assert "A" in graph
+        assert "missing" not in graph
+        assert set(graph) == {"A", "B"}
+
+    def test_clear_resets_leaf_tracking(self) -> None:
+        """Test that clear also drops successor and leaf bookkeeping."""
+        graph = DirectedGraph()
+        graph.add_edge("A", "B")
+        graph.clear()
+
+        assert graph.leaf_nodes() == set()
+        graph.add_node("A")
+        assert graph.out_degree("A") == 0
+        assert graph.leaf_nodes() == {"A"}
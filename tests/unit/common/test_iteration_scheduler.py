@@ -0,0 +1,179 @@
+"""Tests for IterationScheduler."""
+
+# ruff: noqa: PLR2004
+
+import asyncio
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from griptape_nodes.common import iteration_scheduler
+from griptape_nodes.common.iteration_scheduler import IterationScheduler
+
+
+class _ConcurrencyTracker:
+    """Iteration body that records how many iterations run at once."""
+
+    def __init__(self, delays: dict[int, float] | None = None) -> None:
+        self.delays = delays or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started: list[int] = []
+        self.cancelled: list[int] = []
+
+    async def __call__(self, iteration_index: int) -> int:
+        self.started.append(iteration_index)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(iteration_index, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled.append(iteration_index)
+            raise
+        finally:
+            self.in_flight -= 1
+        return iteration_index * 10
+
+
+async def _collect(scheduler: IterationScheduler, tracker: _ConcurrencyTracker, count: int, **kwargs) -> list:
+    return [item async for item in scheduler.run(range(count), tracker, **kwargs)]
+
+
+class TestIterationScheduler:
+    @pytest.mark.asyncio
+    async def test_never_exceeds_max_concurrency(self) -> None:
+        tracker = _ConcurrencyTracker()
+
+        outcomes = await _collect(IterationScheduler(3), tracker, 10)
+
+        assert tracker.max_in_flight == 3
+        assert sorted(outcomes) == [(i, i * 10) for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_yields_outcomes_as_iterations_finish(self) -> None:
+        tracker = _ConcurrencyTracker(delays={0: 0.2, 1: 0.01, 2: 0.05})
+
+        outcomes = await _collect(IterationScheduler(3), tracker, 3)
+
+        assert [index for index, _ in outcomes] == [1, 2, 0]
+
+    @pytest.mark.asyncio
+    async def test_raised_exception_is_yielded_as_outcome(self) -> None:
+        async def run_iteration(iteration_index: int) -> int:
+            if iteration_index == 1:
+                msg = "boom"
+                raise ValueError(msg)
+            return iteration_index
+
+        outcomes = dict([item async for item in IterationScheduler(2).run(range(3), run_iteration)])
+
+        assert isinstance(outcomes[1], ValueError)
+        assert outcomes[0] == 0
+        assert outcomes[2] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_on_failure_stops_remaining_iterations(self) -> None:
+        tracker = _ConcurrencyTracker(delays={0: 0.01, 1: 1.0})
+        scheduler = IterationScheduler(2, cancel_on_failure=True)
+
+        outcomes = await _collect(scheduler, tracker, 5, is_failure=lambda outcome: outcome == 0)
+
+        assert outcomes == [(0, 0)]
+        assert tracker.cancelled == [1]
+        assert tracker.started == [0, 1]
+        assert scheduler.skipped_iterations == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_failures_do_not_stop_iterations_by_default(self) -> None:
+        tracker = _ConcurrencyTracker()
+        scheduler = IterationScheduler(2)
+
+        outcomes = await _collect(scheduler, tracker, 4, is_failure=lambda _: True)
+
+        assert len(outcomes) == 4
+        assert scheduler.skipped_iterations == []
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_running_iterations(self) -> None:
+        tracker = _ConcurrencyTracker(delays={0: 0.01, 1: 1.0, 2: 1.0})
+        outcomes = IterationScheduler(3).run(range(3), tracker)
+
+        assert await anext(outcomes) == (0, 0)
+        await outcomes.aclose()
+
+        assert sorted(tracker.cancelled) == [1, 2]
+        assert tracker.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_backs_off_under_pressure_and_recovers(self) -> None:
+        scheduler = IterationScheduler(8, max_load_per_cpu=1.0)
+
+        with (
+            patch.object(iteration_scheduler, "_SAMPLE_INTERVAL_S", 0),
+            patch.object(iteration_scheduler, "load_per_cpu", return_value=4.0),
+        ):
+            scheduler._adapt_limit()
+            scheduler._adapt_limit()
+            assert scheduler.concurrency_limit == 2
+
+            tracker = _ConcurrencyTracker()
+            await _collect(scheduler, tracker, 6)
+            assert tracker.max_in_flight == 1
+
+        with (
+            patch.object(iteration_scheduler, "_SAMPLE_INTERVAL_S", 0),
+            patch.object(iteration_scheduler, "load_per_cpu", return_value=0.5),
+        ):
+            scheduler._adapt_limit()
+            assert scheduler.concurrency_limit == 2
+
+    @pytest.mark.asyncio
+    async def test_memory_threshold_limits_concurrency(self) -> None:
+        scheduler = IterationScheduler(4, max_rss_mb=100)
+        tracker = _ConcurrencyTracker()
+
+        with (
+            patch.object(iteration_scheduler, "_SAMPLE_INTERVAL_S", 0),
+            patch.object(iteration_scheduler, "current_rss_mb", return_value=500.0),
+        ):
+            await _collect(scheduler, tracker, 4)
+
+        assert tracker.max_in_flight < 4
+
+    def test_unmeasurable_resources_do_not_reduce_limit(self) -> None:
+        scheduler = IterationScheduler(4, max_rss_mb=100, max_load_per_cpu=1.0)
+
+        with (
+            patch.object(iteration_scheduler, "current_rss_mb", return_value=None),
+            patch.object(iteration_scheduler, "load_per_cpu", return_value=None),
+        ):
+            scheduler._adapt_limit()
+
+        assert scheduler.concurrency_limit == 4
+
+
+class TestCurrentRssMb:
+    def test_reads_current_rss(self) -> None:
+        rss_mb = iteration_scheduler.current_rss_mb()
+
+        if rss_mb is not None:
+            assert rss_mb > 0
+
+    def test_without_proc_or_psutil_memory_is_unmeasured(self) -> None:
+        with (
+            patch.object(iteration_scheduler.Path, "read_text", side_effect=OSError),
+            patch.dict(sys.modules, {"psutil": None}),
+        ):
+            assert iteration_scheduler.current_rss_mb() is None
+
+    def test_without_proc_uses_psutil(self) -> None:
+        psutil = MagicMock()
+        psutil.Error = Exception
+        psutil.Process.return_value.memory_info.return_value.rss = 256 * 1024 * 1024
+
+        with (
+            patch.object(iteration_scheduler.Path, "read_text", side_effect=OSError),
+            patch.dict(sys.modules, {"psutil": psutil}),
+        ):
+            assert iteration_scheduler.current_rss_mb() == 256.0
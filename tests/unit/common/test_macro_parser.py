@@ -3,6 +3,7 @@
 # ruff: noqa: PLR2004
 
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -359,6 +360,21 @@ class TestParsedMacro:
         assert len(variables) == 0
         assert variables == set()
 
+    def test_parsed_macro_reuses_cached_parse(self) -> None:
+        """Test instances built from the same template share the cached parse."""
+        first = ParsedMacro("{inputs}/{file_name}.png")
+        second = ParsedMacro("{inputs}/{file_name}.png")
+
+        assert first.segments == second.segments
+        assert first.segments is not second.segments
+        assert all(a is b for a, b in zip(first.segments, second.segments, strict=True))
+
+    def test_parsed_macro_syntax_error_is_raised_every_time(self) -> None:
+        """Test an invalid template keeps raising rather than being cached."""
+        for _ in range(2):
+            with pytest.raises(MacroSyntaxError):
+                ParsedMacro("{unclosed")
+
 
 class TestMacroParserParseVariable:
     """Test cases for parse_variable() function."""
@@ -717,6 +733,16 @@ class TestMacroParserFindMatchesDetailed:
         assert result[VariableInfo(name="file_name", is_required=True)] == "render"
         assert result[VariableInfo(name="index", is_required=True)] == 5  # Reversed to int
 
+    def test_find_matches_rejects_path_missing_static_text(self, mock_secrets_manager: Any) -> None:
+        """Test paths without the template's static text are rejected before extraction."""
+        parsed = ParsedMacro("{inputs}/{workflow_name?:_}{file_name}_v{index:03}.png")
+
+        with patch("griptape_nodes.common.macro_parser.core.extract_unknown_variables") as mock_extract:
+            result = parsed.find_matches_detailed("inputs/notes.txt", {"inputs": "inputs"}, mock_secrets_manager)
+
+        assert result is None
+        mock_extract.assert_not_called()
+
     def test_find_matches_empty_path(self, mock_secrets_manager: Any) -> None:
         """Test matching empty path against empty template."""
         parsed = ParsedMacro("")
@@ -10,19 +10,33 @@ These tests cover small, near-pure helpers that decide loop control flow:
   pair has fired its control output.
 * ``_find_source_for_control_param`` - return the first source for a given
   control parameter name, or None.
+* ``IterationFlowPool`` - lend deserialized loop body copies to parallel
+  iterations and reuse them.
 """
 
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from griptape_nodes.common.node_executor import IterationControlAction, NodeExecutor
+from griptape_nodes.common.node_executor import (
+    IterationControlAction,
+    IterationFlow,
+    IterationFlowPool,
+    IterationFlowSetupError,
+    NodeExecutor,
+)
 from griptape_nodes.exe_types.base_iterative_nodes import BaseIterativeEndNode
 from griptape_nodes.exe_types.node_groups.base_iterative_node_group import BaseIterativeNodeGroup
+from griptape_nodes.retained_mode.events.flow_events import (
+    DeleteFlowResultSuccess,
+    DeserializeFlowFromCommandsResultFailure,
+    DeserializeFlowFromCommandsResultSuccess,
+)
 from griptape_nodes.retained_mode.events.node_events import ListConnectionsForNodeResultSuccess
 
 _GRIPTAPE_NODES_PATH = "griptape_nodes.common.node_executor.GriptapeNodes"
+_EVENT_SUPPRESSION_PATH = "griptape_nodes.common.node_executor.EventSuppressionContext"
 
 
 def _make_executor() -> NodeExecutor:
@@ -397,3 +411,100 @@ class TestGetIterationControlActionEndToEnd:
         # CondNode_orig is NOT in node_name_mappings
         result = self._run_real(end_node, connections, {}, {})
         assert result == IterationControlAction.ADD
+
+
+@pytest.mark.usefixtures("no_event_suppression")
+class TestIterationFlowPool:
+    """Deserializes a loop body copy only when none is idle and deletes copies that can't be reused."""
+
+    @pytest.fixture
+    def no_event_suppression(self):  # noqa: ANN201
+        """Skip event suppression, which needs a real EventManager."""
+        with patch(_EVENT_SUPPRESSION_PATH):
+            yield
+
+    @staticmethod
+    def _mock_griptape_nodes(mock_gn: MagicMock) -> list[str]:
+        created: list[str] = []
+
+        def deserialize(_request: Any) -> DeserializeFlowFromCommandsResultSuccess:
+            flow_name = f"Flow_{len(created)}"
+            created.append(flow_name)
+            return DeserializeFlowFromCommandsResultSuccess(
+                flow_name=flow_name, node_name_mappings={"Start": f"Start_{flow_name}"}, result_details="ok"
+            )
+
+        mock_gn.handle_request.side_effect = deserialize
+        mock_gn.ahandle_request = AsyncMock(return_value=DeleteFlowResultSuccess(result_details="ok"))
+        mock_gn.ContextManager.return_value.has_current_flow.return_value = False
+        return created
+
+    @staticmethod
+    def _deleted_flow_names(mock_gn: MagicMock) -> list[str]:
+        return [call.args[0].flow_name for call in mock_gn.ahandle_request.await_args_list]
+
+    @pytest.mark.asyncio
+    async def test_reuses_released_copy(self) -> None:
+        with patch(_GRIPTAPE_NODES_PATH) as mock_gn:
+            created = self._mock_griptape_nodes(mock_gn)
+            pool = IterationFlowPool(MagicMock(), parent_flow=None)
+
+            first = pool.acquire(0)
+            await pool.release(first, 0, reusable=True)
+            second = pool.acquire(1)
+
+            assert second == first
+            assert created == ["Flow_0"]
+            assert first.node_name_mappings == {"Start": "Start_Flow_0"}
+
+    @pytest.mark.asyncio
+    async def test_deserializes_one_copy_per_concurrent_iteration(self) -> None:
+        with patch(_GRIPTAPE_NODES_PATH) as mock_gn:
+            created = self._mock_griptape_nodes(mock_gn)
+            pool = IterationFlowPool(MagicMock(), parent_flow=None)
+
+            in_use = [pool.acquire(index) for index in range(3)]
+
+            assert [flow.flow_name for flow in in_use] == created
+            assert pool.flows_created == len(created)
+
+    @pytest.mark.asyncio
+    async def test_unreusable_copy_is_deleted(self) -> None:
+        with patch(_GRIPTAPE_NODES_PATH) as mock_gn:
+            created = self._mock_griptape_nodes(mock_gn)
+            pool = IterationFlowPool(MagicMock(), parent_flow=None)
+
+            first = pool.acquire(0)
+            await pool.release(first, 0, reusable=False)
+            second = pool.acquire(1)
+
+            assert self._deleted_flow_names(mock_gn) == ["Flow_0"]
+            assert second != first
+            assert created == ["Flow_0", "Flow_1"]
+
+    @pytest.mark.asyncio
+    async def test_close_deletes_idle_copies(self) -> None:
+        with patch(_GRIPTAPE_NODES_PATH) as mock_gn:
+            self._mock_griptape_nodes(mock_gn)
+            pool = IterationFlowPool(MagicMock(), parent_flow=None)
+            flows = [pool.acquire(index) for index in range(2)]
+            for index, flow in enumerate(flows):
+                await pool.release(flow, index, reusable=True)
+
+            await pool.close()
+
+            assert sorted(self._deleted_flow_names(mock_gn)) == ["Flow_0", "Flow_1"]
+
+    def test_failed_deserialization_raises_setup_error(self) -> None:
+        with patch(_GRIPTAPE_NODES_PATH) as mock_gn:
+            mock_gn.handle_request.return_value = DeserializeFlowFromCommandsResultFailure(result_details="bad")
+            pool = IterationFlowPool(MagicMock(), parent_flow=None)
+
+            with pytest.raises(IterationFlowSetupError, match="bad"):
+                pool.acquire(0)
+            assert pool.flows_created == 0
+
+    def test_iteration_flow_unpacks_to_name_and_mappings(self) -> None:
+        flow_name, node_name_mappings = IterationFlow("Flow", {"a": "b"})
+        assert flow_name == "Flow"
+        assert node_name_mappings == {"a": "b"}
@@ -35,6 +35,14 @@ def isolate_user_config() -> Generator[Path, None, None]:
             SingletonMeta._instances.clear()
 
 
+@pytest.fixture(autouse=True)
+def isolate_user_cache(monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """Isolate the user cache directory (preview index, HTTP cache, library manifests) during tests."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        monkeypatch.setenv("XDG_CACHE_HOME", temp_dir)
+        yield Path(temp_dir)
+
+
 @pytest.fixture
 def griptape_nodes() -> GriptapeNodes:
     """Provide a properly initialized GriptapeNodes instance for testing."""
@@ -0,0 +1,157 @@
+"""Tests for the Connections index."""
+
+import itertools
+from unittest.mock import patch
+
+import pytest
+
+from griptape_nodes.exe_types.connections import Connections
+from griptape_nodes.exe_types.core_types import Parameter, ParameterMode
+from griptape_nodes.exe_types.node_types import ControlNode, DataNode, NodeResolutionState
+
+
+class _PassthroughNode(DataNode):
+    """DataNode with a single ``value`` parameter usable as input and output."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.add_parameter(
+            Parameter(
+                name="value",
+                type="str",
+                default_value="",
+                tooltip="",
+                allowed_modes={ParameterMode.INPUT, ParameterMode.OUTPUT},
+            )
+        )
+
+    def process(self) -> None: ...
+
+
+class _ControlPassthroughNode(ControlNode):
+    """ControlNode with only its control parameters."""
+
+    def process(self) -> None: ...
+
+
+def _connect(connections: Connections, source: DataNode, target: DataNode) -> None:
+    connections.add_connection(
+        source, source.get_parameter_by_name("value"), target, target.get_parameter_by_name("value")
+    )
+
+
+def _connect_control(connections: Connections, source: ControlNode, target: ControlNode) -> None:
+    connections.add_connection(source, source.control_parameter_out, target, target.control_parameter_in)
+
+
+@pytest.fixture
+def no_events():  # noqa: ANN201
+    """Unresolving a node sends an event; swallow it."""
+    with patch("griptape_nodes.retained_mode.griptape_nodes.GriptapeNodes.EventManager"):
+        yield
+
+
+class TestConnectionsIndex:
+    def test_connections_between_nodes_are_in_creation_order(self) -> None:
+        a, b, c, d, e = (_PassthroughNode(name) for name in "abcde")
+        connections = Connections()
+        _connect(connections, c, d)
+        _connect(connections, a, b)
+        _connect(connections, a, c)
+        _connect(connections, b, e)
+
+        between = connections.get_connections_between_nodes({"a", "c", "d"})
+
+        assert [(conn.source_node.name, conn.target_node.name) for conn in between] == [("c", "d"), ("a", "c")]
+
+    def test_remove_connection_cleans_up_every_index(self) -> None:
+        a, b = _PassthroughNode("a"), _PassthroughNode("b")
+        connections = Connections()
+        _connect(connections, a, b)
+
+        assert connections.remove_connection("a", "value", "b", "value")
+
+        assert connections.connections == {}
+        assert connections.outgoing_index == {}
+        assert connections.incoming_index == {}
+        assert connections.get_connections_between_nodes({"a", "b"}) == []
+
+    def test_first_connection_wins_after_earlier_ones_are_removed(self) -> None:
+        a, b, c = (_PassthroughNode(name) for name in "abc")
+        connections = Connections()
+        _connect(connections, a, b)
+        _connect(connections, a, c)
+
+        connections.remove_connection("a", "value", "b", "value")
+        _connect(connections, a, b)
+
+        assert [conn.target_node.name for conn in connections.iter_outgoing_connections("a")] == ["c", "b"]
+        assert [conn.source_node.name for conn in connections.iter_incoming_connections("b")] == ["a"]
+        assert list(connections.iter_outgoing_connections("missing")) == []
+
+    def test_clear_removes_everything(self) -> None:
+        a, b = _PassthroughNode("a"), _PassthroughNode("b")
+        connections = Connections()
+        _connect(connections, a, b)
+
+        connections.clear()
+
+        assert connections.connections == {}
+        assert connections.outgoing_index == {}
+        assert connections.incoming_index == {}
+
+
+@pytest.mark.usefixtures("no_events")
+class TestDownstreamTraversal:
+    def test_unresolves_long_chain_without_recursion(self) -> None:
+        nodes = [_PassthroughNode(f"n{index}") for index in range(1500)]
+        connections = Connections()
+        for source, target in itertools.pairwise(nodes):
+            _connect(connections, source, target)
+        for node in nodes:
+            node.state = NodeResolutionState.RESOLVED
+
+        connections.unresolve_future_nodes(nodes[0])
+
+        assert nodes[0].state == NodeResolutionState.RESOLVED
+        assert all(node.state == NodeResolutionState.UNRESOLVED for node in nodes[1:])
+
+    def test_reaches_nodes_beyond_unresolved_intermediate(self) -> None:
+        a, b, c = (_PassthroughNode(name) for name in "abc")
+        connections = Connections()
+        _connect(connections, a, b)
+        _connect(connections, b, c)
+        c.state = NodeResolutionState.RESOLVED
+
+        connections.unresolve_future_nodes(a)
+
+        assert c.state == NodeResolutionState.UNRESOLVED
+
+    def test_new_connection_invalidates_cached_downstream(self) -> None:
+        a, b, c = (_PassthroughNode(name) for name in "abc")
+        connections = Connections()
+        _connect(connections, a, b)
+        connections.unresolve_future_nodes(a)
+
+        _connect(connections, b, c)
+        c.state = NodeResolutionState.RESOLVED
+        connections.unresolve_future_nodes(a)
+
+        assert c.state == NodeResolutionState.UNRESOLVED
+
+    def test_forward_control_path(self) -> None:
+        first, second, third, other = (_ControlPassthroughNode(name) for name in ("first", "second", "third", "other"))
+        connections = Connections()
+        _connect_control(connections, first, second)
+        _connect_control(connections, second, third)
+
+        assert connections.is_node_in_forward_control_path(first, third)
+        assert not connections.is_node_in_forward_control_path(first, first)
+        assert not connections.is_node_in_forward_control_path(third, first)
+        assert not connections.is_node_in_forward_control_path(first, other)
+
+        connections.remove_connection(
+            "second", second.control_parameter_out.name, "third", third.control_parameter_in.name
+        )
+
+        assert not connections.is_node_in_forward_control_path(first, third)
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from griptape_nodes.files.drivers.griptape_cloud_file_driver import GriptapeCloudFileDriver
+from griptape_nodes.files.http_client import HttpClientPool
 
 
 class TestGriptapeCloudFileDriver:
@@ -14,9 +15,12 @@ class TestGriptapeCloudFileDriver:
 
     @pytest.fixture
     def driver(self) -> GriptapeCloudFileDriver:
-        """Create a GriptapeCloudFileDriver instance."""
+        """Create a GriptapeCloudFileDriver instance with its own uncached client pool."""
         return GriptapeCloudFileDriver(
-            bucket_id="test-bucket-123", api_key="test-api-key", base_url="https://cloud.griptape.ai"
+            bucket_id="test-bucket-123",
+            api_key="test-api-key",
+            base_url="https://cloud.griptape.ai",
+            http_client_pool=HttpClientPool(),
         )
 
     @pytest.fixture
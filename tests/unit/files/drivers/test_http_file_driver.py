@@ -2,9 +2,11 @@
 
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 
 from griptape_nodes.files.drivers.http_file_driver import HttpFileDriver
+from griptape_nodes.files.http_client import HttpClientPool
 
 
 class TestHttpFileDriver:
@@ -12,8 +14,8 @@ class TestHttpFileDriver:
 
     @pytest.fixture
     def driver(self) -> HttpFileDriver:
-        """Create an HttpFileDriver instance."""
-        return HttpFileDriver()
+        """Create an HttpFileDriver instance with its own uncached client pool."""
+        return HttpFileDriver(http_client_pool=HttpClientPool())
 
     def test_can_handle_http_urls(self, driver: HttpFileDriver) -> None:
         """Test that driver handles HTTP URLs."""
@@ -45,7 +47,7 @@ class TestHttpFileDriver:
 
             content = await driver.read("https://example.com/file.txt", timeout=30.0)
             assert content == b"downloaded content"
-            mock_client.get.assert_called_once_with("https://example.com/file.txt", timeout=30.0)
+            mock_client.get.assert_called_once_with("https://example.com/file.txt", headers={}, timeout=30.0)
 
     @pytest.mark.asyncio
     async def test_read_http_error(self, driver: HttpFileDriver) -> None:
@@ -79,7 +81,7 @@ class TestHttpFileDriver:
             mock_client_class.return_value = mock_client
 
             await driver.read("https://example.com/file.txt", timeout=60.0)
-            mock_client.get.assert_called_once_with("https://example.com/file.txt", timeout=60.0)
+            mock_client.get.assert_called_once_with("https://example.com/file.txt", headers={}, timeout=60.0)
 
     @pytest.mark.asyncio
     async def test_exists_returns_true_for_accessible_url(self, driver: HttpFileDriver) -> None:
@@ -174,3 +176,60 @@ class TestHttpFileDriver:
 
             size = driver.get_size("https://example.com/file.txt")
             assert size == 0
+
+
+_BODY = b"0123456789" * 10
+
+
+def _range_aware_handler(request: httpx.Request) -> httpx.Response:
+    """Serve _BODY, honoring a single "bytes=start-end" Range header."""
+    range_header = request.headers.get("range")
+    if range_header is None:
+        return httpx.Response(200, content=_BODY)
+    start, end = range_header.removeprefix("bytes=").split("-")
+    return httpx.Response(206, content=_BODY[int(start) : int(end) + 1 if end else None])
+
+
+def _range_ignoring_handler(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+    """Serve _BODY, ignoring any Range header."""
+    return httpx.Response(200, content=_BODY)
+
+
+def _driver(handler: object) -> HttpFileDriver:
+    return HttpFileDriver(http_client_pool=HttpClientPool(transport=httpx.MockTransport(handler)))  # type: ignore[arg-type]
+
+
+class TestHttpFileDriverRangeAndStream:
+    """Tests for ranged and streamed HTTP reads."""
+
+    @pytest.mark.asyncio
+    async def test_read_range_uses_range_request(self) -> None:
+        content = await _driver(_range_aware_handler).read_range(
+            "https://example.com/f", offset=10, length=5, timeout=5.0
+        )
+
+        assert content == b"01234"
+
+    @pytest.mark.asyncio
+    async def test_read_range_when_server_ignores_range(self) -> None:
+        content = await _driver(_range_ignoring_handler).read_range(
+            "https://example.com/f", offset=95, length=10, timeout=5.0
+        )
+
+        assert content == b"56789"
+
+    @pytest.mark.asyncio
+    async def test_stream(self) -> None:
+        driver = _driver(_range_aware_handler)
+        chunks = [chunk async for chunk in driver.stream("https://example.com/f", timeout=5.0, chunk_size=30)]
+
+        assert b"".join(chunks) == _BODY
+
+    @pytest.mark.asyncio
+    async def test_stream_http_error(self) -> None:
+        def not_found(request: httpx.Request) -> httpx.Response:  # noqa: ARG001
+            return httpx.Response(404)
+
+        with pytest.raises(RuntimeError, match="Failed to download"):
+            async for _chunk in _driver(not_found).stream("https://example.com/f", timeout=5.0):
+                pass
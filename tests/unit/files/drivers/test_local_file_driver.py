@@ -35,6 +35,47 @@ class TestLocalFileDriver:
         content = await driver.read(str(temp_file), timeout=10.0)
         assert content == b"test content"
 
+    @pytest.mark.asyncio
+    async def test_read_range(self, driver: LocalFileDriver, temp_file: Path) -> None:
+        """Test reading byte ranges of a file."""
+        assert await driver.read_range(str(temp_file), offset=5, length=7, timeout=10.0) == b"content"
+        assert await driver.read_range(str(temp_file), offset=5, length=None, timeout=10.0) == b"content"
+        assert await driver.read_range(str(temp_file), offset=5, length=100, timeout=10.0) == b"content"
+        assert await driver.read_range(str(temp_file), offset=100, length=4, timeout=10.0) == b""
+
+    @pytest.mark.asyncio
+    async def test_read_range_empty_file(self, driver: LocalFileDriver, tmp_path: Path) -> None:
+        """Test reading a range of an empty file returns nothing."""
+        empty = tmp_path / "empty.bin"
+        empty.write_bytes(b"")
+
+        assert await driver.read_range(str(empty), offset=0, length=None, timeout=10.0) == b""
+
+    @pytest.mark.asyncio
+    async def test_read_range_file_not_found(self, driver: LocalFileDriver, tmp_path: Path) -> None:
+        """Test reading a range of a non-existent file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await driver.read_range(str(tmp_path / "nonexistent.txt"), offset=0, length=1, timeout=10.0)
+
+    @pytest.mark.asyncio
+    async def test_stream(self, driver: LocalFileDriver, tmp_path: Path) -> None:
+        """Test streaming a file yields its content in bounded chunks."""
+        data = bytes(range(256)) * 40
+        file_path = tmp_path / "data.bin"
+        file_path.write_bytes(data)
+
+        chunks = [chunk async for chunk in driver.stream(str(file_path), timeout=10.0, chunk_size=1000)]
+
+        assert b"".join(chunks) == data
+        assert max(len(chunk) for chunk in chunks) == 1000  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_stream_directory_raises_error(self, driver: LocalFileDriver, tmp_path: Path) -> None:
+        """Test streaming a directory raises IsADirectoryError."""
+        with pytest.raises(IsADirectoryError):
+            async for _chunk in driver.stream(str(tmp_path), timeout=10.0):
+                pass
+
     @pytest.mark.asyncio
     async def test_read_file_not_found(self, driver: LocalFileDriver, tmp_path: Path) -> None:
         """Test reading a non-existent file raises FileNotFoundError."""
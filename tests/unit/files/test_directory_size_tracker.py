@@ -0,0 +1,133 @@
+"""Unit tests for incremental directory size accounting."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from griptape_nodes.files import directory_size_tracker
+from griptape_nodes.files.directory_size_tracker import DirectorySizeTracker
+from griptape_nodes.retained_mode.managers.os_manager import OSManager
+
+
+def _write(path: Path, size: int, mtime: float) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def scan_counter() -> list[Path]:
+    """Record every directory walk made by the tracker."""
+    scans: list[Path] = []
+    original_scan = directory_size_tracker._scan_directory
+
+    def counting_scan(directory: Path) -> directory_size_tracker._DirectoryUsage:
+        scans.append(directory)
+        return original_scan(directory)
+
+    with patch.object(directory_size_tracker, "_scan_directory", counting_scan):
+        yield scans
+
+
+class TestDirectorySizeTracker:
+    def test_counts_files_in_nested_directories(self, tmp_path: Path) -> None:
+        _write(tmp_path / "a.bin", 10, 1000)
+        _write(tmp_path / "nested" / "deeper" / "b.bin", 20, 1000)
+
+        assert DirectorySizeTracker().get_size(tmp_path) == 30  # noqa: PLR2004
+
+    def test_symlinks_are_not_counted(self, tmp_path: Path) -> None:
+        target = _write(tmp_path / "outside" / "big.bin", 100, 1000)
+        watched = tmp_path / "watched"
+        _write(watched / "a.bin", 10, 1000)
+        (watched / "link.bin").symlink_to(target)
+
+        assert DirectorySizeTracker().get_size(watched) == 10  # noqa: PLR2004
+
+    def test_enforce_budget_deletes_oldest_first(self, tmp_path: Path, scan_counter: list[Path]) -> None:
+        oldest = _write(tmp_path / "nested" / "oldest.bin", 10, 1000)
+        middle = _write(tmp_path / "middle.bin", 10, 2000)
+        newest = _write(tmp_path / "newest.bin", 10, 3000)
+        tracker = DirectorySizeTracker()
+
+        removed_count = tracker.enforce_budget(tmp_path, 15)
+
+        assert removed_count == 2  # noqa: PLR2004
+        assert not oldest.exists()
+        assert not middle.exists()
+        assert newest.exists()
+        assert tracker.get_size(tmp_path) == 10  # noqa: PLR2004
+        assert scan_counter == [tmp_path.absolute()]
+
+    def test_enforce_budget_within_budget_deletes_nothing(self, tmp_path: Path) -> None:
+        kept = _write(tmp_path / "a.bin", 10, 1000)
+
+        assert DirectorySizeTracker().enforce_budget(tmp_path, 10) == 0
+        assert kept.exists()
+
+    def test_recorded_writes_and_deletes_update_totals_without_a_walk(
+        self, tmp_path: Path, scan_counter: list[Path]
+    ) -> None:
+        _write(tmp_path / "a.bin", 10, 1000)
+        tracker = DirectorySizeTracker()
+        assert tracker.get_size(tmp_path) == 10  # noqa: PLR2004
+
+        written = _write(tmp_path / "nested" / "b.bin", 25, 2000)
+        tracker.record_write(written)
+        assert tracker.get_size(tmp_path) == 35  # noqa: PLR2004
+
+        _write(written, 5, 2500)
+        tracker.record_write(written)
+        assert tracker.get_size(tmp_path) == 15  # noqa: PLR2004
+
+        written.unlink()
+        tracker.record_delete(written.parent)
+        assert tracker.get_size(tmp_path) == 10  # noqa: PLR2004
+
+        assert scan_counter == [tmp_path.absolute()]
+
+    def test_writes_outside_tracked_directories_are_ignored(self, tmp_path: Path) -> None:
+        tracked = tmp_path / "tracked"
+        _write(tracked / "a.bin", 10, 1000)
+        tracker = DirectorySizeTracker()
+        tracker.get_size(tracked)
+
+        tracker.record_write(_write(tmp_path / "elsewhere.bin", 50, 1000))
+
+        assert tracker.get_size(tracked) == 10  # noqa: PLR2004
+
+    def test_stale_totals_are_rescanned(self, tmp_path: Path, scan_counter: list[Path]) -> None:
+        _write(tmp_path / "a.bin", 10, 1000)
+        tracker = DirectorySizeTracker(rescan_interval=0.0)
+        tracker.get_size(tmp_path)
+
+        # Written without telling the tracker
+        _write(tmp_path / "b.bin", 10, 1000)
+
+        assert tracker.get_size(tmp_path) == 20  # noqa: PLR2004
+        assert len(scan_counter) == 2  # noqa: PLR2004
+
+
+class TestOSManagerDirectoryCleanup:
+    @pytest.fixture(autouse=True)
+    def fresh_tracker(self) -> None:
+        with patch.object(OSManager, "_directory_size_tracker", DirectorySizeTracker()):
+            yield
+
+    def test_cleanup_removes_oldest_nested_files(self, tmp_path: Path) -> None:
+        oldest = _write(tmp_path / "nested" / "oldest.bin", 1024, 1000)
+        newest = _write(tmp_path / "newest.bin", 1024, 2000)
+
+        assert OSManager.cleanup_directory_if_needed(tmp_path, 1024 / 1024**3)
+
+        assert not oldest.exists()
+        assert newest.exists()
+
+    def test_cleanup_under_limit_does_nothing(self, tmp_path: Path) -> None:
+        kept = _write(tmp_path / "nested" / "a.bin", 1024, 1000)
+
+        assert not OSManager.cleanup_directory_if_needed(tmp_path, 1.0)
+        assert kept.exists()
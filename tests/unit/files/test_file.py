@@ -9,6 +9,7 @@ import pytest
 from PIL import Image
 
 from griptape_nodes.common.macro_parser import MacroSyntaxError, ParsedMacro
+from griptape_nodes.files.drivers.local_file_driver import LocalFileDriver
 from griptape_nodes.files.file import (
     File,
     FileContent,
@@ -34,6 +35,7 @@ from griptape_nodes.retained_mode.events.project_events import (
 HANDLE_REQUEST_PATH = "griptape_nodes.files.file.GriptapeNodes.handle_request"
 AHANDLE_REQUEST_PATH = "griptape_nodes.files.file.GriptapeNodes.ahandle_request"
 CONFIG_MANAGER_PATH = "griptape_nodes.files.file.GriptapeNodes.ConfigManager"
+GET_DRIVER_PATH = "griptape_nodes.files.file.FileDriverRegistry.get_driver"
 
 
 class TestFileConstructor:
@@ -607,6 +609,48 @@ class TestFileAsync:
         assert mock_handle.call_count == expected_call_count
 
 
+class TestFileRangeAndStream:
+    """Tests for ranged and streamed reads."""
+
+    @pytest.mark.asyncio
+    async def test_aread_range_requests_only_the_range(self) -> None:
+        success_result = ReadFileResultSuccess(
+            result_details="OK",
+            content=b"\x02\x03",
+            file_size=2,
+            mime_type="application/octet-stream",
+            encoding=None,
+        )
+        with patch(AHANDLE_REQUEST_PATH, return_value=success_result) as mock_handle:
+            data = await File("/workspace/file.bin").aread_range(2, 2)
+
+        assert data == b"\x02\x03"
+        request = mock_handle.call_args.args[0]
+        assert request.byte_offset == 2  # noqa: PLR2004
+        assert request.byte_length == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_astream_reads_through_driver(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "data.bin"
+        file_path.write_bytes(b"x" * 10)
+
+        with patch(GET_DRIVER_PATH, return_value=LocalFileDriver()):
+            chunks = [chunk async for chunk in File(str(file_path)).astream(chunk_size=4)]
+
+        assert chunks == [b"xxxx", b"xxxx", b"xx"]
+
+    @pytest.mark.asyncio
+    async def test_astream_missing_file_raises_file_load_error(self, tmp_path: Path) -> None:
+        with (
+            patch(GET_DRIVER_PATH, return_value=LocalFileDriver()),
+            pytest.raises(FileLoadError) as exc_info,
+        ):
+            async for _chunk in File(str(tmp_path / "missing.bin")).astream():
+                pass
+
+        assert exc_info.value.failure_reason == FileIOFailureReason.FILE_NOT_FOUND
+
+
 class TestFileWrite:
     """Tests for File.write_bytes() and File.write_text()."""
 
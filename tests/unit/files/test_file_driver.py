@@ -200,3 +200,26 @@ class TestFileDriverPriority:
         assert drivers[0] is driver1
         assert drivers[1] is driver2
         assert drivers[2] is driver3
+
+
+class TestFileDriverDefaultRangeAndStream:
+    """Tests for the read_range/stream fallbacks built on read()."""
+
+    @pytest.mark.asyncio
+    async def test_read_range_slices_read(self) -> None:
+        driver = MockDriver("mock://")
+
+        assert await driver.read_range("mock://x", offset=5, length=4, timeout=1.0) == b"read"
+        assert await driver.read_range("mock://x", offset=11, length=None, timeout=1.0) == b"mock://x"
+
+    @pytest.mark.asyncio
+    async def test_read_range_rejects_negative_offset(self) -> None:
+        with pytest.raises(ValueError, match="offset"):
+            await MockDriver("mock://").read_range("mock://x", offset=-1, length=None, timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_chunks_in_order(self) -> None:
+        chunks = [chunk async for chunk in MockDriver("mock://").stream("mock://x", timeout=1.0, chunk_size=4)]
+
+        assert b"".join(chunks) == b"Mock read: mock://x"
+        assert all(len(chunk) <= 4 for chunk in chunks)  # noqa: PLR2004
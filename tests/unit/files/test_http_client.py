@@ -0,0 +1,166 @@
+"""Unit tests for the pooled HTTP client and response cache."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from griptape_nodes.files import directory_size_tracker
+from griptape_nodes.files.drivers.http_file_driver import HttpFileDriver
+from griptape_nodes.files.file_driver_registry import FileDriverRegistry
+from griptape_nodes.files.http_client import HttpClientPool, HttpResponseCache
+
+_URL = "https://example.com/asset.png"
+
+
+class _AssetServer:
+    """Stand-in server serving one asset with an ETag, honoring If-None-Match."""
+
+    def __init__(self, body: bytes = b"asset", headers: dict[str, str] | None = None) -> None:
+        self.body = body
+        self.etag = '"v1"'
+        self.headers = headers or {}
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        # Yield so concurrent downloads overlap
+        await asyncio.sleep(0)
+        if request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(200, content=self.body, headers={"ETag": self.etag, **self.headers})
+
+
+def _pool(server: _AssetServer, cache_dir: Path | None) -> HttpClientPool:
+    cache = HttpResponseCache(cache_dir) if cache_dir is not None else None
+    return HttpClientPool(response_cache=cache, transport=httpx.MockTransport(server))
+
+
+class TestHttpClientPool:
+    @pytest.mark.asyncio
+    async def test_client_is_reused(self) -> None:
+        pool = HttpClientPool()
+
+        assert pool.get_async_client() is pool.get_async_client()
+        assert pool.get_sync_client() is pool.get_sync_client()
+        await pool.aclose()
+
+    def test_client_is_closed_when_its_loop_shuts_down(self) -> None:
+        pool = HttpClientPool()
+
+        async def get_client() -> httpx.AsyncClient:
+            return pool.get_async_client()
+
+        client = asyncio.run(get_client())
+
+        assert client.is_closed
+        assert not pool._async_clients
+        assert not pool._closers
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_clients_and_new_ones_are_created(self) -> None:
+        pool = HttpClientPool()
+        client = pool.get_async_client()
+        sync_client = pool.get_sync_client()
+
+        await pool.aclose()
+
+        assert client.is_closed
+        assert sync_client.is_closed
+        assert pool.get_async_client() is not client
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_downloads_share_one_request(self) -> None:
+        server = _AssetServer()
+        pool = _pool(server, cache_dir=None)
+
+        bodies = await asyncio.gather(*(pool.download(_URL, timeout=5.0) for _ in range(5)))
+
+        assert bodies == [b"asset"] * 5
+        assert len(server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_unchanged_asset_is_revalidated_not_downloaded(self, tmp_path: Path) -> None:
+        server = _AssetServer()
+        pool = _pool(server, tmp_path)
+
+        assert await pool.download(_URL, timeout=5.0) == b"asset"
+        server.body = b"changed but same etag"
+        assert await pool.download(_URL, timeout=5.0) == b"asset"
+
+        assert server.requests[1].headers["if-none-match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_changed_asset_is_downloaded_again(self, tmp_path: Path) -> None:
+        server = _AssetServer()
+        pool = _pool(server, tmp_path)
+        await pool.download(_URL, timeout=5.0)
+
+        server.body = b"new asset"
+        server.etag = '"v2"'
+
+        assert await pool.download(_URL, timeout=5.0) == b"new asset"
+
+    @pytest.mark.asyncio
+    async def test_cache_key_overrides_url(self, tmp_path: Path) -> None:
+        server = _AssetServer()
+        pool = _pool(server, tmp_path)
+
+        await pool.download(f"{_URL}?signature=a", timeout=5.0, cache_key=_URL)
+        await pool.download(f"{_URL}?signature=b", timeout=5.0, cache_key=_URL)
+
+        assert server.requests[1].headers["if-none-match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises(self) -> None:
+        pool = HttpClientPool(transport=httpx.MockTransport(lambda _request: httpx.Response(404)))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await pool.download(_URL, timeout=5.0)
+
+
+class TestHttpResponseCache:
+    def test_no_store_responses_are_not_cached(self, tmp_path: Path) -> None:
+        cache = HttpResponseCache(tmp_path)
+
+        assert not cache.store(_URL, {"etag": '"v1"', "cache-control": "no-store"}, b"secret")
+        assert cache.get_validators(_URL) is None
+
+    def test_responses_without_validators_are_not_cached(self, tmp_path: Path) -> None:
+        cache = HttpResponseCache(tmp_path)
+
+        assert not cache.store(_URL, {}, b"body")
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path: Path) -> None:
+        cache = HttpResponseCache(tmp_path, max_size=150)
+        cache.store("first", {"etag": '"1"'}, b"a" * 60)
+        cache.store("second", {"etag": '"2"'}, b"b" * 60)
+
+        cache.store("third", {"etag": '"3"'}, b"c" * 60)
+
+        assert cache.read_body("first") is None
+        assert cache.read_body("third") == b"c" * 60
+
+    def test_storing_does_not_list_the_cache_each_time(self, tmp_path: Path) -> None:
+        cache = HttpResponseCache(tmp_path, max_size=1000)
+
+        with patch.object(
+            directory_size_tracker, "_scan_directory", wraps=directory_size_tracker._scan_directory
+        ) as scan:
+            for index in range(5):
+                cache.store(f"entry-{index}", {"etag": f'"{index}"'}, b"x" * 100)
+
+        scan.assert_called_once()
+
+
+class TestFileDriverRegistryHttpClientPool:
+    def test_network_drivers_share_the_registry_pool(self) -> None:
+        pool = HttpClientPool()
+        FileDriverRegistry.set_http_client_pool(pool)
+        try:
+            assert HttpFileDriver().http_client_pool is pool
+        finally:
+            FileDriverRegistry.set_http_client_pool(None)
@@ -0,0 +1,96 @@
+"""Unit tests for the cached sequential index allocator."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from griptape_nodes.files.sequential_index_allocator import SequentialIndexAllocator
+
+_PATTERN = "frame_*.png"
+
+
+def _touch_directory(directory: Path) -> None:
+    """Move the directory's mtime forward, as if another process had changed it."""
+    stat = directory.stat()
+    os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestSequentialIndexAllocator:
+    def test_fills_gaps(self, tmp_path: Path) -> None:
+        allocator = SequentialIndexAllocator()
+
+        assert allocator.next_index(tmp_path, _PATTERN, lambda: [1, 2, 4]) == 3  # noqa: PLR2004
+
+    def test_missing_directory_starts_at_one_without_scanning(self, tmp_path: Path) -> None:
+        scan = MagicMock(return_value=[1])
+
+        assert SequentialIndexAllocator().next_index(tmp_path / "missing", _PATTERN, scan) == 1
+        scan.assert_not_called()
+
+    def test_unchanged_directory_is_scanned_once(self, tmp_path: Path) -> None:
+        allocator = SequentialIndexAllocator()
+        scan = MagicMock(return_value=[1, 2])
+
+        for _ in range(3):
+            assert allocator.next_index(tmp_path, _PATTERN, scan) == 3  # noqa: PLR2004
+
+        scan.assert_called_once()
+
+    def test_reservations_give_concurrent_writers_distinct_indices(self, tmp_path: Path) -> None:
+        allocator = SequentialIndexAllocator()
+        scan = MagicMock(return_value=[1])
+
+        first = allocator.next_index(tmp_path, _PATTERN, scan, reserve=True)
+        second = allocator.next_index(tmp_path, _PATTERN, scan, reserve=True)
+
+        assert (first, second) == (2, 3)
+
+    def test_released_reservation_is_handed_out_again(self, tmp_path: Path) -> None:
+        allocator = SequentialIndexAllocator()
+        index = allocator.next_index(tmp_path, _PATTERN, list, reserve=True)
+
+        allocator.release(tmp_path, _PATTERN, index)
+
+        assert allocator.next_index(tmp_path, _PATTERN, list) == index
+
+    def test_lapsed_reservation_is_handed_out_again(self, tmp_path: Path) -> None:
+        allocator = SequentialIndexAllocator(reservation_timeout=0.0)
+        index = allocator.next_index(tmp_path, _PATTERN, list, reserve=True)
+
+        assert allocator.next_index(tmp_path, _PATTERN, list) == index
+
+    def test_recorded_write_does_not_force_a_rescan(self, tmp_path: Path) -> None:
+        allocator = SequentialIndexAllocator()
+        scan = MagicMock(return_value=[])
+
+        for expected_index in range(1, 4):
+            index = allocator.next_index(tmp_path, _PATTERN, scan, reserve=True)
+            assert index == expected_index
+            (tmp_path / f"frame_{index}.png").write_bytes(b"")
+            allocator.record_write(tmp_path, _PATTERN, index)
+
+        scan.assert_called_once()
+
+    def test_directory_change_triggers_rescan(self, tmp_path: Path) -> None:
+        allocator = SequentialIndexAllocator()
+        allocator.next_index(tmp_path, _PATTERN, list)
+
+        _touch_directory(tmp_path)
+
+        assert allocator.next_index(tmp_path, _PATTERN, lambda: [1, 2]) == 3  # noqa: PLR2004
+
+    def test_collision_triggers_rescan(self, tmp_path: Path) -> None:
+        allocator = SequentialIndexAllocator()
+        index = allocator.next_index(tmp_path, _PATTERN, list, reserve=True)
+
+        allocator.record_collision(tmp_path, _PATTERN, index)
+        scan = MagicMock(return_value=[1, 2, 3])
+
+        assert allocator.next_index(tmp_path, _PATTERN, scan) == 4  # noqa: PLR2004
+        scan.assert_called_once()
+
+    def test_patterns_are_tracked_separately(self, tmp_path: Path) -> None:
+        allocator = SequentialIndexAllocator()
+
+        assert allocator.next_index(tmp_path, "frame_*.png", lambda: [1]) == 2  # noqa: PLR2004
+        assert allocator.next_index(tmp_path, "render_*.png", list) == 1
@@ -0,0 +1,147 @@
+"""Tests for NodePriorityQueue."""
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+from griptape_nodes.machines.dag_builder import DagNode
+from griptape_nodes.machines.node_priority_queue import NodePriorityQueue
+
+
+def _make_dag_node(name: str, x: float = 0, y: float = 0, *, ready: bool = True) -> DagNode:
+    node = MagicMock()
+    node.name = name
+    node.metadata = {"position": {"x": x, "y": y}}
+    node.can_queue_for_execution.return_value = ready
+    return DagNode(node_reference=node)
+
+
+def _make_queue(*dag_nodes: DagNode) -> tuple[NodePriorityQueue, Any]:
+    context: Any = SimpleNamespace(
+        node_to_reference={dag_node.node_reference.name: dag_node for dag_node in dag_nodes},
+        last_resolved_node=None,
+    )
+    return NodePriorityQueue(context), context
+
+
+class TestNodePriorityQueue:
+    def test_get_next_node_empty(self) -> None:
+        queue, _ = _make_queue()
+
+        assert queue.get_next_node() is None
+
+    def test_nodes_pop_in_reading_order(self) -> None:
+        nodes = [
+            _make_dag_node("bottom_right", 500, 500),
+            _make_dag_node("top_left", 0, 0),
+            _make_dag_node("mid", 200, 200),
+        ]
+        queue, _ = _make_queue(*nodes)
+        for dag_node in nodes:
+            queue.add_node(dag_node)
+
+        assert [queue.get_next_node() for _ in range(3)] == ["top_left", "mid", "bottom_right"]
+        assert queue.get_next_node() is None
+
+    def test_ties_keep_insertion_order(self) -> None:
+        nodes = [_make_dag_node("first"), _make_dag_node("second"), _make_dag_node("third")]
+        queue, _ = _make_queue(*nodes)
+        for dag_node in nodes:
+            queue.add_node(dag_node)
+
+        assert [queue.get_next_node() for _ in range(3)] == ["first", "second", "third"]
+
+    def test_add_node_is_idempotent(self) -> None:
+        dag_node = _make_dag_node("node")
+        queue, _ = _make_queue(dag_node)
+        queue.add_node(dag_node)
+        queue.add_node(dag_node)
+
+        assert len(queue) == 1
+        assert queue.get_next_node() == "node"
+        assert queue.get_next_node() is None
+
+    def test_remove_node_is_lazily_skipped(self) -> None:
+        nodes = [_make_dag_node("a", 0, 0), _make_dag_node("b", 100, 100)]
+        queue, _ = _make_queue(*nodes)
+        for dag_node in nodes:
+            queue.add_node(dag_node)
+        queue.get_next_node()  # Scores and pops "a"
+        queue.add_node(nodes[0])
+
+        queue.remove_node("a")
+
+        assert "a" not in queue
+        assert queue.get_next_node() == "b"
+        assert queue.get_next_node() is None
+
+    def test_successor_of_last_resolved_node_is_rescored(self) -> None:
+        nodes = [_make_dag_node("a", 100, 100), _make_dag_node("b", 100, 100), _make_dag_node("done", 0, 0)]
+        queue, context = _make_queue(*nodes)
+        queue.add_node(nodes[0])
+        queue.add_node(nodes[1])
+        context.last_resolved_node = nodes[2].node_reference
+        queue.mark_priorities_stale()
+        assert queue.get_next_node() == "a"
+        # Re-queued after "b", so "a" would lose the tie without a rescore
+        queue.add_node(nodes[0])
+
+        queue._last_resolved_successors.add("a")
+        queue.mark_priorities_stale()
+
+        assert queue.get_next_node() == "a"
+        assert queue.get_next_node() == "b"
+
+    def test_unchanged_nodes_are_not_rescored(self) -> None:
+        nodes = [_make_dag_node("a", 0, 0), _make_dag_node("b", 100, 100), _make_dag_node("c", 50, 50)]
+        queue, _ = _make_queue(*nodes)
+        queue.add_node(nodes[0])
+        queue.add_node(nodes[1])
+        queue.get_next_node()
+        queue.add_node(nodes[0])
+
+        scored: list[set[str]] = []
+        original = queue._heuristics[0].calculate_priorities_batch
+
+        def record(dag_nodes: list[DagNode], **kwargs) -> dict[str, float]:
+            scored.append({dag_node.node_reference.name for dag_node in dag_nodes})
+            return original(dag_nodes, **kwargs)
+
+        queue._heuristics[0].calculate_priorities_batch = record  # type: ignore[method-assign]
+        queue.add_node(nodes[2])
+        queue.mark_priorities_stale()
+
+        assert queue.get_next_node() == "a"
+        assert scored == [{"a", "c"}]
+
+    def test_blocked_nodes_wake_on_completion(self) -> None:
+        blocked = _make_dag_node("blocked", ready=False)
+        queue, _ = _make_queue(blocked)
+        queue.add_node(blocked)
+
+        assert "blocked" in queue
+        assert queue.get_next_node() is None
+        blocked.node_reference.can_queue_for_execution.assert_called_once()
+
+        blocked.node_reference.can_queue_for_execution.return_value = True
+        # Without a completion the blocked node is not re-checked
+        assert queue.get_next_node() is None
+        blocked.node_reference.can_queue_for_execution.assert_called_once()
+
+        queue.mark_priorities_stale()
+
+        assert queue.get_next_node() == "blocked"
+
+    def test_check_blocked_nodes_promotes_ready_nodes(self) -> None:
+        blocked = _make_dag_node("blocked", ready=False)
+        still_blocked = _make_dag_node("still_blocked", ready=False)
+        queue, _ = _make_queue(blocked, still_blocked)
+        queue.add_node(blocked)
+        queue.add_node(still_blocked)
+
+        blocked.node_reference.can_queue_for_execution.return_value = True
+
+        assert queue.check_blocked_nodes() == 1
+        assert queue.get_next_node() == "blocked"
+        assert queue.get_next_node() is None
+        assert "still_blocked" in queue
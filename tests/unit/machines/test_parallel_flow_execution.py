@@ -11,6 +11,11 @@ from griptape_nodes.exe_types.node_types import BaseNode
 from griptape_nodes.machines.control_flow import ControlFlowMachine
 from griptape_nodes.machines.dag_builder import DagBuilder
 from griptape_nodes.machines.parallel_resolution import ExecuteDagState, ParallelResolutionMachine
+from griptape_nodes.retained_mode.events.parameter_events import (
+    BatchSetParameterValuesRequest,
+    BatchSetParameterValuesResultFailure,
+    BatchSetParameterValuesResultSuccess,
+)
 from griptape_nodes.retained_mode.managers.event_manager import EventManager
 from griptape_nodes.retained_mode.managers.settings import WorkflowExecutionMode
 
@@ -451,7 +456,11 @@ class TestCollectValuesFromUpstreamNodes:
             mock_flow_manager.return_value.get_connections.return_value = mock_connections
 
             mock_instance = MagicMock()
-            ahandle_request = AsyncMock(return_value=MagicMock())
+            ahandle_request = AsyncMock(
+                return_value=BatchSetParameterValuesResultSuccess(
+                    finalized_values={"prompt": "hello"}, result_details=""
+                )
+            )
             mock_instance.ahandle_request = ahandle_request
             mock_get_instance.return_value = mock_instance
 
@@ -463,7 +472,97 @@ class TestCollectValuesFromUpstreamNodes:
             ahandle_request.assert_awaited_once()
             await_args = ahandle_request.await_args
             assert await_args is not None
-            request = await_args.args[0]
+            batch_request = await_args.args[0]
+            assert isinstance(batch_request, BatchSetParameterValuesRequest)
+            assert batch_request.node_name == "target_node"
+            [request] = batch_request.set_value_requests
             assert request.node_name == "target_node"
             assert request.parameter_name == "prompt"
             assert request.value == "hello"
+            assert request.incoming_connection_source_node_name == "upstream_node"
+            assert request.incoming_connection_source_parameter_name == "out"
+
+    @pytest.mark.asyncio
+    async def test_all_upstream_values_are_sent_in_one_batch(self) -> None:
+        """Every connected input is passed in a single request, and unconnected inputs are skipped."""
+        upstream_node = MagicMock(spec=BaseNode)
+        upstream_node.name = "upstream_node"
+        upstream_node.parameter_output_values = {"a": 1, "b": 2}
+
+        parameters = []
+        for name in ("first", "second", "unconnected"):
+            parameter = MagicMock()
+            parameter.name = name
+            parameters.append(parameter)
+
+        target_node = MagicMock(spec=BaseNode)
+        target_node.name = "target_node"
+        target_node.lock = False
+        target_node.parameters = parameters
+
+        node_reference = MagicMock()
+        node_reference.node_reference = target_node
+
+        def connected_node(_node: BaseNode, parameter: MagicMock, direction: Direction) -> tuple | None:  # noqa: ARG001
+            source_parameter_name = {"first": "a", "second": "b"}.get(parameter.name)
+            if source_parameter_name is None:
+                return None
+            upstream_parameter = MagicMock()
+            upstream_parameter.name = source_parameter_name
+            upstream_parameter.output_type = "int"
+            return upstream_node, upstream_parameter
+
+        with (
+            patch("griptape_nodes.retained_mode.griptape_nodes.GriptapeNodes.FlowManager") as mock_flow_manager,
+            patch("griptape_nodes.retained_mode.griptape_nodes.GriptapeNodes.get_instance") as mock_get_instance,
+        ):
+            mock_flow_manager.return_value.get_connections.return_value.get_connected_node.side_effect = connected_node
+            ahandle_request = AsyncMock(
+                return_value=BatchSetParameterValuesResultSuccess(finalized_values={}, result_details="")
+            )
+            mock_get_instance.return_value.ahandle_request = ahandle_request
+
+            await ExecuteDagState.collect_values_from_upstream_nodes(node_reference)
+
+            ahandle_request.assert_awaited_once()
+            batch_request = ahandle_request.await_args.args[0]
+            assert [(request.parameter_name, request.value) for request in batch_request.set_value_requests] == [
+                ("first", 1),
+                ("second", 2),
+            ]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_raises(self) -> None:
+        """A value the node rejects fails the node, naming the parameter."""
+        upstream_node = MagicMock(spec=BaseNode)
+        upstream_node.name = "upstream_node"
+        upstream_node.parameter_output_values = {"out": "hello"}
+        upstream_parameter = MagicMock()
+        upstream_parameter.name = "out"
+
+        target_parameter = MagicMock()
+        target_parameter.name = "prompt"
+        target_node = MagicMock(spec=BaseNode)
+        target_node.name = "target_node"
+        target_node.lock = False
+        target_node.parameters = [target_parameter]
+
+        node_reference = MagicMock()
+        node_reference.node_reference = target_node
+
+        with (
+            patch("griptape_nodes.retained_mode.griptape_nodes.GriptapeNodes.FlowManager") as mock_flow_manager,
+            patch("griptape_nodes.retained_mode.griptape_nodes.GriptapeNodes.get_instance") as mock_get_instance,
+        ):
+            mock_flow_manager.return_value.get_connections.return_value.get_connected_node.return_value = (
+                upstream_node,
+                upstream_parameter,
+            )
+            mock_get_instance.return_value.ahandle_request = AsyncMock(
+                return_value=BatchSetParameterValuesResultFailure(
+                    result_details="bad type", failed_parameter_name="prompt"
+                )
+            )
+
+            with pytest.raises(RuntimeError, match=r"parameter 'prompt'.*bad type"):
+                await ExecuteDagState.collect_values_from_upstream_nodes(node_reference)
@@ -0,0 +1,122 @@
+"""Tests for the cached spatial summary used by priority heuristics."""
+
+# ruff: noqa: PLR2004
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
+from griptape_nodes.machines.dag_builder import DagNode
+from griptape_nodes.machines.heuristics import DistanceToNode, SpatialIndex, TopLeftToBottomRight
+
+
+def _make_dag_node(name: str, x: float, y: float) -> DagNode:
+    node = MagicMock()
+    node.name = name
+    node.metadata = {"position": {"x": x, "y": y}}
+    return DagNode(node_reference=node)
+
+
+def _make_context(*dag_nodes: DagNode) -> Any:
+    return SimpleNamespace(node_to_reference={dag_node.node_reference.name: dag_node for dag_node in dag_nodes})
+
+
+class TestSpatialIndex:
+    def test_empty_dag_has_no_bounds(self) -> None:
+        index = SpatialIndex(_make_context())
+
+        assert index.reading_order_bounds() is None
+        assert index.distance_squared_bounds((0, 0)) is None
+
+    def test_reading_order_bounds(self) -> None:
+        context = _make_context(_make_dag_node("a", 0, 10), _make_dag_node("b", 30, 40), _make_dag_node("c", 5, 5))
+        index = SpatialIndex(context)
+
+        assert index.reading_order_bounds() == (10, 70)
+
+    def test_distance_bounds_match_brute_force(self) -> None:
+        positions = [(0, 0), (100, 0), (0, 100), (100, 100), (50, 50), (20, 80), (70, 10)]
+        dag_nodes = [_make_dag_node(f"n{i}", x, y) for i, (x, y) in enumerate(positions)]
+        index = SpatialIndex(_make_context(*dag_nodes))
+
+        for origin in [*positions, (500, -20)]:
+            distances = [(x - origin[0]) ** 2 + (y - origin[1]) ** 2 for x, y in positions]
+            assert index.distance_squared_bounds(origin) == (min(distances), max(distances))
+
+    def test_rebuilds_when_node_added(self) -> None:
+        context = _make_context(_make_dag_node("a", 0, 0))
+        index = SpatialIndex(context)
+        assert index.reading_order_bounds() == (0, 0)
+        version = index.version
+
+        context.node_to_reference["b"] = _make_dag_node("b", 10, 10)
+
+        assert index.reading_order_bounds() == (0, 20)
+        assert index.version == version + 1
+
+    def test_rebuilds_when_node_replaced(self) -> None:
+        context = _make_context(_make_dag_node("a", 0, 0), _make_dag_node("b", 10, 10))
+        index = SpatialIndex(context)
+        assert index.reading_order_bounds() == (0, 20)
+
+        del context.node_to_reference["b"]
+        context.node_to_reference["c"] = _make_dag_node("c", 30, 30)
+
+        assert index.reading_order_bounds() == (0, 60)
+
+    def test_rebuilds_when_node_object_swapped_under_same_name(self) -> None:
+        context = _make_context(_make_dag_node("a", 0, 0), _make_dag_node("b", 10, 10))
+        index = SpatialIndex(context)
+        assert index.reading_order_bounds() == (0, 20)
+
+        context.node_to_reference["b"] = _make_dag_node("b", 40, 40)
+
+        assert index.reading_order_bounds() == (0, 80)
+
+    def test_rebuilds_when_scored_node_moved(self) -> None:
+        moving = _make_dag_node("moving", 10, 10)
+        index = SpatialIndex(_make_context(_make_dag_node("a", 0, 0), moving))
+        assert index.reading_order_bounds() == (0, 20)
+
+        moving.node_reference.metadata["position"] = {"x": 50, "y": 50}
+        assert index.position(moving) == (50, 50)
+
+        assert index.reading_order_bounds() == (0, 100)
+
+    def test_does_not_rebuild_when_unchanged(self) -> None:
+        dag_node = _make_dag_node("a", 0, 0)
+        index = SpatialIndex(_make_context(dag_node, _make_dag_node("b", 1, 1)))
+        index.refresh()
+        version = index.version
+
+        index.position(dag_node)
+        index.reading_order_bounds()
+
+        assert index.version == version
+
+
+class TestSpatialHeuristics:
+    def test_top_left_scores_are_independent_of_batch(self) -> None:
+        dag_nodes = [_make_dag_node("a", 0, 0), _make_dag_node("b", 50, 50), _make_dag_node("c", 100, 100)]
+        heuristic = TopLeftToBottomRight(_make_context(*dag_nodes))
+
+        batch_scores = heuristic.calculate_priorities_batch(dag_nodes)
+
+        assert batch_scores == {"a": 100.0, "b": 50.5, "c": 1.0}
+        assert heuristic.calculate_priorities_batch([dag_nodes[1]]) == {"b": 50.5}
+        assert heuristic.calculate_priority(dag_nodes[1]) == 50.5
+
+    def test_distance_scores_are_independent_of_batch(self) -> None:
+        dag_nodes = [_make_dag_node("prev", 0, 0), _make_dag_node("near", 0, 10), _make_dag_node("far", 0, 20)]
+        heuristic = DistanceToNode(_make_context(*dag_nodes))
+
+        batch_scores = heuristic.calculate_priorities_batch(dag_nodes[1:], previous_executed_node=dag_nodes[0])
+
+        assert batch_scores == {"near": 100.0 - 0.25 * 99.0, "far": 1.0}
+        assert heuristic.calculate_priority(dag_nodes[1], previous_executed_node=dag_nodes[0]) == batch_scores["near"]
+
+    def test_distance_without_previous_node_is_neutral(self) -> None:
+        dag_node = _make_dag_node("a", 0, 0)
+        heuristic = DistanceToNode(_make_context(dag_node))
+
+        assert heuristic.calculate_priority(dag_node) == 50.0
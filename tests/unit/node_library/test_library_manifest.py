@@ -0,0 +1,292 @@
+"""Tests for the library manifest and lazily imported node types."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import os
+import pickle
+import sys
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from griptape_nodes.exe_types.node_types import BaseNode, DataNode, EndNode
+from griptape_nodes.node_library.library_manifest import (
+    LazyModuleAlias,
+    LibraryManifest,
+    NodeManifestEntry,
+    compute_library_fingerprint,
+    get_class_path,
+    load_library_manifest,
+    write_library_manifest,
+)
+from griptape_nodes.node_library.library_registry import (
+    LazyNodeType,
+    Library,
+    LibraryMetadata,
+    LibrarySchema,
+    NodeDefinition,
+    NodeMetadata,
+)
+from griptape_nodes.retained_mode.managers.library_manager import LibraryManager
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
+
+_NODE_SOURCE = """
+from griptape_nodes.exe_types.node_types import DataNode
+
+
+class ManifestNode(DataNode):
+    def process(self) -> None:
+        pass
+"""
+
+
+class _ManifestTestNode(DataNode):
+    def process(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def manifest_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep manifests written by these tests out of the user's cache directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+    return cache_dir
+
+
+def _schema(class_name: str = "ManifestNode") -> LibrarySchema:
+    return LibrarySchema(
+        name="manifest-lib",
+        library_schema_version=LibrarySchema.LATEST_SCHEMA_VERSION,
+        metadata=LibraryMetadata(author="t", description="d", library_version="1.0.0", engine_version="1.0.0", tags=[]),
+        categories=[],
+        nodes=[
+            NodeDefinition(
+                class_name=class_name,
+                file_path="nodes.py",
+                metadata=NodeMetadata(category="t", description="d", display_name=class_name),
+            )
+        ],
+    )
+
+
+def _library_dir(tmp_path: Path) -> Path:
+    library_dir = tmp_path / "library"
+    library_dir.mkdir()
+    (library_dir / "griptape_nodes_library.json").write_text("{}")
+    (library_dir / "nodes.py").write_text(_NODE_SOURCE)
+    return library_dir
+
+
+def _library_info(library_dir: Path) -> LibraryManager.LibraryInfo:
+    return LibraryManager.LibraryInfo(
+        lifecycle_state=LibraryManager.LibraryLifecycleState.DEPENDENCIES_INSTALLED,
+        fitness=LibraryManager.LibraryFitness.NOT_EVALUATED,
+        library_path=str(library_dir / "griptape_nodes_library.json"),
+        is_sandbox=False,
+        library_name="manifest-lib",
+        library_version="1.0.0",
+    )
+
+
+class TestLibraryManifest:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        library_dir = _library_dir(tmp_path)
+        library_file = library_dir / "griptape_nodes_library.json"
+        fingerprint = compute_library_fingerprint(library_file, library_dir)
+        manifest = LibraryManifest(
+            fingerprint=fingerprint,
+            nodes=[NodeManifestEntry(class_name="ManifestNode", file_path="nodes.py", base_classes=["a.B"])],
+        )
+
+        write_library_manifest(library_file, manifest)
+
+        assert load_library_manifest(library_file, fingerprint) == manifest
+
+    def test_editing_a_source_makes_the_manifest_stale(self, tmp_path: Path) -> None:
+        library_dir = _library_dir(tmp_path)
+        library_file = library_dir / "griptape_nodes_library.json"
+        fingerprint = compute_library_fingerprint(library_file, library_dir)
+        write_library_manifest(library_file, LibraryManifest(fingerprint=fingerprint, nodes=[]))
+
+        helper = library_dir / "helpers" / "util.py"
+        helper.parent.mkdir()
+        helper.write_text("VALUE = 1\n")
+        new_fingerprint = compute_library_fingerprint(library_file, library_dir)
+
+        assert new_fingerprint != fingerprint
+        assert load_library_manifest(library_file, new_fingerprint) is None
+
+    def test_virtual_environments_are_not_fingerprinted(self, tmp_path: Path) -> None:
+        library_dir = _library_dir(tmp_path)
+        library_file = library_dir / "griptape_nodes_library.json"
+        fingerprint = compute_library_fingerprint(library_file, library_dir)
+
+        site_packages = library_dir / ".venv" / "lib"
+        site_packages.mkdir(parents=True)
+        (site_packages / "dependency.py").write_text("VALUE = 1\n")
+
+        assert compute_library_fingerprint(library_file, library_dir) == fingerprint
+
+    def test_changing_venv_packages_makes_the_manifest_stale(self, tmp_path: Path) -> None:
+        library_dir = _library_dir(tmp_path)
+        library_file = library_dir / "griptape_nodes_library.json"
+        site_packages = library_dir / ".venv" / "lib" / "site-packages"
+        site_packages.mkdir(parents=True)
+        fingerprint = compute_library_fingerprint(library_file, library_dir, site_packages)
+
+        (site_packages / "dependency-2.0.dist-info").mkdir()
+        stat = site_packages.stat()
+        os.utime(site_packages, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert compute_library_fingerprint(library_file, library_dir, site_packages) != fingerprint
+
+    def test_corrupt_manifest_is_ignored(self, tmp_path: Path, manifest_cache: Path) -> None:
+        library_file = tmp_path / "griptape_nodes_library.json"
+        write_library_manifest(library_file, LibraryManifest(fingerprint="f", nodes=[]))
+        for manifest_path in manifest_cache.rglob("*.json"):
+            manifest_path.write_text("not json")
+
+        assert load_library_manifest(library_file, "f") is None
+
+
+class TestLazyNodeTypes:
+    def _library(self) -> Library:
+        return Library(library_data=_schema("_ManifestTestNode"))
+
+    def test_class_is_imported_on_first_use_only(self) -> None:
+        library = self._library()
+        load_node_class = MagicMock(return_value=_ManifestTestNode)
+        library.register_lazy_node_type(
+            "_ManifestTestNode",
+            NodeMetadata(category="t", description="d", display_name="n"),
+            LazyNodeType(load_node_class=load_node_class, base_classes=frozenset()),
+        )
+
+        assert library.has_node_type("_ManifestTestNode")
+        assert library.get_registered_nodes() == ["_ManifestTestNode"]
+        load_node_class.assert_not_called()
+
+        node = library.create_node("_ManifestTestNode", name="node")
+        assert library.get_node_class("_ManifestTestNode") is _ManifestTestNode
+
+        assert isinstance(node, _ManifestTestNode)
+        load_node_class.assert_called_once()
+
+    def test_base_type_lookup_does_not_import(self) -> None:
+        library = self._library()
+        load_node_class = MagicMock(return_value=_ManifestTestNode)
+        library.register_lazy_node_type(
+            "_ManifestTestNode",
+            NodeMetadata(category="t", description="d", display_name="n"),
+            LazyNodeType(
+                load_node_class=load_node_class,
+                base_classes=frozenset(get_class_path(cls) for cls in _ManifestTestNode.__mro__),
+            ),
+        )
+
+        assert library.get_nodes_by_base_type(DataNode) == ["_ManifestTestNode"]
+        assert library.get_nodes_by_base_type(EndNode) == []
+        load_node_class.assert_not_called()
+
+    def test_unregister_lazy_node_type(self) -> None:
+        library = self._library()
+        library.register_lazy_node_type(
+            "_ManifestTestNode",
+            NodeMetadata(category="t", description="d", display_name="n"),
+            LazyNodeType(load_node_class=MagicMock(), base_classes=frozenset()),
+        )
+
+        library.unregister_node_type("_ManifestTestNode")
+
+        assert not library.has_node_type("_ManifestTestNode")
+
+
+class TestLibraryManagerLazyNodeImports:
+    def _load(self, griptape_nodes: GriptapeNodes, library_dir: Path) -> Library:
+        library_manager = griptape_nodes.LibraryManager()
+        library = Library(library_data=_schema())
+        library_manager._attempt_load_nodes_from_library(
+            library_data=library.get_library_data(),
+            library=library,
+            base_dir=library_dir,
+            library_info=_library_info(library_dir),
+        )
+        return library
+
+    def test_second_load_registers_nodes_from_the_manifest(self, griptape_nodes: GriptapeNodes, tmp_path: Path) -> None:
+        library_dir = _library_dir(tmp_path)
+        library_manager = griptape_nodes.LibraryManager()
+
+        first = self._load(griptape_nodes, library_dir)
+        assert "ManifestNode" in first._node_types
+
+        with patch.object(
+            library_manager, "_load_class_from_file", wraps=library_manager._load_class_from_file
+        ) as mock_load_class:
+            second = self._load(griptape_nodes, library_dir)
+            assert "ManifestNode" in second._lazy_node_types
+            assert second.get_nodes_by_base_type(DataNode) == ["ManifestNode"]
+            mock_load_class.assert_not_called()
+
+            node_class = second.get_node_class("ManifestNode")
+
+        assert issubclass(node_class, BaseNode)
+        mock_load_class.assert_called_once()
+
+    def test_dynamic_module_names_are_stable_across_processes(
+        self, griptape_nodes: GriptapeNodes, tmp_path: Path
+    ) -> None:
+        library_dir = _library_dir(tmp_path)
+        node_file = library_dir / "nodes.py"
+
+        module = griptape_nodes.LibraryManager()._load_module_from_file(node_file, "manifest-lib")
+
+        path_digest = hashlib.sha256(str(node_file).encode()).hexdigest()[:16]
+        assert module.__name__ == f"gtn_dynamic_module_nodes_py_{path_digest}"
+
+    def test_lazy_node_module_is_importable_by_stable_name(self, griptape_nodes: GriptapeNodes, tmp_path: Path) -> None:
+        library_dir = _library_dir(tmp_path)
+        library_manager = griptape_nodes.LibraryManager()
+        self._load(griptape_nodes, library_dir)
+        # As in a new session, where nothing has imported the library's modules yet
+        library_manager._unregister_all_stable_module_aliases_for_library("manifest-lib")
+        try:
+            library = self._load(griptape_nodes, library_dir)
+            assert "ManifestNode" in library._lazy_node_types
+
+            stable_namespace = "griptape_nodes.node_libraries.manifest_lib.nodes"
+            assert isinstance(sys.modules[stable_namespace], LazyModuleAlias)
+            imported_class = importlib.import_module(stable_namespace).ManifestNode
+            unpickled_class = pickle.loads(f"c{stable_namespace}\nManifestNode\n.".encode())  # noqa: S301
+
+            assert imported_class is unpickled_class
+            assert library.get_node_class("ManifestNode") is imported_class
+        finally:
+            library_manager._unregister_all_stable_module_aliases_for_library("manifest-lib")
+
+    def test_changed_sources_are_imported_eagerly(self, griptape_nodes: GriptapeNodes, tmp_path: Path) -> None:
+        library_dir = _library_dir(tmp_path)
+        self._load(griptape_nodes, library_dir)
+
+        node_file = library_dir / "nodes.py"
+        node_file.write_text(_NODE_SOURCE + "\n# edited\n")
+        stat = node_file.stat()
+        os.utime(node_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert "ManifestNode" in self._load(griptape_nodes, library_dir)._node_types
+
+    def test_lazy_imports_can_be_disabled(self, griptape_nodes: GriptapeNodes, tmp_path: Path) -> None:
+        library_dir = _library_dir(tmp_path)
+        self._load(griptape_nodes, library_dir)
+
+        with patch.object(griptape_nodes.ConfigManager(), "get_config_value", return_value=False):
+            library = self._load(griptape_nodes, library_dir)
+
+        assert "ManifestNode" in library._node_types
@@ -0,0 +1,150 @@
+"""Tests for event codec selection and event serialization through the codec."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+
+from griptape_nodes.retained_mode.events import event_codec
+from griptape_nodes.retained_mode.events.base_events import ExecutionEvent
+from griptape_nodes.retained_mode.events.event_codec import (
+    EventCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    get_event_codec,
+    register_event_codec,
+    set_event_codec,
+)
+from griptape_nodes.retained_mode.events.execution_events import NodeResolvedEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class _RecordingCodec(StdlibJsonCodec):
+    name = "recording"
+
+    dumped: list[Any] = []  # noqa: RUF012
+
+    def dumps(self, value: Any, *, default: Callable[[Any], Any] | None = None) -> str:
+        self.dumped.append(value)
+        return super().dumps(value, default=default)
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+def _available_codecs() -> list[EventCodec]:
+    codecs: list[EventCodec] = [StdlibJsonCodec()]
+    if OrjsonCodec.is_available():
+        codecs.append(OrjsonCodec())
+    return codecs
+
+
+@pytest.fixture
+def codec_registry() -> Iterator[None]:
+    """Isolate codec registration and selection to the test."""
+    with (
+        patch.object(event_codec, "_codec_types", dict(event_codec._codec_types)),
+        patch.object(event_codec, "_active_codec", None),
+    ):
+        yield
+
+
+@pytest.mark.usefixtures("codec_registry")
+class TestEventCodecSelection:
+    def test_uses_stdlib_json_unless_configured(self) -> None:
+        register_event_codec(_RecordingCodec)
+
+        with (
+            patch.object(OrjsonCodec, "is_available", return_value=True),
+            patch.dict("os.environ", {event_codec.EVENT_CODEC_ENV_VAR: ""}),
+        ):
+            codec = get_event_codec()
+
+        assert type(codec) is StdlibJsonCodec
+
+    def test_configured_codec_is_used(self) -> None:
+        register_event_codec(_RecordingCodec)
+
+        with patch.dict("os.environ", {event_codec.EVENT_CODEC_ENV_VAR: "recording"}):
+            codec = get_event_codec()
+
+        assert isinstance(codec, _RecordingCodec)
+
+    def test_unknown_configured_codec_falls_back(self) -> None:
+        with patch.object(OrjsonCodec, "is_available", return_value=False):
+            assert isinstance(set_event_codec("msgpack"), StdlibJsonCodec)
+
+    def test_codecs_round_trip_json(self) -> None:
+        value = {"a": [1, 2.5, None, True], "b": {"c": "é"}}
+
+        for codec in _available_codecs():
+            assert codec.loads(codec.dumps(value)) == value
+            with pytest.raises(json.JSONDecodeError):
+                codec.loads("{not json")
+
+
+@pytest.mark.usefixtures("codec_registry")
+class TestEventSerialization:
+    def test_event_json_uses_active_codec(self) -> None:
+        register_event_codec(_RecordingCodec)
+        set_event_codec("recording")
+        _RecordingCodec.dumped.clear()
+        event = ExecutionEvent(payload=NodeResolvedEvent(node_name="n", parameter_output_values={}, node_type="Node"))
+
+        data = json.loads(event.json())
+
+        assert data["payload"]["node_name"] == "n"
+        assert data["payload_type"] == "NodeResolvedEvent"
+        assert _RecordingCodec.dumped == [data]
+
+    def test_dict_serializes_payload_only_once(self) -> None:
+        event = ExecutionEvent(payload=NodeResolvedEvent(node_name="n", parameter_output_values={}, node_type="Node"))
+
+        with patch.object(ExecutionEvent, "model_dump", wraps=event.model_dump) as model_dump:
+            event.dict()
+
+        assert model_dump.call_args.kwargs["exclude"] == {"payload"}
+
+    @pytest.mark.parametrize("codec", _available_codecs(), ids=lambda codec: codec.name)
+    def test_codecs_encode_events_like_the_stdlib(self, codec: EventCodec) -> None:
+        value_id = uuid.uuid4()
+        event = ExecutionEvent(
+            payload=NodeResolvedEvent(
+                node_name="n",
+                parameter_output_values={
+                    "when": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+                    "id": value_id,
+                    "point": _Point(1, 2),
+                    "big": 2**70,
+                },
+                node_type="Node",
+            )
+        )
+
+        with patch.object(event_codec, "_active_codec", StdlibJsonCodec()):
+            expected = event.json()
+        with patch.object(event_codec, "_active_codec", codec):
+            encoded = event.json()
+
+        assert json.loads(encoded) == json.loads(expected)
+
+    @pytest.mark.parametrize("codec", _available_codecs(), ids=lambda codec: codec.name)
+    def test_unencodable_values_go_through_default(self, codec: EventCodec) -> None:
+        value = {"when": datetime(2024, 1, 2, tzinfo=UTC), "id": uuid.UUID(int=1), "point": _Point(1, 2)}
+
+        assert json.loads(codec.dumps(value, default=str)) == {
+            "when": "2024-01-02 00:00:00+00:00",
+            "id": "00000000-0000-0000-0000-000000000001",
+            "point": "_Point(x=1, y=2)",
+        }
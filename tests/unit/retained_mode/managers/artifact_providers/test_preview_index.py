@@ -0,0 +1,156 @@
+"""Tests for the persistent preview index."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from griptape_nodes.retained_mode.managers.artifact_providers.preview_index import (
+    IndexedPreview,
+    PreviewIndex,
+    compute_preview_key,
+    hash_source_file,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _key(content_hash: str = "abc", **overrides: object) -> str:
+    fields: dict = {
+        "provider_name": "Image",
+        "generator_name": "Standard Thumbnail Generation",
+        "generator_parameters": {"max_width": 1024, "max_height": 1024},
+        "preview_format": "webp",
+        "metadata_version": "0.2.0",
+    }
+    fields.update(overrides)
+    return compute_preview_key(content_hash, **fields)
+
+
+class TestComputePreviewKey:
+    def test_parameter_order_does_not_matter(self) -> None:
+        assert _key(generator_parameters={"max_width": 1, "max_height": 2}) == _key(
+            generator_parameters={"max_height": 2, "max_width": 1}
+        )
+
+    def test_settings_change_the_key(self) -> None:
+        assert _key() != _key("other")
+        assert _key() != _key(generator_parameters={"max_width": 512, "max_height": 1024})
+        assert _key() != _key(preview_format="png")
+
+
+class TestPreviewIndex:
+    def test_previews_persist_across_instances(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "index.sqlite3"
+        preview = IndexedPreview(
+            paths_to_preview={"r": "/p/r.png", "g": "/p/g.png"},
+            artifact_metadata={"width": 4},
+            preview_file_stamps={"/p/r.png": (1, 2), "/p/g.png": (3, 4)},
+        )
+        index = PreviewIndex(db_path)
+        index.put_preview("key", preview)
+        index.flush()
+
+        assert PreviewIndex(db_path).get_preview("key") == preview
+        assert PreviewIndex(db_path).get_preview("missing") is None
+
+    def test_source_hash_is_only_returned_for_unchanged_source(self, tmp_path: Path) -> None:
+        index = PreviewIndex(tmp_path / "index.sqlite3")
+        index.set_source_hash("/a.png", 10, 1.5, "abc")
+
+        assert index.get_source_hash("/a.png", 10, 1.5) == "abc"
+        assert index.get_source_hash("/a.png", 11, 1.5) is None
+        assert index.get_source_hash("/a.png", 10, 2.5) is None
+
+    def test_entries_evicted_from_memory_are_read_from_disk(self, tmp_path: Path) -> None:
+        index = PreviewIndex(tmp_path / "index.sqlite3", memory_cache_size=1)
+        index.put_preview("first", IndexedPreview(paths_to_preview="/p/first.webp", preview_file_stamps={}))
+        index.put_preview("second", IndexedPreview(paths_to_preview="/p/second.webp", preview_file_stamps={}))
+        index.flush()
+
+        assert index.get_preview("first") == IndexedPreview(paths_to_preview="/p/first.webp", preview_file_stamps={})
+
+    def test_database_from_another_version_is_rebuilt(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "index.sqlite3"
+        index = PreviewIndex(db_path)
+        index.put_preview("key", IndexedPreview(paths_to_preview="/p/a.webp"))
+        index.close()
+        with sqlite3.connect(db_path) as connection:
+            connection.execute("PRAGMA user_version = 0")
+
+        assert PreviewIndex(db_path).get_preview("key") is None
+
+    def test_unusable_database_is_a_miss(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "index.sqlite3"
+        db_path.write_text("not a database")
+        index = PreviewIndex(db_path)
+
+        index.put_preview("key", IndexedPreview(paths_to_preview="/p/a.webp"))
+        index.flush()
+
+        assert PreviewIndex(db_path).get_preview("key") is None
+
+    def test_files_unchanged(self, tmp_path: Path) -> None:
+        preview_file = tmp_path / "preview.webp"
+        preview_file.write_bytes(b"preview")
+
+        assert IndexedPreview.from_files(str(preview_file)).files_unchanged()
+        assert not IndexedPreview.from_files({"a": str(preview_file), "b": str(tmp_path / "gone")}).files_unchanged()
+
+    def test_regenerated_preview_file_is_not_reused(self, tmp_path: Path) -> None:
+        preview_file = tmp_path / "preview.webp"
+        preview_file.write_bytes(b"preview of the old content")
+        preview = IndexedPreview.from_files(str(preview_file))
+
+        # Regenerating the preview for edited source content overwrites the same file
+        preview_file.write_bytes(b"preview of the new content")
+        stat = preview_file.stat()
+        os.utime(preview_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert not preview.files_unchanged()
+
+    def test_database_is_written_off_the_calling_thread_in_batches(self, tmp_path: Path) -> None:
+        index = PreviewIndex(tmp_path / "index.sqlite3")
+        connect_threads = []
+        original_connect = index._connect
+
+        def recording_connect() -> sqlite3.Connection:
+            connect_threads.append(threading.current_thread())
+            return original_connect()
+
+        with patch.object(index, "_connect", recording_connect):
+            for number in range(5):
+                index.put_preview(f"key{number}", IndexedPreview(paths_to_preview=f"/p/{number}.webp"))
+            index.flush()
+
+        assert len(connect_threads) == 1
+        assert connect_threads[0] is not threading.current_thread()
+        assert PreviewIndex(tmp_path / "index.sqlite3").get_preview("key4") is not None
+
+    @pytest.mark.asyncio
+    async def test_async_reads_find_entries(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "index.sqlite3"
+        index = PreviewIndex(db_path)
+        index.set_source_hash("/a.png", 10, 1.5, "abc")
+        index.put_preview("key", IndexedPreview(paths_to_preview="/p/a.webp", preview_file_stamps={}))
+        await asyncio.to_thread(index.flush)
+
+        reopened = PreviewIndex(db_path)
+        assert await reopened.aget_source_hash("/a.png", 10, 1.5) == "abc"
+        assert await reopened.aget_preview("key") == IndexedPreview(
+            paths_to_preview="/p/a.webp", preview_file_stamps={}
+        )
+        assert await reopened.aget_preview("missing") is None
+
+    def test_identical_content_hashes_equal(self, tmp_path: Path) -> None:
+        (tmp_path / "a.png").write_bytes(b"same")
+        (tmp_path / "b.png").write_bytes(b"same")
+
+        assert hash_source_file(tmp_path / "a.png") == hash_source_file(tmp_path / "b.png")
@@ -1,9 +1,11 @@
 import json
 import os
+import shutil
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
+from unittest.mock import patch
 
 import anyio
 import pytest
@@ -1418,6 +1420,89 @@ class TestGetPreviewForArtifact:
         assert isinstance(result, GetPreviewForArtifactResultSuccess)
         assert result.paths_to_preview is not None
 
+    def test_copy_of_source_shares_indexed_preview(
+        self,
+        artifact_manager: ArtifactManager,
+        test_macro_path: MacroPath,
+        test_image_path: Path,
+        temp_dir: Path,
+    ) -> None:
+        """Test that an identical source at another path is served the indexed preview instead of generating one."""
+        import asyncio
+
+        request = GetPreviewForArtifactRequest(macro_path=test_macro_path, artifact_provider_name="Image")
+        generated = asyncio.run(artifact_manager.on_handle_get_preview_for_artifact_request(request))
+        assert isinstance(generated, GetPreviewForArtifactResultSuccess)
+
+        copy_path = temp_dir / "copies" / "copy.jpg"
+        copy_path.parent.mkdir()
+        shutil.copyfile(test_image_path, copy_path)
+        copy_request = GetPreviewForArtifactRequest(
+            macro_path=MacroPath(parsed_macro=ParsedMacro(str(copy_path)), variables={}),
+            artifact_provider_name="Image",
+        )
+        with patch.object(artifact_manager, "on_handle_generate_preview_from_defaults_request") as mock_generate:
+            result = asyncio.run(artifact_manager.on_handle_get_preview_for_artifact_request(copy_request))
+
+        assert isinstance(result, GetPreviewForArtifactResultSuccess)
+        assert result.paths_to_preview == generated.paths_to_preview
+        mock_generate.assert_not_called()
+
+    def test_lookup_with_valid_preview_does_not_hash_source(
+        self, artifact_manager: ArtifactManager, test_macro_path: MacroPath
+    ) -> None:
+        """Test that a source with a fresh preview on disk is not read, even if its hash is not indexed."""
+        import asyncio
+
+        request = GetPreviewForArtifactRequest(macro_path=test_macro_path, artifact_provider_name="Image")
+        generated = asyncio.run(artifact_manager.on_handle_get_preview_for_artifact_request(request))
+        assert isinstance(generated, GetPreviewForArtifactResultSuccess)
+
+        with (
+            patch.object(artifact_manager._preview_index, "aget_source_hash", return_value=None),
+            patch("griptape_nodes.retained_mode.managers.artifact_manager.hash_source_file") as mock_hash,
+        ):
+            result = asyncio.run(artifact_manager.on_handle_get_preview_for_artifact_request(request))
+
+        assert isinstance(result, GetPreviewForArtifactResultSuccess)
+        assert result.paths_to_preview == generated.paths_to_preview
+        mock_hash.assert_not_called()
+
+    def test_do_not_generate_does_not_hash_unseen_source(
+        self, artifact_manager: ArtifactManager, test_macro_path: MacroPath
+    ) -> None:
+        """Test that DO_NOT_GENERATE never reads a source whose hash is not indexed."""
+        import asyncio
+
+        request = GetPreviewForArtifactRequest(
+            macro_path=test_macro_path,
+            artifact_provider_name="Image",
+            preview_generation_policy=PreviewGenerationPolicy.DO_NOT_GENERATE,
+        )
+        with patch("griptape_nodes.retained_mode.managers.artifact_manager.hash_source_file") as mock_hash:
+            result = asyncio.run(artifact_manager.on_handle_get_preview_for_artifact_request(request))
+
+        assert isinstance(result, GetPreviewForArtifactResultFailure)
+        mock_hash.assert_not_called()
+
+    def test_deleted_indexed_preview_is_regenerated(
+        self, artifact_manager: ArtifactManager, test_macro_path: MacroPath
+    ) -> None:
+        """Test that an index entry whose preview file was deleted is not served."""
+        import asyncio
+
+        request = GetPreviewForArtifactRequest(macro_path=test_macro_path, artifact_provider_name="Image")
+        generated = asyncio.run(artifact_manager.on_handle_get_preview_for_artifact_request(request))
+        assert isinstance(generated, GetPreviewForArtifactResultSuccess)
+        assert isinstance(generated.paths_to_preview, str)
+        Path(generated.paths_to_preview).unlink()
+
+        result = asyncio.run(artifact_manager.on_handle_get_preview_for_artifact_request(request))
+
+        assert isinstance(result, GetPreviewForArtifactResultSuccess)
+        assert "regenerated" in str(result.result_details).lower()
+        assert Path(generated.paths_to_preview).exists()
+
 
 class TestGeneratorValidation:
     """Test generator parameter validation logic."""
@@ -23,7 +23,9 @@ from griptape_nodes.retained_mode.events.base_events import (
     ResultPayloadSuccess,
     StrictModeViolationDetail,
 )
+from griptape_nodes.retained_mode.events.execution_events import NodeResolvedEvent, ParameterValueUpdateEvent
 from griptape_nodes.retained_mode.events.generic_events import GenericResultFailure
+from griptape_nodes.retained_mode.events.parameter_events import AlterElementEvent
 from griptape_nodes.retained_mode.events.payload_registry import PayloadRegistry
 from griptape_nodes.retained_mode.managers.authorization_checkpoint import (
     AuthorizationCheckpoint,
@@ -975,3 +977,128 @@ class TestExecutionEventSubscription:
         manager.put_event(ProgressEvent(value="x", node_name="n", parameter_name="output"))
 
         assert received == []
+
+
+def _alter_element(element_id: str, **changes: object) -> ExecutionGriptapeNodeEvent:
+    details = {"element_id": element_id, "node_name": "node", **changes}
+    return ExecutionGriptapeNodeEvent(wrapped_event=ExecutionEvent(payload=AlterElementEvent(element_details=details)))
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    events = []
+    while not queue.empty():
+        events.append(queue.get_nowait())
+    return events
+
+
+class TestEventCoalescing:
+    """Repeated UI updates to one element are merged; anything else flushes them first."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_element_updates_are_merged(self) -> None:
+        manager = EventManager()
+        queue: asyncio.Queue = asyncio.Queue()
+        manager.initialize_queue(queue)
+
+        manager.put_event(_alter_element("a", value=1, tooltip="tip"))
+        manager.put_event(_alter_element("a", value=2))
+        manager.put_event(_alter_element("a", value=3))
+
+        assert queue.empty()
+        manager.flush_coalesced_events()
+        [event] = _drain(queue)
+        assert event.wrapped_event.payload.element_details == {
+            "element_id": "a",
+            "node_name": "node",
+            "value": 3,
+            "tooltip": "tip",
+        }
+
+    @pytest.mark.asyncio
+    async def test_held_updates_flush_after_window(self) -> None:
+        manager = EventManager()
+        manager.coalesce_window_s = 0.01
+        queue: asyncio.Queue = asyncio.Queue()
+        manager.initialize_queue(queue)
+
+        manager.put_event(_alter_element("a", value=1))
+        event = await asyncio.wait_for(queue.get(), timeout=1)
+
+        assert event.wrapped_event.payload.element_details["value"] == 1
+
+    @pytest.mark.asyncio
+    async def test_other_events_flush_held_updates_first(self) -> None:
+        manager = EventManager()
+        queue: asyncio.Queue = asyncio.Queue()
+        manager.initialize_queue(queue)
+        resolved = ExecutionGriptapeNodeEvent(
+            wrapped_event=ExecutionEvent(
+                payload=NodeResolvedEvent(node_name="node", parameter_output_values={}, node_type="Node")
+            )
+        )
+
+        manager.put_event(_alter_element("a", value=1))
+        manager.put_event(_alter_element("b", value=2))
+        manager.put_event(_alter_element("a", value=3))
+        await manager.aput_event(resolved)
+        manager.put_event(_alter_element("a", value=4))
+        manager.flush_coalesced_events()
+
+        events = _drain(queue)
+        assert [event.wrapped_event.payload for event in events[2:3]] == [resolved.wrapped_event.payload]
+        assert [event.wrapped_event.payload.element_details["value"] for event in events[:2]] == [3, 2]
+        assert events[3].wrapped_event.payload.element_details["value"] == 4  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_parameter_value_updates_keep_latest_value(self) -> None:
+        manager = EventManager()
+        queue: asyncio.Queue = asyncio.Queue()
+        manager.initialize_queue(queue)
+
+        for value in range(5):
+            manager.put_event(
+                ExecutionGriptapeNodeEvent(
+                    wrapped_event=ExecutionEvent(
+                        payload=ParameterValueUpdateEvent(
+                            node_name="node", parameter_name="progress", data_type="int", value=value
+                        )
+                    )
+                )
+            )
+        manager.flush_coalesced_events()
+
+        [event] = _drain(queue)
+        assert event.wrapped_event.payload.value == 4  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_listeners_still_see_every_update(self) -> None:
+        manager = EventManager()
+        manager.initialize_queue(asyncio.Queue())
+        received: list[ExecutionPayload] = []
+        manager.add_listener_to_execution_event(AlterElementEvent, received.append)
+
+        manager.put_event(_alter_element("a", value=1))
+        manager.put_event(_alter_element("a", value=2))
+
+        assert [payload.element_details["value"] for payload in received] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_zero_window_disables_coalescing(self) -> None:
+        manager = EventManager()
+        manager.coalesce_window_s = 0
+        queue: asyncio.Queue = asyncio.Queue()
+        manager.initialize_queue(queue)
+
+        manager.put_event(_alter_element("a", value=1))
+        manager.put_event(_alter_element("a", value=2))
+
+        assert queue.qsize() == 2  # noqa: PLR2004
+
+    def test_updates_outside_event_loop_are_not_held(self) -> None:
+        manager = EventManager()
+        queue: asyncio.Queue = asyncio.Queue()
+        manager.initialize_queue(queue)
+
+        manager.put_event(_alter_element("a", value=1))
+
+        assert queue.qsize() == 1
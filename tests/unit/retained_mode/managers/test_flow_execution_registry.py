@@ -0,0 +1,141 @@
+"""Tests for FlowExecutionRegistry."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from griptape_nodes.retained_mode.managers.flow_execution_registry import (
+    FlowExecutionContext,
+    FlowExecutionRegistry,
+)
+
+
+class _FakeMachine:
+    """Stand-in ControlFlowMachine whose run blocks until released."""
+
+    def __init__(self, node_names: tuple[str, ...] = ()) -> None:
+        self.release = asyncio.Event()
+        self.started = asyncio.Event()
+        self.resolution_machine: Any = SimpleNamespace(
+            context=SimpleNamespace(dag_builder=SimpleNamespace(node_to_reference=dict.fromkeys(node_names)))
+        )
+        self.cancel_flow = AsyncMock()
+        self.reset_machine = MagicMock()
+
+    async def start_flow(self, start_node: Any) -> None:  # noqa: ARG002
+        self.started.set()
+        await self.release.wait()
+
+
+def _make_context(flow_name: str, *node_names: str) -> tuple[FlowExecutionContext, _FakeMachine]:
+    machine = _FakeMachine(node_names)
+    return FlowExecutionContext(flow_name=flow_name, control_flow_machine=machine), machine  # type: ignore[arg-type]
+
+
+class TestFlowExecutionRegistry:
+    @pytest.mark.asyncio
+    async def test_flows_run_concurrently_up_to_cap(self) -> None:
+        registry = FlowExecutionRegistry()
+        (ctx_a, machine_a), (ctx_b, machine_b), (ctx_c, machine_c) = (
+            _make_context("a"),
+            _make_context("b"),
+            _make_context("c"),
+        )
+
+        runs = [
+            asyncio.create_task(registry.run(ctx, MagicMock(), max_concurrent_flows=2)) for ctx in (ctx_a, ctx_b, ctx_c)
+        ]
+        await asyncio.wait_for(asyncio.gather(machine_a.started.wait(), machine_b.started.wait()), timeout=1)
+
+        assert ctx_a.is_running()
+        assert ctx_b.is_running()
+        # Third flow is registered but waits for a slot
+        assert registry.get_context("c") is ctx_c
+        assert not ctx_c.is_running()
+
+        machine_a.release.set()
+        await asyncio.wait_for(machine_c.started.wait(), timeout=1)
+        assert registry.get_context("a") is None
+
+        machine_b.release.set()
+        machine_c.release.set()
+        await asyncio.wait_for(asyncio.gather(*runs), timeout=1)
+        assert registry.contexts() == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_flow_that_is_already_registered(self) -> None:
+        registry = FlowExecutionRegistry()
+        ctx, machine = _make_context("a")
+        run = asyncio.create_task(registry.run(ctx, MagicMock(), max_concurrent_flows=1))
+        await asyncio.wait_for(machine.started.wait(), timeout=1)
+
+        duplicate, _ = _make_context("a")
+        with pytest.raises(RuntimeError, match="already executing"):
+            await registry.run(duplicate, MagicMock(), max_concurrent_flows=1)
+
+        machine.release.set()
+        await run
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_flow(self) -> None:
+        registry = FlowExecutionRegistry()
+        ctx, machine = _make_context("a")
+        run = asyncio.create_task(registry.run(ctx, MagicMock(), max_concurrent_flows=1))
+        await asyncio.wait_for(machine.started.wait(), timeout=1)
+
+        assert await registry.cancel("a")
+        await asyncio.wait_for(run, timeout=1)
+
+        assert ctx.cancel_requested
+        machine.cancel_flow.assert_awaited_once()
+        machine.reset_machine.assert_called_once_with(cancel=True)
+        assert registry.get_context("a") is None
+
+    @pytest.mark.asyncio
+    async def test_cancel_waiting_flow_gives_up_its_slot(self) -> None:
+        registry = FlowExecutionRegistry()
+        (ctx_a, machine_a), (ctx_b, machine_b) = _make_context("a"), _make_context("b")
+        run_a = asyncio.create_task(registry.run(ctx_a, MagicMock(), max_concurrent_flows=1))
+        run_b = asyncio.create_task(registry.run(ctx_b, MagicMock(), max_concurrent_flows=1))
+        await asyncio.wait_for(machine_a.started.wait(), timeout=1)
+
+        assert await registry.cancel("b")
+        await asyncio.wait_for(run_b, timeout=1)
+
+        assert not machine_b.started.is_set()
+        machine_b.cancel_flow.assert_not_called()
+        machine_a.release.set()
+        await run_a
+
+    @pytest.mark.asyncio
+    async def test_cancel_unknown_flow_returns_false(self) -> None:
+        assert not await FlowExecutionRegistry().cancel("missing")
+
+    @pytest.mark.asyncio
+    async def test_caller_cancellation_stops_flow(self) -> None:
+        registry = FlowExecutionRegistry()
+        ctx, machine = _make_context("a")
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                await registry.run(ctx, MagicMock(), max_concurrent_flows=1)
+
+        machine.cancel_flow.assert_awaited_once()
+        assert registry.get_context("a") is None
+
+    @pytest.mark.asyncio
+    async def test_find_context_for_node(self) -> None:
+        registry = FlowExecutionRegistry()
+        ctx, machine = _make_context("a", "node_1", "node_2")
+        run = asyncio.create_task(registry.run(ctx, MagicMock(), max_concurrent_flows=1))
+        await asyncio.wait_for(machine.started.wait(), timeout=1)
+
+        assert registry.find_context_for_node("node_2") is ctx
+        assert registry.find_context_for_node("other") is None
+
+        machine.release.set()
+        await run
+        assert registry.find_context_for_node("node_2") is None
@@ -447,6 +447,200 @@ class TestStartFlowCancelsOnWaitTimeout:
         cancel_mock.assert_not_called()
 
 
+class TestStartFlowConcurrently:
+    """Tests for StartFlowRequest(run_concurrently=True)."""
+
+    @pytest.mark.asyncio
+    async def test_runs_on_own_machine_while_global_flow_is_running(self, griptape_nodes: GriptapeNodes) -> None:
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from griptape_nodes.retained_mode.events.execution_events import (
+            StartFlowRequest,
+            StartFlowResultSuccess,
+        )
+        from griptape_nodes.retained_mode.events.validation_events import (
+            ValidateFlowDependenciesResultSuccess,
+        )
+
+        flow_manager = griptape_nodes.FlowManager()
+        fake_flow = MagicMock()
+        fake_flow.name = "concurrent_flow"
+        fake_flow.nodes = {}
+        start_node = MagicMock()
+        start_node.name = "start"
+        validate_success = ValidateFlowDependenciesResultSuccess(
+            validation_succeeded=True, exceptions=[], result_details="validated"
+        )
+        machine = MagicMock()
+        machine.start_flow = AsyncMock()
+        machine.resolution_machine.is_errored.return_value = False
+        max_nodes_in_parallel = 3
+
+        with (
+            patch.object(flow_manager, "get_flow_by_name", return_value=fake_flow),
+            patch.object(flow_manager, "check_for_existing_running_flow", return_value=True),
+            patch.object(flow_manager, "get_start_nodes_in_flow", return_value=[start_node]),
+            patch.object(
+                flow_manager,
+                "on_validate_flow_dependencies_request",
+                AsyncMock(return_value=validate_success),
+            ),
+            patch.object(flow_manager, "start_flow", AsyncMock()) as global_start_mock,
+            patch(
+                "griptape_nodes.retained_mode.managers.flow_manager.ControlFlowMachine", return_value=machine
+            ) as machine_cls,
+        ):
+            result = await flow_manager.on_start_flow_request(
+                StartFlowRequest(
+                    flow_name="concurrent_flow", run_concurrently=True, max_nodes_in_parallel=max_nodes_in_parallel
+                )
+            )
+
+        assert isinstance(result, StartFlowResultSuccess)
+        global_start_mock.assert_not_called()
+        machine.start_flow.assert_awaited_once_with(start_node)
+        assert machine_cls.call_args.kwargs["is_isolated"] is True
+        assert machine_cls.call_args.kwargs["max_nodes_in_parallel"] == max_nodes_in_parallel
+        assert flow_manager.flow_execution_registry.get_context("concurrent_flow") is None
+
+    async def _run_concurrently_capturing_involved_nodes(
+        self, griptape_nodes: GriptapeNodes, start_nodes: list
+    ) -> list[list[str]]:
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from griptape_nodes.retained_mode.events.execution_events import (
+            InvolvedNodesEvent,
+            StartFlowRequest,
+            StartFlowResultSuccess,
+        )
+        from griptape_nodes.retained_mode.events.validation_events import (
+            ValidateFlowDependenciesResultSuccess,
+        )
+
+        flow_manager = griptape_nodes.FlowManager()
+        fake_flow = MagicMock()
+        fake_flow.name = "concurrent_flow"
+        fake_flow.nodes = {node.name: node for node in start_nodes}
+        validate_success = ValidateFlowDependenciesResultSuccess(
+            validation_succeeded=True, exceptions=[], result_details="validated"
+        )
+        machine = MagicMock()
+        machine.start_flow = AsyncMock()
+        machine.resolution_machine.is_errored.return_value = False
+        involved_node_lists = []
+
+        def capture_event(event: object) -> None:
+            payload = getattr(getattr(event, "wrapped_event", None), "payload", None)
+            if isinstance(payload, InvolvedNodesEvent):
+                involved_node_lists.append(payload.involved_nodes)
+
+        with (
+            patch.object(flow_manager, "get_flow_by_name", return_value=fake_flow),
+            patch.object(flow_manager, "check_for_existing_running_flow", return_value=False),
+            patch.object(flow_manager, "get_start_nodes_in_flow", return_value=start_nodes),
+            patch.object(flow_manager, "get_all_connected_nodes", side_effect=lambda node: [node]),
+            patch.object(
+                flow_manager,
+                "on_validate_flow_dependencies_request",
+                AsyncMock(return_value=validate_success),
+            ),
+            patch("griptape_nodes.retained_mode.managers.flow_manager.ControlFlowMachine", return_value=machine),
+            patch.object(griptape_nodes.EventManager(), "put_event", side_effect=capture_event),
+        ):
+            result = await flow_manager.on_start_flow_request(
+                StartFlowRequest(flow_name="concurrent_flow", run_concurrently=True)
+            )
+
+        assert isinstance(result, StartFlowResultSuccess)
+        return involved_node_lists
+
+    def _make_start_node(self, name: str) -> object:
+        from unittest.mock import MagicMock
+
+        node = MagicMock()
+        node.name = name
+        return node
+
+    @pytest.mark.asyncio
+    async def test_involved_nodes_cover_every_start_node(self, griptape_nodes: GriptapeNodes) -> None:
+        start_nodes = [self._make_start_node("start_a"), self._make_start_node("start_b")]
+
+        involved_node_lists = await self._run_concurrently_capturing_involved_nodes(griptape_nodes, start_nodes)
+
+        assert involved_node_lists[0] == ["start_a", "start_b"]
+        assert involved_node_lists[-1] == []
+
+    @pytest.mark.asyncio
+    async def test_finishing_keeps_other_running_flows_involved_nodes(self, griptape_nodes: GriptapeNodes) -> None:
+        from unittest.mock import MagicMock
+
+        from griptape_nodes.retained_mode.managers.flow_execution_registry import FlowExecutionContext
+
+        registry = griptape_nodes.FlowManager().flow_execution_registry
+        other_context = FlowExecutionContext(
+            flow_name="other_flow", control_flow_machine=MagicMock(), involved_nodes=frozenset({"other_node"})
+        )
+        registry._contexts["other_flow"] = other_context
+        try:
+            involved_node_lists = await self._run_concurrently_capturing_involved_nodes(
+                griptape_nodes, [self._make_start_node("start")]
+            )
+        finally:
+            registry._contexts.pop("other_flow", None)
+
+        assert involved_node_lists[0] == ["other_node", "start"]
+        assert involved_node_lists[-1] == ["other_node"]
+
+    @pytest.mark.asyncio
+    async def test_rejects_debug_mode(self, griptape_nodes: GriptapeNodes) -> None:
+        from unittest.mock import MagicMock, patch
+
+        from griptape_nodes.retained_mode.events.execution_events import (
+            StartFlowRequest,
+            StartFlowResultFailure,
+        )
+
+        flow_manager = griptape_nodes.FlowManager()
+        fake_flow = MagicMock()
+        fake_flow.name = "debug_flow"
+
+        with patch.object(flow_manager, "get_flow_by_name", return_value=fake_flow):
+            result = await flow_manager.on_start_flow_request(
+                StartFlowRequest(flow_name="debug_flow", run_concurrently=True, debug_mode=True)
+            )
+
+        assert isinstance(result, StartFlowResultFailure)
+        assert "Debug mode" in str(result.result_details)
+
+    @pytest.mark.asyncio
+    async def test_rejects_flow_sharing_nodes_with_running_flow(self, griptape_nodes: GriptapeNodes) -> None:
+        from unittest.mock import MagicMock, patch
+
+        from griptape_nodes.retained_mode.events.execution_events import (
+            StartFlowRequest,
+            StartFlowResultFailure,
+        )
+
+        flow_manager = griptape_nodes.FlowManager()
+        fake_flow = MagicMock()
+        fake_flow.name = "overlapping_flow"
+        fake_flow.nodes = {"shared": MagicMock()}
+        running_context = MagicMock()
+        running_context.flow_name = "other_flow"
+
+        with (
+            patch.object(flow_manager, "get_flow_by_name", return_value=fake_flow),
+            patch.object(flow_manager, "check_for_existing_running_flow", return_value=False),
+            patch.object(flow_manager.flow_execution_registry, "find_context_for_node", return_value=running_context),
+        ):
+            result = await flow_manager.on_start_flow_request(
+                StartFlowRequest(flow_name="overlapping_flow", run_concurrently=True)
+            )
+
+        assert isinstance(result, StartFlowResultFailure)
+        assert "other_flow" in str(result.result_details)
+
+
 class TestListNodesInFlowRequest:
     """Tests for FlowManager.on_list_nodes_in_flow_request node_types filter."""
 
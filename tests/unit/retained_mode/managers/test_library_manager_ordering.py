@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from griptape_nodes.node_library.library_declarations import LibraryDependencyDeclaration
 from griptape_nodes.retained_mode.events.library_events import (
     DiscoverLibrariesRequest,
     DiscoverLibrariesResultSuccess,
+    InstallLibraryDependenciesResultSuccess,
+    RegisterLibraryFromFileRequest,
+    RegisterLibraryFromFileResultFailure,
+    RegisterLibraryFromFileResultSuccess,
 )
+from griptape_nodes.retained_mode.managers.library_manager import LibraryManager
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
@@ -261,3 +268,136 @@ class TestLibraryManagerDeterministicOrdering:
 
             # All three calls should return the same order
             assert paths1 == paths2 == paths3
+
+
+def _tracked_library(path: str, name: str) -> LibraryManager.LibraryInfo:
+    return LibraryManager.LibraryInfo(
+        lifecycle_state=LibraryManager.LibraryLifecycleState.DISCOVERED,
+        library_path=path,
+        is_sandbox=False,
+        library_name=name,
+        fitness=LibraryManager.LibraryFitness.NOT_EVALUATED,
+        problems=[],
+    )
+
+
+class TestLibraryManagerParallelLoading:
+    """Test that libraries are prepared concurrently and registered deterministically."""
+
+    @pytest.mark.asyncio
+    async def test_prepares_concurrently_then_registers_in_config_order(self, griptape_nodes: GriptapeNodes) -> None:
+        library_manager = griptape_nodes.LibraryManager()
+        lib_paths = ["/libs/c.json", "/libs/a.json", "/libs/b.json"]
+        events: list[str] = []
+        running = 0
+        max_running = 0
+
+        async def prepare(lib_path: str) -> None:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            # Finish in reverse order so registration order can't come from preparation order
+            await asyncio.sleep(0.01 * (len(lib_paths) - lib_paths.index(lib_path)))
+            running -= 1
+            events.append(f"prepared {lib_path}")
+
+        async def register(request: RegisterLibraryFromFileRequest) -> RegisterLibraryFromFileResultSuccess:
+            events.append(f"registered {request.file_path}")
+            return RegisterLibraryFromFileResultSuccess(library_name=request.file_path, result_details="ok")
+
+        with (
+            patch.object(library_manager, "_prepare_library_for_registration", side_effect=prepare),
+            patch.object(library_manager, "register_library_from_file_request", side_effect=register),
+            patch.object(library_manager, "_get_library_dependency_declarations", return_value=[]),
+            patch.object(library_manager, "_emit_library_loading_progress"),
+            patch.object(library_manager, "_emit_library_load_result_progress"),
+        ):
+            await library_manager._load_libraries(list(enumerate(lib_paths, start=1)), len(lib_paths))
+
+        assert max_running == len(lib_paths)
+        assert events[3:] == [f"registered {lib_path}" for lib_path in lib_paths]
+
+    @pytest.mark.asyncio
+    async def test_preparation_failure_skips_registration(self, griptape_nodes: GriptapeNodes) -> None:
+        library_manager = griptape_nodes.LibraryManager()
+        failure = RegisterLibraryFromFileResultFailure(result_details="install failed")
+        mock_register = AsyncMock()
+        mock_emit_result = MagicMock()
+
+        with (
+            patch.object(library_manager, "_prepare_library_for_registration", AsyncMock(return_value=failure)),
+            patch.object(library_manager, "register_library_from_file_request", mock_register),
+            patch.object(library_manager, "_get_library_dependency_declarations", return_value=[]),
+            patch.object(library_manager, "_emit_library_loading_progress"),
+            patch.object(library_manager, "_emit_library_load_result_progress", mock_emit_result),
+        ):
+            await library_manager._load_libraries([(1, "/libs/a.json")], 1)
+
+        mock_register.assert_not_called()
+        mock_emit_result.assert_called_once_with("/libs/a.json", failure, 1, 1)
+
+    def test_dependencies_are_ordered_before_their_dependents(self, griptape_nodes: GriptapeNodes) -> None:
+        library_manager = griptape_nodes.LibraryManager()
+        tracked = {
+            "/libs/app/griptape_nodes_library.json": _tracked_library("/libs/app/griptape_nodes_library.json", "app"),
+            "/libs/other/griptape_nodes_library.json": _tracked_library(
+                "/libs/other/griptape_nodes_library.json", "other"
+            ),
+            "/libs/base-lib/griptape_nodes_library.json": _tracked_library(
+                "/libs/base-lib/griptape_nodes_library.json", "Base Library"
+            ),
+        }
+        dependencies = {"/libs/app/griptape_nodes_library.json": [LibraryDependencyDeclaration(url="acme/base-lib@v1")]}
+
+        with patch.object(library_manager, "_library_file_path_to_info", tracked):
+            ordered = library_manager._order_libraries_by_dependencies(list(tracked), dependencies)
+
+        assert ordered == [
+            "/libs/other/griptape_nodes_library.json",
+            "/libs/base-lib/griptape_nodes_library.json",
+            "/libs/app/griptape_nodes_library.json",
+        ]
+
+    def test_dependency_cycle_keeps_config_order(self, griptape_nodes: GriptapeNodes) -> None:
+        library_manager = griptape_nodes.LibraryManager()
+        tracked = {
+            "/libs/a.json": _tracked_library("/libs/a.json", "a"),
+            "/libs/b.json": _tracked_library("/libs/b.json", "b"),
+        }
+        dependencies = {
+            "/libs/a.json": [LibraryDependencyDeclaration(url="acme/b@v1")],
+            "/libs/b.json": [LibraryDependencyDeclaration(url="acme/a@v1")],
+        }
+
+        with patch.object(library_manager, "_library_file_path_to_info", tracked):
+            ordered = library_manager._order_libraries_by_dependencies(list(tracked), dependencies)
+
+        assert ordered == ["/libs/a.json", "/libs/b.json"]
+
+    @pytest.mark.asyncio
+    async def test_preparation_stops_before_registration(self, griptape_nodes: GriptapeNodes) -> None:
+        library_manager = griptape_nodes.LibraryManager()
+        lib_info = _tracked_library("/libs/a.json", "a")
+        lib_info.lifecycle_state = LibraryManager.LibraryLifecycleState.EVALUATED
+        metadata = MagicMock()
+        metadata.library_schema.metadata.declarations = []
+        installed = InstallLibraryDependenciesResultSuccess(
+            library_name="a", dependencies_installed=0, result_details="ok"
+        )
+
+        with (
+            patch.object(library_manager, "_library_file_path_to_info", {"/libs/a.json": lib_info}),
+            patch.object(library_manager, "load_library_metadata_from_file_request", return_value=metadata),
+            patch.object(library_manager, "install_library_dependencies_request", AsyncMock(return_value=installed)),
+            patch.object(library_manager, "_add_library_paths_to_sys_path") as mock_add_paths,
+        ):
+            result = await library_manager._progress_library_through_lifecycle(
+                library_info=lib_info,
+                file_path="/libs/a.json",
+                request=RegisterLibraryFromFileRequest(file_path="/libs/a.json"),
+                stop_before_registration=True,
+            )
+
+        assert result is None
+        assert lib_info.lifecycle_state == LibraryManager.LibraryLifecycleState.DEPENDENCIES_INSTALLED
+        mock_add_paths.assert_not_called()
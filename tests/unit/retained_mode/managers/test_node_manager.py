@@ -14,7 +14,15 @@ from griptape_nodes.retained_mode.events.node_events import (
     UnresolveNodeResultFailure,
     UnresolveNodeResultSuccess,
 )
-from griptape_nodes.retained_mode.events.parameter_events import AlterParameterDetailsRequest
+from griptape_nodes.retained_mode.events.parameter_events import (
+    AlterParameterDetailsRequest,
+    BatchSetParameterValuesRequest,
+    BatchSetParameterValuesResultFailure,
+    BatchSetParameterValuesResultSuccess,
+    SetParameterValueRequest,
+    SetParameterValueResultFailure,
+    SetParameterValueResultSuccess,
+)
 from griptape_nodes.retained_mode.griptape_nodes import GriptapeNodes
 
 
@@ -56,6 +64,68 @@ class TestNodeManagerBatchSetNodeMetadata:
         assert "nonexistent_node2" in result_str
 
 
+class TestNodeManagerBatchSetParameterValues:
+    """Each value in a batch goes through the single-value handler; the batch stops at the first failure."""
+
+    def test_sets_every_value_on_the_batch_node(self, griptape_nodes: GriptapeNodes) -> None:
+        node_manager = griptape_nodes.NodeManager()
+        request = BatchSetParameterValuesRequest(
+            node_name="node",
+            set_value_requests=[
+                SetParameterValueRequest(parameter_name="a", value=1),
+                SetParameterValueRequest(parameter_name="b", value=2, node_name="node"),
+            ],
+        )
+
+        def set_value(set_value_request: SetParameterValueRequest) -> SetParameterValueResultSuccess:
+            return SetParameterValueResultSuccess(
+                finalized_value=set_value_request.value * 10, data_type="int", result_details=""
+            )
+
+        with patch.object(node_manager, "on_set_parameter_value_request", side_effect=set_value) as mock_set:
+            result = node_manager.on_batch_set_parameter_values_request(request)
+
+        assert isinstance(result, BatchSetParameterValuesResultSuccess)
+        assert result.finalized_values == {"a": 10, "b": 20}
+        assert [call.args[0].node_name for call in mock_set.call_args_list] == ["node", "node"]
+
+    def test_stops_at_first_failed_value(self, griptape_nodes: GriptapeNodes) -> None:
+        node_manager = griptape_nodes.NodeManager()
+        request = BatchSetParameterValuesRequest(
+            node_name="node",
+            set_value_requests=[
+                SetParameterValueRequest(parameter_name="a", value=1),
+                SetParameterValueRequest(parameter_name="b", value=2),
+            ],
+        )
+
+        with patch.object(
+            node_manager,
+            "on_set_parameter_value_request",
+            return_value=SetParameterValueResultFailure(result_details="not allowed"),
+        ) as mock_set:
+            result = node_manager.on_batch_set_parameter_values_request(request)
+
+        assert isinstance(result, BatchSetParameterValuesResultFailure)
+        assert result.failed_parameter_name == "a"
+        assert "not allowed" in str(result.result_details)
+        mock_set.assert_called_once()
+
+    def test_rejects_value_for_another_node(self, griptape_nodes: GriptapeNodes) -> None:
+        node_manager = griptape_nodes.NodeManager()
+        request = BatchSetParameterValuesRequest(
+            node_name="node",
+            set_value_requests=[SetParameterValueRequest(parameter_name="a", value=1, node_name="other")],
+        )
+
+        with patch.object(node_manager, "on_set_parameter_value_request") as mock_set:
+            result = node_manager.on_batch_set_parameter_values_request(request)
+
+        assert isinstance(result, BatchSetParameterValuesResultFailure)
+        assert "other" in str(result.result_details)
+        mock_set.assert_not_called()
+
+
 class TestNodeManagerResolutionStateSerialization:
     """Test that node resolution states are preserved correctly during serialization."""
 
@@ -225,6 +295,82 @@ class TestNodeManagerResolutionStateSerialization:
         assert create_node_request.resolution == NodeResolutionState.UNRESOLVED.value
 
 
+class TestValueHashingDeduplication:
+    """Each value is pickled once, and equal values share one copy of their bytes."""
+
+    @staticmethod
+    def _hash(value: object, tracker: object, unique_values: dict, *, use_pickling: bool = False) -> object:
+        from griptape_nodes.retained_mode.managers.node_manager import NodeManager
+
+        parameter = MagicMock(spec=Parameter)
+        parameter.serializable = True
+        command = NodeManager._handle_value_hashing(
+            value=value,
+            serialized_parameter_value_tracker=tracker,  # type: ignore[arg-type]
+            unique_parameter_uuid_to_values=unique_values,
+            parameter=parameter,
+            parameter_name="param",
+            node_name="node",
+            is_output=False,
+            use_pickling=use_pickling,
+        )
+        assert command is not None
+        return command.unique_value_uuid
+
+    @pytest.mark.usefixtures("griptape_nodes")
+    def test_equal_unhashable_values_share_bytes_but_not_entries(self) -> None:
+        from griptape_nodes.retained_mode.managers.node_manager import SerializedParameterValueTracker
+
+        tracker = SerializedParameterValueTracker()
+        unique_values: dict = {}
+
+        # Keep the values alive: unhashable values are tracked by object ID
+        values = [[1, 2, 3], [1, 2, 3], [4]]
+        first, second, other = (self._hash(value, tracker, unique_values, use_pickling=True) for value in values)
+
+        # Each value loads back as its own object, so editing one parameter's list can't change another's
+        assert len({first, second, other}) == 3  # noqa: PLR2004
+        assert unique_values[first] is unique_values[second]
+        assert unique_values[other] != unique_values[first]
+
+    def test_value_is_pickled_once_and_reused_by_the_writer(self, griptape_nodes: GriptapeNodes) -> None:
+        from griptape_nodes.retained_mode.managers.node_manager import SerializedParameterValueTracker
+        from griptape_nodes.retained_mode.managers.workflow_manager import ImportRecorder
+
+        workflow_manager = griptape_nodes.WorkflowManager()
+        value = {"pixels": [0] * 100}
+        unique_values: dict = {}
+
+        with (
+            patch.object(
+                workflow_manager, "_patch_and_pickle_object", wraps=workflow_manager._patch_and_pickle_object
+            ) as mock_pickle,
+            workflow_manager._share_pickled_unique_values(),
+        ):
+            unique_uuid = self._hash(value, SerializedParameterValueTracker(), unique_values)
+            workflow_manager._generate_unique_values_code(
+                unique_parameter_uuid_to_values=unique_values,
+                prefix="top_level",
+                import_recorder=ImportRecorder(),
+            )
+
+        mock_pickle.assert_called_once_with(value)
+        # The pickle is the snapshot, so the save holds the value itself rather than a deep copy
+        assert unique_values[unique_uuid] is value
+
+    @pytest.mark.usefixtures("griptape_nodes")
+    def test_value_is_deep_copied_outside_a_save(self) -> None:
+        from griptape_nodes.retained_mode.managers.node_manager import SerializedParameterValueTracker
+
+        value = {"pixels": [0] * 100}
+        unique_values: dict = {}
+
+        unique_uuid = self._hash(value, SerializedParameterValueTracker(), unique_values)
+
+        assert unique_values[unique_uuid] == value
+        assert unique_values[unique_uuid] is not value
+
+
 class TestSerializeNodeWithoutLibraryMetadata:
     """Serializing a node whose metadata lacks a 'library' key must not crash the save."""
 
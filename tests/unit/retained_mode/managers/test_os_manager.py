@@ -252,6 +252,29 @@ class TestReadFileRequest:
         # Binary files might be returned as base64 or bytes
         assert result.content is not None
 
+    def test_read_byte_range(self, griptape_nodes: GriptapeNodes, temp_dir: Path) -> None:
+        """Test reading only a byte range of a file."""
+        file_path = temp_dir / "test.bin"
+        file_path.write_bytes(bytes(range(16)))
+
+        request = ReadFileRequest(file_path=str(file_path), byte_offset=4, byte_length=3)
+        result = griptape_nodes.handle_request(request)
+
+        assert isinstance(result, ReadFileResultSuccess)
+        assert result.content == b"\x04\x05\x06"
+        assert result.file_size == 3  # noqa: PLR2004
+
+    def test_read_byte_range_negative_offset(self, griptape_nodes: GriptapeNodes, temp_dir: Path) -> None:
+        """Test a negative byte offset returns INVALID_PATH."""
+        file_path = temp_dir / "test.bin"
+        file_path.write_bytes(b"data")
+
+        request = ReadFileRequest(file_path=str(file_path), byte_offset=-1)
+        result = griptape_nodes.handle_request(request)
+
+        assert isinstance(result, ReadFileResultFailure)
+        assert result.failure_reason == FileIOFailureReason.INVALID_PATH
+
     def test_read_file_not_found(self, griptape_nodes: GriptapeNodes, temp_dir: Path) -> None:
         """Test reading non-existent file returns FILE_NOT_FOUND."""
         request = ReadFileRequest(file_path=str(temp_dir / "nonexistent.txt"))
@@ -10,6 +10,7 @@ Tests cover:
 """
 
 import logging
+import os
 import sys
 import tempfile
 import unicodedata
@@ -408,6 +409,62 @@ class TestOnDemandCandidateGeneration:
         )
 
 
+class TestCreateNewIndexCache:
+    """Test that CREATE_NEW writes into one sequence list the directory only when it changed."""
+
+    @pytest.fixture
+    def temp_dir(self) -> Generator[Path, None, None]:
+        """Create a temporary directory for testing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture(autouse=True)
+    def setup_workspace(self, temp_dir: Path, griptape_nodes: GriptapeNodes) -> Generator[None, None, None]:
+        """Automatically set workspace to temp_dir for all tests."""
+        original_workspace = griptape_nodes.ConfigManager().workspace_path
+        griptape_nodes.ConfigManager().workspace_path = temp_dir
+        yield
+        griptape_nodes.ConfigManager().workspace_path = original_workspace
+
+    def _write_frame(self, griptape_nodes: GriptapeNodes, temp_dir: Path) -> WriteFileResultSuccess:
+        result = griptape_nodes.OSManager().on_write_file_request(
+            WriteFileRequest(
+                file_path=str(temp_dir / "frame.txt"),
+                content="frame",
+                existing_file_policy=ExistingFilePolicy.CREATE_NEW,
+            )
+        )
+        assert isinstance(result, WriteFileResultSuccess)
+        return result
+
+    def test_sequential_writes_do_not_rescan(self, griptape_nodes: GriptapeNodes, temp_dir: Path) -> None:
+        """Existing frames are reverse-matched once, not once per write."""
+        (temp_dir / "frame.txt").write_text("base")
+        for i in range(1, 4):
+            (temp_dir / f"frame_{i}.txt").write_text(f"frame {i}")
+        os_manager = griptape_nodes.OSManager()
+
+        with patch.object(
+            os_manager, "_extract_index_from_filename", wraps=os_manager._extract_index_from_filename
+        ) as mock_extract:
+            written = [Path(self._write_frame(griptape_nodes, temp_dir).final_file_path).name for _ in range(3)]
+
+        assert written == ["frame_4.txt", "frame_5.txt", "frame_6.txt"]
+        expected_extractions = 3  # The three pre-existing frames, from the first write's scan only
+        assert mock_extract.call_count == expected_extractions
+
+    def test_files_added_outside_the_engine_are_seen(self, griptape_nodes: GriptapeNodes, temp_dir: Path) -> None:
+        """A directory change made behind the cache's back triggers a rescan."""
+        (temp_dir / "frame.txt").write_text("base")
+        assert Path(self._write_frame(griptape_nodes, temp_dir).final_file_path).name == "frame_1.txt"
+
+        (temp_dir / "frame_2.txt").write_text("external")
+        stat = temp_dir.stat()
+        os.utime(temp_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert Path(self._write_frame(griptape_nodes, temp_dir).final_file_path).name == "frame_3.txt"
+
+
 class TestMetadataInjection:
     """Test workflow metadata injection in WriteFileRequest handler."""
 
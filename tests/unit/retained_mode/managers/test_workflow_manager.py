@@ -4182,3 +4182,147 @@ class TestExecuteWorkflowImport:
         # ...and returns exactly what the helper chose.
         assert isinstance(result, ImportWorkflowAsReferencedSubFlowResultSuccess)
         assert result.created_flow_name == "ControlFlow_2"
+
+
+class TestWorkflowValueSidecarStore:
+    """Large unique values are stored next to the saved workflow and loaded by digest."""
+
+    LARGE_VALUE = b"\x01" * 300_000
+
+    @staticmethod
+    def _commands(unique_values: dict) -> SerializedFlowCommands:
+        return SerializedFlowCommands(
+            flow_initialization_command=None,
+            serialized_node_commands=[],
+            serialized_connections=[],
+            unique_parameter_uuid_to_values=unique_values,
+            set_parameter_value_commands={},
+            set_lock_commands_per_node={},
+            sub_flows_commands=[],
+            node_dependencies=NodeDependencies(),
+            node_types_used=set(),
+        )
+
+    def _generate_unique_values_source(
+        self, griptape_nodes: GriptapeNodes, external_values: dict[str, bytes] | None
+    ) -> str:
+        from griptape_nodes.retained_mode.managers.workflow_manager import ImportRecorder
+
+        module = griptape_nodes.WorkflowManager()._generate_unique_values_code(
+            unique_parameter_uuid_to_values={"large": self.LARGE_VALUE, "small": "tiny"},  # type: ignore[dict-item]
+            prefix="top_level",
+            import_recorder=ImportRecorder(),
+            external_values=external_values,
+        )
+        return ast.unparse(ast.fix_missing_locations(module))
+
+    def test_large_values_are_externalized_and_load_by_digest(
+        self, griptape_nodes: GriptapeNodes, tmp_path: Path
+    ) -> None:
+        from griptape_nodes.utils.workflow_value_store import load_workflow_value, write_workflow_values
+
+        external_values: dict[str, bytes] = {}
+        source = self._generate_unique_values_source(griptape_nodes, external_values)
+
+        assert len(external_values) == 1
+        assert "load_workflow_value(__file__, " in source
+        assert len(source) < len(self.LARGE_VALUE)
+
+        workflow_file = tmp_path / "workflow.py"
+        write_workflow_values(workflow_file, external_values)
+        namespace: dict[str, Any] = {"__file__": str(workflow_file), "load_workflow_value": load_workflow_value}
+        exec(f"import pickle\n{source}", namespace)  # noqa: S102
+        assert namespace["top_level_unique_values_dict"] == {"large": self.LARGE_VALUE, "small": "tiny"}
+
+    def test_values_stay_inline_without_a_store(self, griptape_nodes: GriptapeNodes) -> None:
+        source = self._generate_unique_values_source(griptape_nodes, None)
+
+        assert "load_workflow_value" not in source
+        assert source.count("pickle.loads(") == 2  # noqa: PLR2004
+
+    def test_save_writes_values_next_to_workflow_once(self, griptape_nodes: GriptapeNodes, tmp_path: Path) -> None:
+        from griptape_nodes.files.project_file import ProjectFileDestination
+        from griptape_nodes.retained_mode.events.os_events import ExistingFilePolicy
+        from griptape_nodes.retained_mode.events.workflow_events import (
+            SaveWorkflowFileFromSerializedFlowResultSuccess,
+        )
+        from griptape_nodes.utils.workflow_value_store import get_workflow_values_dir
+
+        workflow_manager = griptape_nodes.WorkflowManager()
+        workflow_file = tmp_path / "big_values.py"
+
+        def save() -> None:
+            result = workflow_manager._save_workflow_file_inline(
+                destination=ProjectFileDestination(
+                    str(workflow_file), existing_file_policy=ExistingFilePolicy.OVERWRITE
+                ),
+                serialized_flow_commands=self._commands({"large": self.LARGE_VALUE}),
+                file_name="big_values",
+                creation_date=datetime.now(UTC),
+                display_name=None,
+                image_path=None,
+                description=None,
+                is_template=None,
+                branched_from=None,
+                workflow_shape=None,
+                pickle_control_flow_result=False,
+            )
+            assert isinstance(result, SaveWorkflowFileFromSerializedFlowResultSuccess), result.result_details
+
+        save()
+        stored = list(get_workflow_values_dir(workflow_file).iterdir())
+        assert len(stored) == 1
+        assert workflow_file.stat().st_size < len(self.LARGE_VALUE)
+
+        with patch("griptape_nodes.utils.workflow_value_store.atomic_write_bytes") as mock_write:
+            save()
+        mock_write.assert_not_called()
+
+    def _save(
+        self, griptape_nodes: GriptapeNodes, workflow_file: Path, value: bytes, *, store_large_values_externally: bool
+    ) -> None:
+        from griptape_nodes.files.project_file import ProjectFileDestination
+        from griptape_nodes.retained_mode.events.os_events import ExistingFilePolicy
+        from griptape_nodes.retained_mode.events.workflow_events import (
+            SaveWorkflowFileFromSerializedFlowResultSuccess,
+        )
+
+        result = griptape_nodes.WorkflowManager()._save_workflow_file_inline(
+            destination=ProjectFileDestination(str(workflow_file), existing_file_policy=ExistingFilePolicy.OVERWRITE),
+            serialized_flow_commands=self._commands({"large": value}),
+            file_name=workflow_file.stem,
+            creation_date=datetime.now(UTC),
+            display_name=None,
+            image_path=None,
+            description=None,
+            is_template=None,
+            branched_from=None,
+            workflow_shape=None,
+            pickle_control_flow_result=False,
+            store_large_values_externally=store_large_values_externally,
+        )
+        assert isinstance(result, SaveWorkflowFileFromSerializedFlowResultSuccess), result.result_details
+
+    def test_overwrite_deletes_values_the_file_no_longer_references(
+        self, griptape_nodes: GriptapeNodes, tmp_path: Path
+    ) -> None:
+        from griptape_nodes.utils.workflow_value_store import get_workflow_values_dir
+
+        workflow_file = tmp_path / "big_values.py"
+        self._save(griptape_nodes, workflow_file, self.LARGE_VALUE, store_large_values_externally=True)
+        (first_value,) = get_workflow_values_dir(workflow_file).iterdir()
+
+        self._save(griptape_nodes, workflow_file, b"\x02" * 300_000, store_large_values_externally=True)
+
+        stored = list(get_workflow_values_dir(workflow_file).iterdir())
+        assert len(stored) == 1
+        assert first_value not in stored
+
+    def test_self_contained_save_keeps_values_inline(self, griptape_nodes: GriptapeNodes, tmp_path: Path) -> None:
+        from griptape_nodes.utils.workflow_value_store import get_workflow_values_dir
+
+        workflow_file = tmp_path / "published.py"
+        self._save(griptape_nodes, workflow_file, self.LARGE_VALUE, store_large_values_externally=False)
+
+        assert not get_workflow_values_dir(workflow_file).exists()
+        assert "load_workflow_value" not in workflow_file.read_text(encoding="utf-8")
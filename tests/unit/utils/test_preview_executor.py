@@ -0,0 +1,154 @@
+"""Unit tests for preview_executor and the image preview renderers."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from PIL import Image
+
+from griptape_nodes.utils.image_preview import (
+    acreate_image_preview_from_bytes,
+    open_preview_image,
+    render_image_preview,
+)
+from griptape_nodes.utils.preview_executor import (
+    PreviewExecutor,
+    PreviewPriority,
+    preview_priority,
+    run_preview_job,
+)
+
+
+def _jpeg_bytes(size: tuple[int, int]) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color="red").save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+def _thread_executor(max_workers: int = 1) -> PreviewExecutor:
+    return PreviewExecutor(max_workers, executor_factory=ThreadPoolExecutor)
+
+
+class TestPreviewExecutor:
+    def test_queued_jobs_run_highest_priority_first(self) -> None:
+        executor = _thread_executor()
+        release = threading.Event()
+        order = []
+
+        executor.submit("blocker", release.wait)
+        futures = [
+            executor.submit("background", order.append, "background", priority=PreviewPriority.BACKGROUND),
+            executor.submit("normal", order.append, "normal"),
+            executor.submit("visible", order.append, "visible", priority=PreviewPriority.VISIBLE),
+        ]
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+        assert order == ["visible", "normal", "background"]
+        executor.shutdown()
+
+    def test_duplicate_jobs_share_one_execution(self) -> None:
+        executor = _thread_executor()
+        release = threading.Event()
+        calls = []
+
+        def render() -> str:
+            calls.append(1)
+            release.wait()
+            return "preview"
+
+        first = executor.submit("image", render)
+        second = executor.submit("image", render)
+        release.set()
+
+        assert first is second
+        assert first.result(timeout=5) == "preview"
+        assert len(calls) == 1
+        executor.shutdown()
+
+    def test_duplicate_raises_priority_of_queued_job(self) -> None:
+        executor = _thread_executor()
+        release = threading.Event()
+        order = []
+
+        executor.submit("blocker", release.wait)
+        normal = executor.submit("normal", order.append, "normal")
+        promoted = executor.submit("promoted", order.append, "promoted", priority=PreviewPriority.BACKGROUND)
+        executor.submit("promoted", order.append, "promoted", priority=PreviewPriority.VISIBLE)
+        release.set()
+        normal.result(timeout=5)
+        promoted.result(timeout=5)
+
+        assert order == ["promoted", "normal"]
+        executor.shutdown()
+
+    def test_priority_defaults_to_context(self) -> None:
+        executor = _thread_executor()
+        release = threading.Event()
+        order = []
+
+        executor.submit("blocker", release.wait)
+        normal = executor.submit("normal", order.append, "normal")
+        with preview_priority(PreviewPriority.VISIBLE):
+            visible = executor.submit("visible", order.append, "visible")
+        release.set()
+        normal.result(timeout=5)
+        visible.result(timeout=5)
+
+        assert order == ["visible", "normal"]
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_raises_job_errors(self) -> None:
+        executor = _thread_executor()
+
+        with pytest.raises(ValueError, match="bad image"):
+            await executor.run("bad", _raise_value_error)
+
+        executor.shutdown()
+
+
+def _raise_value_error() -> None:
+    msg = "bad image"
+    raise ValueError(msg)
+
+
+class TestImagePreviewRendering:
+    def test_jpeg_is_decoded_at_reduced_scale(self) -> None:
+        with Image.open(io.BytesIO(_jpeg_bytes((4000, 2000)))) as raw_img:
+            img = open_preview_image(raw_img, 100, 100)
+
+            assert img.width < 4000  # noqa: PLR2004
+            assert min(img.size) >= 200  # noqa: PLR2004
+
+    def test_render_fits_within_bounds(self) -> None:
+        preview = render_image_preview(_jpeg_bytes((1200, 600)), 200, 200, "PNG")
+
+        with Image.open(io.BytesIO(preview)) as img:
+            assert img.size == (200, 100)
+
+    @pytest.mark.asyncio
+    async def test_render_in_worker_process(self) -> None:
+        previews = await asyncio.gather(
+            *(run_preview_job(render_image_preview, _jpeg_bytes((800, 800)), 64, 64, "PNG") for _ in range(3))
+        )
+
+        assert len(set(previews)) == 1
+        with Image.open(io.BytesIO(previews[0])) as img:
+            assert img.size == (64, 64)
+
+    @pytest.mark.asyncio
+    async def test_data_url_preview(self) -> None:
+        data_url = await acreate_image_preview_from_bytes(_jpeg_bytes((300, 300)), max_width=50, max_height=50)
+
+        assert data_url is not None
+        assert data_url.startswith("data:image/webp;base64,")
+
+    @pytest.mark.asyncio
+    async def test_svg_is_not_rendered(self) -> None:
+        assert await acreate_image_preview_from_bytes(b"<svg xmlns='http://www.w3.org/2000/svg'></svg>") is None
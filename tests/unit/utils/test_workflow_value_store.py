@@ -0,0 +1,164 @@
+"""Unit tests for workflow_value_store module."""
+
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from griptape_nodes.utils.workflow_value_store import (
+    WORKFLOW_VALUE_DIRS_ENV_VAR,
+    WorkflowValueNotFoundError,
+    collect_unreferenced_workflow_values,
+    copy_workflow_values,
+    get_value_digest,
+    get_workflow_values_dir,
+    load_workflow_value,
+    move_workflow_values,
+    write_workflow_values,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _store(workflow_file: Path, value: object) -> str:
+    data = pickle.dumps(value)
+    digest = get_value_digest(data)
+    write_workflow_values(workflow_file, {digest: data})
+    return digest
+
+
+def _reference(digest: str) -> str:
+    return f"value = load_workflow_value(__file__, '{digest}')\n"
+
+
+class TestWriteWorkflowValues:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        workflow_file = tmp_path / "workflow.py"
+
+        digest = _store(workflow_file, {"pixels": b"\x00" * 1024})
+
+        assert (get_workflow_values_dir(workflow_file) / f"{digest}.pickle").exists()
+        assert load_workflow_value(str(workflow_file), digest) == {"pixels": b"\x00" * 1024}
+
+    def test_unchanged_values_are_not_rewritten(self, tmp_path: Path) -> None:
+        workflow_file = tmp_path / "workflow.py"
+        data = pickle.dumps("value")
+        digest = get_value_digest(data)
+
+        assert write_workflow_values(workflow_file, {digest: data}) == 1
+        with patch("griptape_nodes.utils.workflow_value_store.atomic_write_bytes") as mock_write:
+            assert write_workflow_values(workflow_file, {digest: data}) == 0
+        mock_write.assert_not_called()
+
+    def test_no_values_creates_nothing(self, tmp_path: Path) -> None:
+        workflow_file = tmp_path / "workflow.py"
+
+        assert write_workflow_values(workflow_file, {}) == 0
+        assert not get_workflow_values_dir(workflow_file).exists()
+
+
+class TestLoadWorkflowValue:
+    def test_falls_back_to_env_var_directories(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        original = tmp_path / "original" / "workflow.py"
+        digest = _store(original, [1, 2, 3])
+        staged = tmp_path / "staged" / "workflow.py"
+        monkeypatch.setenv(WORKFLOW_VALUE_DIRS_ENV_VAR, str(get_workflow_values_dir(original)))
+
+        assert load_workflow_value(str(staged), digest) == [1, 2, 3]
+
+    def test_missing_value_raises(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv(WORKFLOW_VALUE_DIRS_ENV_VAR, raising=False)
+
+        with pytest.raises(WorkflowValueNotFoundError, match="was not found"):
+            load_workflow_value(str(tmp_path / "workflow.py"), "0" * 64)
+
+
+class TestCopyWorkflowValues:
+    def test_copies_only_referenced_values(self, tmp_path: Path) -> None:
+        source = tmp_path / "source" / "workflow.py"
+        referenced = _store(source, "referenced")
+        unreferenced = _store(source, "unreferenced")
+        target = tmp_path / "target" / "workflow.py"
+        content = f"value = load_workflow_value(__file__, '{referenced}')\n"
+
+        assert copy_workflow_values(source, target, content) == 1
+
+        target_dir = get_workflow_values_dir(target)
+        assert (target_dir / f"{referenced}.pickle").exists()
+        assert not (target_dir / f"{unreferenced}.pickle").exists()
+        assert copy_workflow_values(source, target, content) == 0
+
+    def test_same_directory_is_a_no_op(self, tmp_path: Path) -> None:
+        source = tmp_path / "workflow.py"
+        digest = _store(source, "value")
+
+        assert copy_workflow_values(source, tmp_path / "branch.py", f"load_workflow_value(__file__, '{digest}')") == 0
+
+
+class TestMoveWorkflowValues:
+    def test_moves_values_only_the_moved_workflow_referenced(self, tmp_path: Path) -> None:
+        source = tmp_path / "source" / "workflow.py"
+        moved = _store(source, "moved")
+        shared = _store(source, "shared")
+        (tmp_path / "source" / "other.py").write_text(_reference(shared), encoding="utf-8")
+        target = tmp_path / "target" / "workflow.py"
+        target.parent.mkdir()
+        target.write_text(_reference(moved) + _reference(shared), encoding="utf-8")
+
+        assert move_workflow_values(source, target) == 2  # noqa: PLR2004
+
+        source_dir = get_workflow_values_dir(source)
+        target_dir = get_workflow_values_dir(target)
+        assert not (source_dir / f"{moved}.pickle").exists()
+        assert (source_dir / f"{shared}.pickle").exists()
+        assert (target_dir / f"{moved}.pickle").exists()
+        assert (target_dir / f"{shared}.pickle").exists()
+
+    def test_emptied_source_directory_is_removed(self, tmp_path: Path) -> None:
+        source = tmp_path / "source" / "workflow.py"
+        digest = _store(source, "value")
+        target = tmp_path / "target" / "workflow.py"
+        target.parent.mkdir()
+        target.write_text(_reference(digest), encoding="utf-8")
+
+        assert move_workflow_values(source, target) == 1
+
+        assert not get_workflow_values_dir(source).exists()
+        assert load_workflow_value(str(target), digest) == "value"
+
+
+class TestCollectUnreferencedWorkflowValues:
+    def test_deletes_only_values_no_workflow_references(self, tmp_path: Path) -> None:
+        workflow_file = tmp_path / "workflow.py"
+        kept = _store(workflow_file, "kept")
+        dropped = _store(workflow_file, "dropped")
+        workflow_file.write_text(_reference(kept), encoding="utf-8")
+
+        assert collect_unreferenced_workflow_values(tmp_path) == 1
+
+        values_dir = get_workflow_values_dir(workflow_file)
+        assert (values_dir / f"{kept}.pickle").exists()
+        assert not (values_dir / f"{dropped}.pickle").exists()
+
+    def test_reformatted_references_are_kept(self, tmp_path: Path) -> None:
+        workflow_file = tmp_path / "workflow.py"
+        kept = _store(workflow_file, "kept")
+        workflow_file.write_text(
+            f'value = load_workflow_value(\n    __file__,\n    "{kept}",\n)\n',
+            encoding="utf-8",
+        )
+
+        assert collect_unreferenced_workflow_values(tmp_path) == 0
+        assert load_workflow_value(str(workflow_file), kept) == "kept"
+
+    def test_unreadable_workflow_keeps_everything(self, tmp_path: Path) -> None:
+        workflow_file = tmp_path / "workflow.py"
+        digest = _store(workflow_file, "value")
+        workflow_file.write_bytes(b"\xff\xfe not utf-8")
+
+        assert collect_unreferenced_workflow_values(tmp_path) == 0
+        assert (get_workflow_values_dir(workflow_file) / f"{digest}.pickle").exists()